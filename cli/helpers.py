@@ -7,11 +7,15 @@ import pandas as pd
 import typer
 
 from client.fpl_data_client import FPLDataClient
-from db.database import initialize_database
+from db.database import initialize_database, sqlite_profile
 from db.operations import DatabaseOperations
-from fetchers import fetch_fpl_bootstrap, fetch_fpl_fixtures
+from fetchers.async_fetch import fetch_many
 from fetchers.derived_processor import DerivedDataProcessor
-from fetchers.fpl_api import fetch_gameweek_live_data, fetch_manager_gameweek_picks, fetch_manager_team_with_budget
+from fetchers.fpl_api import fetch_manager_team_with_budget, fpl_api_url, last_fetch_unchanged
+from fetchers.http_cache import get_cache_stats
+from fetchers.http_client import get_connection_stats
+from fetchers.payload_archive import ReplayError, get_run_id, is_replaying, start_replay
+from fetchers.rate_limit import get_rate_limiter_stats
 from fetchers.raw_processor import (
     process_all_raw_bootstrap_data,
     process_raw_fixtures,
@@ -20,8 +24,11 @@ from fetchers.raw_processor import (
     process_raw_my_manager,
     process_raw_my_picks,
 )
+from fetchers.run_context import RunContext
+from fetchers.vaastav import get_vaastav_cache_stats
 from safety import create_safety_backup, validate_data_integrity
 from utils import ensure_data_dir
+from validation.validators import get_validation_stats, parse_table_modes, set_validation_policy
 
 
 def run_preflight_checks(validate: bool, create_backup: bool, backup_suffix: str = "pre_run") -> None:
@@ -47,6 +54,42 @@ def run_preflight_checks(validate: bool, create_backup: bool, backup_suffix: str
         typer.echo()
 
 
+def start_replay_mode(run_id: str | None) -> None:
+    """Serve all fetches from an archived run instead of the network.
+
+    Args:
+        run_id: Archived run ID to replay (no-op if None)
+    """
+    if not run_id:
+        return
+    try:
+        manifest = start_replay(run_id)
+    except ReplayError as e:
+        typer.echo(f"❌ {e}")
+        raise typer.Exit(1) from e
+    typer.echo(f"🔁 Replaying archived run {run_id} ({len(manifest['entries'])} payloads, no network access)")
+    typer.echo()
+
+
+def configure_validation(mode: str | None, table_modes: list[str] | None = None) -> None:
+    """Apply the schema validation mode chosen on the command line.
+
+    Args:
+        mode: Mode for all tables ("full", "sampled" or "fingerprint"; None keeps FPL_VALIDATION_MODE)
+        table_modes: Per-table overrides as "table=mode" items
+    """
+    if not mode and not table_modes:
+        return
+    try:
+        tables = parse_table_modes(table_modes)
+        set_validation_policy(default=mode, tables=tables)
+    except ValueError as e:
+        typer.echo(f"❌ {e}")
+        raise typer.Exit(1) from e
+    overrides = ", ".join(f"{table}={table_mode}" for table, table_mode in tables.items())
+    typer.echo(f"🔎 Schema validation: {mode or 'default'}" + (f" ({overrides})" if overrides else ""))
+
+
 def initialize_data_environment() -> None:
     """Initialize data directory and database."""
     typer.echo("🗄️ Initializing data environment...")
@@ -56,24 +99,42 @@ def initialize_data_environment() -> None:
     typer.echo()
 
 
-def fetch_and_save_bootstrap_data(manager_id: int) -> dict:
+def fetch_and_save_bootstrap_data(manager_id: int, context: RunContext | None = None) -> dict:
     """Fetch and save all bootstrap, fixtures, and manager data.
 
     Args:
         manager_id: FPL manager ID for personal data
+        context: Run-scoped resources; bootstrap and fixtures are fetched through it once
 
     Returns:
         Bootstrap data dictionary from FPL API
     """
     typer.echo("📥 Fetching bootstrap data from FPL API...")
 
-    # Fetch core data
-    bootstrap = fetch_fpl_bootstrap()
-    fixtures_data = fetch_fpl_fixtures()
+    # Fetch core data (once per run, shared with later gameweek and odds steps)
+    if context is None:
+        context = RunContext()
+    bootstrap = context.bootstrap
+    fixtures_data = context.fixtures
+
+    # Skip reprocessing payloads that are unchanged since the last run (and already stored)
+    db_ops = DatabaseOperations()
+    table_counts = db_ops.get_database_summary()
+    bootstrap_unchanged = last_fetch_unchanged("bootstrap") and _has_rows(table_counts, "raw_players_bootstrap")
+    fixtures_unchanged = last_fetch_unchanged("fixtures") and _has_rows(table_counts, "raw_fixtures")
+
+    # One capture time for every table built from this run's payloads
+    as_of_utc = pd.Timestamp.now(tz="UTC")
 
     # Process raw bootstrap data
-    typer.echo("📥 Processing raw API data for complete capture...")
-    raw_bootstrap_data = process_all_raw_bootstrap_data(bootstrap)
+    if bootstrap_unchanged:
+        typer.echo("⏭️  Bootstrap unchanged since last run - skipping raw bootstrap reprocessing")
+        raw_bootstrap_data = {}
+        # Curated team-name aliases can change without the bootstrap changing
+        db_ops.rebuild_team_aliases()
+    else:
+        typer.echo("📥 Processing raw API data for complete capture...")
+        raw_bootstrap_data = process_all_raw_bootstrap_data(bootstrap, as_of_utc=as_of_utc)
 
     # Fetch personal manager data
     typer.echo(f"👤 Fetching personal data for manager {manager_id}...")
@@ -91,12 +152,14 @@ def fetch_and_save_bootstrap_data(manager_id: int) -> dict:
         raw_bootstrap_data["raw_my_picks"] = pd.DataFrame()
 
     # Process fixtures
-    raw_fixtures_data = process_raw_fixtures(fixtures_data)
-    if not raw_fixtures_data.empty:
-        raw_bootstrap_data["raw_fixtures"] = raw_fixtures_data
+    if fixtures_unchanged:
+        typer.echo("⏭️  Fixtures unchanged since last run - skipping fixtures reprocessing")
+    else:
+        raw_fixtures_data = process_raw_fixtures(fixtures_data, as_of_utc=as_of_utc)
+        if not raw_fixtures_data.empty:
+            raw_bootstrap_data["raw_fixtures"] = raw_fixtures_data
 
     # Save to database
-    db_ops = DatabaseOperations()
     db_ops.save_all_raw_data(raw_bootstrap_data)
     typer.echo("✅ Bootstrap data saved to database")
     typer.echo()
@@ -104,11 +167,18 @@ def fetch_and_save_bootstrap_data(manager_id: int) -> dict:
     return bootstrap
 
 
+def _has_rows(table_counts: dict, table_name: str) -> bool:
+    """Whether a get_database_summary() count shows the table has data."""
+    count = table_counts.get(table_name)
+    return isinstance(count, int) and count > 0
+
+
 def fetch_and_save_gameweek_data(
     gameweek: int,
     manager_id: int,
     bootstrap: dict,
     force_refresh: bool = False,
+    context: RunContext | None = None,
 ) -> bool:
     """Fetch and save gameweek performance and picks data.
 
@@ -117,6 +187,7 @@ def fetch_and_save_gameweek_data(
         manager_id: FPL manager ID for picks data
         bootstrap: Bootstrap data dictionary (for player mapping)
         force_refresh: If True, refresh even if data already exists
+        context: Run-scoped resources; supplies the fixtures lookup without re-fetching fixtures
 
     Returns:
         True if data was fetched/updated, False if skipped
@@ -140,21 +211,33 @@ def fetch_and_save_gameweek_data(
     else:
         typer.echo(f"📥 Fetching gameweek {gameweek} data...")
 
-    # Fetch live gameweek performance data
-    live_data = fetch_gameweek_live_data(gameweek)
+    # Fetch live gameweek performance data and manager picks concurrently
+    live_result, picks_result = fetch_many(
+        [
+            ("live", fpl_api_url(f"event/{gameweek}/live/")),
+            ("picks", fpl_api_url(f"entry/{manager_id}/event/{gameweek}/picks/")),
+        ]
+    )
+    live_data = live_result.data if live_result.ok else None
+    if live_data is None:
+        typer.echo(f"⚠️ Could not fetch live data for gameweek {gameweek}: {live_result.error}")
     if live_data:
-        # Fetch fixtures data for opponent_team lookup
-        fixtures_data = fetch_fpl_fixtures()
-
-        gameweek_performance_df = process_raw_gameweek_performance(live_data, gameweek, bootstrap, fixtures_data)
+        # Fixtures lookup for opponent_team comes from the run context (fetched at most once per run)
+        if context is None:
+            context = RunContext(bootstrap=bootstrap)
+        gameweek_performance_df = process_raw_gameweek_performance(
+            live_data, gameweek, bootstrap, fixtures_lookup=context.fixtures_lookup
+        )
 
         if not gameweek_performance_df.empty:
             db_ops = DatabaseOperations()
             db_ops.save_raw_player_gameweek_performance(gameweek_performance_df)
             typer.echo(f"✅ Saved gameweek {gameweek} performance data ({len(gameweek_performance_df)} players)")
 
-    # Fetch updated manager picks for current gameweek
-    updated_picks = fetch_manager_gameweek_picks(manager_id, gameweek)
+    # Updated manager picks for current gameweek
+    updated_picks = picks_result.data if picks_result.ok else None
+    if updated_picks is None:
+        typer.echo(f"⚠️ Could not fetch picks for manager {manager_id}, gameweek {gameweek}: {picks_result.error}")
     if updated_picks:
         # Process and save picks
         picks_df = process_raw_my_picks({**updated_picks, "current_event": gameweek})
@@ -183,8 +266,9 @@ def process_and_save_derived_data() -> None:
     """Process and save all derived analytics data."""
     typer.echo("🧮 Processing derived analytics from raw data...")
 
-    derived_processor = DerivedDataProcessor()
-    derived_data = derived_processor.process_all_derived_data()
+    with sqlite_profile("analytics"):
+        derived_processor = DerivedDataProcessor()
+        derived_data = derived_processor.process_all_derived_data()
 
     db_ops = DatabaseOperations()
     db_ops.save_all_derived_data(derived_data)
@@ -288,6 +372,14 @@ def print_completion_summary(operations: dict) -> None:
     if operations.get("derived_updated"):
         typer.echo("  ✅ Derived analytics processed and saved")
 
+    http_stats = get_connection_stats()
+    if http_stats["requests"]:
+        typer.echo(
+            f"  🔌 HTTP: {http_stats['requests']} requests over {http_stats['new_connections']} connections "
+            f"({http_stats['reused_connections']} reused via keep-alive)"
+        )
+    print_run_summaries()
+
     typer.echo()
     typer.echo("💡 Quick access commands:")
     typer.echo(
@@ -301,3 +393,65 @@ def print_completion_summary(operations: dict) -> None:
             f'  🔴 GW{gw} data: uv run python -c "from client.fpl_data_client import FPLDataClient; '
             f'client=FPLDataClient(); print(len(client.get_gameweek_performance({gw})))"'
         )
+
+
+def print_http_cache_summary() -> None:
+    """Print conditional-GET cache hit/miss counters for this run."""
+    cache_stats = get_cache_stats()
+    if cache_stats["hits"] or cache_stats["misses"]:
+        typer.echo(
+            f"  🗃️  HTTP cache: {cache_stats['hits']} hits (304), {cache_stats['misses']} misses, "
+            f"{cache_stats['unchanged']} unchanged payloads"
+        )
+
+
+def print_run_summaries() -> None:
+    """Print the per-run summaries (HTTP cache, vaastav cache, archive, rate limiter, validation) that had activity."""
+    print_http_cache_summary()
+    print_vaastav_cache_summary()
+    print_archive_summary()
+    print_rate_limiter_summary()
+    print_validation_summary()
+
+
+def print_validation_summary() -> None:
+    """Print schema validation time per table, slowest first."""
+    stats = get_validation_stats()
+    if not stats:
+        return
+    total = sum(table_stats["seconds"] for table_stats in stats.values())
+    skipped = sum(table_stats["skipped"] for table_stats in stats.values())
+    typer.echo(f"  🔎 Schema validation: {total:.2f}s across {len(stats)} tables ({skipped} skipped as unchanged)")
+    for table, table_stats in sorted(stats.items(), key=lambda item: item[1]["seconds"], reverse=True)[:5]:
+        typer.echo(
+            f"     {table} ({table_stats['schema']}, {table_stats['mode']}): {table_stats['seconds']:.3f}s, "
+            f"{table_stats['calls']} calls, {table_stats['rows']} rows"
+        )
+
+
+def print_vaastav_cache_summary() -> None:
+    """Print how vaastav CSVs were served (local copy, download or revalidation), if any were read."""
+    vaastav_stats = get_vaastav_cache_stats()
+    if any(vaastav_stats.values()):
+        typer.echo(
+            f"  📚 Vaastav cache: {vaastav_stats['hits']} local hits, {vaastav_stats['downloads']} downloads, "
+            f"{vaastav_stats['revalidated']} revalidated (304), {vaastav_stats['corrupt']} integrity failures"
+        )
+
+
+def print_rate_limiter_summary() -> None:
+    """Print per-host throttling and circuit-breaker activity, if there was any."""
+    for host, stats in get_rate_limiter_stats().items():
+        if stats["throttled"] or stats["server_errors"] or stats["connection_errors"] or stats["rejected"]:
+            typer.echo(
+                f"  🚦 {host}: {stats['throttled']} throttled (429), {stats['server_errors']} server errors, "
+                f"{stats['rejected']} rejected by circuit breaker ({stats['state']}), "
+                f"rate now {stats['rate']}/{stats['max_rate']} req/s, waited {stats['wait_seconds']}s"
+            )
+
+
+def print_archive_summary() -> None:
+    """Print the archive run ID that recorded this run's payloads."""
+    run_id = get_run_id()
+    if run_id and not is_replaying():
+        typer.echo(f"  📼 Payloads archived as run {run_id} (replay with --replay {run_id})")
@@ -27,6 +27,10 @@ from .fpl_data_client import (
     get_derived_value_analysis,
     get_fixtures_normalized,
     get_gameweek_live_data,
+    get_league_entries,
+    get_manager_gameweek_summary,
+    # League-scale manager data
+    get_manager_picks,
     get_my_chip_usage,
     get_my_current_picks,
     get_my_gameweek_summary,
@@ -42,6 +46,8 @@ from .fpl_data_client import (
     # Raw FPL API data
     get_raw_players_bootstrap,
     get_raw_teams_bootstrap,
+    get_team_aliases,
+    resolve_team_ids,
 )
 
 __all__ = [
@@ -54,6 +60,10 @@ __all__ = [
     "get_my_current_picks",
     "get_my_gameweek_summary",
     "get_my_manager_data",
+    # League-scale manager data
+    "get_manager_picks",
+    "get_manager_gameweek_summary",
+    "get_league_entries",
     # Legacy compatibility functions
     "get_current_players",
     "get_current_teams",
@@ -70,6 +80,8 @@ __all__ = [
     "get_raw_element_types",
     "get_raw_chips",
     "get_raw_phases",
+    "get_team_aliases",
+    "resolve_team_ids",
     # Derived analytics data
     "get_derived_player_metrics",
     "get_derived_team_form",
@@ -1,6 +1,7 @@
 """FPL Data Client - Raw + Derived Architecture Only."""
 
 import sys
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
@@ -8,34 +9,45 @@ import pandas as pd
 # Add parent directory to path to import db modules
 sys.path.append(str(Path(__file__).parent.parent))
 
-from db.database import create_tables
-from db.operations import db_ops
+from sqlalchemy.orm import sessionmaker
+
+from db import models_raw, team_aliases
+from db.database import create_profiled_engine, create_tables
+from db.operations import DatabaseOperations, db_ops
 
 
 class FPLDataClient:
     """Client for accessing FPL raw and derived data from database."""
 
-    def __init__(self, auto_init: bool = True):
+    def __init__(self, auto_init: bool = True, read_only: bool = False):
         """Initialize client with optional automatic database setup.
 
         Args:
             auto_init: If True, automatically create tables if they don't exist
+            read_only: Read through a separate engine with the "readonly" SQLite profile (writes refused,
+                reader-sized cache); the shared engine used for writes is not touched
         """
         if auto_init:
             try:
                 create_tables()
             except Exception as e:
                 print(f"Warning: Could not initialize database tables: {e}")
+        self._db = db_ops
+        if read_only:
+            self._db = DatabaseOperations(sessionmaker(bind=create_profiled_engine("readonly")))
 
     # Raw FPL API Data Access
-    def get_raw_players_bootstrap(self) -> pd.DataFrame:
+    def get_raw_players_bootstrap(self, numeric: bool = False) -> pd.DataFrame:
         """Get complete raw player data from FPL API bootstrap.
 
+        Args:
+            numeric: Return string-encoded stats (form, selected_by_percent, ICT, xG, ...) as floats
+
         Returns:
             DataFrame with all raw player fields from FPL API (100+ columns)
         """
         try:
-            return db_ops.get_raw_players_bootstrap()
+            return self._db.get_raw_players_bootstrap(numeric=numeric)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch raw players bootstrap data: {e}") from e
 
@@ -46,10 +58,39 @@ class FPLDataClient:
             DataFrame with all raw team fields from FPL API (20+ columns)
         """
         try:
-            return db_ops.get_raw_teams_bootstrap()
+            return self._db.get_raw_teams_bootstrap()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch raw teams bootstrap data: {e}") from e
 
+    def get_team_aliases(self) -> pd.DataFrame:
+        """Get the team-name alias index used to match external sources to FPL teams.
+
+        Returns:
+            DataFrame with alias_key (normalized name), alias, team_id, source
+        """
+        try:
+            return self._db.get_team_aliases()
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch team aliases: {e}") from e
+
+    def resolve_team_ids(self, names: list[str] | pd.Series) -> pd.Series:
+        """Resolve team names as any source spells them to FPL team IDs.
+
+        Args:
+            names: Team names, e.g. ["Man United", "Tottenham Hotspur", "Nott'm Forest"]
+
+        Returns:
+            Series of team IDs aligned with names (NaN where a name is not in the alias index)
+
+        Example:
+            >>> client = FPLDataClient()
+            >>> client.resolve_team_ids(["Brighton and Hove Albion", "Wolves"])
+        """
+        try:
+            return team_aliases.resolve_team_ids(pd.Series(names), self._db.get_team_aliases())
+        except Exception as e:
+            raise RuntimeError(f"Failed to resolve team names: {e}") from e
+
     def get_raw_events_bootstrap(self) -> pd.DataFrame:
         """Get complete raw gameweek/event data from FPL API bootstrap.
 
@@ -57,7 +98,7 @@ class FPLDataClient:
             DataFrame with all raw event fields from FPL API (30+ columns)
         """
         try:
-            return db_ops.get_raw_events_bootstrap()
+            return self._db.get_raw_events_bootstrap()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch raw events bootstrap data: {e}") from e
 
@@ -68,7 +109,7 @@ class FPLDataClient:
             DataFrame with all raw fixture fields from FPL API
         """
         try:
-            return db_ops.get_raw_fixtures()
+            return self._db.get_raw_fixtures()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch raw fixtures data: {e}") from e
 
@@ -89,7 +130,7 @@ class FPLDataClient:
             >>> gw_odds = client.get_raw_betting_odds(gameweek=5)  # GW5 only
         """
         try:
-            return db_ops.get_raw_betting_odds(gameweek=gameweek)
+            return self._db.get_raw_betting_odds(gameweek=gameweek)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch betting odds data: {e}") from e
 
@@ -130,7 +171,7 @@ class FPLDataClient:
             DataFrame with all raw game configuration fields (35+ columns)
         """
         try:
-            return db_ops.get_raw_game_settings()
+            return self._db.get_raw_game_settings()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch raw game settings: {e}") from e
 
@@ -141,7 +182,7 @@ class FPLDataClient:
             DataFrame with all raw stat definitions from FPL API
         """
         try:
-            return db_ops.get_raw_element_stats()
+            return self._db.get_raw_element_stats()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch raw element stats: {e}") from e
 
@@ -152,7 +193,7 @@ class FPLDataClient:
             DataFrame with raw position definitions (GKP, DEF, MID, FWD)
         """
         try:
-            return db_ops.get_raw_element_types()
+            return self._db.get_raw_element_types()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch raw element types: {e}") from e
 
@@ -163,7 +204,7 @@ class FPLDataClient:
             DataFrame with all raw chip information and rules
         """
         try:
-            return db_ops.get_raw_chips()
+            return self._db.get_raw_chips()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch raw chips data: {e}") from e
 
@@ -174,7 +215,7 @@ class FPLDataClient:
             DataFrame with all raw season phase information
         """
         try:
-            return db_ops.get_raw_phases()
+            return self._db.get_raw_phases()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch raw phases data: {e}") from e
 
@@ -186,7 +227,7 @@ class FPLDataClient:
             DataFrame with advanced metrics, value scores, risk analysis, etc.
         """
         try:
-            return db_ops.get_derived_player_metrics()
+            return self._db.get_derived_player_metrics()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch derived player metrics: {e}") from e
 
@@ -197,7 +238,7 @@ class FPLDataClient:
             DataFrame with rolling team performance metrics and venue analysis
         """
         try:
-            return db_ops.get_derived_team_form()
+            return self._db.get_derived_team_form()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch derived team form: {e}") from e
 
@@ -208,7 +249,7 @@ class FPLDataClient:
             DataFrame with comprehensive fixture difficulty ratings and predictions
         """
         try:
-            return db_ops.get_derived_fixture_difficulty()
+            return self._db.get_derived_fixture_difficulty()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch derived fixture difficulty: {e}") from e
 
@@ -219,7 +260,7 @@ class FPLDataClient:
             DataFrame with value analysis and investment recommendations
         """
         try:
-            return db_ops.get_derived_value_analysis()
+            return self._db.get_derived_value_analysis()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch derived value analysis: {e}") from e
 
@@ -230,7 +271,7 @@ class FPLDataClient:
             DataFrame with ownership patterns and transfer momentum insights
         """
         try:
-            return db_ops.get_derived_ownership_trends()
+            return self._db.get_derived_ownership_trends()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch derived ownership trends: {e}") from e
 
@@ -241,7 +282,7 @@ class FPLDataClient:
             gameweek: Optional gameweek filter
         """
         try:
-            return db_ops.get_derived_betting_features(gameweek=gameweek)
+            return self._db.get_derived_betting_features(gameweek=gameweek)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch derived betting features: {e}") from e
 
@@ -259,7 +300,7 @@ class FPLDataClient:
             green fixture counts, fixture swings, and transfer timing signals
         """
         try:
-            return db_ops.get_derived_fixture_runs(gameweek=gameweek)
+            return self._db.get_derived_fixture_runs(gameweek=gameweek)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch derived fixture runs: {e}") from e
 
@@ -271,7 +312,7 @@ class FPLDataClient:
             DataFrame with my manager information
         """
         try:
-            return db_ops.get_my_manager_data()
+            return self._db.get_my_manager_data()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch my manager data: {e}") from e
 
@@ -282,13 +323,13 @@ class FPLDataClient:
             DataFrame with current gameweek team selection
         """
         try:
-            return db_ops.get_my_current_picks()
+            return self._db.get_my_current_picks()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch my current picks: {e}") from e
 
     # Gameweek-specific data methods
     def get_player_gameweek_history(
-        self, player_id: int = None, start_gw: int = None, end_gw: int = None
+        self, player_id: int = None, start_gw: int = None, end_gw: int = None, columns: list[str] | None = None
     ) -> pd.DataFrame:
         """Get historical gameweek performance for a player.
 
@@ -296,50 +337,42 @@ class FPLDataClient:
             player_id: Specific player ID (optional, returns all players if None)
             start_gw: Starting gameweek (optional)
             end_gw: Ending gameweek (optional)
+            columns: Columns to return, e.g. ["player_id", "gameweek", "total_points"] (None = all)
 
         Returns:
-            DataFrame with gameweek-by-gameweek player performance
+            DataFrame with gameweek-by-gameweek player performance, ordered by player and gameweek
         """
         try:
-            # Get all gameweek performance data
-            df = db_ops.get_raw_player_gameweek_performance(player_id=player_id)
-
-            if df.empty:
-                return df
-
-            # Filter by gameweek range if specified
-            if start_gw is not None:
-                df = df[df["gameweek"] >= start_gw]
-            if end_gw is not None:
-                df = df[df["gameweek"] <= end_gw]
-
-            return df.sort_values(["player_id", "gameweek"])
+            return self._db.query_frame(
+                models_raw.RawPlayerGameweekPerformance,
+                equals={"player_id": player_id} if player_id is not None else None,
+                ranges={"gameweek": (start_gw, end_gw)},
+                order_by=["player_id", "gameweek"],
+                columns=columns,
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to fetch player gameweek history: {e}") from e
 
-    def get_my_picks_history(self, start_gw: int = None, end_gw: int = None) -> pd.DataFrame:
+    def get_my_picks_history(
+        self, start_gw: int = None, end_gw: int = None, columns: list[str] | None = None
+    ) -> pd.DataFrame:
         """Get historical picks across gameweeks.
 
         Args:
             start_gw: Starting gameweek (optional)
             end_gw: Ending gameweek (optional)
+            columns: Columns to return (None = all)
 
         Returns:
-            DataFrame with picks history across gameweeks
+            DataFrame with picks history across gameweeks, ordered by gameweek and position
         """
         try:
-            df = db_ops.get_raw_my_picks()
-
-            if df.empty:
-                return df
-
-            # Filter by gameweek range if specified
-            if start_gw is not None:
-                df = df[df["event"] >= start_gw]
-            if end_gw is not None:
-                df = df[df["event"] <= end_gw]
-
-            return df.sort_values(["event", "position"])
+            return self._db.query_frame(
+                models_raw.RawMyPicks,
+                ranges={"event": (start_gw, end_gw)},
+                order_by=["event", "position"],
+                columns=columns,
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to fetch picks history: {e}") from e
 
@@ -360,36 +393,32 @@ class FPLDataClient:
             >>> chips = client.get_my_chip_usage(start_gw=1, end_gw=10)
         """
         try:
-            df = db_ops.get_raw_my_picks()
+            # Distinct gameweek-chip combinations (chip is same for all picks in a gameweek)
+            df = self._db.query_frame(
+                models_raw.RawMyPicks,
+                ranges={"event": (start_gw, end_gw)},
+                order_by=["event"],
+                columns=["event", "chip_used"],
+                distinct=True,
+            )
 
             if df.empty:
                 return pd.DataFrame(columns=["gameweek", "chip_used"])
 
-            # Filter by gameweek range if specified
-            if start_gw is not None:
-                df = df[df["event"] >= start_gw]
-            if end_gw is not None:
-                df = df[df["event"] <= end_gw]
-
-            # Get unique gameweek-chip combinations (chip is same for all picks in a gameweek)
-            # Group by gameweek and take first chip_used value
-            chip_usage = (
-                df[["event", "chip_used"]]
-                .drop_duplicates(subset=["event"])
-                .rename(columns={"event": "gameweek"})
-                .sort_values("gameweek")
-            )
-
-            return chip_usage
+            # Take the first chip_used value per gameweek
+            return df.drop_duplicates(subset=["event"]).rename(columns={"event": "gameweek"})
         except Exception as e:
             raise RuntimeError(f"Failed to fetch chip usage history: {e}") from e
 
-    def get_my_gameweek_summary(self, start_gw: int = None, end_gw: int = None) -> pd.DataFrame:
+    def get_my_gameweek_summary(
+        self, start_gw: int = None, end_gw: int = None, columns: list[str] | None = None
+    ) -> pd.DataFrame:
         """Get historical gameweek summary data including transfers made, bank, value, etc.
 
         Args:
             start_gw: Starting gameweek (optional)
             end_gw: Ending gameweek (optional)
+            columns: Columns to return, e.g. ["event", "event_transfers"] (None = all)
 
         Returns:
             DataFrame with gameweek summary data including event_transfers, event_transfers_cost,
@@ -402,18 +431,12 @@ class FPLDataClient:
             >>> summary[["event", "event_transfers", "event_transfers_cost"]]
         """
         try:
-            df = db_ops.get_raw_my_gameweek_summary()
-
-            if df.empty:
-                return df
-
-            # Filter by gameweek range if specified
-            if start_gw is not None:
-                df = df[df["event"] >= start_gw]
-            if end_gw is not None:
-                df = df[df["event"] <= end_gw]
-
-            return df.sort_values("event")
+            return self._db.query_frame(
+                models_raw.RawMyGameweekSummary,
+                ranges={"event": (start_gw, end_gw)},
+                order_by=["event"],
+                columns=columns,
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to fetch gameweek summary: {e}") from e
 
@@ -473,6 +496,97 @@ class FPLDataClient:
             print(f"Warning: Could not calculate free transfers for GW{gameweek}: {e}")
             return 1  # Fallback to 1 FT on error
 
+    # League-scale manager data (many managers, see `backfill managers`)
+    def get_manager_picks(self, gameweek: int | None = None, manager_ids: list[int] | None = None) -> pd.DataFrame:
+        """Get stored picks for many managers.
+
+        Args:
+            gameweek: Filter to a gameweek (optional)
+            manager_ids: Filter to these managers (optional)
+
+        Returns:
+            DataFrame with manager_id, event, position, player_id, multiplier, is_captain, is_vice_captain
+        """
+        try:
+            df = self._db.get_raw_manager_picks(gameweek=gameweek, manager_ids=manager_ids)
+            if df.empty:
+                return df
+            return df.sort_values(["manager_id", "event", "position"]).reset_index(drop=True)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch manager picks: {e}") from e
+
+    def get_manager_gameweek_summary(
+        self, start_gw: int = None, end_gw: int = None, manager_ids: list[int] | None = None
+    ) -> pd.DataFrame:
+        """Get per-gameweek summaries (points, rank, bank, transfers, chip) for many managers.
+
+        Args:
+            start_gw: Starting gameweek (optional)
+            end_gw: Ending gameweek (optional)
+            manager_ids: Filter to these managers (optional)
+
+        Returns:
+            DataFrame with one row per manager and gameweek
+        """
+        try:
+            df = self._db.get_raw_manager_gameweek_summary(manager_ids=manager_ids)
+            if df.empty:
+                return df
+
+            if start_gw is not None:
+                df = df[df["event"] >= start_gw]
+            if end_gw is not None:
+                df = df[df["event"] <= end_gw]
+
+            return df.sort_values(["manager_id", "event"]).reset_index(drop=True)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch manager gameweek summary: {e}") from e
+
+    def get_league_entries(self, league_id: int | None = None) -> pd.DataFrame:
+        """Get stored classic league members.
+
+        Args:
+            league_id: Classic league ID (optional, all stored leagues if None)
+
+        Returns:
+            DataFrame with league_id, manager_id, entry_name, player_name, rank, total
+        """
+        try:
+            df = self._db.get_raw_league_entries(league_id=league_id)
+            if df.empty:
+                return df
+            return df.sort_values(["league_id", "rank"]).reset_index(drop=True)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch league entries: {e}") from e
+
+    def get_player_bootstrap_changes(
+        self, since: datetime | None = None, player_id: int | None = None, fields: list[str] | None = None
+    ) -> pd.DataFrame:
+        """Get field-level changes between bootstrap refreshes (prices, news, status, ...).
+
+        Args:
+            since: Only changes captured at or after this UTC time (optional)
+            player_id: Specific player ID (optional, all players if None)
+            fields: Specific fields such as ["now_cost", "news"] (optional, all fields if None)
+
+        Returns:
+            DataFrame with player_id, field, old_value, new_value, as_of_utc (values as text)
+
+        Example:
+            >>> client = FPLDataClient()
+            >>> price_changes = client.get_player_bootstrap_changes(fields=["now_cost"])
+        """
+        try:
+            if since is not None:
+                # Stored timestamps are naive UTC
+                since = pd.Timestamp(since)
+                if since.tzinfo is not None:
+                    since = since.tz_convert("UTC").tz_localize(None)
+                since = since.to_pydatetime()
+            return self._db.get_raw_player_bootstrap_changes(since=since, player_id=player_id, fields=fields)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch player bootstrap changes: {e}") from e
+
     def get_gameweek_performance(self, gameweek: int) -> pd.DataFrame:
         """Get all player performances for a specific gameweek.
 
@@ -483,7 +597,7 @@ class FPLDataClient:
             DataFrame with all player performances for the specified gameweek
         """
         try:
-            return db_ops.get_raw_player_gameweek_performance(gameweek=gameweek)
+            return self._db.get_raw_player_gameweek_performance(gameweek=gameweek)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch gameweek {gameweek} performance: {e}") from e
 
@@ -520,12 +634,17 @@ class FPLDataClient:
             >>> injured = snapshot[snapshot['status'] == 'i']  # Get injured players
         """
         try:
-            return db_ops.get_raw_player_gameweek_snapshot(gameweek=gameweek, include_backfilled=include_backfilled)
+            return self._db.get_raw_player_gameweek_snapshot(gameweek=gameweek, include_backfilled=include_backfilled)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch availability snapshot for GW{gameweek}: {e}") from e
 
     def get_player_snapshots_history(
-        self, start_gw: int, end_gw: int, player_id: int = None, include_backfilled: bool = True
+        self,
+        start_gw: int,
+        end_gw: int,
+        player_id: int = None,
+        include_backfilled: bool = True,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
         """Get player availability snapshots across multiple gameweeks.
 
@@ -537,9 +656,10 @@ class FPLDataClient:
             end_gw: Ending gameweek (inclusive)
             player_id: Optional filter for specific player (None = all players)
             include_backfilled: If False, exclude inferred/backfilled data
+            columns: Columns to return, e.g. ["player_id", "gameweek", "status"] (None = all)
 
         Returns:
-            DataFrame with player snapshots across gameweek range
+            DataFrame with player snapshots across gameweek range, ordered by player and gameweek
 
         Example:
             >>> client = FPLDataClient()
@@ -551,15 +671,19 @@ class FPLDataClient:
             ... )
         """
         try:
-            df = db_ops.get_player_snapshots_range(
-                start_gw=start_gw, end_gw=end_gw, include_backfilled=include_backfilled
+            equals = {}
+            if player_id is not None:
+                equals["player_id"] = player_id
+            if not include_backfilled:
+                equals["is_backfilled"] = False
+
+            return self._db.query_frame(
+                models_raw.RawPlayerGameweekSnapshot,
+                equals=equals,
+                ranges={"gameweek": (start_gw, end_gw)},
+                order_by=["player_id", "gameweek"],
+                columns=columns,
             )
-
-            # Filter by player_id if specified
-            if player_id is not None and not df.empty:
-                df = df[df["player_id"] == player_id]
-
-            return df.sort_values(["player_id", "gameweek"]) if not df.empty else df
         except Exception as e:
             raise RuntimeError(f"Failed to fetch snapshots history (GW{start_gw}-{end_gw}): {e}") from e
 
@@ -576,8 +700,8 @@ class FPLDataClient:
             - Market intelligence (cost_change_event, news)
         """
         try:
-            # Get full raw data using existing method
-            full_data = self.get_raw_players_bootstrap()
+            # Numeric read: form, selected_by_percent, ICT and expected stats arrive as floats
+            full_data = self.get_raw_players_bootstrap(numeric=True)
 
             if full_data.empty:
                 return pd.DataFrame()
@@ -650,54 +774,6 @@ class FPLDataClient:
             # Select the desired columns
             enhanced_data = full_data[available_columns].copy()
 
-            # Ensure proper data types for numeric columns
-            numeric_columns = [
-                "chance_of_playing_next_round",
-                "chance_of_playing_this_round",
-                "corners_and_indirect_freekicks_order",
-                "direct_freekicks_order",
-                "penalties_order",
-                "expected_goals_per_90",
-                "expected_assists_per_90",
-                "transfers_in_event",
-                "transfers_out_event",
-                "form_rank",
-                "ict_index_rank",
-                "points_per_game_rank",
-                "cost_change_event",
-                "cost_change_start",
-                "value_form",
-                "influence_rank",
-                "creativity_rank",
-                "threat_rank",
-                "defensive_contribution",
-                "tackles",
-                "recoveries",
-                "goals_scored",
-                "assists",
-                "clean_sheets",
-                "bonus",
-                "bps",
-                "influence",
-                "creativity",
-                "threat",
-                "ict_index",
-                "expected_goals",
-                "expected_assists",
-                "points_per_game",
-                "now_cost",
-                "total_points",
-                "form",
-                "selected_by_percent",
-                "minutes",
-                "starts",
-            ]
-
-            # Convert numeric columns to proper types
-            for col in numeric_columns:
-                if col in enhanced_data.columns:
-                    enhanced_data[col] = pd.to_numeric(enhanced_data[col], errors="coerce")
-
             return enhanced_data
 
         except Exception as e:
@@ -785,7 +861,7 @@ class FPLDataClient:
             DataFrame with current player stats, prices, positions, etc.
         """
         try:
-            return db_ops.get_players_current()
+            return self._db.get_players_current()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch current players: {e}") from e
 
@@ -796,7 +872,7 @@ class FPLDataClient:
             DataFrame with team IDs, names, and short names
         """
         try:
-            return db_ops.get_teams_current()
+            return self._db.get_teams_current()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch current teams: {e}") from e
 
@@ -807,7 +883,7 @@ class FPLDataClient:
             DataFrame with fixture data including team IDs and kickoff times
         """
         try:
-            return db_ops.get_fixtures_normalized()
+            return self._db.get_fixtures_normalized()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch fixtures: {e}") from e
 
@@ -821,7 +897,7 @@ class FPLDataClient:
             DataFrame with live player performance data
         """
         try:
-            return db_ops.get_gameweek_live_data(gameweek)
+            return self._db.get_gameweek_live_data(gameweek)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch gameweek live data: {e}") from e
 
@@ -832,7 +908,7 @@ class FPLDataClient:
             DataFrame with expected goals and assists rates
         """
         try:
-            return db_ops.get_player_xg_xa_rates()
+            return self._db.get_player_xg_xa_rates()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch player xG/xA rates: {e}") from e
 
@@ -844,7 +920,7 @@ class FPLDataClient:
             Dictionary with row counts for all raw and derived tables
         """
         try:
-            return db_ops.get_database_summary()
+            return self._db.get_database_summary()
         except Exception as e:
             raise RuntimeError(f"Failed to fetch database summary: {e}") from e
 
@@ -861,7 +937,7 @@ class FPLDataClient:
         """
         try:
             # Get raw freshness data from database operations
-            freshness_summary = db_ops.get_data_freshness_summary()
+            freshness_summary = self._db.get_data_freshness_summary()
 
             # Format for user consumption
             user_friendly_data = {
@@ -975,9 +1051,9 @@ class FPLDataClient:
 
 
 # Convenience functions for direct access
-def get_raw_players_bootstrap() -> pd.DataFrame:
+def get_raw_players_bootstrap(numeric: bool = False) -> pd.DataFrame:
     """Get complete raw player data from FPL API bootstrap."""
-    return _get_client().get_raw_players_bootstrap()
+    return _get_client().get_raw_players_bootstrap(numeric=numeric)
 
 
 def get_raw_teams_bootstrap() -> pd.DataFrame:
@@ -985,6 +1061,16 @@ def get_raw_teams_bootstrap() -> pd.DataFrame:
     return _get_client().get_raw_teams_bootstrap()
 
 
+def get_team_aliases() -> pd.DataFrame:
+    """Get the team-name alias index."""
+    return _get_client().get_team_aliases()
+
+
+def resolve_team_ids(names: list[str] | pd.Series) -> pd.Series:
+    """Resolve team names as any source spells them to FPL team IDs."""
+    return _get_client().resolve_team_ids(names)
+
+
 def get_raw_events_bootstrap() -> pd.DataFrame:
     """Get complete raw gameweek/event data from FPL API bootstrap."""
     return _get_client().get_raw_events_bootstrap()
@@ -1089,18 +1175,19 @@ def get_my_chip_usage(start_gw: int = None, end_gw: int = None) -> pd.DataFrame:
     return _get_client().get_my_chip_usage(start_gw=start_gw, end_gw=end_gw)
 
 
-def get_my_gameweek_summary(start_gw: int = None, end_gw: int = None) -> pd.DataFrame:
+def get_my_gameweek_summary(start_gw: int = None, end_gw: int = None, columns: list[str] | None = None) -> pd.DataFrame:
     """Get historical gameweek summary data including transfers made, bank, value, etc.
 
     Args:
         start_gw: Starting gameweek (optional)
         end_gw: Ending gameweek (optional)
+        columns: Columns to return (None = all)
 
     Returns:
         DataFrame with gameweek summary data including event_transfers, event_transfers_cost,
         points, rank, bank, value, points_on_bench
     """
-    return _get_client().get_my_gameweek_summary(start_gw=start_gw, end_gw=end_gw)
+    return _get_client().get_my_gameweek_summary(start_gw=start_gw, end_gw=end_gw, columns=columns)
 
 
 def calculate_available_free_transfers(gameweek: int) -> int:
@@ -1153,6 +1240,30 @@ def get_player_xg_xa_rates() -> pd.DataFrame:
     return _get_client().get_player_xg_xa_rates()
 
 
+def get_manager_picks(gameweek: int | None = None, manager_ids: list[int] | None = None) -> pd.DataFrame:
+    """Get stored picks for many managers."""
+    return _get_client().get_manager_picks(gameweek=gameweek, manager_ids=manager_ids)
+
+
+def get_manager_gameweek_summary(
+    start_gw: int = None, end_gw: int = None, manager_ids: list[int] | None = None
+) -> pd.DataFrame:
+    """Get per-gameweek summaries for many managers."""
+    return _get_client().get_manager_gameweek_summary(start_gw=start_gw, end_gw=end_gw, manager_ids=manager_ids)
+
+
+def get_league_entries(league_id: int | None = None) -> pd.DataFrame:
+    """Get stored classic league members."""
+    return _get_client().get_league_entries(league_id=league_id)
+
+
+def get_player_bootstrap_changes(
+    since: datetime | None = None, player_id: int | None = None, fields: list[str] | None = None
+) -> pd.DataFrame:
+    """Get field-level changes between bootstrap refreshes."""
+    return _get_client().get_player_bootstrap_changes(since=since, player_id=player_id, fields=fields)
+
+
 # Global client instance
 _client_instance = None
 
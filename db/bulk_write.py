@@ -0,0 +1,190 @@
+"""Bulk DataFrame inserts through a prepared Core INSERT.
+
+``bulk_insert_frame`` converts a DataFrame to DB-API values one column at a time and
+hands them to the driver's ``executemany`` as tuples for a compiled ``insert()``, in
+chunks of ``FPL_BULK_CHUNK_SIZE`` rows. No dict per row is built and the ORM unit of
+work is not involved. It runs on the caller's connection, so the rows commit or roll
+back with the rest of the caller's transaction.
+
+With ``upsert=True`` the INSERT becomes SQLite's ``ON CONFLICT DO UPDATE`` on the
+table's unique key (``conflict_columns``), updating a stored row only if one of its
+data columns differs. ``delete_missing_keys`` removes the rows a delete-and-reinsert
+would have dropped. Together they give the same table contents while writing only
+the rows that changed.
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import UniqueConstraint, delete, insert, or_, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.inspection import inspect
+
+BULK_CHUNK_SIZE = int(os.getenv("FPL_BULK_CHUNK_SIZE", "5000"))
+
+# Capture/calculation timestamps: not compared when deciding whether an upserted row changed
+CAPTURE_TIME_COLUMNS = frozenset({"as_of_utc", "calculation_date", "last_updated", "analysis_date"})
+
+
+def _python_scalar(value):
+    """numpy scalars as the equivalent Python value, which sqlite3 can bind."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _column_values(series: pd.Series, bind_processor) -> list:
+    """Python values of one column ready for the driver, with NaN/NaT/NA as None."""
+    nulls = series.isna()
+    if nulls.any():
+        series = series.astype(object).where(~nulls, None)
+    values = series.tolist()
+    if series.dtype == object:
+        # Object columns can hold numpy scalars, which sqlite3 cannot bind
+        values = [_python_scalar(value) for value in values]
+    if bind_processor is not None:
+        values = [bind_processor(value) for value in values]
+    return values
+
+
+def _python_default(column):
+    """Value of a column's scalar or callable Python-side default, or None if it has neither."""
+    default = column.default
+    if default is None or default.is_sequence or default.is_clause_element:
+        return None
+    # Callable defaults are wrapped by SQLAlchemy to take an (unused here) execution context
+    return default.arg(None) if default.is_callable else default.arg
+
+
+def _conflict_key(model) -> list:
+    """Columns of the table's first unique constraint, or of its primary key if it has none."""
+    table = model.__table__
+    unique = [constraint for constraint in table.constraints if isinstance(constraint, UniqueConstraint)]
+    return list(unique[0].columns) if unique else list(table.primary_key.columns)
+
+
+def conflict_columns(model) -> list[str]:
+    """Attribute names of the key that upserts of model conflict on."""
+    mapper = inspect(model)
+    return [mapper.get_property_by_column(column).key for column in _conflict_key(model)]
+
+
+def _upsert_statement(model, column_keys: list[str], compared_keys: set[str]):
+    """INSERT ... ON CONFLICT DO UPDATE that skips rows whose compared columns are unchanged."""
+    table = model.__table__
+    statement = sqlite_insert(table)
+    key = _conflict_key(model)
+    updated = [table.c[name] for name in column_keys if table.c[name] not in key and not table.c[name].primary_key]
+    compared = [column for column in updated if column.key in compared_keys]
+    if not compared:
+        return statement.on_conflict_do_nothing(index_elements=key)
+    return statement.on_conflict_do_update(
+        index_elements=key,
+        set_={column: statement.excluded[column.key] for column in updated},
+        where=or_(*(column.is_distinct_from(statement.excluded[column.key]) for column in compared)),
+    )
+
+
+def delete_missing_keys(connection: Connection, model, df: pd.DataFrame, scope: list[str]) -> int:
+    """Delete stored rows inside the frame's scope whose conflict key is not in the frame.
+
+    Args:
+        connection: Connection to delete on; not committed here
+        model: Model class of the table
+        df: Rows about to be upserted
+        scope: Attribute names whose values in df bound the rows being replaced (e.g. ["gameweek"]);
+            empty to replace the whole table
+
+    Returns:
+        Number of rows deleted
+    """
+    key = [name for name in conflict_columns(model) if name not in scope]
+    if not key:
+        return 0
+
+    groups = df.groupby(scope) if scope else [((), df)]
+    deleted = 0
+    for scope_values, group in groups:
+        criteria = [
+            getattr(model, name) == _python_scalar(value) for name, value in zip(scope, scope_values, strict=True)
+        ]
+        keys = group[key].drop_duplicates()
+        if len(key) == 1:
+            missing = getattr(model, key[0]).notin_(keys[key[0]].tolist())
+        else:
+            rows = [tuple(_python_scalar(value) for value in row) for row in keys.itertuples(index=False, name=None)]
+            missing = tuple_(*(getattr(model, name) for name in key)).notin_(rows)
+        deleted += connection.execute(delete(model.__table__).where(*criteria, missing)).rowcount
+    return deleted
+
+
+def bulk_insert_frame(
+    connection: Connection,
+    model,
+    df: pd.DataFrame,
+    datetime_columns: tuple[str, ...] | list[str] = (),
+    chunk_size: int | None = None,
+    upsert: bool = False,
+) -> dict[str, float]:
+    """Insert a DataFrame's rows into a model's table with chunked executemany.
+
+    Frame columns are matched to the model's attribute names, and other columns are
+    ignored, as with Session.bulk_insert_mappings. Model columns missing from the
+    frame get their Python-side default (evaluated once per call) or are left to the
+    database.
+
+    Args:
+        connection: Connection to write on (e.g. session.connection()); not committed here
+        model: Model class whose table receives the rows
+        df: Rows to insert
+        datetime_columns: Columns to parse as datetimes, converted to naive UTC for SQLite
+        chunk_size: Rows per executemany call (defaults to FPL_BULK_CHUNK_SIZE)
+        upsert: Update rows whose conflict key already exists instead of failing, skipping
+            rows whose frame columns (other than capture timestamps) are unchanged
+
+    Returns:
+        Dict with the number of frame rows, rows "written" (inserted or changed), elapsed
+        seconds and rows_per_s
+    """
+    start = time.perf_counter()
+    dialect = connection.dialect
+    n_rows = len(df)
+
+    values: dict[str, list] = {}
+    frame_keys = set()
+    for attr in inspect(model).column_attrs:
+        column = attr.columns[0]
+        bind_processor = column.type.dialect_impl(dialect).bind_processor(dialect)
+        if attr.key in df.columns:
+            series = df[attr.key]
+            if attr.key in datetime_columns:
+                series = pd.to_datetime(series, errors="coerce", utc=True).dt.tz_localize(None)
+            values[column.key] = _column_values(series, bind_processor)
+            frame_keys.add(column.key)
+        elif (default := _python_default(column)) is not None:
+            value = bind_processor(default) if bind_processor is not None else default
+            values[column.key] = [value] * n_rows
+
+    if not values:
+        n_rows = 0
+    written = 0
+    if n_rows:
+        if upsert:
+            compared = {column.key for column in model.__table__.columns if column.key in frame_keys}
+            statement = _upsert_statement(model, list(values), compared - CAPTURE_TIME_COLUMNS)
+        else:
+            statement = insert(model.__table__)
+        compiled = statement.compile(dialect=dialect, column_keys=list(values))
+        rows = list(zip(*(values[key] for key in compiled.positiontup), strict=True))
+        chunk_size = chunk_size or BULK_CHUNK_SIZE
+        for offset in range(0, n_rows, chunk_size):
+            written += connection.exec_driver_sql(compiled.string, rows[offset : offset + chunk_size]).rowcount
+
+    seconds = time.perf_counter() - start
+    return {
+        "rows": n_rows,
+        "written": written,
+        "seconds": seconds,
+        "rows_per_s": n_rows / seconds if seconds else 0.0,
+    }
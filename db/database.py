@@ -1,9 +1,11 @@
 """Database configuration and session management using SQLAlchemy 2.0."""
 
 import os
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 
@@ -17,6 +19,67 @@ class Base(DeclarativeBase):
 DATABASE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "fpl_data.db")
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
+# SQLite PRAGMA settings per workload, applied to every new connection.
+# WAL lets FPLDataClient readers keep reading while main writes; synchronous=NORMAL is durable
+# under WAL except for the last commits before a power loss. cache_size is in KiB when negative.
+SQLITE_PROFILES: dict[str, dict[str, Any]] = {
+    # main / backfills: bulk writes, wait for readers rather than fail
+    "ingest": {
+        "busy_timeout": 30000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    # Derived processing and large joins/sorts over the raw tables
+    "analytics": {
+        "busy_timeout": 10000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -262144,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+    },
+    # Client-side readers: writes refused, pages served from the memory map, short cache, patient while
+    # main writes. The journal mode is left to the writers, as switching it needs write access.
+    "readonly": {
+        "query_only": "ON",
+        "busy_timeout": 60000,
+        "synchronous": "NORMAL",
+        "cache_size": -16384,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+    },
+    # No PRAGMAs: SQLite's built-in settings (a journal_mode=WAL set by another profile persists in the file)
+    "default": {},
+}
+DEFAULT_SQLITE_PROFILE = "ingest"
+
+
+def _sqlite_profile_from_env() -> str:
+    profile = os.getenv("FPL_SQLITE_PROFILE", DEFAULT_SQLITE_PROFILE)
+    return profile if profile in SQLITE_PROFILES else DEFAULT_SQLITE_PROFILE
+
+
+_sqlite_profile = {"name": _sqlite_profile_from_env()}
+
+
+def apply_sqlite_profile(dbapi_connection, profile: str) -> None:
+    """Run a profile's PRAGMA statements on a raw sqlite3 connection.
+
+    Args:
+        dbapi_connection: DB-API connection (as passed to a "connect" event listener)
+        profile: Key of SQLITE_PROFILES
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in SQLITE_PROFILES[profile].items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+    finally:
+        cursor.close()
+
+
 # Create engine with SQLite-specific settings
 engine = create_engine(
     DATABASE_URL,
@@ -25,6 +88,69 @@ engine = create_engine(
     connect_args={"check_same_thread": False},  # Allow multi-threading with SQLite
 )
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    apply_sqlite_profile(dbapi_connection, _sqlite_profile["name"])
+
+
+def create_profiled_engine(profile: str):
+    """Separate engine on the FPL database whose connections get one profile; the shared engine is left as is.
+
+    Args:
+        profile: Key of SQLITE_PROFILES
+
+    Raises:
+        ValueError: If profile is not a key of SQLITE_PROFILES
+    """
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile '{profile}' (expected one of {tuple(SQLITE_PROFILES)})")
+    profiled = create_engine(DATABASE_URL, pool_pre_ping=True, connect_args={"check_same_thread": False})
+    event.listen(profiled, "connect", lambda dbapi_connection, _: apply_sqlite_profile(dbapi_connection, profile))
+    return profiled
+
+
+def set_sqlite_profile(profile: str) -> None:
+    """Switch the SQLite performance profile (see SQLITE_PROFILES) for this process.
+
+    Pooled connections are discarded so every later connection uses the new profile.
+
+    Raises:
+        ValueError: If profile is not a key of SQLITE_PROFILES
+    """
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile '{profile}' (expected one of {tuple(SQLITE_PROFILES)})")
+    _sqlite_profile["name"] = profile
+    engine.dispose()
+
+
+def get_sqlite_profile() -> str:
+    """Name of the SQLite performance profile applied to new connections."""
+    return _sqlite_profile["name"]
+
+
+def use_sqlite_profile(profile: str) -> None:
+    """Select the SQLite profile for a workload, unless FPL_SQLITE_PROFILE pins one for the process.
+
+    Raises:
+        ValueError: If profile is not a key of SQLITE_PROFILES
+    """
+    if "FPL_SQLITE_PROFILE" not in os.environ and get_sqlite_profile() != profile:
+        set_sqlite_profile(profile)
+
+
+@contextmanager
+def sqlite_profile(profile: str) -> Iterator[None]:
+    """Use a workload's SQLite profile (see use_sqlite_profile) for the duration of a block."""
+    previous = get_sqlite_profile()
+    use_sqlite_profile(profile)
+    try:
+        yield
+    finally:
+        if get_sqlite_profile() != previous:
+            set_sqlite_profile(previous)
+
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -47,12 +173,17 @@ def create_tables() -> None:
     """Create all tables in the database."""
     # Import models to register them with Base.metadata
     from . import models_derived, models_raw  # noqa: F401
+    from .numeric_views import create_numeric_views
 
     Base.metadata.create_all(bind=engine)
+    create_numeric_views(engine)
 
 
 def drop_tables() -> None:
     """Drop all tables in the database."""
+    from .numeric_views import drop_numeric_views
+
+    drop_numeric_views(engine)
     Base.metadata.drop_all(bind=engine)
 
 
@@ -7,7 +7,7 @@ everything the API provides.
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Float, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .database import Base
@@ -198,6 +198,21 @@ class RawTeamBootstrap(Base):
     as_of_utc: Mapped[datetime] = mapped_column(DateTime, index=True)
 
 
+class RawTeamAlias(Base):
+    """Normalized team-name index for resolving external sources to FPL team IDs.
+
+    Rebuilt with raw_teams_bootstrap: each team's name and short name plus the curated
+    aliases in db/team_aliases.py, keyed by normalize_team_names.
+    """
+
+    __tablename__ = "raw_team_aliases"
+
+    alias_key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    alias: Mapped[str] = mapped_column(String(100))
+    team_id: Mapped[int] = mapped_column(Integer, index=True)
+    source: Mapped[str] = mapped_column(String(20))  # name, short_name or curated
+
+
 class RawEventBootstrap(Base):
     """Complete FPL API events (gameweeks) data from bootstrap-static endpoint."""
 
@@ -533,6 +548,94 @@ class RawMyGameweekSummary(Base):
     __table_args__ = (UniqueConstraint("manager_id", "event", name="uq_manager_event"),)
 
 
+class RawManagerPicks(Base):
+    """Team selections for any number of managers per gameweek (league-scale ingestion).
+
+    One row per (manager, gameweek, squad position). Kept deliberately narrow - no
+    per-row timestamp, since the matching raw_manager_gameweek_summary row records
+    when the gameweek was captured - and stored WITHOUT ROWID so the composite
+    primary key is the table's clustered index.
+    """
+
+    __tablename__ = "raw_manager_picks"
+
+    # Composite primary key
+    manager_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    event: Mapped[int] = mapped_column(Integer, primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)  # 1-15, team position
+
+    player_id: Mapped[int] = mapped_column(Integer)
+    multiplier: Mapped[int] = mapped_column(Integer)  # 0=benched, 1, 2=captain, 3=triple captain
+    is_captain: Mapped[bool] = mapped_column(Boolean)
+    is_vice_captain: Mapped[bool] = mapped_column(Boolean)
+
+    # "Who owns/captains player X in GW N" lookups
+    __table_args__ = (
+        Index("ix_raw_manager_picks_event_player", "event", "player_id"),
+        {"sqlite_with_rowid": False},
+    )
+
+
+class RawManagerGameweekSummary(Base):
+    """Per-gameweek summary (entry_history) for any number of managers.
+
+    Filled from /entry/{id}/event/{gw}/picks/ and, for past gameweeks, from
+    /entry/{id}/history/. One row per (manager, gameweek).
+    """
+
+    __tablename__ = "raw_manager_gameweek_summary"
+
+    # Composite primary key
+    manager_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    event: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Performance
+    points: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    total_points: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    overall_rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # Financial
+    bank: Mapped[int | None] = mapped_column(Integer, nullable=True)  # In 0.1M units
+    value: Mapped[int | None] = mapped_column(Integer, nullable=True)  # In 0.1M units
+
+    # Transfers and chips
+    event_transfers: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    event_transfers_cost: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    points_on_bench: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    active_chip: Mapped[str | None] = mapped_column(String(20), nullable=True)  # wildcard, freehit, bboost, 3xc
+
+    # Metadata
+    as_of_utc: Mapped[datetime] = mapped_column(DateTime)
+
+    __table_args__ = (
+        Index("ix_raw_manager_gameweek_summary_event_rank", "event", "overall_rank"),
+        {"sqlite_with_rowid": False},
+    )
+
+
+class RawLeagueEntries(Base):
+    """Members of a classic league from /leagues-classic/{id}/standings/.
+
+    Doubles as the manager list for league-scale ingestion, so a resumed run does
+    not need to page through the standings again.
+    """
+
+    __tablename__ = "raw_league_entries"
+
+    # Composite primary key
+    league_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    manager_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    entry_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    player_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # Metadata
+    as_of_utc: Mapped[datetime] = mapped_column(DateTime)
+
+
 class RawPlayerGameweekPerformance(Base):
     """Individual player performance data per gameweek from FPL API."""
 
@@ -642,6 +745,27 @@ class RawPlayerGameweekSnapshot(Base):
     as_of_utc: Mapped[datetime] = mapped_column(DateTime, index=True)
 
 
+class RawPlayerBootstrapChange(Base):
+    """Field-level change log for raw_players_bootstrap.
+
+    APPEND-ONLY: one row per (player, field) whose value changed between two bootstrap
+    saves, e.g. now_cost on a price change or news on an injury update. Values are
+    stored as text; as_of_utc is the timestamp of the bootstrap that introduced the change.
+    """
+
+    __tablename__ = "raw_player_bootstrap_changes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    player_id: Mapped[int] = mapped_column(Integer, index=True)
+    field: Mapped[str] = mapped_column(String(50))
+    old_value: Mapped[str | None] = mapped_column(Text, nullable=True)
+    new_value: Mapped[str | None] = mapped_column(Text, nullable=True)
+    as_of_utc: Mapped[datetime] = mapped_column(DateTime, index=True)
+
+    # "All price/news changes since X" lookups
+    __table_args__ = (Index("ix_raw_player_bootstrap_changes_field_as_of", "field", "as_of_utc"),)
+
+
 class RawBettingOdds(Base):
     """Premier League betting odds data from football-data.co.uk.
 
@@ -0,0 +1,117 @@
+"""Typed numeric reads of the FPL stats the API encodes as strings.
+
+The FPL API returns decimals such as form, ict_index and expected_goals as strings, and the raw
+tables store them verbatim (String(10)) to mirror the API. Each table listed here also gets a
+``<table>_numeric`` view with those columns cast to REAL, and ``numeric_select`` builds the same
+projection for pandas reads, so analytical code gets floats without re-parsing in Python.
+"""
+
+import pandas as pd
+from sqlalchemy import Float, Select, cast, func, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.inspection import inspect
+
+from . import models_raw
+
+# Model -> string-encoded columns that hold decimal values
+NUMERIC_TEXT_COLUMNS: dict[type, tuple[str, ...]] = {
+    models_raw.RawPlayerBootstrap: (
+        "form",
+        "selected_by_percent",
+        "points_per_game",
+        "value_form",
+        "value_season",
+        "influence",
+        "creativity",
+        "threat",
+        "ict_index",
+        "expected_goals",
+        "expected_assists",
+        "expected_goal_involvements",
+        "expected_goals_conceded",
+        "ep_this",
+        "ep_next",
+    ),
+    models_raw.RawPlayerGameweekPerformance: (
+        "influence",
+        "creativity",
+        "threat",
+        "ict_index",
+        "expected_goals",
+        "expected_assists",
+        "expected_goal_involvements",
+        "expected_goals_conceded",
+    ),
+    models_raw.RawPlayerGameweekSnapshot: ("ep_this", "ep_next", "form"),
+}
+
+
+def numeric_view_name(model) -> str:
+    """Name of the numeric view for a raw model's table."""
+    return f"{model.__tablename__}_numeric"
+
+
+def numeric_select(model, *criteria, use_column_names: bool = False) -> Select:
+    """Select every column of a raw model with its string-encoded decimals cast to floats.
+
+    Empty strings become NULL rather than 0.0.
+
+    Args:
+        model: Raw model class listed in NUMERIC_TEXT_COLUMNS
+        *criteria: Optional WHERE clauses on the model's attributes
+        use_column_names: Label columns with their database names (e.g. "id", "team") instead of the
+            model attribute names (e.g. "player_id", "team_id") that the ORM getters return
+
+    Returns:
+        SQLAlchemy select over the model's table
+    """
+    numeric_columns = NUMERIC_TEXT_COLUMNS[model]
+    selected = []
+    for attr in inspect(model).column_attrs:
+        column = attr.columns[0]
+        label = column.name if use_column_names else attr.key
+        if attr.key in numeric_columns:
+            selected.append(cast(func.nullif(column, ""), Float).label(label))
+        else:
+            selected.append(column.label(label))
+    return select(*selected).where(*criteria)
+
+
+def read_numeric_frame(bind: Engine | Connection, model, *criteria, use_column_names: bool = False) -> pd.DataFrame:
+    """Read a raw model into a DataFrame with its string-encoded decimals as float64 columns.
+
+    Args:
+        bind: Engine or connection to read from
+        model: Raw model class listed in NUMERIC_TEXT_COLUMNS
+        *criteria: Optional WHERE clauses on the model's attributes
+        use_column_names: Label columns with their database names instead of the model attribute names
+
+    Returns:
+        DataFrame with one row per matching record
+    """
+    query = numeric_select(model, *criteria, use_column_names=use_column_names)
+    # Explicit dtypes keep all-NULL float columns float64 instead of object
+    dtypes = {}
+    for attr in inspect(model).column_attrs:
+        column = attr.columns[0]
+        if attr.key in NUMERIC_TEXT_COLUMNS[model] or isinstance(column.type, Float):
+            dtypes[column.name if use_column_names else attr.key] = "float64"
+    return pd.read_sql_query(query, bind, dtype=dtypes)
+
+
+def create_numeric_views(bind: Engine) -> None:
+    """(Re)create the ``<table>_numeric`` views for every model in NUMERIC_TEXT_COLUMNS."""
+    with bind.begin() as connection:
+        for model in NUMERIC_TEXT_COLUMNS:
+            query = numeric_select(model, use_column_names=True)
+            compiled = query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+            view_name = numeric_view_name(model)
+            connection.execute(text(f"DROP VIEW IF EXISTS {view_name}"))
+            connection.execute(text(f"CREATE VIEW {view_name} AS {compiled}"))
+
+
+def drop_numeric_views(bind: Engine) -> None:
+    """Drop the numeric views so their tables can be dropped."""
+    with bind.begin() as connection:
+        for model in NUMERIC_TEXT_COLUMNS:
+            connection.execute(text(f"DROP VIEW IF EXISTS {numeric_view_name(model)}"))
@@ -1,13 +1,28 @@
 """Database operations for raw and derived data only - lean architecture."""
 
+import os
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import func
+from sqlalchemy import Boolean, DateTime, Float, Integer, Select, func, select
 from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import Session, sessionmaker
 
 from . import models_derived, models_raw
+from .bulk_write import bulk_insert_frame, delete_missing_keys
 from .database import SessionLocal, get_session
+from .numeric_views import read_numeric_frame
+from .team_aliases import build_team_alias_index
+
+# How per-gameweek saves replace stored rows (FPL_WRITE_MODE): "replace" deletes the gameweek and
+# re-inserts it; "upsert" writes only new or changed rows with INSERT ... ON CONFLICT DO UPDATE
+WRITE_MODES = ("replace", "upsert")
+
+
+def _write_mode_from_env() -> str:
+    mode = os.getenv("FPL_WRITE_MODE", "replace")
+    return mode if mode in WRITE_MODES else "replace"
 
 
 def convert_datetime_columns(df: pd.DataFrame, datetime_columns: list[str]) -> pd.DataFrame:
@@ -28,40 +43,287 @@ def convert_datetime_columns(df: pd.DataFrame, datetime_columns: list[str]) -> p
     return df_copy
 
 
-def model_to_dataframe(model_class, query_result) -> pd.DataFrame:
-    """Convert SQLAlchemy model query result to pandas DataFrame."""
-    if not query_result:
-        return pd.DataFrame()
+def _delete_manager_events(session, model, df: pd.DataFrame) -> None:
+    """Delete rows of a (manager_id, event)-keyed model for every pair present in df."""
+    for event, managers in df.groupby("event")["manager_id"]:
+        manager_ids = [int(manager_id) for manager_id in managers.unique()]
+        session.query(model).filter(model.event == int(event), model.manager_id.in_(manager_ids)).delete(
+            synchronize_session=False
+        )
+    session.flush()
+
 
-    # Get attribute names from the model (these are the Python property names)
-    mapper = inspect(model_class)
-    # Use the actual attribute names that exist on the Python object
-    attributes = [attr.key for attr in mapper.attrs]
+def _attribute_select(model):
+    """Select every column of a model labelled with its attribute name (player_id, not id)."""
+    return select(*(attr.columns[0].label(attr.key) for attr in inspect(model).column_attrs))
 
-    # Convert model objects to dictionaries
-    data = []
-    for obj in query_result:
-        row_data = {attr: getattr(obj, attr) for attr in attributes}
-        data.append(row_data)
 
-    return pd.DataFrame(data)
+def read_model_frame(bind, model, *criteria, query: Select | None = None) -> pd.DataFrame:
+    """Read a model's rows straight from the cursor into a DataFrame, without ORM instances.
+
+    Args:
+        bind: Engine or connection (e.g. session.connection()) to read from
+        model: Model class; columns are labelled with its attribute names
+        *criteria: Optional WHERE clauses on the model's attributes
+        query: Select to run instead of every column of the model (joins, ordering)
+
+    Returns:
+        DataFrame with one row per matching record (Float columns as float64), or an empty
+        DataFrame without columns if none match
+    """
+    query = (_attribute_select(model) if query is None else query).where(*criteria)
+    # Explicit dtypes keep all-NULL float columns float64 instead of object
+    selected = set(query.selected_columns.keys())
+    dtypes = {
+        attr.key: "float64"
+        for attr in inspect(model).column_attrs
+        if attr.key in selected and isinstance(attr.columns[0].type, Float)
+    }
+    df = pd.read_sql_query(query, bind, dtype=dtypes)
+    return df if not df.empty else pd.DataFrame()
+
+
+def _canonical_frame(model, df: pd.DataFrame) -> pd.DataFrame:
+    """Cast a model's columns to one dtype per SQL type so stored and incoming rows compare equal.
+
+    Numbers (including integers and booleans) become float64, datetimes naive UTC datetime64 and
+    text object with None for NULL. Columns missing from df are treated as NULL, matching what an
+    insert would store.
+    """
+    columns = {}
+    for attr in inspect(model).column_attrs:
+        values = df[attr.key] if attr.key in df.columns else pd.Series(None, index=df.index, dtype=object)
+        sql_type = attr.columns[0].type
+        if isinstance(sql_type, DateTime):
+            # Stored as naive UTC with microsecond precision
+            values = pd.to_datetime(values, utc=True, errors="coerce").dt.tz_localize(None).dt.floor("us")
+        elif isinstance(sql_type, Integer | Float | Boolean):
+            if values.dtype.kind not in "biuf":
+                # Nullable extension dtypes and object columns holding None
+                values = pd.to_numeric(values.astype(object), errors="coerce")
+            values = values.astype("float64", copy=False)
+        else:
+            if values.dtype != object:
+                values = values.astype(object)
+            if values.hasnans:
+                values = values.where(values.notna(), None)
+        columns[attr.key] = values
+    return pd.DataFrame(columns, index=df.index)
+
+
+def diff_model_rows(
+    model, existing: pd.DataFrame, incoming: pd.DataFrame, key: str, ignore: tuple[str, ...] = ("as_of_utc",)
+) -> dict:
+    """Compare stored and incoming rows of a model by row hash.
+
+    Rows are hashed with pandas' hash_pandas_object over every column except the key and
+    ignored columns; only rows whose hashes differ are compared field by field.
+
+    Args:
+        model: SQLAlchemy model both frames follow (attribute names as columns)
+        existing: Rows currently stored
+        incoming: Rows about to be saved
+        key: Primary key attribute identifying a row in both frames
+        ignore: Columns excluded from the comparison (e.g. the capture timestamp)
+
+    Returns:
+        Dict with "inserted", "updated" and "deleted" key lists and a "changes" DataFrame
+        of (key, field, old_value, new_value) with values rendered as text
+    """
+    old = _canonical_frame(model, existing).set_index(key)
+    new = _canonical_frame(model, incoming).set_index(key)
+    if new.index.dtype.kind == "f":
+        # Integer keys were canonicalized to float64; primary keys are never NULL
+        old.index, new.index = old.index.astype("int64"), new.index.astype("int64")
+    compared = [col for col in new.columns if col not in ignore]
+
+    common = new.index.intersection(old.index)
+    old_hashes = pd.util.hash_pandas_object(old.loc[common, compared], index=False).to_numpy()
+    new_hashes = pd.util.hash_pandas_object(new.loc[common, compared], index=False).to_numpy()
+    updated = common[old_hashes != new_hashes]
+
+    # Field-level comparison on the (few) changed rows only, with NULLs as None
+    before = old.loc[updated, compared].astype(object)
+    after = new.loc[updated, compared].astype(object)
+    before_values = before.where(before.notna(), None).to_numpy()
+    after_values = after.where(after.notna(), None).to_numpy()
+    rows, cols = np.nonzero(before_values != after_values)
+    sql_types = {attr.key: attr.columns[0].type for attr in inspect(model).column_attrs}
+
+    changes = pd.DataFrame(
+        {
+            key: updated[rows],
+            "field": [compared[col] for col in cols],
+            "old_value": [
+                _change_text(before_values[r, c], sql_types[compared[c]]) for r, c in zip(rows, cols, strict=True)
+            ],
+            "new_value": [
+                _change_text(after_values[r, c], sql_types[compared[c]]) for r, c in zip(rows, cols, strict=True)
+            ],
+        }
+    )
+
+    return {
+        "inserted": new.index.difference(old.index).tolist(),
+        "updated": updated.tolist(),
+        "deleted": old.index.difference(new.index).tolist(),
+        "changes": changes,
+    }
+
+
+def _change_text(value, sql_type) -> str | None:
+    """Render a canonical value as change-log text in its column's type (NULL stays None)."""
+    if value is None:
+        return None
+    if isinstance(sql_type, Boolean):
+        return str(bool(value))
+    if isinstance(sql_type, Integer):
+        return str(int(value))
+    return str(value)
 
 
 class DatabaseOperations:
     """Database operations class for raw + derived data architecture."""
 
-    def __init__(self):
-        self.session_factory = SessionLocal
+    def __init__(self, session_factory: sessionmaker | None = None):
+        """Initialize database operations.
+
+        Args:
+            session_factory: Sessions for every read and write of this instance (e.g. bound to an engine of
+                create_profiled_engine). By default the shared engine of db.database is used.
+        """
+        self.session_factory = session_factory or SessionLocal
+        self._own_sessions = session_factory is not None
+        # Table name -> rows/seconds/rows_per_s of its latest bulk insert
+        self.write_stats: dict[str, dict[str, float]] = {}
+        self.write_mode = _write_mode_from_env()
+
+    def _session(self) -> Session:
+        """New session from this instance's session_factory if one was given, else from get_session."""
+        return self.session_factory() if self._own_sessions else next(get_session())
+
+    def _bulk_insert(
+        self, session, model, df: pd.DataFrame, datetime_columns: list[str] | None = None, upsert: bool = False
+    ) -> None:
+        """Insert df into model's table (upsert: update rows whose key exists) in the session's transaction."""
+        stats = bulk_insert_frame(session.connection(), model, df, datetime_columns or [], upsert=upsert)
+        self.write_stats[model.__tablename__] = stats
+
+    def _upsert(
+        self, session, model, df: pd.DataFrame, scope: list[str], datetime_columns: list[str] | None = None
+    ) -> None:
+        """Upsert df on model's unique key and delete the rows within scope that df no longer contains.
+
+        Args:
+            session: Session whose transaction the writes join
+            model: Model class of the table
+            df: Rows to store
+            scope: Columns whose values in df bound the rows being replaced ([] = whole table)
+            datetime_columns: Columns to parse as datetimes
+        """
+        if df.empty:
+            return
+        connection = session.connection()
+        deleted = delete_missing_keys(connection, model, df, scope)
+        stats = bulk_insert_frame(connection, model, df, datetime_columns or [], upsert=True)
+        self.write_stats[model.__tablename__] = {**stats, "deleted": deleted}
+        print(
+            f"  🔁 Upserted {model.__tablename__}: {stats['written']} of {stats['rows']} rows written, "
+            f"{deleted} removed"
+        )
+
+    def query_frame(
+        self,
+        model,
+        *,
+        equals: dict[str, object] | None = None,
+        ranges: dict[str, tuple[object | None, object | None]] | None = None,
+        isin: dict[str, list] | None = None,
+        order_by: list[str] | None = None,
+        columns: list[str] | None = None,
+        distinct: bool = False,
+    ) -> pd.DataFrame:
+        """Read a filtered, ordered projection of a table, with every option compiled into the SQL.
+
+        Args:
+            model: Model class to read
+            equals: Column -> value that rows must equal
+            ranges: Column -> (low, high) inclusive bounds; None leaves that side open
+            isin: Column -> list of allowed values
+            order_by: Columns to sort by (ascending)
+            columns: Columns to return (None = every column)
+            distinct: Drop duplicate rows in SQL
+
+        Returns:
+            DataFrame with the matching rows and requested columns, or an empty DataFrame
+            without columns if none match
+
+        Raises:
+            ValueError: If a column name is not an attribute of the model
+        """
+        attributes = {attr.key: attr.columns[0] for attr in inspect(model).column_attrs}
+        names = [
+            *(equals or {}),
+            *(ranges or {}),
+            *(isin or {}),
+            *(order_by or []),
+            *(columns or []),
+        ]
+        unknown = sorted(set(names) - set(attributes))
+        if unknown:
+            raise ValueError(f"Unknown columns for {model.__tablename__}: {unknown}")
+
+        criteria = [attributes[name] == value for name, value in (equals or {}).items()]
+        for name, (low, high) in (ranges or {}).items():
+            if low is not None:
+                criteria.append(attributes[name] >= low)
+            if high is not None:
+                criteria.append(attributes[name] <= high)
+        criteria.extend(attributes[name].in_(values) for name, values in (isin or {}).items())
+
+        query = select(*(attributes[name].label(name) for name in columns or attributes))
+        if distinct:
+            query = query.distinct()
+        query = query.order_by(*(attributes[name] for name in order_by or []))
+
+        with self._session() as session:
+            return read_model_frame(session.connection(), model, *criteria, query=query)
 
     # Raw data operations for complete API capture
-    def save_raw_players_bootstrap(self, df: pd.DataFrame) -> None:
-        """Save raw players bootstrap DataFrame to database."""
+    def save_raw_players_bootstrap(self, df: pd.DataFrame) -> dict[str, int]:
+        """Save raw players bootstrap DataFrame, writing only the players whose fields changed.
+
+        Stored and incoming rows are hashed (ignoring as_of_utc): changed players are updated
+        in place, new players inserted and players no longer in the bootstrap deleted. Each
+        changed field is appended to raw_player_bootstrap_changes, so a player's as_of_utc
+        is the capture time of its last change.
+
+        Returns:
+            Dict with inserted/updated/deleted/unchanged player counts and field "changes"
+        """
+        model = models_raw.RawPlayerBootstrap
         session = self.session_factory()
         try:
-            session.query(models_raw.RawPlayerBootstrap).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc", "news_added"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawPlayerBootstrap, records)
+            existing = read_model_frame(session.connection(), model)
+            diff = diff_model_rows(model, existing, df, key="player_id")
+
+            if diff["deleted"]:
+                session.query(model).filter(model.player_id.in_(diff["deleted"])).delete(synchronize_session=False)
+            rows_by_id = df.set_index("player_id", drop=False)
+            if diff["updated"] or diff["inserted"]:
+                # Changed players overwrite their stored row on the primary key, new ones are inserted
+                self._bulk_insert(
+                    session,
+                    model,
+                    rows_by_id.loc[diff["updated"] + diff["inserted"]],
+                    ["as_of_utc", "news_added"],
+                    upsert=True,
+                )
+
+            changes = diff["changes"]
+            if not changes.empty:
+                changes["as_of_utc"] = changes["player_id"].map(rows_by_id["as_of_utc"])
+                self._bulk_insert(session, models_raw.RawPlayerBootstrapChange, changes, ["as_of_utc"])
             session.commit()
         except Exception:
             session.rollback()
@@ -69,20 +331,62 @@ class DatabaseOperations:
         finally:
             session.close()
 
-    def get_raw_players_bootstrap(self) -> pd.DataFrame:
-        """Get raw players bootstrap data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawPlayerBootstrap).all()
-            return model_to_dataframe(models_raw.RawPlayerBootstrap, query_result)
+        return {
+            "inserted": len(diff["inserted"]),
+            "updated": len(diff["updated"]),
+            "deleted": len(diff["deleted"]),
+            "unchanged": len(df) - len(diff["inserted"]) - len(diff["updated"]),
+            "changes": len(changes),
+        }
+
+    def get_raw_players_bootstrap(self, numeric: bool = False) -> pd.DataFrame:
+        """Get raw players bootstrap data as DataFrame.
+
+        Args:
+            numeric: Return string-encoded stats (form, selected_by_percent, xG, ...) as floats
+
+        Returns:
+            DataFrame with one row per player
+        """
+        with self._session() as session:
+            if numeric:
+                return read_numeric_frame(session.connection(), models_raw.RawPlayerBootstrap)
+            return read_model_frame(session.connection(), models_raw.RawPlayerBootstrap)
+
+    def get_raw_player_bootstrap_changes(
+        self, since: datetime | None = None, player_id: int | None = None, fields: list[str] | None = None
+    ) -> pd.DataFrame:
+        """Get the field-level change log of raw_players_bootstrap.
+
+        Args:
+            since: Only changes captured at or after this (naive UTC) time
+            player_id: Filter to specific player (None = all players)
+            fields: Filter to specific fields, e.g. ["now_cost", "news"] (None = all fields)
+
+        Returns:
+            DataFrame with player_id, field, old_value, new_value, as_of_utc ordered by capture time
+        """
+        model = models_raw.RawPlayerBootstrapChange
+        criteria = []
+        if since is not None:
+            criteria.append(model.as_of_utc >= since)
+        if player_id is not None:
+            criteria.append(model.player_id == player_id)
+        if fields:
+            criteria.append(model.field.in_(fields))
+
+        with self._session() as session:
+            query = _attribute_select(model).order_by(model.as_of_utc, model.id)
+            return read_model_frame(session.connection(), model, *criteria, query=query)
 
     def save_raw_teams_bootstrap(self, df: pd.DataFrame) -> None:
-        """Save raw teams bootstrap DataFrame to database."""
+        """Save raw teams bootstrap DataFrame to database and rebuild the team alias index."""
         session = self.session_factory()
         try:
             session.query(models_raw.RawTeamBootstrap).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawTeamBootstrap, records)
+            self._bulk_insert(session, models_raw.RawTeamBootstrap, df, ["as_of_utc"])
+            session.query(models_raw.RawTeamAlias).delete()
+            self._bulk_insert(session, models_raw.RawTeamAlias, build_team_alias_index(df))
             session.commit()
         except Exception:
             session.rollback()
@@ -92,18 +396,43 @@ class DatabaseOperations:
 
     def get_raw_teams_bootstrap(self) -> pd.DataFrame:
         """Get raw teams bootstrap data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawTeamBootstrap).all()
-            return model_to_dataframe(models_raw.RawTeamBootstrap, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawTeamBootstrap)
+
+    def rebuild_team_aliases(self) -> pd.DataFrame:
+        """Rebuild the team alias index from the stored raw_teams_bootstrap and the current TEAM_NAME_ALIASES.
+
+        Runs that skip an unchanged bootstrap call this so curated spellings added since the teams were
+        last saved take effect.
+
+        Returns:
+            The rebuilt index (alias_key, alias, team_id, source); empty if no teams are stored
+        """
+        session = self.session_factory()
+        try:
+            teams_df = read_model_frame(session.connection(), models_raw.RawTeamBootstrap)
+            alias_index = build_team_alias_index(teams_df) if not teams_df.empty else pd.DataFrame()
+            session.query(models_raw.RawTeamAlias).delete()
+            self._bulk_insert(session, models_raw.RawTeamAlias, alias_index)
+            session.commit()
+            return alias_index
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def get_team_aliases(self) -> pd.DataFrame:
+        """Get the normalized team-name index (alias_key, alias, team_id, source) as DataFrame."""
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawTeamAlias)
 
     def save_raw_events_bootstrap(self, df: pd.DataFrame) -> None:
         """Save raw events bootstrap DataFrame to database."""
         session = self.session_factory()
         try:
             session.query(models_raw.RawEventBootstrap).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc", "deadline_time", "release_time"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawEventBootstrap, records)
+            self._bulk_insert(session, models_raw.RawEventBootstrap, df, ["as_of_utc", "deadline_time", "release_time"])
             session.commit()
         except Exception:
             session.rollback()
@@ -113,18 +442,15 @@ class DatabaseOperations:
 
     def get_raw_events_bootstrap(self) -> pd.DataFrame:
         """Get raw events bootstrap data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawEventBootstrap).all()
-            return model_to_dataframe(models_raw.RawEventBootstrap, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawEventBootstrap)
 
     def save_raw_fixtures(self, df: pd.DataFrame) -> None:
         """Save raw fixtures DataFrame to database."""
         session = self.session_factory()
         try:
             session.query(models_raw.RawFixtures).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc", "kickoff_time"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawFixtures, records)
+            self._bulk_insert(session, models_raw.RawFixtures, df, ["as_of_utc", "kickoff_time"])
             session.commit()
         except Exception:
             session.rollback()
@@ -134,18 +460,15 @@ class DatabaseOperations:
 
     def get_raw_fixtures(self) -> pd.DataFrame:
         """Get raw fixtures data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawFixtures).all()
-            return model_to_dataframe(models_raw.RawFixtures, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawFixtures)
 
     def save_raw_game_settings(self, df: pd.DataFrame) -> None:
         """Save raw game settings DataFrame to database."""
         session = self.session_factory()
         try:
             session.query(models_raw.RawGameSettings).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawGameSettings, records)
+            self._bulk_insert(session, models_raw.RawGameSettings, df, ["as_of_utc"])
             session.commit()
         except Exception:
             session.rollback()
@@ -155,18 +478,15 @@ class DatabaseOperations:
 
     def get_raw_game_settings(self) -> pd.DataFrame:
         """Get raw game settings data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawGameSettings).all()
-            return model_to_dataframe(models_raw.RawGameSettings, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawGameSettings)
 
     def save_raw_element_stats(self, df: pd.DataFrame) -> None:
         """Save raw element stats DataFrame to database."""
         session = self.session_factory()
         try:
             session.query(models_raw.RawElementStats).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawElementStats, records)
+            self._bulk_insert(session, models_raw.RawElementStats, df, ["as_of_utc"])
             session.commit()
         except Exception:
             session.rollback()
@@ -176,18 +496,15 @@ class DatabaseOperations:
 
     def get_raw_element_stats(self) -> pd.DataFrame:
         """Get raw element stats data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawElementStats).all()
-            return model_to_dataframe(models_raw.RawElementStats, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawElementStats)
 
     def save_raw_element_types(self, df: pd.DataFrame) -> None:
         """Save raw element types DataFrame to database."""
         session = self.session_factory()
         try:
             session.query(models_raw.RawElementTypes).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawElementTypes, records)
+            self._bulk_insert(session, models_raw.RawElementTypes, df, ["as_of_utc"])
             session.commit()
         except Exception:
             session.rollback()
@@ -197,18 +514,15 @@ class DatabaseOperations:
 
     def get_raw_element_types(self) -> pd.DataFrame:
         """Get raw element types data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawElementTypes).all()
-            return model_to_dataframe(models_raw.RawElementTypes, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawElementTypes)
 
     def save_raw_chips(self, df: pd.DataFrame) -> None:
         """Save raw chips DataFrame to database."""
         session = self.session_factory()
         try:
             session.query(models_raw.RawChips).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawChips, records)
+            self._bulk_insert(session, models_raw.RawChips, df, ["as_of_utc"])
             session.commit()
         except Exception:
             session.rollback()
@@ -218,18 +532,15 @@ class DatabaseOperations:
 
     def get_raw_chips(self) -> pd.DataFrame:
         """Get raw chips data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawChips).all()
-            return model_to_dataframe(models_raw.RawChips, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawChips)
 
     def save_raw_phases(self, df: pd.DataFrame) -> None:
         """Save raw phases DataFrame to database."""
         session = self.session_factory()
         try:
             session.query(models_raw.RawPhases).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawPhases, records)
+            self._bulk_insert(session, models_raw.RawPhases, df, ["as_of_utc"])
             session.commit()
         except Exception:
             session.rollback()
@@ -239,18 +550,15 @@ class DatabaseOperations:
 
     def get_raw_phases(self) -> pd.DataFrame:
         """Get raw phases data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawPhases).all()
-            return model_to_dataframe(models_raw.RawPhases, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawPhases)
 
     def save_raw_my_manager(self, df: pd.DataFrame) -> None:
         """Save raw my manager DataFrame to database."""
         session = self.session_factory()
         try:
             session.query(models_raw.RawMyManager).delete()
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawMyManager, records)
+            self._bulk_insert(session, models_raw.RawMyManager, df, ["as_of_utc"])
             session.commit()
         except Exception:
             session.rollback()
@@ -260,13 +568,17 @@ class DatabaseOperations:
 
     def get_raw_my_manager(self) -> pd.DataFrame:
         """Get raw my manager data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawMyManager).all()
-            return model_to_dataframe(models_raw.RawMyManager, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawMyManager)
 
     def save_raw_my_picks(self, df: pd.DataFrame) -> None:
         """Save raw my picks DataFrame to database (append-only for historical tracking)."""
-        with next(get_session()) as session:
+        with self._session() as session:
+            if self.write_mode == "upsert":
+                self._upsert(session, models_raw.RawMyPicks, df, ["event"], ["as_of_utc"])
+                session.commit()
+                return
+
             # Check if data already exists for this gameweek
             if not df.empty and "event" in df.columns:
                 gameweek = int(df["event"].iloc[0])  # Convert from numpy.int64 to Python int
@@ -281,20 +593,22 @@ class DatabaseOperations:
                     session.flush()
                     print(f"  🗑️ Deleted {deleted_count} existing pick records for GW{gameweek}")
 
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawMyPicks, records)
+            self._bulk_insert(session, models_raw.RawMyPicks, df, ["as_of_utc"])
             session.commit()
 
     def get_raw_my_picks(self) -> pd.DataFrame:
         """Get raw my picks data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawMyPicks).all()
-            return model_to_dataframe(models_raw.RawMyPicks, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawMyPicks)
 
     def save_raw_my_gameweek_summary(self, df: pd.DataFrame) -> None:
         """Save raw my gameweek summary DataFrame to database (upsert by gameweek)."""
-        with next(get_session()) as session:
+        with self._session() as session:
+            if self.write_mode == "upsert":
+                self._upsert(session, models_raw.RawMyGameweekSummary, df, ["manager_id", "event"], ["as_of_utc"])
+                session.commit()
+                return
+
             # Check if data already exists for this manager + gameweek
             if not df.empty and "event" in df.columns and "manager_id" in df.columns:
                 gameweek = int(df["event"].iloc[0])
@@ -321,30 +635,121 @@ class DatabaseOperations:
                     session.flush()
                     print(f"  🗑️ Deleted {deleted_count} existing gameweek summary for GW{gameweek}")
 
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawMyGameweekSummary, records)
+            self._bulk_insert(session, models_raw.RawMyGameweekSummary, df, ["as_of_utc"])
             session.commit()
 
     def get_raw_my_gameweek_summary(self) -> pd.DataFrame:
         """Get raw my gameweek summary data as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_raw.RawMyGameweekSummary).all()
-            return model_to_dataframe(models_raw.RawMyGameweekSummary, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_raw.RawMyGameweekSummary)
+
+    # League-scale manager data (many managers per gameweek)
+
+    def save_manager_gameweek_batch(self, picks_df: pd.DataFrame, summary_df: pd.DataFrame) -> None:
+        """Save one chunk of managers' picks and gameweek summaries in a single transaction.
+
+        Existing rows for the same (manager_id, event) pairs are replaced, so a chunk is
+        either fully stored or not at all - which is what makes ingestion resumable.
+        """
+        with self._session() as session:
+            for model, df in (
+                (models_raw.RawManagerPicks, picks_df),
+                (models_raw.RawManagerGameweekSummary, summary_df),
+            ):
+                if df.empty:
+                    continue
+                if self.write_mode == "upsert":
+                    self._upsert(session, model, df, ["manager_id", "event"], ["as_of_utc"])
+                    continue
+                _delete_manager_events(session, model, df)
+                self._bulk_insert(session, model, df, ["as_of_utc"])
+            session.commit()
+
+    def save_raw_manager_gameweek_summary(self, df: pd.DataFrame) -> None:
+        """Save manager gameweek summaries (upsert by manager_id + event)."""
+        self.save_manager_gameweek_batch(pd.DataFrame(), df)
+
+    def get_raw_manager_picks(self, gameweek: int | None = None, manager_ids: list[int] | None = None) -> pd.DataFrame:
+        """Get league-scale manager picks, optionally filtered by gameweek and managers."""
+        model = models_raw.RawManagerPicks
+        criteria = []
+        if gameweek is not None:
+            criteria.append(model.event == gameweek)
+        if manager_ids is not None:
+            criteria.append(model.manager_id.in_(manager_ids))
+
+        with self._session() as session:
+            return read_model_frame(session.connection(), model, *criteria)
+
+    def get_raw_manager_gameweek_summary(
+        self, gameweek: int | None = None, manager_ids: list[int] | None = None
+    ) -> pd.DataFrame:
+        """Get league-scale manager gameweek summaries, optionally filtered by gameweek and managers."""
+        model = models_raw.RawManagerGameweekSummary
+        criteria = []
+        if gameweek is not None:
+            criteria.append(model.event == gameweek)
+        if manager_ids is not None:
+            criteria.append(model.manager_id.in_(manager_ids))
+
+        with self._session() as session:
+            return read_model_frame(session.connection(), model, *criteria)
+
+    def get_ingested_manager_ids(self, gameweek: int) -> set[int]:
+        """Managers whose picks for a gameweek are already stored (the ingestion checkpoint)."""
+        with self._session() as session:
+            rows = (
+                session.query(models_raw.RawManagerPicks.manager_id)
+                .filter(models_raw.RawManagerPicks.event == gameweek)
+                .distinct()
+                .all()
+            )
+            return {row[0] for row in rows}
+
+    def get_manager_summary_coverage(self, gameweeks: list[int]) -> dict[int, int]:
+        """Count stored gameweek summaries per manager within the given gameweeks."""
+        model = models_raw.RawManagerGameweekSummary
+        with self._session() as session:
+            rows = (
+                session.query(model.manager_id, func.count(model.event))
+                .filter(model.event.in_(gameweeks))
+                .group_by(model.manager_id)
+                .all()
+            )
+            return dict(rows)
+
+    def save_raw_league_entries(self, df: pd.DataFrame) -> None:
+        """Save classic league members, replacing any previous standings for the same league(s)."""
+        with self._session() as session:
+            if not df.empty and "league_id" in df.columns:
+                league_ids = [int(league_id) for league_id in df["league_id"].unique()]
+                session.query(models_raw.RawLeagueEntries).filter(
+                    models_raw.RawLeagueEntries.league_id.in_(league_ids)
+                ).delete(synchronize_session=False)
+                session.flush()
+
+            self._bulk_insert(session, models_raw.RawLeagueEntries, df, ["as_of_utc"])
+            session.commit()
+
+    def get_raw_league_entries(self, league_id: int | None = None) -> pd.DataFrame:
+        """Get stored classic league members, optionally for one league."""
+        model = models_raw.RawLeagueEntries
+        criteria = [model.league_id == league_id] if league_id is not None else []
+        with self._session() as session:
+            return read_model_frame(session.connection(), model, *criteria)
 
     def save_raw_betting_odds(self, df: pd.DataFrame) -> None:
         """Save raw betting odds DataFrame to database (REPLACE strategy)."""
         session = self.session_factory()
         try:
-            # Delete all existing betting odds (REPLACE strategy)
-            session.query(models_raw.RawBettingOdds).delete()
-
-            # Convert datetime columns
-            df_converted = convert_datetime_columns(df, ["as_of_utc", "match_date"])
+            if self.write_mode == "upsert":
+                self._upsert(session, models_raw.RawBettingOdds, df, [], ["as_of_utc", "match_date"])
+            else:
+                # Delete all existing betting odds (REPLACE strategy)
+                session.query(models_raw.RawBettingOdds).delete()
 
-            # Insert new data
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawBettingOdds, records)
+                # Insert new data
+                self._bulk_insert(session, models_raw.RawBettingOdds, df, ["as_of_utc", "match_date"])
             session.commit()
         except Exception:
             session.rollback()
@@ -361,22 +766,16 @@ class DatabaseOperations:
         Returns:
             DataFrame with betting odds data
         """
-        with next(get_session()) as session:
-            if gameweek is not None:
-                # Join with fixtures to filter by gameweek
-                query_result = (
-                    session.query(models_raw.RawBettingOdds)
-                    .join(
-                        models_raw.RawFixtures,
-                        models_raw.RawBettingOdds.fixture_id == models_raw.RawFixtures.fixture_id,
-                    )
-                    .filter(models_raw.RawFixtures.event == gameweek)
-                    .all()
-                )
-            else:
-                query_result = session.query(models_raw.RawBettingOdds).all()
+        model = models_raw.RawBettingOdds
+        query = _attribute_select(model)
+        if gameweek is not None:
+            # Join with fixtures to filter by gameweek
+            query = query.join(models_raw.RawFixtures, model.fixture_id == models_raw.RawFixtures.fixture_id).where(
+                models_raw.RawFixtures.event == gameweek
+            )
 
-            return model_to_dataframe(models_raw.RawBettingOdds, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), model, query=query)
 
     def get_my_manager_data(self) -> pd.DataFrame:
         """Get my manager data (single row).
@@ -392,54 +791,66 @@ class DatabaseOperations:
         Returns:
             DataFrame with current gameweek team selection
         """
-        with next(get_session()) as session:
-            # Get the latest event for current picks
-            latest_event = (
-                session.query(models_raw.RawMyPicks.event).order_by(models_raw.RawMyPicks.event.desc()).first()
-            )
-            if latest_event:
-                query_result = (
-                    session.query(models_raw.RawMyPicks).filter(models_raw.RawMyPicks.event == latest_event[0]).all()
-                )
-                return model_to_dataframe(models_raw.RawMyPicks, query_result)
-            return pd.DataFrame()
+        model = models_raw.RawMyPicks
+        # Picks of the latest event
+        latest_event = select(func.max(model.event)).scalar_subquery()
+        with self._session() as session:
+            return read_model_frame(session.connection(), model, model.event == latest_event)
 
     def save_raw_player_gameweek_performance(self, df: pd.DataFrame) -> None:
-        """Save raw player gameweek performance DataFrame to database."""
-        with next(get_session()) as session:
-            # Check if data already exists for this gameweek
-            if not df.empty and "gameweek" in df.columns:
-                gameweek = int(df["gameweek"].iloc[0])  # Convert from numpy.int64 to Python int
+        """Save raw player gameweek performance DataFrame to database.
+
+        The frame may hold any number of gameweeks: existing rows for every gameweek
+        present are replaced, all in one transaction.
+        """
+        model = models_raw.RawPlayerGameweekPerformance
+        with self._session() as session:
+            if self.write_mode == "upsert":
+                self._upsert(session, model, df, ["gameweek"], ["as_of_utc"])
+                session.commit()
+                return
 
-                # Delete existing data for this gameweek to allow updates
+            # Replace existing data for the gameweeks being saved
+            if not df.empty and "gameweek" in df.columns:
+                gameweeks = sorted(int(gw) for gw in df["gameweek"].unique())  # numpy.int64 -> Python int
                 deleted_count = (
-                    session.query(models_raw.RawPlayerGameweekPerformance)
-                    .filter(models_raw.RawPlayerGameweekPerformance.gameweek == gameweek)
-                    .delete()
+                    session.query(model).filter(model.gameweek.in_(gameweeks)).delete(synchronize_session=False)
                 )
 
-                # Flush the delete to ensure it's committed before insert
+                # Flush the delete so the inserts do not hit the unique constraint
                 session.flush()
 
-                print(f"  🗑️ Deleted {deleted_count} existing records for GW{gameweek}")
+                label = f"GW{gameweeks[0]}" if len(gameweeks) == 1 else f"{len(gameweeks)} gameweeks"
+                print(f"  🗑️ Deleted {deleted_count} existing records for {label}")
 
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_raw.RawPlayerGameweekPerformance, records)
+            self._bulk_insert(session, model, df, ["as_of_utc"])
             session.commit()
 
-    def get_raw_player_gameweek_performance(self, gameweek: int = None, player_id: int = None) -> pd.DataFrame:
-        """Get raw player gameweek performance data as DataFrame."""
-        with next(get_session()) as session:
-            query = session.query(models_raw.RawPlayerGameweekPerformance)
+    def get_raw_player_gameweek_performance(
+        self, gameweek: int = None, player_id: int = None, numeric: bool = False
+    ) -> pd.DataFrame:
+        """Get raw player gameweek performance data as DataFrame.
 
-            if gameweek is not None:
-                query = query.filter(models_raw.RawPlayerGameweekPerformance.gameweek == gameweek)
-            if player_id is not None:
-                query = query.filter(models_raw.RawPlayerGameweekPerformance.player_id == player_id)
+        Args:
+            gameweek: Filter to specific gameweek (None = all gameweeks)
+            player_id: Filter to specific player (None = all players)
+            numeric: Return string-encoded stats (ICT, expected stats) as floats
 
-            query_result = query.all()
-            return model_to_dataframe(models_raw.RawPlayerGameweekPerformance, query_result)
+        Returns:
+            DataFrame with performance data
+        """
+        model = models_raw.RawPlayerGameweekPerformance
+        criteria = []
+        if gameweek is not None:
+            criteria.append(model.gameweek == gameweek)
+        if player_id is not None:
+            criteria.append(model.player_id == player_id)
+
+        with self._session() as session:
+            if numeric:
+                return read_numeric_frame(session.connection(), model, *criteria)
+
+            return read_model_frame(session.connection(), model, *criteria)
 
     def save_raw_player_gameweek_snapshot(self, df: pd.DataFrame, force: bool = False) -> None:
         """Save raw player gameweek snapshot DataFrame to database.
@@ -451,7 +862,7 @@ class DatabaseOperations:
             df: DataFrame with snapshot data
             force: If True, delete existing snapshots for this gameweek first (use with caution)
         """
-        with next(get_session()) as session:
+        with self._session() as session:
             # Optional: force overwrite for specific gameweek
             if force and not df.empty and "gameweek" in df.columns:
                 gameweek = int(df["gameweek"].iloc[0])
@@ -463,11 +874,10 @@ class DatabaseOperations:
                 session.flush()
                 print(f"  🗑️ Force mode: Deleted {deleted_count} existing snapshot records for GW{gameweek}")
 
-            df_converted = convert_datetime_columns(df, ["as_of_utc", "snapshot_date", "news_added"])
-            records = df_converted.to_dict("records")
-
             try:
-                session.bulk_insert_mappings(models_raw.RawPlayerGameweekSnapshot, records)
+                self._bulk_insert(
+                    session, models_raw.RawPlayerGameweekSnapshot, df, ["as_of_utc", "snapshot_date", "news_added"]
+                )
                 session.commit()
             except Exception as e:
                 # If duplicate key error, provide helpful message
@@ -479,7 +889,7 @@ class DatabaseOperations:
                 raise
 
     def get_raw_player_gameweek_snapshot(
-        self, gameweek: int = None, player_id: int = None, include_backfilled: bool = True
+        self, gameweek: int = None, player_id: int = None, include_backfilled: bool = True, numeric: bool = False
     ) -> pd.DataFrame:
         """Get raw player gameweek snapshot data as DataFrame.
 
@@ -487,22 +897,25 @@ class DatabaseOperations:
             gameweek: Filter to specific gameweek (None = all gameweeks)
             player_id: Filter to specific player (None = all players)
             include_backfilled: If False, exclude backfilled records (only real captures)
+            numeric: Return ep_this, ep_next and form as floats
 
         Returns:
             DataFrame with snapshot data
         """
-        with next(get_session()) as session:
-            query = session.query(models_raw.RawPlayerGameweekSnapshot)
+        model = models_raw.RawPlayerGameweekSnapshot
+        criteria = []
+        if gameweek is not None:
+            criteria.append(model.gameweek == gameweek)
+        if player_id is not None:
+            criteria.append(model.player_id == player_id)
+        if not include_backfilled:
+            criteria.append(~model.is_backfilled)
 
-            if gameweek is not None:
-                query = query.filter(models_raw.RawPlayerGameweekSnapshot.gameweek == gameweek)
-            if player_id is not None:
-                query = query.filter(models_raw.RawPlayerGameweekSnapshot.player_id == player_id)
-            if not include_backfilled:
-                query = query.filter(~models_raw.RawPlayerGameweekSnapshot.is_backfilled)
+        with self._session() as session:
+            if numeric:
+                return read_numeric_frame(session.connection(), model, *criteria)
 
-            query_result = query.all()
-            return model_to_dataframe(models_raw.RawPlayerGameweekSnapshot, query_result)
+            return read_model_frame(session.connection(), model, *criteria)
 
     def get_player_snapshots_range(self, start_gw: int, end_gw: int, include_backfilled: bool = True) -> pd.DataFrame:
         """Get player snapshots for a range of gameweeks.
@@ -515,17 +928,13 @@ class DatabaseOperations:
         Returns:
             DataFrame with snapshot data for all players across gameweek range
         """
-        with next(get_session()) as session:
-            query = session.query(models_raw.RawPlayerGameweekSnapshot).filter(
-                models_raw.RawPlayerGameweekSnapshot.gameweek >= start_gw,
-                models_raw.RawPlayerGameweekSnapshot.gameweek <= end_gw,
-            )
-
-            if not include_backfilled:
-                query = query.filter(~models_raw.RawPlayerGameweekSnapshot.is_backfilled)
+        model = models_raw.RawPlayerGameweekSnapshot
+        criteria = [model.gameweek >= start_gw, model.gameweek <= end_gw]
+        if not include_backfilled:
+            criteria.append(~model.is_backfilled)
 
-            query_result = query.all()
-            return model_to_dataframe(models_raw.RawPlayerGameweekSnapshot, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), model, *criteria)
 
     # Legacy compatibility adapter functions
     def get_players_current(self) -> pd.DataFrame:
@@ -533,7 +942,7 @@ class DatabaseOperations:
 
         Transforms raw FPL API data into the expected legacy format.
         """
-        raw_players = self.get_raw_players_bootstrap()
+        raw_players = self.get_raw_players_bootstrap(numeric=True)
         # raw_teams = self.get_raw_teams_bootstrap()  # Unused for now
         raw_positions = self.get_raw_element_types()
 
@@ -562,7 +971,7 @@ class DatabaseOperations:
                 "team_id": raw_players["team_id"],
                 "position": raw_players["position_id"].map(position_mapping),
                 "price_gbp": raw_players["now_cost"] / 10.0,  # Convert from API format
-                "selected_by_percentage": pd.to_numeric(raw_players["selected_by_percent"], errors="coerce"),
+                "selected_by_percentage": raw_players["selected_by_percent"],
                 "availability_status": raw_players["status"],
                 "as_of_utc": raw_players["as_of_utc"],
                 "mapped_player_id": raw_players["player_id"],  # For current players, mapped_id = player_id
@@ -626,15 +1035,12 @@ class DatabaseOperations:
         Returns:
             DataFrame with player performance data for the specified gameweek(s)
         """
-        with next(get_session()) as session:
-            query = session.query(models_raw.RawPlayerGameweekPerformance)
-
-            if gameweek is not None:
-                query = query.filter(models_raw.RawPlayerGameweekPerformance.gameweek == gameweek)
-
-            query_result = query.all()
+        model = models_raw.RawPlayerGameweekPerformance
+        criteria = [model.gameweek == gameweek] if gameweek is not None else []
+        with self._session() as session:
+            df = read_model_frame(session.connection(), model, *criteria)
 
-            if not query_result:
+            if df.empty:
                 # Return empty DataFrame with expected structure
                 columns = [
                     "id",
@@ -656,9 +1062,6 @@ class DatabaseOperations:
                 ]
                 return pd.DataFrame(columns=columns)
 
-            # Convert to DataFrame
-            df = model_to_dataframe(models_raw.RawPlayerGameweekPerformance, query_result)
-
             # Rename gameweek to event for legacy compatibility
             if "gameweek" in df.columns:
                 df = df.rename(columns={"gameweek": "event"})
@@ -678,22 +1081,19 @@ class DatabaseOperations:
         Returns:
             DataFrame with columns: id, player, team, team_id, season, xG90, xA90, as_of_utc, mapped_player_id
         """
-        with next(get_session()) as session:
-            query_result = (
-                session.query(models_raw.RawPlayerBootstrap).filter(models_raw.RawPlayerBootstrap.minutes > 0).all()
+        with self._session() as session:
+            df = read_numeric_frame(
+                session.connection(), models_raw.RawPlayerBootstrap, models_raw.RawPlayerBootstrap.minutes > 0
             )
 
-            if not query_result:
+            if df.empty:
                 # Return empty DataFrame with expected structure if no data
                 columns = ["id", "player", "team", "team_id", "season", "xG90", "xA90", "as_of_utc", "mapped_player_id"]
                 return pd.DataFrame(columns=columns)
 
-            # Convert to DataFrame and calculate per-90 rates
-            df = model_to_dataframe(models_raw.RawPlayerBootstrap, query_result)
-
-            # Calculate xG90 and xA90 from cumulative values
-            df["xG90"] = (df["expected_goals"].astype(float) * 90.0 / df["minutes"]).fillna(0.0)
-            df["xA90"] = (df["expected_assists"].astype(float) * 90.0 / df["minutes"]).fillna(0.0)
+            # Calculate xG90 and xA90 from cumulative values (already floats from the numeric read)
+            df["xG90"] = (df["expected_goals"] * 90.0 / df["minutes"]).fillna(0.0)
+            df["xA90"] = (df["expected_assists"] * 90.0 / df["minutes"]).fillna(0.0)
 
             # Return in expected legacy format
             result_df = pd.DataFrame(
@@ -738,8 +1138,17 @@ class DatabaseOperations:
         for table_name, df in raw_dataframes.items():
             if table_name in save_methods and not df.empty:
                 try:
-                    save_methods[table_name](df)
-                    print(f"✅ Saved {table_name}: {len(df)} rows")
+                    self.write_stats.pop(table_name, None)
+                    result = save_methods[table_name](df)
+                    stats = self.write_stats.get(table_name)
+                    rate = f" ({stats['rows_per_s']:,.0f} rows/s)" if stats and stats["rows"] else ""
+                    print(f"✅ Saved {table_name}: {len(df)} rows{rate}")
+                    if isinstance(result, dict):
+                        print(
+                            f"   {result['updated']} updated, {result['inserted']} inserted, "
+                            f"{result['deleted']} deleted, {result['unchanged']} unchanged "
+                            f"({result['changes']} field changes logged)"
+                        )
                 except Exception as e:
                     print(f"❌ Failed to save {table_name}: {e}")
             elif df.empty:
@@ -756,7 +1165,12 @@ class DatabaseOperations:
         Per-gameweek update: deletes existing data for the specific gameweek
         before inserting new data, preserving historical gameweeks.
         """
-        with next(get_session()) as session:
+        with self._session() as session:
+            if self.write_mode == "upsert":
+                self._upsert(session, models_derived.DerivedPlayerMetrics, df, ["gameweek"], ["calculation_date"])
+                session.commit()
+                return
+
             # Check if data has gameweek column
             if not df.empty and "gameweek" in df.columns:
                 gameweek = int(df["gameweek"].iloc[0])
@@ -773,16 +1187,13 @@ class DatabaseOperations:
                 if deleted_count > 0:
                     print(f"  🗑️ Deleted {deleted_count} existing player metrics for GW{gameweek}")
 
-            df_converted = convert_datetime_columns(df, ["calculation_date"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_derived.DerivedPlayerMetrics, records)
+            self._bulk_insert(session, models_derived.DerivedPlayerMetrics, df, ["calculation_date"])
             session.commit()
 
     def get_derived_player_metrics(self) -> pd.DataFrame:
         """Get derived player metrics as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_derived.DerivedPlayerMetrics).all()
-            return model_to_dataframe(models_derived.DerivedPlayerMetrics, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_derived.DerivedPlayerMetrics)
 
     def save_derived_team_form(self, df: pd.DataFrame) -> None:
         """Save derived team form DataFrame to database.
@@ -790,7 +1201,12 @@ class DatabaseOperations:
         Per-gameweek update: deletes existing data for the specific gameweek
         before inserting new data, preserving historical gameweeks.
         """
-        with next(get_session()) as session:
+        with self._session() as session:
+            if self.write_mode == "upsert":
+                self._upsert(session, models_derived.DerivedTeamForm, df, ["gameweek"], ["last_updated"])
+                session.commit()
+                return
+
             # Check if data has gameweek column
             if not df.empty and "gameweek" in df.columns:
                 gameweek = int(df["gameweek"].iloc[0])
@@ -807,25 +1223,22 @@ class DatabaseOperations:
                 if deleted_count > 0:
                     print(f"  🗑️ Deleted {deleted_count} existing team form for GW{gameweek}")
 
-            df_converted = convert_datetime_columns(df, ["last_updated"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_derived.DerivedTeamForm, records)
+            self._bulk_insert(session, models_derived.DerivedTeamForm, df, ["last_updated"])
             session.commit()
 
     def get_derived_team_form(self) -> pd.DataFrame:
         """Get derived team form as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_derived.DerivedTeamForm).all()
-            return model_to_dataframe(models_derived.DerivedTeamForm, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_derived.DerivedTeamForm)
 
     def save_derived_fixture_difficulty(self, df: pd.DataFrame) -> None:
         """Save derived fixture difficulty DataFrame to database."""
         session = self.session_factory()
         try:
             session.query(models_derived.DerivedFixtureDifficulty).delete()
-            df_converted = convert_datetime_columns(df, ["kickoff_time", "calculation_date"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_derived.DerivedFixtureDifficulty, records)
+            self._bulk_insert(
+                session, models_derived.DerivedFixtureDifficulty, df, ["kickoff_time", "calculation_date"]
+            )
             session.commit()
         except Exception:
             session.rollback()
@@ -835,9 +1248,8 @@ class DatabaseOperations:
 
     def get_derived_fixture_difficulty(self) -> pd.DataFrame:
         """Get derived fixture difficulty as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_derived.DerivedFixtureDifficulty).all()
-            return model_to_dataframe(models_derived.DerivedFixtureDifficulty, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_derived.DerivedFixtureDifficulty)
 
     def save_derived_value_analysis(self, df: pd.DataFrame) -> None:
         """Save derived value analysis DataFrame to database.
@@ -845,7 +1257,12 @@ class DatabaseOperations:
         Per-gameweek update: deletes existing data for the specific gameweek
         before inserting new data, preserving historical gameweeks.
         """
-        with next(get_session()) as session:
+        with self._session() as session:
+            if self.write_mode == "upsert":
+                self._upsert(session, models_derived.DerivedValueAnalysis, df, ["gameweek"], ["analysis_date"])
+                session.commit()
+                return
+
             # Check if data has gameweek column
             if not df.empty and "gameweek" in df.columns:
                 gameweek = int(df["gameweek"].iloc[0])
@@ -862,16 +1279,13 @@ class DatabaseOperations:
                 if deleted_count > 0:
                     print(f"  🗑️ Deleted {deleted_count} existing value analysis for GW{gameweek}")
 
-            df_converted = convert_datetime_columns(df, ["analysis_date"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_derived.DerivedValueAnalysis, records)
+            self._bulk_insert(session, models_derived.DerivedValueAnalysis, df, ["analysis_date"])
             session.commit()
 
     def get_derived_value_analysis(self) -> pd.DataFrame:
         """Get derived value analysis as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_derived.DerivedValueAnalysis).all()
-            return model_to_dataframe(models_derived.DerivedValueAnalysis, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_derived.DerivedValueAnalysis)
 
     def save_derived_ownership_trends(self, df: pd.DataFrame) -> None:
         """Save derived ownership trends DataFrame to database.
@@ -879,7 +1293,12 @@ class DatabaseOperations:
         Per-gameweek update: deletes existing data for the specific gameweek
         before inserting new data, preserving historical gameweeks.
         """
-        with next(get_session()) as session:
+        with self._session() as session:
+            if self.write_mode == "upsert":
+                self._upsert(session, models_derived.DerivedOwnershipTrends, df, ["gameweek"], ["last_updated"])
+                session.commit()
+                return
+
             # Check if data has gameweek column
             if not df.empty and "gameweek" in df.columns:
                 gameweek = int(df["gameweek"].iloc[0])
@@ -896,9 +1315,7 @@ class DatabaseOperations:
                 if deleted_count > 0:
                     print(f"  🗑️ Deleted {deleted_count} existing ownership trends for GW{gameweek}")
 
-            df_converted = convert_datetime_columns(df, ["last_updated"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_derived.DerivedOwnershipTrends, records)
+            self._bulk_insert(session, models_derived.DerivedOwnershipTrends, df, ["last_updated"])
             session.commit()
 
     def save_all_derived_data(self, derived_dataframes: dict[str, pd.DataFrame]) -> None:
@@ -923,8 +1340,17 @@ class DatabaseOperations:
         for table_name, df in derived_dataframes.items():
             if table_name in save_methods and not df.empty:
                 try:
-                    save_methods[table_name](df)
-                    print(f"✅ Saved {table_name}: {len(df)} rows")
+                    self.write_stats.pop(table_name, None)
+                    result = save_methods[table_name](df)
+                    stats = self.write_stats.get(table_name)
+                    rate = f" ({stats['rows_per_s']:,.0f} rows/s)" if stats and stats["rows"] else ""
+                    print(f"✅ Saved {table_name}: {len(df)} rows{rate}")
+                    if isinstance(result, dict):
+                        print(
+                            f"   {result['updated']} updated, {result['inserted']} inserted, "
+                            f"{result['deleted']} deleted, {result['unchanged']} unchanged "
+                            f"({result['changes']} field changes logged)"
+                        )
                 except Exception as e:
                     print(f"❌ Failed to save {table_name}: {e}")
             elif df.empty:
@@ -936,9 +1362,8 @@ class DatabaseOperations:
 
     def get_derived_ownership_trends(self) -> pd.DataFrame:
         """Get derived ownership trends as DataFrame."""
-        with next(get_session()) as session:
-            query_result = session.query(models_derived.DerivedOwnershipTrends).all()
-            return model_to_dataframe(models_derived.DerivedOwnershipTrends, query_result)
+        with self._session() as session:
+            return read_model_frame(session.connection(), models_derived.DerivedOwnershipTrends)
 
     def save_derived_betting_features(self, df: pd.DataFrame) -> None:
         """Save derived betting features DataFrame to database.
@@ -946,7 +1371,12 @@ class DatabaseOperations:
         Per-gameweek update: deletes existing data for the specific gameweek
         before inserting new data, preserving historical gameweeks.
         """
-        with next(get_session()) as session:
+        with self._session() as session:
+            if self.write_mode == "upsert":
+                self._upsert(session, models_derived.DerivedBettingFeatures, df, ["fixture_id"], ["as_of_utc"])
+                session.commit()
+                return
+
             if not df.empty:
                 # Prefer precise deletion by incoming fixture_ids to avoid unique conflicts
                 fixture_ids = df["fixture_id"].dropna().unique().tolist()
@@ -960,9 +1390,7 @@ class DatabaseOperations:
                     if deleted_count > 0:
                         print(f"  🗑️ Deleted {deleted_count} existing betting features for {len(fixture_ids)} fixtures")
 
-            df_converted = convert_datetime_columns(df, ["as_of_utc"])
-            records = df_converted.to_dict("records")
-            session.bulk_insert_mappings(models_derived.DerivedBettingFeatures, records)
+            self._bulk_insert(session, models_derived.DerivedBettingFeatures, df, ["as_of_utc"])
             session.commit()
 
     def get_derived_betting_features(self, gameweek: int | None = None) -> pd.DataFrame:
@@ -971,12 +1399,10 @@ class DatabaseOperations:
         Args:
             gameweek: Optional gameweek filter
         """
-        with next(get_session()) as session:
-            query = session.query(models_derived.DerivedBettingFeatures)
-            if gameweek is not None:
-                query = query.filter(models_derived.DerivedBettingFeatures.gameweek == gameweek)
-            query_result = query.all()
-            return model_to_dataframe(models_derived.DerivedBettingFeatures, query_result)
+        model = models_derived.DerivedBettingFeatures
+        criteria = [model.gameweek == gameweek] if gameweek is not None else []
+        with self._session() as session:
+            return read_model_frame(session.connection(), model, *criteria)
 
     def save_derived_fixture_runs(self, df: pd.DataFrame) -> None:
         """Save derived fixture runs DataFrame to database.
@@ -987,8 +1413,13 @@ class DatabaseOperations:
         if df.empty:
             return
 
-        with next(get_session()) as session:
+        with self._session() as session:
             try:
+                if self.write_mode == "upsert":
+                    self._upsert(session, models_derived.DerivedFixtureRuns, df, ["gameweek"])
+                    session.commit()
+                    return
+
                 # Get the gameweek from the dataframe
                 gameweek = int(df["gameweek"].iloc[0])
 
@@ -998,9 +1429,7 @@ class DatabaseOperations:
                 ).delete()
 
                 # Insert new records
-                records = df.to_dict("records")
-                for record in records:
-                    session.add(models_derived.DerivedFixtureRuns(**record))
+                self._bulk_insert(session, models_derived.DerivedFixtureRuns, df)
 
                 session.commit()
             except Exception as e:
@@ -1013,22 +1442,21 @@ class DatabaseOperations:
         Args:
             gameweek: Optional gameweek filter
         """
-        with next(get_session()) as session:
-            query = session.query(models_derived.DerivedFixtureRuns)
-            if gameweek is not None:
-                query = query.filter(models_derived.DerivedFixtureRuns.gameweek == gameweek)
-            query_result = query.all()
-            return model_to_dataframe(models_derived.DerivedFixtureRuns, query_result)
+        model = models_derived.DerivedFixtureRuns
+        criteria = [model.gameweek == gameweek] if gameweek is not None else []
+        with self._session() as session:
+            return read_model_frame(session.connection(), model, *criteria)
 
     def get_database_summary(self) -> dict[str, int]:
         """Get comprehensive database summary with row counts for all tables."""
-        with next(get_session()) as session:
+        with self._session() as session:
             summary = {}
 
             # Raw data tables
             raw_tables = [
                 ("raw_players_bootstrap", models_raw.RawPlayerBootstrap),
                 ("raw_teams_bootstrap", models_raw.RawTeamBootstrap),
+                ("raw_team_aliases", models_raw.RawTeamAlias),
                 ("raw_events_bootstrap", models_raw.RawEventBootstrap),
                 ("raw_fixtures", models_raw.RawFixtures),
                 ("raw_game_settings", models_raw.RawGameSettings),
@@ -1038,6 +1466,10 @@ class DatabaseOperations:
                 ("raw_phases", models_raw.RawPhases),
                 ("raw_my_manager", models_raw.RawMyManager),
                 ("raw_my_picks", models_raw.RawMyPicks),
+                ("raw_manager_picks", models_raw.RawManagerPicks),
+                ("raw_manager_gameweek_summary", models_raw.RawManagerGameweekSummary),
+                ("raw_league_entries", models_raw.RawLeagueEntries),
+                ("raw_player_bootstrap_changes", models_raw.RawPlayerBootstrapChange),
             ]
 
             # Derived data tables
@@ -1079,7 +1511,7 @@ class DatabaseOperations:
             - data_age_hours: Hours since newest data update
             - freshness_status: Simple status indicator
         """
-        with next(get_session()) as session:
+        with self._session() as session:
             freshness_data = {
                 "raw_data_timestamps": {},
                 "derived_data_timestamps": {},
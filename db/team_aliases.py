@@ -0,0 +1,95 @@
+"""Team-name resolution for external data sources.
+
+Odds providers and other feeds spell Premier League teams their own way ("Man United",
+"Manchester United", "Tottenham Hotspur", ...). The ``raw_team_aliases`` table is an index of
+normalized name -> FPL team_id, rebuilt from raw_teams_bootstrap (each team's name and short
+name) plus the curated ``TEAM_NAME_ALIASES`` whenever teams are saved, and on runs that skip an
+unchanged bootstrap (DatabaseOperations.rebuild_team_aliases). Every source resolves
+names against it with one vectorized ``map``, so supporting a new source's spellings only means
+adding them to ``TEAM_NAME_ALIASES``.
+"""
+
+import pandas as pd
+
+# FPL team name (raw_teams_bootstrap.name) -> names other sources use for it.
+# Spellings that differ only in case, punctuation or "&"/"and" need no entry (see normalize_team_names).
+TEAM_NAME_ALIASES: dict[str, tuple[str, ...]] = {
+    "Bournemouth": ("AFC Bournemouth",),
+    "Brighton": ("Brighton & Hove Albion", "Brighton and Hove Albion"),
+    "Ipswich": ("Ipswich Town",),
+    "Leeds": ("Leeds United",),
+    "Leicester": ("Leicester City",),
+    "Luton": ("Luton Town",),
+    "Man City": ("Manchester City",),
+    "Man Utd": ("Man United", "Manchester United"),
+    "Newcastle": ("Newcastle United",),
+    "Nott'm Forest": ("Nottingham Forest",),
+    "Sheffield Utd": ("Sheffield United",),
+    "Spurs": ("Tottenham", "Tottenham Hotspur"),
+    "West Ham": ("West Ham United",),
+    "Wolves": ("Wolverhampton Wanderers", "Wolverhampton"),
+}
+
+
+def normalize_team_names(names: pd.Series) -> pd.Series:
+    """Normalize team names to lookup keys: case-folded, "&" as "and", no punctuation.
+
+    Args:
+        names: Team names as spelled by any source
+
+    Returns:
+        Series of keys aligned with names (e.g. "Brighton & Hove Albion" -> "brighton and hove albion")
+    """
+    return (
+        names.astype("string")
+        .str.casefold()
+        .str.replace("&", " and ", regex=False)
+        .str.replace(r"['.]", "", regex=True)
+        .str.replace(r"[^0-9a-z]+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def build_team_alias_index(teams_df: pd.DataFrame) -> pd.DataFrame:
+    """Build the normalized alias index for a season's teams.
+
+    Args:
+        teams_df: raw_teams_bootstrap frame (team_id, name and, if present, short_name)
+
+    Returns:
+        DataFrame with alias_key, alias, team_id, source; one row per alias_key. Curated aliases
+        for teams not in teams_df are left out.
+    """
+    curated = pd.DataFrame(
+        [(alias, name) for name, aliases in TEAM_NAME_ALIASES.items() for alias in aliases],
+        columns=["alias", "name"],
+    ).merge(teams_df[["name", "team_id"]], on="name")
+
+    # On a key clash the bootstrap name wins, then the short name, then the curated alias
+    index = pd.concat(
+        [
+            *(
+                pd.DataFrame({"alias": teams_df[source], "team_id": teams_df["team_id"], "source": source})
+                for source in ("name", "short_name")
+                if source in teams_df
+            ),
+            curated[["alias", "team_id"]].assign(source="curated"),
+        ],
+        ignore_index=True,
+    ).dropna(subset=["alias"])
+    index.insert(0, "alias_key", normalize_team_names(index["alias"]).astype(object))
+    return index.drop_duplicates("alias_key", keep="first").astype({"team_id": "int64"}).reset_index(drop=True)
+
+
+def resolve_team_ids(names: pd.Series, alias_index: pd.DataFrame) -> pd.Series:
+    """Resolve team names from any source to FPL team IDs.
+
+    Args:
+        names: Team names as spelled by the source
+        alias_index: Alias index (raw_team_aliases or build_team_alias_index output)
+
+    Returns:
+        Series of team IDs aligned with names, NaN where a name matches no alias
+    """
+    lookup = pd.Series(alias_index["team_id"].to_numpy(), index=alias_index["alias_key"].to_numpy())
+    return normalize_team_names(names).astype(object).map(lookup)
@@ -1,5 +1,6 @@
 """Fetchers package for FPL dataset builder."""
 
+from .async_fetch import fetch_many_live, fetch_many_picks
 from .external import fetch_player_rates_last_season, fetch_results_last_season
 from .fpl_api import (
     fetch_fpl_bootstrap,
@@ -15,6 +16,8 @@ __all__ = [
     "fetch_fpl_fixtures",
     "fetch_team_details_by_id",
     "fetch_manager_team_with_budget",
+    "fetch_many_live",
+    "fetch_many_picks",
     "fetch_results_last_season",
     "fetch_player_rates_last_season",
     "download_vaastav_merged_gw",
@@ -0,0 +1,145 @@
+"""Concurrent batch fetching for per-gameweek FPL endpoints.
+
+Backfills and chip-usage capture need one request per gameweek
+(``event/{gw}/live``, ``entry/{id}/event/{gw}/picks``). Issuing them one at a
+time makes a 38-gameweek backfill take minutes of mostly idle wall time. This
+module runs them on an asyncio event loop with bounded concurrency and a
+polite global request rate, reusing the pooled session from ``http_client``
+(blocking calls are dispatched to worker threads, so no extra HTTP dependency
+is required).
+
+Results always come back in the order requested, one ``FetchResult`` per
+request, with the error recorded instead of raised so one bad gameweek never
+aborts the batch.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from utils import loads_json
+
+from .fpl_api import fpl_api_url
+from .http_client import http_get
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a single request in a batch."""
+
+    key: Any
+    url: str
+    data: Any = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.data is not None
+
+
+class AsyncRateLimiter:
+    """Space request start times evenly to stay under a global requests/second budget."""
+
+    def __init__(self, requests_per_second: float):
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self._interval == 0.0:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            wait = self._next_slot - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now = loop.time()
+            self._next_slot = max(now, self._next_slot) + self._interval
+
+
+async def _fetch_one(
+    key: Any,
+    url: str,
+    semaphore: asyncio.Semaphore,
+    limiter: AsyncRateLimiter,
+    retries: int,
+) -> FetchResult:
+    async with semaphore:
+        await limiter.acquire()
+        try:
+            body = await asyncio.to_thread(http_get, url, retries)
+            return FetchResult(key=key, url=url, data=loads_json(body))
+        except Exception as e:
+            return FetchResult(key=key, url=url, error=f"{type(e).__name__}: {e}")
+
+
+async def fetch_many_async(
+    requests: list[tuple[Any, str]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    retries: int = 3,
+) -> list[FetchResult]:
+    """Fetch JSON from many URLs concurrently.
+
+    Args:
+        requests: (key, url) pairs; the key is echoed back on each result
+        max_concurrency: Maximum requests in flight at once
+        requests_per_second: Global cap on request start rate (0 disables)
+        retries: Per-request retry budget passed to http_get
+
+    Returns:
+        One FetchResult per request, in the same order as ``requests``
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    limiter = AsyncRateLimiter(requests_per_second)
+    tasks = [_fetch_one(key, url, semaphore, limiter, retries) for key, url in requests]
+    return list(await asyncio.gather(*tasks))
+
+
+def fetch_many(
+    requests: list[tuple[Any, str]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    retries: int = 3,
+) -> list[FetchResult]:
+    """Synchronous entry point for fetch_many_async (runs its own event loop)."""
+    if not requests:
+        return []
+    return asyncio.run(
+        fetch_many_async(
+            requests,
+            max_concurrency=max_concurrency,
+            requests_per_second=requests_per_second,
+            retries=retries,
+        )
+    )
+
+
+def fetch_many_live(gameweeks: list[int], **kwargs) -> list[FetchResult]:
+    """Fetch ``event/{gw}/live`` for many gameweeks concurrently (keyed by gameweek)."""
+    print(f"Fetching live data for {len(gameweeks)} gameweeks concurrently...")
+    results = fetch_many([(gw, fpl_api_url(f"event/{gw}/live/")) for gw in gameweeks], **kwargs)
+    _report_errors(results, "live data")
+    return results
+
+
+def fetch_many_picks(manager_id: int, gameweeks: list[int], **kwargs) -> list[FetchResult]:
+    """Fetch ``entry/{id}/event/{gw}/picks`` for many gameweeks concurrently (keyed by gameweek)."""
+    print(f"Fetching picks for manager {manager_id} across {len(gameweeks)} gameweeks concurrently...")
+    results = fetch_many(
+        [(gw, fpl_api_url(f"entry/{manager_id}/event/{gw}/picks/")) for gw in gameweeks],
+        **kwargs,
+    )
+    _report_errors(results, f"manager {manager_id} picks")
+    return results
+
+
+def _report_errors(results: list[FetchResult], label: str) -> None:
+    failed = [r for r in results if not r.ok]
+    for result in failed:
+        print(f"Error fetching {label} for {result.key}: {result.error}")
+    print(f"Fetched {label}: {len(results) - len(failed)}/{len(results)} succeeded")
@@ -12,6 +12,8 @@ import pandas as pd
 from sqlalchemy import text
 
 from db.database import SessionLocal
+from db.models_raw import RawPlayerBootstrap
+from db.numeric_views import read_numeric_frame
 from validation.derived_schemas import (
     DerivedBettingFeaturesSchema,
     DerivedFixtureDifficultySchema,
@@ -21,6 +23,7 @@ from validation.derived_schemas import (
     DerivedTeamFormSchema,
     DerivedValueAnalysisSchema,
 )
+from validation.validators import validate_table
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,13 @@ FORM_GAMES = 5  # Number of games for form calculations
 VALUE_CONFIDENCE_THRESHOLD = 0.7  # Minimum confidence for value recommendations
 
 
+def _player_stat(players: pd.DataFrame, column: str, default: float) -> pd.Series:
+    """Numeric player stat with missing values (or a missing column) filled with default."""
+    if column not in players.columns:
+        return pd.Series(default, index=players.index, dtype="float64")
+    return players[column].fillna(default)
+
+
 def devig_two_way_probability(odds_a: float | None, odds_b: float | None) -> float:
     """Return de-vigged probability for outcome A given two-way decimal odds.
 
@@ -513,7 +523,7 @@ class DerivedDataProcessor:
 
         # Validate
         try:
-            validated = DerivedBettingFeaturesSchema.validate(result[expected_cols])
+            validated = validate_table(result[expected_cols], DerivedBettingFeaturesSchema, "derived_betting_features")
             logger.info(
                 f"Processed betting features for {validated['fixture_id'].nunique()} fixtures, {len(validated)} player-rows"
             )
@@ -528,9 +538,8 @@ class DerivedDataProcessor:
 
         raw_data = {}
 
-        # Load raw players data
-        players_query = text("SELECT * FROM raw_players_bootstrap")
-        raw_data["players"] = pd.read_sql(players_query, self.session.bind)
+        # Load raw players data (string-encoded stats such as form and selected_by_percent as floats)
+        raw_data["players"] = read_numeric_frame(self.session.bind, RawPlayerBootstrap, use_column_names=True)
         # Rename columns for backwards compatibility with processing code
         if "player_id" in raw_data["players"].columns:
             raw_data["players"] = raw_data["players"].rename(
@@ -589,8 +598,7 @@ class DerivedDataProcessor:
 
         players["form_per_million"] = np.where(
             (players["current_price"] > 0) & (players["form"].notna()),
-            np.maximum(pd.to_numeric(players["form"], errors="coerce"), 0)
-            / players["current_price"],  # Use max(0, form) to avoid negative values
+            np.maximum(players["form"], 0) / players["current_price"],  # Use max(0, form) to avoid negative values
             0.0,
         )
 
@@ -602,7 +610,7 @@ class DerivedDataProcessor:
         players["form_trend"] = self._analyze_form_trend(players)
         players["form_momentum"] = self._calculate_form_momentum(players)
         players["recent_form_5gw"] = np.maximum(
-            pd.to_numeric(players["form"], errors="coerce").fillna(0.0), 0.0
+            players["form"].fillna(0.0), 0.0
         )  # Use max(0, form) to avoid negative values
         players["season_consistency"] = self._calculate_consistency(players)
 
@@ -672,7 +680,7 @@ class DerivedDataProcessor:
 
         # Validate with schema
         try:
-            validated_df = DerivedPlayerMetricsSchema.validate(derived_players)
+            validated_df = validate_table(derived_players, DerivedPlayerMetricsSchema, "derived_player_metrics")
             logger.info(f"Processed {len(validated_df)} player metrics successfully")
             return validated_df
         except Exception as e:
@@ -813,7 +821,7 @@ class DerivedDataProcessor:
         ].rename(columns={"id": "team_id"})
 
         try:
-            validated_df = DerivedTeamFormSchema.validate(derived_teams)
+            validated_df = validate_table(derived_teams, DerivedTeamFormSchema, "derived_team_form")
             logger.info(f"Processed {len(validated_df)} team form metrics successfully")
             return validated_df
         except Exception as e:
@@ -859,7 +867,9 @@ class DerivedDataProcessor:
         derived_fixtures = pd.DataFrame(fixture_difficulties)
 
         try:
-            validated_df = DerivedFixtureDifficultySchema.validate(derived_fixtures)
+            validated_df = validate_table(
+                derived_fixtures, DerivedFixtureDifficultySchema, "derived_fixture_difficulty"
+            )
             logger.info(f"Processed {len(validated_df)} fixture difficulty metrics successfully")
             return validated_df
         except Exception as e:
@@ -965,7 +975,7 @@ class DerivedDataProcessor:
         ].rename(columns={"id": "player_id", "element_type": "position_id"})
 
         try:
-            validated_df = DerivedValueAnalysisSchema.validate(derived_value)
+            validated_df = validate_table(derived_value, DerivedValueAnalysisSchema, "derived_value_analysis")
 
             # Save backfill records separately (directly to database)
             if backfill_records:
@@ -1041,15 +1051,15 @@ class DerivedDataProcessor:
         players["current_price"] = players["now_cost"] / 10.0
         players["ownership_vs_price"] = np.where(
             players["current_price"] > 0,
-            pd.to_numeric(players["selected_by_percent"], errors="coerce").fillna(0.0) / players["current_price"],
+            players["selected_by_percent"].fillna(0.0) / players["current_price"],
             0.0,
         )
 
         # template_player: >40% owned
-        players["template_player"] = pd.to_numeric(players["selected_by_percent"], errors="coerce").fillna(0.0) > 40.0
+        players["template_player"] = players["selected_by_percent"].fillna(0.0) > 40.0
 
         # high_ownership_falling: >30% owned + negative net transfers
-        ownership_pct = pd.to_numeric(players["selected_by_percent"], errors="coerce").fillna(0.0)
+        ownership_pct = players["selected_by_percent"].fillna(0.0)
         players["high_ownership_falling"] = (ownership_pct > 30.0) & (players["net_transfers_gw"] < 0)
 
         # Meta information
@@ -1083,7 +1093,7 @@ class DerivedDataProcessor:
         ].rename(columns={"id": "player_id"})
 
         try:
-            validated_df = DerivedOwnershipTrendsSchema.validate(derived_ownership)
+            validated_df = validate_table(derived_ownership, DerivedOwnershipTrendsSchema, "derived_ownership_trends")
 
             # Save backfill records separately (directly to database)
             if backfill_records:
@@ -1215,7 +1225,7 @@ class DerivedDataProcessor:
         df = pd.DataFrame(records)
 
         try:
-            validated_df = DerivedFixtureRunsSchema.validate(df)
+            validated_df = validate_table(df, DerivedFixtureRunsSchema, "derived_fixture_runs")
             logger.info(f"Processed {len(validated_df)} fixture run analyses successfully")
             return validated_df
         except Exception as e:
@@ -1478,7 +1488,7 @@ class DerivedDataProcessor:
 
     def _analyze_form_trend(self, players: pd.DataFrame) -> pd.Series:
         """Analyze form trend based on recent performance."""
-        form = pd.to_numeric(players.get("form", 3.0), errors="coerce").fillna(3.0)
+        form = _player_stat(players, "form", 3.0)
 
         # Simple trend analysis based on form value
         conditions = [form >= 5.0, form >= 3.5, form >= 2.5, form < 2.5]
@@ -1745,7 +1755,7 @@ class DerivedDataProcessor:
 
     def _calculate_expected_ppg(self, players: pd.DataFrame) -> pd.Series:
         """Calculate expected points per game."""
-        form_values = pd.to_numeric(players.get("form", 3.0), errors="coerce").fillna(3.0)
+        form_values = _player_stat(players, "form", 3.0)
         return np.maximum(form_values, 0.0)  # Use max(0, form) to avoid negative values
 
     def _calculate_overperformance_risk(self, players: pd.DataFrame) -> pd.Series:
@@ -1761,7 +1771,7 @@ class DerivedDataProcessor:
 
     def _calculate_ownership_risk(self, players: pd.DataFrame) -> pd.Series:
         """Calculate ownership risk."""
-        ownership = pd.to_numeric(players.get("selected_by_percent", 5.0), errors="coerce").fillna(5.0)
+        ownership = _player_stat(players, "selected_by_percent", 5.0)
         return np.minimum(ownership / 50.0, 1.0)  # Higher ownership = higher risk
 
     def _analyze_set_pieces(self, players: pd.DataFrame) -> pd.Series:
@@ -1780,7 +1790,7 @@ class DerivedDataProcessor:
 
     def _calculate_injury_risk(self, players: pd.DataFrame) -> pd.Series:
         """Calculate injury risk."""
-        chance_next = pd.to_numeric(players.get("chance_of_playing_next_round", 100), errors="coerce").fillna(100)
+        chance_next = _player_stat(players, "chance_of_playing_next_round", 100)
         return (100 - chance_next) / 100.0
 
     def _calculate_rotation_risk(self, players: pd.DataFrame) -> pd.Series:
@@ -1909,7 +1919,7 @@ class DerivedDataProcessor:
         if new_players is None:
             new_players = set()
 
-        ownership = pd.to_numeric(players.get("selected_by_percent", 5.0), errors="coerce").fillna(5.0)
+        ownership = _player_stat(players, "selected_by_percent", 5.0)
         conditions = [ownership >= 30.0, ownership >= 15.0, ownership >= 5.0, ownership >= 1.0]
         choices = ["template", "popular", "mid_owned", "differential"]
         result = pd.Series(np.select(conditions, choices, default="punt"), index=players.index)
@@ -1920,12 +1930,12 @@ class DerivedDataProcessor:
 
     def _categorize_ownership_risk(self, players: pd.DataFrame) -> pd.Series:
         """Categorize ownership risk level."""
-        ownership = pd.to_numeric(players.get("selected_by_percent", 5.0), errors="coerce").fillna(5.0)
+        ownership = _player_stat(players, "selected_by_percent", 5.0)
         conditions = [ownership >= 40.0, ownership >= 20.0, ownership >= 10.0]
         choices = ["very_high", "high", "medium"]
         return pd.Series(np.select(conditions, choices, default="low"), index=players.index)
 
     def _calculate_bandwagon_score(self, players: pd.DataFrame) -> pd.Series:
         """Calculate bandwagon following score."""
-        ownership = pd.to_numeric(players.get("selected_by_percent", 5.0), errors="coerce").fillna(5.0)
+        ownership = _player_stat(players, "selected_by_percent", 5.0)
         return np.minimum(ownership / 5.0, 10.0)
@@ -1,11 +1,14 @@
 """External data fetching functions."""
 
-from io import StringIO
+from io import BytesIO
 
 import pandas as pd
 import requests
 
-from utils import http_get
+from utils import loads_json
+
+from .http_client import http_get, http_get_response
+from .vaastav import read_vaastav_csv
 
 
 def fetch_results_last_season(season: str) -> pd.DataFrame:
@@ -20,17 +23,13 @@ def fetch_results_last_season(season: str) -> pd.DataFrame:
         else:
             season_key = season
 
-        # Fetch fixtures.csv from vaastav's repo
-        base_url = "https://raw.githubusercontent.com/vaastav/Fantasy-Premier-League/master/data"
-        url = f"{base_url}/{season_key}/fixtures.csv"
-
-        data = http_get(url)
-
-        # Read CSV data
-        fixtures_df = pd.read_csv(StringIO(data.decode("utf-8")))
-
-        # Filter for completed matches (both scores not null)
-        completed_matches = fixtures_df.dropna(subset=["team_h_score", "team_a_score"])
+        # Read fixtures.csv from the local vaastav cache, keeping completed matches only
+        completed_matches = read_vaastav_csv(
+            season_key,
+            "fixtures.csv",
+            columns=["kickoff_time", "team_h", "team_a", "team_h_score", "team_a_score"],
+            row_filter=lambda df: df.dropna(subset=["team_h_score", "team_a_score"]),
+        )
 
         # Create team ID to name mapping from database
         from db.operations import db_ops
@@ -99,8 +98,8 @@ def fetch_betting_odds_data(season: str = "2025-26") -> pd.DataFrame:
         url = f"https://www.football-data.co.uk/mmz4281/{season_code}/E0.csv"
         data = http_get(url)
 
-        # Read CSV data
-        odds_df = pd.read_csv(StringIO(data.decode("utf-8")))
+        # Parse straight from the response bytes
+        odds_df = pd.read_csv(BytesIO(data))
 
         print(f"Successfully fetched {len(odds_df)} matches from football-data.co.uk")
         return odds_df
@@ -137,7 +136,6 @@ def fetch_realtime_betting_odds(api_key: str | None = None, gameweek: int | None
         >>> from fetchers.external import fetch_realtime_betting_odds
         >>> odds = fetch_realtime_betting_odds(api_key="your-key", gameweek=10)
     """
-    import json
     import os
 
     # Get API key from parameter or environment
@@ -166,15 +164,14 @@ def fetch_realtime_betting_odds(api_key: str | None = None, gameweek: int | None
 
         # Make request with query parameters
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
+            response = http_get_response(url, retries=1, timeout=30, params=params)
             response_data = response.content
         except requests.RequestException as e:
             print(f"❌ HTTP error fetching odds: {e}")
             return pd.DataFrame()
 
         # Parse JSON response
-        odds_data = json.loads(response_data.decode("utf-8"))
+        odds_data = loads_json(response_data)
 
         if not odds_data:
             print("⚠️  No odds data returned from API")
@@ -288,37 +285,12 @@ def fetch_realtime_betting_odds(api_key: str | None = None, gameweek: int | None
                     max_a = max(away_odds_list)
                     avg_a = sum(away_odds_list) / len(away_odds_list)
 
-            # Map team names from The Odds API format to football-data.co.uk format
-            # The Odds API uses various name formats, we need to normalize to football-data.co.uk format
-            # which then gets mapped to FPL names by process_raw_betting_odds()
-            ODDS_API_TO_FOOTBALL_DATA = {
-                # Full names → football-data.co.uk format
-                "Manchester United": "Man United",
-                "Man United": "Man United",  # Sometimes already short
-                "Tottenham Hotspur": "Tottenham",
-                "Tottenham": "Tottenham",  # Sometimes already short
-                "Manchester City": "Man City",
-                "Man City": "Man City",  # Sometimes already short
-                "Brighton & Hove Albion": "Brighton",
-                "Brighton and Hove Albion": "Brighton",  # Alternative format
-                "Wolverhampton Wanderers": "Wolves",
-                "Leicester City": "Leicester",
-                "Newcastle United": "Newcastle",
-                "West Ham United": "West Ham",
-                "Crystal Palace": "Crystal Palace",
-                "Nottingham Forest": "Nott'm Forest",
-                "Leeds United": "Leeds",
-            }
-
-            # Normalize team names to match football-data.co.uk format
-            normalized_home = ODDS_API_TO_FOOTBALL_DATA.get(home_team, home_team)
-            normalized_away = ODDS_API_TO_FOOTBALL_DATA.get(away_team, away_team)
-
             # Create row in format compatible with football-data.co.uk CSV
             odds_row = {
                 "Date": match_date.strftime("%d/%m/%Y"),
-                "HomeTeam": normalized_home,
-                "AwayTeam": normalized_away,
+                # Names stay as The Odds API spells them; process_raw_betting_odds resolves them via raw_team_aliases
+                "HomeTeam": home_team,
+                "AwayTeam": away_team,
                 # Bet365 odds
                 "B365H": b365_h,
                 "B365D": b365_d,
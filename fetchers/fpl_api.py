@@ -1,13 +1,40 @@
 """FPL API data fetching functions."""
 
-import json
+import gzip
+import os
+from pathlib import Path
 
-from utils import http_get
+from utils import loads_json
 
+from .http_cache import cached_get
+from .http_client import http_get
 
-def fetch_fpl_bootstrap() -> dict:
+DEFAULT_FPL_API_BASE_URL = "https://fantasy.premierleague.com/api"
+
+# Override with FPL_API_BASE_URL (e.g. a local stub server) or set_fpl_api_base_url()
+FPL_API_BASE_URL = os.getenv("FPL_API_BASE_URL", DEFAULT_FPL_API_BASE_URL).rstrip("/")
+
+_last_fetch_unchanged: dict[str, bool] = {}
+
+
+def set_fpl_api_base_url(base_url: str | None) -> None:
+    """Point all FPL API fetchers at a different base URL (None restores the default)."""
+    global FPL_API_BASE_URL
+    FPL_API_BASE_URL = (base_url or DEFAULT_FPL_API_BASE_URL).rstrip("/")
+
+
+def fpl_api_url(path: str) -> str:
+    """Build a full FPL API URL for a path such as "bootstrap-static/" using the current base URL."""
+    return f"{FPL_API_BASE_URL}/{path.lstrip('/')}"
+
+
+def fetch_fpl_bootstrap(use_cache: bool = True) -> dict:
     """Fetch FPL bootstrap data and save raw JSON.
 
+    With use_cache, the request is revalidated against data/http_cache/ and the
+    cached body is reused on 304; check last_fetch_unchanged("bootstrap") to skip
+    downstream reprocessing.
+
     Returns complete bootstrap data with all API sections:
     - elements: All player data (101 fields per player)
     - teams: All team data (21 fields per team)
@@ -19,14 +46,15 @@ def fetch_fpl_bootstrap() -> dict:
     - phases: Season phases (11 items)
     """
     print("Fetching FPL bootstrap data...")
-    url = "https://fantasy.premierleague.com/api/bootstrap-static/"
-    data = http_get(url)
+    url = fpl_api_url("bootstrap-static/")
+    data, unchanged = _fetch(url, "bootstrap", use_cache)
 
-    bootstrap = json.loads(data)
+    if unchanged:
+        print("Bootstrap data unchanged since last fetch (served from cache)")
+    else:
+        save_raw_dump("fpl_raw_bootstrap", data)
 
-    # Save raw JSON
-    with open("data/fpl_raw_bootstrap.json", "w") as f:
-        json.dump(bootstrap, f, indent=2)
+    bootstrap = loads_json(data)
 
     # Log what we captured for visibility
     print("Bootstrap data captured:")
@@ -42,21 +70,67 @@ def fetch_fpl_bootstrap() -> dict:
     return bootstrap
 
 
-def fetch_fpl_fixtures() -> list[dict]:
-    """Fetch FPL fixtures and save raw JSON."""
+def fetch_fpl_fixtures(use_cache: bool = True) -> list[dict]:
+    """Fetch FPL fixtures and save raw JSON (revalidated against the HTTP cache)."""
     print("Fetching FPL fixtures...")
-    url = "https://fantasy.premierleague.com/api/fixtures/"
-    data = http_get(url)
+    url = fpl_api_url("fixtures/")
+    data, unchanged = _fetch(url, "fixtures", use_cache)
 
-    fixtures = json.loads(data)
+    if unchanged:
+        print("Fixtures unchanged since last fetch (served from cache)")
+    else:
+        save_raw_dump("fpl_raw_fixtures", data)
 
-    # Save raw JSON
-    with open("data/fpl_raw_fixtures.json", "w") as f:
-        json.dump(fixtures, f, indent=2)
+    fixtures = loads_json(data)
 
     return fixtures
 
 
+def save_raw_dump(name: str, data: bytes, data_dir: str = "data") -> Path:
+    """Write a raw API payload to data/<name>.json exactly as received (no re-serialization).
+
+    Set FPL_RAW_DUMP_GZIP=1 to write data/<name>.json.gz instead; the other form is
+    removed so only one copy of each dump exists.
+
+    Args:
+        name: Dump file name without extension (e.g. "fpl_raw_bootstrap")
+        data: Raw response body
+        data_dir: Directory to write into
+
+    Returns:
+        Path of the written file
+    """
+    plain_path = Path(data_dir) / f"{name}.json"
+    gzip_path = Path(data_dir) / f"{name}.json.gz"
+    if os.getenv("FPL_RAW_DUMP_GZIP", "0") == "1":
+        path, stale_path = gzip_path, plain_path
+        payload = gzip.compress(data, compresslevel=6)
+    else:
+        path, stale_path = plain_path, gzip_path
+        payload = data
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+    stale_path.unlink(missing_ok=True)
+    return path
+
+
+def _fetch(url: str, endpoint: str, use_cache: bool) -> tuple[bytes, bool]:
+    """Fetch an endpoint, optionally through the conditional-GET cache."""
+    if use_cache:
+        data, unchanged = cached_get(url)
+    else:
+        data, unchanged = http_get(url), False
+    _last_fetch_unchanged[endpoint] = unchanged
+    return data, unchanged
+
+
+def last_fetch_unchanged(endpoint: str) -> bool:
+    """Whether the last fetch of an endpoint ("bootstrap" or "fixtures") returned unchanged content."""
+    return _last_fetch_unchanged.get(endpoint, False)
+
+
 def fetch_team_details_by_id(team_id: int, bootstrap_data: dict | None = None) -> dict | None:
     """Fetch team details by team ID from bootstrap data or API."""
     if bootstrap_data is None:
@@ -77,15 +151,15 @@ def fetch_manager_team_with_budget(manager_id: int) -> dict | None:
 
     try:
         # Get manager summary data
-        url = f"https://fantasy.premierleague.com/api/entry/{manager_id}/"
+        url = fpl_api_url(f"entry/{manager_id}/")
         data = http_get(url)
-        manager_data = json.loads(data)
+        manager_data = loads_json(data)
 
         # Get current gameweek picks and team details
         current_event = manager_data.get("current_event", 1)
-        picks_url = f"https://fantasy.premierleague.com/api/entry/{manager_id}/event/{current_event}/picks/"
+        picks_url = fpl_api_url(f"entry/{manager_id}/event/{current_event}/picks/")
         picks_data = http_get(picks_url)
-        picks_info = json.loads(picks_data)
+        picks_info = loads_json(picks_data)
 
         # Combine manager summary with detailed team info
         team_details = {
@@ -118,9 +192,9 @@ def fetch_gameweek_live_data(gameweek: int) -> dict | None:
     print(f"Fetching live data for gameweek {gameweek}...")
 
     try:
-        url = f"https://fantasy.premierleague.com/api/event/{gameweek}/live/"
+        url = fpl_api_url(f"event/{gameweek}/live/")
         data = http_get(url)
-        live_data = json.loads(data)
+        live_data = loads_json(data)
 
         print(f"Live data for GW{gameweek}: {len(live_data.get('elements', []))} player records")
         return live_data
@@ -135,9 +209,9 @@ def fetch_manager_gameweek_picks(manager_id: int, gameweek: int) -> dict | None:
     print(f"Fetching picks for manager {manager_id}, gameweek {gameweek}...")
 
     try:
-        url = f"https://fantasy.premierleague.com/api/entry/{manager_id}/event/{gameweek}/picks/"
+        url = fpl_api_url(f"entry/{manager_id}/event/{gameweek}/picks/")
         data = http_get(url)
-        picks_data = json.loads(data)
+        picks_data = loads_json(data)
 
         return picks_data
 
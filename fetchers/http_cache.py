@@ -0,0 +1,131 @@
+"""On-disk conditional-GET cache for large, slowly changing endpoints.
+
+``bootstrap-static`` and ``fixtures`` are multi-MB payloads that are re-requested
+on every ``main``, ``refresh-bootstrap``, ``snapshot`` and ``refresh-gameweek``
+run, yet often have not changed since the previous run. This cache stores the
+last body for each URL under ``data/http_cache/`` together with its validators
+(``ETag`` / ``Last-Modified``) and a content hash, and revalidates with
+``If-None-Match`` / ``If-Modified-Since``.
+
+On a 304 the cached body is served. Either way the caller is told whether the
+content is unchanged since the previous fetch (304, or a 200 with an identical
+body hash) so downstream processing can be skipped.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from utils import now_utc
+
+from . import payload_archive
+from .http_client import http_get_response
+
+CACHE_DIR = Path("data") / "http_cache"
+
+_stats = {"hits": 0, "misses": 0, "unchanged": 0}
+_last_unchanged: dict[str, bool] = {}
+
+
+def _cache_paths(url: str) -> tuple[Path, Path]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+    return CACHE_DIR / f"{key}.json", CACHE_DIR / f"{key}.body"
+
+
+def _load_meta(meta_path: Path, body_path: Path) -> dict:
+    if not (meta_path.exists() and body_path.exists()):
+        return {}
+    try:
+        return json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def cached_get(url: str, retries: int = 3, timeout: int | None = None) -> tuple[bytes, bool]:
+    """Fetch a URL through the conditional-GET cache.
+
+    Args:
+        url: URL to fetch
+        retries: Retry budget passed to the HTTP client
+        timeout: Optional request timeout in seconds
+
+    Returns:
+        (body, unchanged) where unchanged is True when the content is identical to
+        the previously cached copy (served from a 304 or matched by content hash)
+    """
+    if payload_archive.is_replaying():
+        # Replays must reproduce the recorded run, not this machine's cache state
+        return http_get_response(url, retries=retries, timeout=timeout).content, False
+
+    meta_path, body_path = _cache_paths(url)
+    meta = _load_meta(meta_path, body_path)
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = http_get_response(url, retries=retries, timeout=timeout, headers=headers or None)
+
+    if response.status_code == 304 and meta:
+        try:
+            body = body_path.read_bytes()
+        except OSError:
+            # Cached body vanished between the check and the read; fall back to a plain GET
+            response = http_get_response(url, retries=retries, timeout=timeout)
+        else:
+            _stats["hits"] += 1
+            _stats["unchanged"] += 1
+            _last_unchanged[url] = True
+            payload_archive.archive_payload(url, body)
+            return body, True
+
+    _stats["misses"] += 1
+    body = response.content
+    content_hash = hashlib.sha256(body).hexdigest()
+    unchanged = bool(meta) and meta.get("sha256") == content_hash
+    if unchanged:
+        _stats["unchanged"] += 1
+    _last_unchanged[url] = unchanged
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Body first, then metadata, so validators never point at a stale body
+        if not unchanged:
+            _write_atomic(body_path, body)
+        new_meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "sha256": content_hash,
+            "size": len(body),
+            "fetched_at": now_utc().isoformat(),
+        }
+        _write_atomic(meta_path, json.dumps(new_meta).encode("utf-8"))
+    except OSError as e:
+        print(f"Warning: could not update HTTP cache for {url}: {e}")
+
+    return body, unchanged
+
+
+def was_unchanged(url: str) -> bool:
+    """Whether the most recent cached_get for this URL returned unchanged content."""
+    return _last_unchanged.get(url, False)
+
+
+def get_cache_stats() -> dict:
+    """Get conditional-GET counters for this process.
+
+    hits: served from cache after a 304
+    misses: full body downloaded (first fetch, changed content, or no validators)
+    unchanged: fetches whose content matched the cached copy (hits + identical 200s)
+    """
+    return dict(_stats)
@@ -0,0 +1,209 @@
+"""Shared HTTP client with connection pooling for all fetchers.
+
+Every fetcher goes through a single ``requests.Session`` so that repeated
+calls to the same host (FPL API, GitHub raw, football-data.co.uk, The Odds API)
+reuse keep-alive connections instead of paying a fresh TCP+TLS handshake per
+request.
+
+Configuration (environment variables, read when the client is first created):
+    FPL_HTTP_POOL_HOSTS: Number of distinct hosts to keep connection pools for (default 10)
+    FPL_HTTP_POOL_SIZE: Maximum connections kept alive per host (default 10)
+    FPL_HTTP_TIMEOUT: Default request timeout in seconds (default 30)
+"""
+
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from . import payload_archive
+from .rate_limit import CircuitOpenError, get_host_limiter, parse_retry_after
+
+DEFAULT_POOL_HOSTS = 10
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 30
+USER_AGENT = "fpl-dataset-builder/0.2"
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        print(f"Warning: {name} '{value}' is not a valid integer, using default {default}")
+        return default
+    return parsed if parsed > 0 else default
+
+
+class HTTPClient:
+    """Pooled, keep-alive HTTP client shared by all fetchers."""
+
+    def __init__(
+        self,
+        pool_hosts: int = DEFAULT_POOL_HOSTS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: int = DEFAULT_TIMEOUT,
+    ):
+        self.timeout = timeout
+        self.session = requests.Session()
+        # Advertise every content encoding urllib3 can decode (adds br/zstd when installed)
+        self.session.headers.update({"Accept-Encoding": ACCEPT_ENCODING, "User-Agent": USER_AGENT})
+
+        # pool_block=False: never stall a caller, just open a short-lived extra connection
+        self._adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size, pool_block=False)
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+
+    def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: int | None = None,
+    ) -> requests.Response:
+        """Issue a single GET request over the pooled session (no retries, no status check)."""
+        return self.session.get(url, params=params, headers=headers, timeout=timeout or self.timeout)
+
+    def connection_stats(self) -> dict:
+        """Return request and connection counters aggregated over all host pools.
+
+        ``new_connections`` counts TCP connections opened; every other request was
+        served over an already-open keep-alive connection (``reused_connections``).
+        """
+        per_host = {}
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.scheme}://{pool.host}"
+            stats = per_host.setdefault(host, {"requests": 0, "new_connections": 0, "reused_connections": 0})
+            stats["requests"] += pool.num_requests
+            stats["new_connections"] += pool.num_connections
+            stats["reused_connections"] += max(pool.num_requests - pool.num_connections, 0)
+
+        return {
+            "requests": sum(s["requests"] for s in per_host.values()),
+            "new_connections": sum(s["new_connections"] for s in per_host.values()),
+            "reused_connections": sum(s["reused_connections"] for s in per_host.values()),
+            "hosts": per_host,
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_client: HTTPClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """Get the process-wide HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HTTPClient(
+                    pool_hosts=_env_int("FPL_HTTP_POOL_HOSTS", DEFAULT_POOL_HOSTS),
+                    pool_size=_env_int("FPL_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE),
+                    timeout=_env_int("FPL_HTTP_TIMEOUT", DEFAULT_TIMEOUT),
+                )
+    return _client
+
+
+def configure_http_client(
+    pool_hosts: int = DEFAULT_POOL_HOSTS,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> HTTPClient:
+    """Replace the process-wide HTTP client with one using explicit settings."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = HTTPClient(pool_hosts=pool_hosts, pool_size=pool_size, timeout=timeout)
+    return _client
+
+
+def get_connection_stats() -> dict:
+    """Get connection reuse counters for the process-wide HTTP client."""
+    return get_http_client().connection_stats()
+
+
+def http_get_response(
+    url: str,
+    retries: int = 3,
+    timeout: int | None = None,
+    params: dict | None = None,
+    headers: dict | None = None,
+) -> requests.Response:
+    """HTTP GET over the pooled session with retries, returning the full response.
+
+    Requests go through the host's adaptive rate limiter (see fetchers.rate_limit):
+    429 and 5xx responses and connection errors are retried after Retry-After or a
+    jittered backoff, other 4xx responses raise immediately, and a CircuitOpenError
+    is raised without a request while the host's circuit breaker is open.
+    304 Not Modified is returned as-is.
+
+    Successful bodies are recorded in the payload archive; while replaying an archived
+    run the response is served from the archive without touching the network.
+    """
+    if payload_archive.is_replaying():
+        return _replayed_response(url, params)
+
+    client = get_http_client()
+    limiter = get_host_limiter(urlsplit(url).netloc)
+    for attempt in range(retries):
+        last_attempt = attempt == retries - 1
+        limiter.acquire()
+        try:
+            response = client.get(url, params=params, headers=headers, timeout=timeout)
+        except requests.RequestException as e:
+            limiter.record_failure()
+            if last_attempt:
+                raise
+            delay = limiter.backoff_delay(attempt)
+            print(f"Retry {attempt + 1}/{retries} for {url} in {delay:.1f}s: {e}")
+            time.sleep(delay)
+            continue
+
+        if response.status_code == 429 or response.status_code >= 500:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            limiter.record_failure(response.status_code, retry_after)
+            if last_attempt:
+                response.raise_for_status()
+            if retry_after is not None and retry_after > limiter.max_retry_after:
+                raise CircuitOpenError(f"{limiter.host} asked to retry after {retry_after:.0f}s; not waiting")
+            delay = limiter.backoff_delay(attempt, retry_after)
+            print(f"Retry {attempt + 1}/{retries} for {url} in {delay:.1f}s: HTTP {response.status_code}")
+            time.sleep(delay)
+            continue
+
+        limiter.record_success()
+        response.raise_for_status()
+        if response.status_code == 200:
+            payload_archive.archive_payload(url, response.content, params)
+        return response
+    raise requests.RequestException(f"No attempts made for {url}")
+
+
+def _replayed_response(url: str, params: dict | None) -> requests.Response:
+    """Build a 200 response from the archived payload of the run being replayed."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = payload_archive.request_key(url, params)
+    response._content = payload_archive.replay_payload(url, params)
+    return response
+
+
+def http_get(url: str, retries: int = 3, timeout: int | None = None, params: dict | None = None) -> bytes:
+    """HTTP GET over the pooled session with retries."""
+    return http_get_response(url, retries=retries, timeout=timeout, params=params).content
@@ -0,0 +1,208 @@
+"""League-scale manager ingestion.
+
+The personal-manager path (``raw_my_picks``, ``raw_my_gameweek_summary``) tracks a
+single manager. This module ingests picks and gameweek summaries for whole
+mini-leagues or large cohorts (thousands of managers) into the compact
+multi-manager tables ``raw_manager_picks`` and ``raw_manager_gameweek_summary``.
+
+Managers are processed in fixed-size chunks: each chunk is fetched concurrently
+with ``async_fetch.fetch_many``, converted to rows, and written in a single
+transaction before the next chunk is fetched, so memory stays bounded by the
+chunk size no matter how many managers are ingested. The database is the
+checkpoint - managers whose picks for a gameweek are already stored are skipped,
+so an interrupted run resumes where it stopped when re-run.
+"""
+
+import math
+import time
+
+import pandas as pd
+
+from db.operations import DatabaseOperations
+
+from .async_fetch import DEFAULT_MAX_CONCURRENCY, DEFAULT_REQUESTS_PER_SECOND, FetchResult, fetch_many
+from .fpl_api import fpl_api_url
+from .raw_processor import (
+    process_raw_league_standings,
+    process_raw_manager_history_batch,
+    process_raw_manager_picks_batch,
+)
+
+DEFAULT_CHUNK_SIZE = 500
+STANDINGS_PAGE_SIZE = 50  # Managers per classic league standings page
+
+
+def fetch_league_standings(
+    league_id: int,
+    max_managers: int | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+) -> pd.DataFrame:
+    """Fetch the members of a classic league, paging through the standings concurrently.
+
+    Args:
+        league_id: Classic league ID
+        max_managers: Stop after this many top-ranked managers (None for the whole league)
+        max_concurrency: Maximum page requests in flight at once
+        requests_per_second: Global cap on request start rate
+
+    Returns:
+        DataFrame of league members ordered by rank (empty on failure)
+    """
+    print(f"Fetching standings for league {league_id}...")
+    max_pages = math.ceil(max_managers / STANDINGS_PAGE_SIZE) if max_managers else None
+    pages = []
+    next_page = 1
+
+    while max_pages is None or next_page <= max_pages:
+        last_page = next_page + max_concurrency - 1
+        if max_pages is not None:
+            last_page = min(last_page, max_pages)
+        batch = [
+            (page, fpl_api_url(f"leagues-classic/{league_id}/standings/?page_standings={page}"))
+            for page in range(next_page, last_page + 1)
+        ]
+        results = fetch_many(batch, max_concurrency=max_concurrency, requests_per_second=requests_per_second)
+
+        reached_end = False
+        for result in results:
+            if not result.ok:
+                print(f"Error fetching league {league_id} standings page {result.key}: {result.error}")
+                reached_end = True
+                break
+            pages.append(result.data)
+            if not result.data.get("standings", {}).get("has_next"):
+                reached_end = True
+                break
+        if reached_end:
+            break
+        next_page = last_page + 1
+
+    df = process_raw_league_standings(league_id, pages)
+    if max_managers and not df.empty:
+        df = df.head(max_managers)
+    print(f"League {league_id}: {len(df)} managers across {len(pages)} standings pages")
+    return df
+
+
+def _chunks(items: list[int], size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _ok_by_key(results: list[FetchResult]) -> tuple[dict, int]:
+    data = {r.key: r.data for r in results if r.ok}
+    return data, len(results) - len(data)
+
+
+def ingest_manager_history(
+    manager_ids: list[int],
+    gameweeks: list[int],
+    db_ops: DatabaseOperations | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    force: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+) -> dict[str, int]:
+    """Store gameweek summaries for many managers from one /entry/{id}/history/ request each.
+
+    Managers that already have a summary for every requested gameweek are skipped
+    unless force is set.
+
+    Returns:
+        Counts of managers stored, skipped and failed
+    """
+    db_ops = db_ops or DatabaseOperations()
+    stats = {"stored": 0, "skipped": 0, "failed": 0, "rows": 0}
+
+    pending = manager_ids
+    if not force:
+        coverage = db_ops.get_manager_summary_coverage(gameweeks)
+        pending = [m for m in manager_ids if coverage.get(m, 0) < len(gameweeks)]
+        stats["skipped"] = len(manager_ids) - len(pending)
+
+    print(f"📜 Entry history: {len(pending)} managers to fetch ({stats['skipped']} already complete)")
+    for chunk in _chunks(pending, chunk_size):
+        results = fetch_many(
+            [(m, fpl_api_url(f"entry/{m}/history/")) for m in chunk],
+            max_concurrency=max_concurrency,
+            requests_per_second=requests_per_second,
+        )
+        history_by_manager, failed = _ok_by_key(results)
+        summary_df = process_raw_manager_history_batch(history_by_manager, gameweeks)
+        if not summary_df.empty:
+            db_ops.save_raw_manager_gameweek_summary(summary_df)
+
+        stats["stored"] += len(history_by_manager)
+        stats["failed"] += failed
+        stats["rows"] += len(summary_df)
+        print(f"  ✅ History chunk: {len(history_by_manager)}/{len(chunk)} managers, {len(summary_df)} summaries")
+
+    return stats
+
+
+def ingest_manager_picks(
+    manager_ids: list[int],
+    gameweeks: list[int],
+    db_ops: DatabaseOperations | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    force: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+) -> dict[str, int]:
+    """Fetch and store picks (plus entry_history summaries) for many managers and gameweeks.
+
+    Each chunk of managers is fetched concurrently and saved in one transaction
+    before the next chunk starts. Managers whose picks for a gameweek are already
+    stored are skipped unless force is set, so re-running resumes an interrupted run.
+
+    Args:
+        manager_ids: Managers to ingest
+        gameweeks: Gameweeks to ingest picks for
+        db_ops: Database operations instance (a new one by default)
+        chunk_size: Managers fetched and saved per transaction (bounds memory)
+        force: Re-fetch managers that are already stored
+        max_concurrency: Maximum requests in flight at once
+        requests_per_second: Global cap on request start rate
+
+    Returns:
+        Counts of manager-gameweeks stored, skipped and failed, and pick rows written
+    """
+    db_ops = db_ops or DatabaseOperations()
+    stats = {"stored": 0, "skipped": 0, "failed": 0, "rows": 0}
+
+    for gameweek in gameweeks:
+        pending = manager_ids
+        if not force:
+            done = db_ops.get_ingested_manager_ids(gameweek)
+            pending = [m for m in manager_ids if m not in done]
+            stats["skipped"] += len(manager_ids) - len(pending)
+
+        if not pending:
+            print(f"⏭️  GW{gameweek}: all {len(manager_ids)} managers already ingested")
+            continue
+
+        print(f"🔄 GW{gameweek}: fetching picks for {len(pending)} managers in chunks of {chunk_size}...")
+        start = time.perf_counter()
+        for chunk in _chunks(pending, chunk_size):
+            results = fetch_many(
+                [(m, fpl_api_url(f"entry/{m}/event/{gameweek}/picks/")) for m in chunk],
+                max_concurrency=max_concurrency,
+                requests_per_second=requests_per_second,
+            )
+            picks_by_manager, failed = _ok_by_key(results)
+            picks_df, summary_df = process_raw_manager_picks_batch(picks_by_manager, gameweek)
+            if not picks_df.empty:
+                db_ops.save_manager_gameweek_batch(picks_df, summary_df)
+
+            stats["stored"] += summary_df["manager_id"].nunique() if not summary_df.empty else 0
+            stats["failed"] += failed
+            stats["rows"] += len(picks_df)
+            for result in results:
+                if not result.ok:
+                    print(f"  ⚠️ Manager {result.key} GW{gameweek}: {result.error}")
+
+        elapsed = time.perf_counter() - start
+        print(f"✅ GW{gameweek}: {len(pending)} managers processed in {elapsed:.1f}s")
+
+    return stats
@@ -0,0 +1,195 @@
+"""Content-addressed archive of raw API payloads, with offline replay.
+
+Every payload fetched over HTTP (bootstrap, fixtures, live, picks, odds CSV/JSON,
+vaastav CSVs) is stored gzip-compressed under its SHA-256, and each run appends to a
+JSON Lines manifest mapping request keys to those hashes (a header line with the run
+ID and start time, then one line per payload; a key fetched again is superseded by
+its later line):
+
+    data/archive/objects/<sha[:2]>/<sha>.gz
+    data/archive/runs/<run_id>.jsonl
+
+Identical payloads across runs are stored once. Calling start_replay(run_id)
+makes the HTTP layer serve every request from that run's manifest instead of the
+network, so a recorded pipeline run can be reproduced, benchmarked and profiled
+offline.
+
+Configuration (environment variables):
+    FPL_ARCHIVE_DIR: Archive root directory (default data/archive)
+    FPL_ARCHIVE: Set to 0 to disable recording payloads
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from urllib.parse import urlencode
+
+from utils import now_utc
+
+ARCHIVE_DIR = Path(os.getenv("FPL_ARCHIVE_DIR", str(Path("data") / "archive")))
+
+# Query parameters that must never end up in a manifest key
+_SECRET_PARAMS = {"apiKey", "api_key"}
+
+_lock = threading.Lock()
+_run: dict | None = None
+_replay: dict | None = None
+
+
+class ReplayError(Exception):
+    """Raised when a replayed run has no archived payload for a request."""
+
+
+def _enabled() -> bool:
+    return os.getenv("FPL_ARCHIVE", "1") != "0"
+
+
+def request_key(url: str, params: dict | None = None) -> str:
+    """Stable manifest key for a request (URL plus sorted, non-secret query params)."""
+    if not params:
+        return url
+    safe_params = sorted((k, v) for k, v in params.items() if k not in _SECRET_PARAMS)
+    return f"{url}?{urlencode(safe_params)}" if safe_params else url
+
+
+def _object_path(sha: str) -> Path:
+    return ARCHIVE_DIR / "objects" / sha[:2] / f"{sha}.gz"
+
+
+def _manifest_path(run_id: str) -> Path:
+    return ARCHIVE_DIR / "runs" / f"{run_id}.jsonl"
+
+
+def _append_manifest_line(run_id: str, line: dict) -> None:
+    path = _manifest_path(run_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(line) + "\n")
+
+
+def _read_manifest(path: Path) -> dict:
+    """Run manifest as {"run_id", "started_at", "entries": {key: {"sha256", "size"}}}."""
+    if path.suffix == ".json":
+        # Runs recorded before manifests became append-only
+        return json.loads(path.read_text())
+    with open(path, encoding="utf-8") as f:
+        manifest = {**json.loads(f.readline()), "entries": {}}
+        for raw in f:
+            if raw.strip():
+                entry = json.loads(raw)
+                manifest["entries"][entry.pop("key")] = entry
+    return manifest
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + f".{uuid.uuid4().hex[:8]}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def store_object(body: bytes) -> str:
+    """Store a payload under its content hash (no-op if already archived) and return the hash."""
+    sha = hashlib.sha256(body).hexdigest()
+    path = _object_path(sha)
+    if not path.exists():
+        _write_atomic(path, gzip.compress(body, compresslevel=6))
+    return sha
+
+
+def load_object(sha: str) -> bytes:
+    """Load and decompress an archived payload by content hash."""
+    return gzip.decompress(_object_path(sha).read_bytes())
+
+
+def get_run_id() -> str | None:
+    """ID of the run being recorded in this process (None until the first payload is archived)."""
+    return _run["run_id"] if _run else None
+
+
+def archive_payload(url: str, body: bytes, params: dict | None = None) -> str | None:
+    """Archive a fetched payload and record it in this run's manifest.
+
+    Args:
+        url: Request URL
+        body: Raw response body
+        params: Query parameters sent with the request
+
+    Returns:
+        Content hash of the payload, or None if archiving is disabled, replaying, or failed
+    """
+    global _run
+    if _replay is not None or not _enabled():
+        return None
+
+    try:
+        sha = store_object(body)
+        with _lock:
+            if _run is None:
+                run_id = f"{now_utc().strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:6]}"
+                _append_manifest_line(run_id, {"run_id": run_id, "started_at": now_utc().isoformat()})
+                _run = {"run_id": run_id}
+            _append_manifest_line(_run["run_id"], {"key": request_key(url, params), "sha256": sha, "size": len(body)})
+        return sha
+    except OSError as e:
+        print(f"Warning: could not archive payload for {url}: {e}")
+        return None
+
+
+def start_replay(run_id: str) -> dict:
+    """Serve all HTTP requests from an archived run instead of the network.
+
+    Args:
+        run_id: ID of a recorded run (see list_runs)
+
+    Returns:
+        The run manifest
+
+    Raises:
+        ReplayError: If no manifest exists for run_id
+    """
+    global _replay
+    path = _manifest_path(run_id)
+    if not path.exists():
+        path = path.with_suffix(".json")
+    if not path.exists():
+        raise ReplayError(f"No archived run '{run_id}' in {ARCHIVE_DIR / 'runs'}")
+    _replay = _read_manifest(path)
+    return _replay
+
+
+def stop_replay() -> None:
+    """Return to fetching from the network."""
+    global _replay
+    _replay = None
+
+
+def is_replaying() -> bool:
+    """Whether requests are currently served from an archived run."""
+    return _replay is not None
+
+
+def replay_payload(url: str, params: dict | None = None) -> bytes:
+    """Return the archived body for a request in the run being replayed.
+
+    Raises:
+        ReplayError: If the run has no payload for this request
+    """
+    if _replay is None:
+        raise ReplayError("Replay mode is not active")
+    entry = _replay["entries"].get(request_key(url, params))
+    if entry is None:
+        raise ReplayError(f"Run '{_replay['run_id']}' has no archived payload for {request_key(url, params)}")
+    return load_object(entry["sha256"])
+
+
+def list_runs() -> list[str]:
+    """IDs of all recorded runs, oldest first."""
+    runs_dir = ARCHIVE_DIR / "runs"
+    if not runs_dir.exists():
+        return []
+    return sorted({p.stem for pattern in ("*.jsonl", "*.json") for p in runs_dir.glob(pattern)})
@@ -0,0 +1,240 @@
+"""Adaptive per-host rate limiting with a circuit breaker.
+
+Every request made through ``http_client.http_get_response`` first takes a token
+from its host's bucket. The bucket refills at the host's current rate, which
+halves on 429/5xx responses and creeps back up by one request/second on each
+success (additive increase, multiplicative decrease). ``Retry-After`` blocks the
+host until the server says it is ready, and retry backoff is jittered so
+concurrent workers do not retry in lockstep.
+
+After ``failure_threshold`` consecutive failures the host's circuit opens. While
+it is open, requests fail immediately with ``CircuitOpenError`` instead of
+sleeping through more retries. Once ``cooldown`` has elapsed a single trial request
+is let through (half-open), and a success closes the circuit again.
+
+Configuration (environment variables, read when a host's limiter is first created):
+    FPL_RATE_LIMIT_RPS: Steady-state requests per second per host (default 10)
+    FPL_RATE_LIMIT_BURST: Bucket size, i.e. requests allowed back-to-back (default 10)
+    FPL_CIRCUIT_FAILURES: Consecutive failures that open the circuit (default 5)
+    FPL_CIRCUIT_COOLDOWN: Seconds the circuit stays open before a trial request (default 30)
+    FPL_MAX_RETRY_AFTER: Longest Retry-After (seconds) worth waiting for; longer fails fast (default 60)
+"""
+
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from utils import now_utc
+
+DEFAULT_RPS = 10.0
+DEFAULT_BURST = 10
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN = 30.0
+DEFAULT_MAX_RETRY_AFTER = 60.0
+MIN_RPS = 0.5
+MAX_BACKOFF = 30.0
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of making a request while a host's circuit breaker is open."""
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a positive float from the environment, falling back to default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        parsed = float(value)
+    except ValueError:
+        print(f"Warning: {name} '{value}' is not a valid number, using default {default}")
+        return default
+    return parsed if parsed > 0 else default
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - now_utc()).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HostRateLimiter:
+    """Token bucket plus circuit breaker for a single host."""
+
+    def __init__(
+        self,
+        host: str,
+        rate: float = DEFAULT_RPS,
+        burst: int = DEFAULT_BURST,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+    ):
+        self.host = host
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_retry_after = max_retry_after
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self._metrics = {
+            "requests": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "connection_errors": 0,
+            "wait_seconds": 0.0,
+            "circuit_opens": 0,
+            "rejected": 0,
+        }
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if now - self._opened_at >= self.cooldown else "open"
+
+    def acquire(self) -> None:
+        """Wait for a token (and any Retry-After block) before a request.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or the host asked us to wait
+                longer than max_retry_after
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                state = self._state(now)
+                if state == "open" or (state == "half_open" and self._trial_in_flight):
+                    self._metrics["rejected"] += 1
+                    retry_in = self.cooldown - (now - self._opened_at)
+                    raise CircuitOpenError(f"Circuit open for {self.host} (retry in {max(retry_in, 0):.0f}s)")
+
+                blocked_for = self._blocked_until - now
+                if blocked_for > self.max_retry_after:
+                    self._metrics["rejected"] += 1
+                    raise CircuitOpenError(f"{self.host} asked to retry after {blocked_for:.0f}s; not waiting")
+
+                self._refill(now)
+                if blocked_for <= 0 and self._tokens >= 1:
+                    self._tokens -= 1
+                    self._metrics["requests"] += 1
+                    if state == "half_open":
+                        self._trial_in_flight = True
+                    return
+
+                wait = max(blocked_for, (1 - self._tokens) / self.rate)
+                self._metrics["wait_seconds"] += wait
+            time.sleep(wait)
+
+    def record_success(self) -> None:
+        """Record a healthy response: close the circuit and recover the rate."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+            self.rate = min(self.max_rate, self.rate + 1.0)
+
+    def record_failure(self, status_code: int | None = None, retry_after: float | None = None) -> None:
+        """Record a 429/5xx response or connection error.
+
+        Args:
+            status_code: HTTP status, or None for connection-level errors
+            retry_after: Parsed Retry-After seconds, if the server sent one
+        """
+        with self._lock:
+            now = time.monotonic()
+            if status_code == 429:
+                self._metrics["throttled"] += 1
+            elif status_code is None:
+                self._metrics["connection_errors"] += 1
+            else:
+                self._metrics["server_errors"] += 1
+
+            self.rate = max(MIN_RPS, self.rate / 2)
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+            self._consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._consecutive_failures >= self.failure_threshold:
+                if self._state(now) != "open":
+                    self._metrics["circuit_opens"] += 1
+                self._opened_at = now
+
+    def backoff_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Delay before retry number attempt+1: Retry-After capped at max_retry_after, else jittered backoff."""
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0.5, 1.0) * min(MAX_BACKOFF, 2**attempt)
+
+    def stats(self) -> dict:
+        """Current rate, circuit state and counters for this host."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "rate": round(self.rate, 2),
+                "max_rate": self.max_rate,
+                "tokens": round(self._tokens, 2),
+                "state": self._state(now),
+                "consecutive_failures": self._consecutive_failures,
+                "blocked_for": round(max(self._blocked_until - now, 0.0), 2),
+                **{k: round(v, 3) if isinstance(v, float) else v for k, v in self._metrics.items()},
+            }
+
+
+_limiters: dict[str, HostRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> HostRateLimiter:
+    """Get the limiter for a host (netloc), creating it from the environment on first use."""
+    limiter = _limiters.get(host)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(host)
+            if limiter is None:
+                limiter = HostRateLimiter(
+                    host,
+                    rate=_env_float("FPL_RATE_LIMIT_RPS", DEFAULT_RPS),
+                    burst=int(_env_float("FPL_RATE_LIMIT_BURST", DEFAULT_BURST)),
+                    failure_threshold=int(_env_float("FPL_CIRCUIT_FAILURES", DEFAULT_FAILURE_THRESHOLD)),
+                    cooldown=_env_float("FPL_CIRCUIT_COOLDOWN", DEFAULT_COOLDOWN),
+                    max_retry_after=_env_float("FPL_MAX_RETRY_AFTER", DEFAULT_MAX_RETRY_AFTER),
+                )
+                _limiters[host] = limiter
+    return limiter
+
+
+def get_rate_limiter_stats() -> dict[str, dict]:
+    """Per-host limiter metrics for this process."""
+    return {host: limiter.stats() for host, limiter in list(_limiters.items())}
+
+
+def reset_rate_limiters() -> None:
+    """Forget all limiter state (fresh buckets, closed circuits)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -8,10 +8,16 @@ adding metadata and handling type coercion.
 """
 
 import json
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from db.team_aliases import build_team_alias_index, resolve_team_ids
 from validation.raw_schemas import (
     RawChipsSchema,
     RawElementStatsSchema,
@@ -24,440 +30,382 @@ from validation.raw_schemas import (
     RawPlayersBootstrapSchema,
     RawTeamsBootstrapSchema,
 )
-
-
-def process_raw_players_bootstrap(bootstrap_data: dict[str, Any]) -> pd.DataFrame:
-    """Convert raw FPL players data to DataFrame with complete field preservation.
+from validation.validators import schema_dtypes, validate_table
+
+# Low-cardinality text columns held as categoricals once validated
+PLAYERS_CATEGORICAL_COLUMNS = [
+    "status",
+    "news",
+    "corners_and_indirect_freekicks_text",
+    "direct_freekicks_text",
+    "penalties_text",
+]
+
+# Player columns whose nulls are meaningful (kept as <NA> rather than filled with 0)
+PLAYERS_NULLABLE_COLUMNS = ("chance_of_playing_next_round", "chance_of_playing_this_round")
+
+
+def _typed_frame(
+    records: list[dict[str, Any]],
+    schema: type,
+    fill_nulls: bool = False,
+    keep_nulls: tuple[str, ...] = (),
+    converters: dict[str, Callable[[Any], Any]] | None = None,
+) -> pd.DataFrame:
+    """Build a DataFrame from API records with each column created directly in its declared dtype.
 
     Args:
-        bootstrap_data: Raw bootstrap response from FPL API
+        records: API records (one dict per row)
+        schema: Raw schema declaring the column types (see schema_dtypes)
+        fill_nulls: Fill missing numbers with 0 and missing strings with "" (as the raw tables store them)
+        keep_nulls: Columns left null even when fill_nulls is set
+        converters: Per-field functions applied to each value first (e.g. JSON-encoding nested fields)
 
     Returns:
-        DataFrame with all 101 player fields + metadata
+        DataFrame with declared dtypes; a column whose values do not fit is left with an
+        inferred dtype for schema validation to report
     """
-    print("Processing raw player data...")
-
-    players = bootstrap_data.get("elements", [])
-    if not players:
-        print("Warning: No player data found in bootstrap")
-        return pd.DataFrame()
-
-    # Process each player with field name mapping for schema compatibility
-    processed_players = []
-    timestamp = pd.Timestamp.now(tz="UTC")
-
-    for player in players:
-        # Create a copy and map field names for schema compatibility
-        processed_player = dict(player)
-
-        # Add alias columns for schema compatibility
-        # The schema expects these alias names to be present
-        processed_player["player_id"] = processed_player["id"]
-        processed_player["team_id"] = processed_player["team"]
-        processed_player["position_id"] = processed_player["element_type"]
-
-        # Add our metadata
-        processed_player["as_of_utc"] = timestamp
-
-        processed_players.append(processed_player)
-
-    # Convert to DataFrame
-    df = pd.DataFrame(processed_players)
-
-    # Clean data before validation
-    print("🧹 Cleaning players data...")
-
-    # Handle squad_number specifically (can be None from API)
-    if "squad_number" in df.columns:
-        # Keep None values as None, don't convert to 0
-        df["squad_number"] = df["squad_number"].replace(["", "0"], None)
-        # Convert to nullable integer type, preserving None values
-        # Use astype('Int64') directly to preserve None values
-        df["squad_number"] = df["squad_number"].astype("Int64")
-
-    # Handle NaN values in numeric columns
-    numeric_columns = df.select_dtypes(include=["number"]).columns
-    for col in numeric_columns:
-        if col in df.columns:
-            if col in ["chance_of_playing_next_round", "chance_of_playing_this_round"]:
-                # These can be NaN, convert to nullable float
-                df[col] = df[col].astype("Float64")
-            else:
-                # For other numeric columns, fill NaN with 0 and convert to int
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
-
-    # Handle NaN values in string columns
-    string_columns = df.select_dtypes(include=["object"]).columns
-    for col in string_columns:
-        if col in df.columns and col != "squad_number":  # Skip squad_number as it's handled above
-            df[col] = df[col].fillna("")
-
-    # Handle datetime columns
-    datetime_columns = ["news_added", "as_of_utc"]
-    for col in datetime_columns:
+    dtypes = schema_dtypes(schema)
+    converters = converters or {}
+    fields = dict.fromkeys(key for record in records for key in record)
+
+    columns = {}
+    for field in fields:
+        values = [record.get(field) for record in records]
+        if field in converters:
+            values = [converters[field](value) for value in values]
+        dtype = dtypes.get(field)
+        if dtype is None:
+            columns[field] = values
+            continue
+        if fill_nulls and dtype != "bool" and field not in keep_nulls and None in values:
+            fill_value = "" if dtype == "object" else 0
+            values = [fill_value if value is None else value for value in values]
+        try:
+            columns[field] = pd.array(values, dtype=dtype)
+        except (ValueError, TypeError):
+            columns[field] = values
+    return pd.DataFrame(columns)
+
+
+def _players_frame(players: list[dict[str, Any]], as_of_utc: pd.Timestamp) -> pd.DataFrame:
+    """Players frame built directly in the dtypes declared by RawPlayersBootstrapSchema."""
+    # squad_number can be None or "" from API; like other counts it is stored as 0 when missing
+    df = _typed_frame(
+        players,
+        RawPlayersBootstrapSchema,
+        fill_nulls=True,
+        keep_nulls=PLAYERS_NULLABLE_COLUMNS,
+        converters={"squad_number": lambda value: None if value in ("", "0") else value},
+    )
+    if "news_added" in df.columns:
+        df["news_added"] = pd.to_datetime(df["news_added"], errors="coerce")
+
+    # Add alias columns for schema compatibility
+    # The schema expects these alias names to be present
+    df["player_id"] = df["id"]
+    df["team_id"] = df["team"]
+    df["position_id"] = df["element_type"]
+    df["as_of_utc"] = as_of_utc
+    return df
+
+
+def _teams_frame(teams: list[dict[str, Any]], as_of_utc: pd.Timestamp) -> pd.DataFrame:
+    df = _typed_frame(teams, RawTeamsBootstrapSchema)
+    df["team_id"] = df["id"]
+    df["as_of_utc"] = as_of_utc
+    return df
+
+
+def _events_frame(events: list[dict[str, Any]], as_of_utc: pd.Timestamp) -> pd.DataFrame:
+    # Complex nested fields are stored as JSON strings; most numeric fields can be 0 for future gameweeks
+    df = _typed_frame(
+        events,
+        RawEventsBootstrapSchema,
+        fill_nulls=True,
+        converters=dict.fromkeys(
+            ["top_element_info", "chip_plays", "overrides"], lambda value: json.dumps(value or {})
+        ),
+    )
+    for col in ["deadline_time", "release_time"]:
         if col in df.columns:
             df[col] = pd.to_datetime(df[col], errors="coerce")
+    df["event_id"] = df["id"]
+    df["as_of_utc"] = as_of_utc
+    return df
+
+
+GAME_SETTINGS_JSON_FIELDS = [
+    "featured_entries",
+    "percentile_ranks",
+    "underdog_differential",
+    "league_h2h_tiebreak_stats",
+    "ui_special_shirt_exclusions",
+]
+
+
+def _game_settings_frame(game_settings: dict[str, Any], as_of_utc: pd.Timestamp) -> pd.DataFrame:
+    # Game settings is a single object; complex fields are stored as JSON strings
+    df = _typed_frame(
+        [game_settings],
+        RawGameSettingsSchema,
+        converters=dict.fromkeys(GAME_SETTINGS_JSON_FIELDS, lambda value: json.dumps(value or [])),
+    )
+    df["as_of_utc"] = as_of_utc
+    return df
+
+
+def _element_stats_frame(element_stats: list[dict[str, Any]], as_of_utc: pd.Timestamp) -> pd.DataFrame:
+    df = _typed_frame(element_stats, RawElementStatsSchema)
+    df["as_of_utc"] = as_of_utc
+    return df
+
+
+def _element_types_frame(element_types: list[dict[str, Any]], as_of_utc: pd.Timestamp) -> pd.DataFrame:
+    # Map API field name
+    df = _typed_frame(element_types, RawElementTypesSchema).rename(columns={"id": "position_id"})
+    df["as_of_utc"] = as_of_utc
+    return df
+
+
+def _chips_frame(chips: list[dict[str, Any]], as_of_utc: pd.Timestamp) -> pd.DataFrame:
+    df = _typed_frame(chips, RawChipsSchema, converters={"overrides": lambda value: json.dumps(value or {})})
+    # The schema expects 'id' but the model expects 'chip_id'; keep both for compatibility
+    if "id" in df.columns:
+        df["chip_id"] = df["id"]
+    df["as_of_utc"] = as_of_utc
+    return df
+
+
+def _phases_frame(phases: list[dict[str, Any]], as_of_utc: pd.Timestamp) -> pd.DataFrame:
+    df = _typed_frame(phases, RawPhasesSchema)
+    # The schema expects 'id' but the model expects 'phase_id'; keep both for compatibility
+    if "id" in df.columns:
+        df["phase_id"] = df["id"]
+    df["as_of_utc"] = as_of_utc
+    return df
+
+
+# Bootstrap table -> (bootstrap section, description, frame builder, schema)
+BOOTSTRAP_TABLES: dict[str, tuple[str, str, Callable[[Any, pd.Timestamp], pd.DataFrame], type]] = {
+    "raw_players_bootstrap": ("elements", "player data", _players_frame, RawPlayersBootstrapSchema),
+    "raw_teams_bootstrap": ("teams", "team data", _teams_frame, RawTeamsBootstrapSchema),
+    "raw_events_bootstrap": ("events", "events data", _events_frame, RawEventsBootstrapSchema),
+    "raw_game_settings": ("game_settings", "game settings", _game_settings_frame, RawGameSettingsSchema),
+    "raw_element_stats": ("element_stats", "element stats", _element_stats_frame, RawElementStatsSchema),
+    "raw_element_types": ("element_types", "element types", _element_types_frame, RawElementTypesSchema),
+    "raw_chips": ("chips", "chips", _chips_frame, RawChipsSchema),
+    "raw_phases": ("phases", "phases", _phases_frame, RawPhasesSchema),
+}
+
+# Threads used to validate the bootstrap tables. Defaults to 1 (one after another): pandera's
+# checks hold the GIL, so threads only pay off when validation time is spent in numpy/pandas kernels
+BOOTSTRAP_VALIDATION_WORKERS = int(os.getenv("FPL_BOOTSTRAP_WORKERS", "1"))
+
+
+def _validate_bootstrap_frame(table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Validate one decomposed bootstrap table (raises on schema errors)."""
+    validated_df = validate_table(df, BOOTSTRAP_TABLES[table][3], table)
+    if table == "raw_players_bootstrap":
+        categorical = [col for col in PLAYERS_CATEGORICAL_COLUMNS if col in validated_df.columns]
+        validated_df = validated_df.astype(dict.fromkeys(categorical, "category"))
+    return validated_df
+
+
+def _process_bootstrap_table(
+    table: str, bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None
+) -> pd.DataFrame:
+    """Build and validate a single bootstrap table; the unvalidated frame is returned if validation fails."""
+    section, description, build, _ = BOOTSTRAP_TABLES[table]
+    print(f"Processing raw {description}...")
 
-    # Validate with schema
-    try:
-        validated_df = RawPlayersBootstrapSchema.validate(df)
-        print(f"✅ Processed {len(validated_df)} players with {len(validated_df.columns)} fields")
-        return validated_df
-    except Exception as e:
-        print(f"❌ Player data validation failed: {str(e)[:200]}")
-        # Return unvalidated DataFrame for debugging
-        return df
-
-
-def process_raw_teams_bootstrap(bootstrap_data: dict[str, Any]) -> pd.DataFrame:
-    """Convert raw FPL teams data to DataFrame with complete field preservation."""
-    print("Processing raw team data...")
-
-    teams = bootstrap_data.get("teams", [])
-    if not teams:
-        print("Warning: No team data found in bootstrap")
+    records = bootstrap_data.get(section)
+    if not records:
+        print(f"Warning: No {description} found in bootstrap")
         return pd.DataFrame()
 
-    processed_teams = []
-    timestamp = pd.Timestamp.now(tz="UTC")
-
-    for team in teams:
-        processed_team = dict(team)
-
-        # Add alias columns for schema compatibility
-        # The schema expects these alias names to be present
-        processed_team["team_id"] = processed_team["id"]
-
-        # Handle nullable form field
-        if processed_team.get("form") is None:
-            processed_team["form"] = None
-
-        # Add metadata
-        processed_team["as_of_utc"] = timestamp
-
-        processed_teams.append(processed_team)
-
-    df = pd.DataFrame(processed_teams)
-
+    df = build(records, as_of_utc if as_of_utc is not None else pd.Timestamp.now(tz="UTC"))
     try:
-        validated_df = RawTeamsBootstrapSchema.validate(df)
-        print(f"✅ Processed {len(validated_df)} teams with {len(validated_df.columns)} fields")
+        validated_df = _validate_bootstrap_frame(table, df)
+        print(f"✅ Processed {len(validated_df)} {table} rows with {len(validated_df.columns)} fields")
         return validated_df
     except Exception as e:
-        print(f"❌ Team data validation failed: {str(e)[:200]}")
+        print(f"❌ {table} validation failed: {str(e)[:200]}")
         return df
 
 
-def process_raw_events_bootstrap(bootstrap_data: dict[str, Any]) -> pd.DataFrame:
-    """Convert raw FPL events (gameweeks) data to DataFrame."""
-    print("Processing raw events data...")
-
-    events = bootstrap_data.get("events", [])
-    if not events:
-        print("Warning: No events data found in bootstrap")
-        return pd.DataFrame()
-
-    processed_events = []
-    timestamp = pd.Timestamp.now(tz="UTC")
-
-    for event in events:
-        processed_event = dict(event)
-
-        # Add alias columns for schema compatibility
-        # The schema expects these alias names to be present
-        processed_event["event_id"] = processed_event["id"]
-
-        # Convert complex nested fields to JSON strings
-        for field in ["top_element_info", "chip_plays", "overrides"]:
-            if field in processed_event:
-                processed_event[field] = json.dumps(processed_event[field] or {})
-
-        # Handle nullable release_time
-        if processed_event.get("release_time") is None:
-            processed_event["release_time"] = None
+def process_raw_players_bootstrap(
+    bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None
+) -> pd.DataFrame:
+    """Convert raw FPL players data to DataFrame with complete field preservation.
 
-        # Add metadata
-        processed_event["as_of_utc"] = timestamp
+    Columns are built directly in the dtypes declared by RawPlayersBootstrapSchema
+    and PLAYERS_CATEGORICAL_COLUMNS are stored as categoricals.
 
-        processed_events.append(processed_event)
+    Args:
+        bootstrap_data: Raw bootstrap response from FPL API
+        as_of_utc: Capture timestamp (defaults to now)
 
-    df = pd.DataFrame(processed_events)
+    Returns:
+        DataFrame with all 101 player fields + metadata
+    """
+    return _process_bootstrap_table("raw_players_bootstrap", bootstrap_data, as_of_utc)
 
-    # Clean data before validation
-    print("🧹 Cleaning events data...")
 
-    # Handle NaN values in numeric columns
-    numeric_columns = df.select_dtypes(include=["number"]).columns
-    for col in numeric_columns:
-        if col in df.columns:
-            # For events, most numeric fields can be 0 for future gameweeks
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
+def process_raw_teams_bootstrap(bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None) -> pd.DataFrame:
+    """Convert raw FPL teams data to DataFrame with complete field preservation."""
+    return _process_bootstrap_table("raw_teams_bootstrap", bootstrap_data, as_of_utc)
 
-    # Handle datetime columns
-    datetime_columns = ["deadline_time", "release_time", "as_of_utc"]
-    for col in datetime_columns:
-        if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors="coerce")
 
-    try:
-        validated_df = RawEventsBootstrapSchema.validate(df)
-        print(f"✅ Processed {len(validated_df)} events with {len(validated_df.columns)} fields")
-        return validated_df
-    except Exception as e:
-        print(f"❌ Events data validation failed: {str(e)[:200]}")
-        return df
+def process_raw_events_bootstrap(bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None) -> pd.DataFrame:
+    """Convert raw FPL events (gameweeks) data to DataFrame."""
+    return _process_bootstrap_table("raw_events_bootstrap", bootstrap_data, as_of_utc)
 
 
-def process_raw_game_settings_bootstrap(bootstrap_data: dict[str, Any]) -> pd.DataFrame:
+def process_raw_game_settings_bootstrap(
+    bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None
+) -> pd.DataFrame:
     """Convert raw FPL game settings to single-row DataFrame."""
-    print("Processing raw game settings...")
+    return _process_bootstrap_table("raw_game_settings", bootstrap_data, as_of_utc)
 
-    game_settings = bootstrap_data.get("game_settings", {})
-    if not game_settings:
-        print("Warning: No game settings found in bootstrap")
-        return pd.DataFrame()
-
-    # Game settings is a single object, convert to single-row DataFrame
-    processed_settings = dict(game_settings)
-
-    # Convert complex fields to JSON strings
-    for field in [
-        "featured_entries",
-        "percentile_ranks",
-        "underdog_differential",
-        "league_h2h_tiebreak_stats",
-        "ui_special_shirt_exclusions",
-    ]:
-        if field in processed_settings:
-            processed_settings[field] = json.dumps(processed_settings[field] or [])
-
-    # Add metadata
-    processed_settings["as_of_utc"] = pd.Timestamp.now(tz="UTC")
 
-    df = pd.DataFrame([processed_settings])
-
-    try:
-        validated_df = RawGameSettingsSchema.validate(df)
-        print(f"✅ Processed game settings with {len(validated_df.columns)} fields")
-        return validated_df
-    except Exception as e:
-        print(f"❌ Game settings validation failed: {str(e)[:200]}")
-        return df
-
-
-def process_raw_element_stats_bootstrap(bootstrap_data: dict[str, Any]) -> pd.DataFrame:
+def process_raw_element_stats_bootstrap(
+    bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None
+) -> pd.DataFrame:
     """Convert raw FPL element stats definitions to DataFrame."""
-    print("Processing raw element stats...")
-
-    element_stats = bootstrap_data.get("element_stats", [])
-    if not element_stats:
-        print("Warning: No element stats found in bootstrap")
-        return pd.DataFrame()
-
-    processed_stats = []
-    timestamp = pd.Timestamp.now(tz="UTC")
+    return _process_bootstrap_table("raw_element_stats", bootstrap_data, as_of_utc)
 
-    for stat in element_stats:
-        processed_stat = dict(stat)
-        processed_stat["as_of_utc"] = timestamp
-        processed_stats.append(processed_stat)
 
-    df = pd.DataFrame(processed_stats)
-
-    try:
-        validated_df = RawElementStatsSchema.validate(df)
-        print(f"✅ Processed {len(validated_df)} element stats")
-        return validated_df
-    except Exception as e:
-        print(f"❌ Element stats validation failed: {str(e)[:200]}")
-        return df
-
-
-def process_raw_element_types_bootstrap(bootstrap_data: dict[str, Any]) -> pd.DataFrame:
+def process_raw_element_types_bootstrap(
+    bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None
+) -> pd.DataFrame:
     """Convert raw FPL element types (positions) to DataFrame."""
-    print("Processing raw element types...")
-
-    element_types = bootstrap_data.get("element_types", [])
-    if not element_types:
-        print("Warning: No element types found in bootstrap")
-        return pd.DataFrame()
-
-    processed_types = []
-    timestamp = pd.Timestamp.now(tz="UTC")
-
-    for element_type in element_types:
-        processed_type = dict(element_type)
-
-        # Map API field name
-        if "id" in processed_type:
-            processed_type["position_id"] = processed_type.pop("id")
-
-        processed_type["as_of_utc"] = timestamp
-        processed_types.append(processed_type)
-
-    df = pd.DataFrame(processed_types)
-
-    try:
-        validated_df = RawElementTypesSchema.validate(df)
-        print(f"✅ Processed {len(validated_df)} element types")
-        return validated_df
-    except Exception as e:
-        print(f"❌ Element types validation failed: {str(e)[:200]}")
-        return df
+    return _process_bootstrap_table("raw_element_types", bootstrap_data, as_of_utc)
 
 
-def process_raw_chips_bootstrap(bootstrap_data: dict[str, Any]) -> pd.DataFrame:
+def process_raw_chips_bootstrap(bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None) -> pd.DataFrame:
     """Convert raw FPL chips data to DataFrame."""
-    print("Processing raw chips data...")
-
-    chips = bootstrap_data.get("chips", [])
-    if not chips:
-        print("Warning: No chips found in bootstrap")
-        return pd.DataFrame()
-
-    processed_chips = []
-    timestamp = pd.Timestamp.now(tz="UTC")
+    return _process_bootstrap_table("raw_chips", bootstrap_data, as_of_utc)
 
-    for chip in chips:
-        processed_chip = dict(chip)
 
-        # Add alias columns for schema compatibility
-        # The schema expects 'id' but the model expects 'chip_id'
-        if "id" in processed_chip:
-            processed_chip["chip_id"] = processed_chip["id"]  # Keep both for compatibility
-
-        # Convert overrides to JSON string
-        if "overrides" in processed_chip:
-            processed_chip["overrides"] = json.dumps(processed_chip["overrides"] or {})
-
-        processed_chip["as_of_utc"] = timestamp
-        processed_chips.append(processed_chip)
-
-    df = pd.DataFrame(processed_chips)
-
-    try:
-        validated_df = RawChipsSchema.validate(df)
-        print(f"✅ Processed {len(validated_df)} chips")
-        return validated_df
-    except Exception as e:
-        print(f"❌ Chips validation failed: {str(e)[:200]}")
-        return df
-
-
-def process_raw_phases_bootstrap(bootstrap_data: dict[str, Any]) -> pd.DataFrame:
+def process_raw_phases_bootstrap(bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None) -> pd.DataFrame:
     """Convert raw FPL phases data to DataFrame."""
-    print("Processing raw phases data...")
+    return _process_bootstrap_table("raw_phases", bootstrap_data, as_of_utc)
 
-    phases = bootstrap_data.get("phases", [])
-    if not phases:
-        print("Warning: No phases found in bootstrap")
-        return pd.DataFrame()
 
-    processed_phases = []
-    timestamp = pd.Timestamp.now(tz="UTC")
+def process_raw_fixtures(fixtures_data: list[dict[str, Any]], as_of_utc: pd.Timestamp | None = None) -> pd.DataFrame:
+    """Convert raw FPL fixtures data to DataFrame with complete field preservation."""
+    print("Processing raw fixtures data...")
 
-    for phase in phases:
-        processed_phase = dict(phase)
+    if not fixtures_data:
+        print("Warning: No fixtures data provided")
+        return pd.DataFrame()
 
-        # Add alias columns for schema compatibility
-        # The schema expects 'id' but the model expects 'phase_id'
-        if "id" in processed_phase:
-            processed_phase["phase_id"] = processed_phase["id"]  # Keep both for compatibility
+    # Stats are stored as a JSON string
+    df = _typed_frame(fixtures_data, RawFixturesSchema, converters={"stats": lambda value: json.dumps(value or [])})
 
-        processed_phase["as_of_utc"] = timestamp
-        processed_phases.append(processed_phase)
+    # Map API field names to schema field names
+    df = df.rename(
+        columns={"id": "fixture_id", "kickoff_time": "kickoff_utc", "team_h": "home_team_id", "team_a": "away_team_id"}
+    )
 
-    df = pd.DataFrame(processed_phases)
+    # Add metadata
+    df["as_of_utc"] = as_of_utc if as_of_utc is not None else pd.Timestamp.now(tz="UTC")
 
     try:
-        validated_df = RawPhasesSchema.validate(df)
-        print(f"✅ Processed {len(validated_df)} phases")
+        validated_df = validate_table(df, RawFixturesSchema, "raw_fixtures")
+        print(f"✅ Processed {len(validated_df)} fixtures with {len(validated_df.columns)} fields")
         return validated_df
     except Exception as e:
-        print(f"❌ Phases validation failed: {str(e)[:200]}")
+        print(f"❌ Fixtures validation failed: {str(e)[:200]}")
         return df
 
 
-def process_raw_fixtures(fixtures_data: list[dict[str, Any]]) -> pd.DataFrame:
-    """Convert raw FPL fixtures data to DataFrame with complete field preservation."""
-    print("Processing raw fixtures data...")
-
-    if not fixtures_data:
-        print("Warning: No fixtures data provided")
-        return pd.DataFrame()
-
-    processed_fixtures = []
-    timestamp = pd.Timestamp.now(tz="UTC")
-
-    for fixture in fixtures_data:
-        processed_fixture = dict(fixture)
+def decompose_bootstrap(
+    bootstrap_data: dict[str, Any],
+    as_of_utc: pd.Timestamp | None = None,
+    build_seconds: dict[str, float] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Walk the bootstrap response once and build every raw bootstrap table (unvalidated).
 
-        # Map API field names to schema field names
-        if "id" in processed_fixture:
-            processed_fixture["fixture_id"] = processed_fixture.pop("id")
-        if "kickoff_time" in processed_fixture:
-            processed_fixture["kickoff_utc"] = processed_fixture.pop("kickoff_time")
-        if "team_h" in processed_fixture:
-            processed_fixture["home_team_id"] = processed_fixture.pop("team_h")
-        if "team_a" in processed_fixture:
-            processed_fixture["away_team_id"] = processed_fixture.pop("team_a")
+    The frames share one as_of_utc and hold no references to each other, so they
+    can be validated independently (see process_all_raw_bootstrap_data).
 
-        # Convert stats to JSON string
-        if "stats" in processed_fixture:
-            processed_fixture["stats"] = json.dumps(processed_fixture["stats"] or [])
-
-        # Add metadata
-        processed_fixture["as_of_utc"] = timestamp
+    Args:
+        bootstrap_data: Complete bootstrap response from FPL API
+        as_of_utc: Capture timestamp for every table (defaults to now)
+        build_seconds: If given, filled with the build time of each table
 
-        processed_fixtures.append(processed_fixture)
+    Returns:
+        Dictionary mapping table names to DataFrames; empty or failed sections are left out
+    """
+    as_of_utc = as_of_utc if as_of_utc is not None else pd.Timestamp.now(tz="UTC")
+    frames = {}
+    for table, (section, description, build, _) in BOOTSTRAP_TABLES.items():
+        records = bootstrap_data.get(section)
+        if not records:
+            print(f"⚠️  {table}: No {description} in bootstrap")
+            continue
+        start = time.perf_counter()
+        try:
+            frames[table] = build(records, as_of_utc)
+        except Exception as e:
+            print(f"❌ {table} processing failed: {str(e)[:150]}")
+            continue
+        if build_seconds is not None:
+            build_seconds[table] = time.perf_counter() - start
+    return frames
 
-    df = pd.DataFrame(processed_fixtures)
 
+def _timed_validation(table: str, df: pd.DataFrame) -> tuple[pd.DataFrame, float, str | None]:
+    start = time.perf_counter()
     try:
-        validated_df = RawFixturesSchema.validate(df)
-        print(f"✅ Processed {len(validated_df)} fixtures with {len(validated_df.columns)} fields")
-        return validated_df
+        return _validate_bootstrap_frame(table, df), time.perf_counter() - start, None
     except Exception as e:
-        print(f"❌ Fixtures validation failed: {str(e)[:200]}")
-        return df
+        return df, time.perf_counter() - start, str(e)[:150]
 
 
-def process_all_raw_bootstrap_data(bootstrap_data: dict[str, Any]) -> dict[str, pd.DataFrame]:
+def process_all_raw_bootstrap_data(
+    bootstrap_data: dict[str, Any], as_of_utc: pd.Timestamp | None = None, max_workers: int | None = None
+) -> dict[str, pd.DataFrame]:
     """Process all sections of bootstrap data into raw DataFrames.
 
+    The bootstrap is decomposed in one pass with a shared as_of_utc, then the
+    tables are validated concurrently and the build/validation time of each is printed.
+
     Args:
         bootstrap_data: Complete bootstrap response from FPL API
+        as_of_utc: Capture timestamp for every table (defaults to now)
+        max_workers: Validation threads (defaults to FPL_BOOTSTRAP_WORKERS)
 
     Returns:
-        Dictionary mapping table names to validated DataFrames
+        Dictionary mapping table names to validated DataFrames (unvalidated if validation failed)
     """
     print("Processing all raw bootstrap data sections...")
+    stage_start = time.perf_counter()
 
-    raw_dataframes = {}
+    build_seconds: dict[str, float] = {}
+    frames = decompose_bootstrap(bootstrap_data, as_of_utc, build_seconds)
 
-    # Process each section
-    sections = [
-        ("raw_players_bootstrap", process_raw_players_bootstrap),
-        ("raw_teams_bootstrap", process_raw_teams_bootstrap),
-        ("raw_events_bootstrap", process_raw_events_bootstrap),
-        ("raw_game_settings", process_raw_game_settings_bootstrap),
-        ("raw_element_stats", process_raw_element_stats_bootstrap),
-        ("raw_element_types", process_raw_element_types_bootstrap),
-        ("raw_chips", process_raw_chips_bootstrap),
-        ("raw_phases", process_raw_phases_bootstrap),
-    ]
+    workers = max(1, max_workers or BOOTSTRAP_VALIDATION_WORKERS)
+    if workers == 1 or len(frames) < 2:
+        results = {table: _timed_validation(table, df) for table, df in frames.items()}
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bootstrap-validate") as pool:
+            futures = {table: pool.submit(_timed_validation, table, df) for table, df in frames.items()}
+            results = {table: future.result() for table, future in futures.items()}
 
-    for table_name, processor_func in sections:
-        try:
-            df = processor_func(bootstrap_data)
-            if not df.empty:
-                raw_dataframes[table_name] = df
-                print(f"✅ {table_name}: {len(df)} records")
-            else:
-                print(f"⚠️  {table_name}: No data")
-        except Exception as e:
-            print(f"❌ {table_name} processing failed: {str(e)[:150]}")
+    raw_dataframes = {}
+    for table, (df, validate_seconds, error) in results.items():
+        timing = f"build {build_seconds.get(table, 0) * 1000:.0f} ms, validate {validate_seconds * 1000:.0f} ms"
+        if error:
+            print(f"❌ {table} validation failed ({timing}): {error}")
+        else:
+            print(f"✅ {table}: {len(df)} records ({timing})")
+        if not df.empty:
+            raw_dataframes[table] = df
 
+    print(f"⏱️  Bootstrap stage: {(time.perf_counter() - stage_start) * 1000:.0f} ms ({workers} validation threads)")
     return raw_dataframes
 
 
@@ -587,32 +535,145 @@ def process_raw_my_gameweek_summary(manager_data: dict[str, Any]) -> pd.DataFram
         return df
 
 
-def process_raw_gameweek_performance(
-    live_data: dict[str, Any], gameweek: int, bootstrap_data: dict[str, Any] = None, fixtures_data: list[dict] = None
+_MANAGER_SUMMARY_FIELDS = [
+    "points",
+    "total_points",
+    "rank",
+    "overall_rank",
+    "bank",
+    "value",
+    "event_transfers",
+    "event_transfers_cost",
+    "points_on_bench",
+]
+
+MANAGER_PICKS_COLUMNS = ["manager_id", "event", "position", "player_id", "multiplier", "is_captain", "is_vice_captain"]
+MANAGER_SUMMARY_COLUMNS = ["manager_id", "event", *_MANAGER_SUMMARY_FIELDS, "active_chip", "as_of_utc"]
+
+
+def process_raw_manager_picks_batch(
+    picks_by_manager: dict[int, dict[str, Any]], gameweek: int
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Convert /entry/{id}/event/{gw}/picks/ responses for many managers into table rows.
+
+    Quiet by design: called once per chunk of hundreds of managers.
+
+    Args:
+        picks_by_manager: manager_id -> raw picks response
+        gameweek: Gameweek the picks belong to
+
+    Returns:
+        (picks, summaries) DataFrames for raw_manager_picks and raw_manager_gameweek_summary
+    """
+    timestamp = pd.Timestamp.now(tz="UTC")
+    pick_rows = []
+    summary_rows = []
+
+    for manager_id, data in picks_by_manager.items():
+        if not data or not data.get("picks"):
+            continue
+        for pick in data["picks"]:
+            pick_rows.append(
+                (
+                    manager_id,
+                    gameweek,
+                    pick.get("position"),
+                    pick.get("element"),
+                    pick.get("multiplier", 1),
+                    pick.get("is_captain", False),
+                    pick.get("is_vice_captain", False),
+                )
+            )
+        entry_history = data.get("entry_history") or {}
+        summary_rows.append(
+            (
+                manager_id,
+                gameweek,
+                *(entry_history.get(field) for field in _MANAGER_SUMMARY_FIELDS),
+                data.get("active_chip"),
+                timestamp,
+            )
+        )
+
+    return (
+        pd.DataFrame(pick_rows, columns=MANAGER_PICKS_COLUMNS),
+        pd.DataFrame(summary_rows, columns=MANAGER_SUMMARY_COLUMNS),
+    )
+
+
+def process_raw_manager_history_batch(
+    history_by_manager: dict[int, dict[str, Any]], gameweeks: list[int] | None = None
 ) -> pd.DataFrame:
-    """Convert raw gameweek live data to DataFrame with proper value population."""
-    print(f"Processing gameweek {gameweek} performance data...")
+    """Convert /entry/{id}/history/ responses into raw_manager_gameweek_summary rows.
 
-    if not live_data or "elements" not in live_data:
-        print("Warning: No live data provided")
-        return pd.DataFrame()
+    One history request covers every gameweek a manager has played this season, so
+    past summaries cost one request per manager instead of one per manager per gameweek.
 
-    elements = live_data.get("elements", [])
-    if not elements:
-        print("Warning: No player performance data found")
+    Args:
+        history_by_manager: manager_id -> raw history response
+        gameweeks: Keep only these gameweeks (None keeps all)
+
+    Returns:
+        DataFrame with one row per (manager_id, event)
+    """
+    timestamp = pd.Timestamp.now(tz="UTC")
+    wanted = set(gameweeks) if gameweeks is not None else None
+    rows = []
+
+    for manager_id, data in history_by_manager.items():
+        if not data:
+            continue
+        chips_by_event = {chip.get("event"): chip.get("name") for chip in data.get("chips", [])}
+        for entry_history in data.get("current", []):
+            event = entry_history.get("event")
+            if wanted is not None and event not in wanted:
+                continue
+            rows.append(
+                (
+                    manager_id,
+                    event,
+                    *(entry_history.get(field) for field in _MANAGER_SUMMARY_FIELDS),
+                    chips_by_event.get(event),
+                    timestamp,
+                )
+            )
+
+    return pd.DataFrame(rows, columns=MANAGER_SUMMARY_COLUMNS)
+
+
+def process_raw_league_standings(league_id: int, pages: list[dict[str, Any]]) -> pd.DataFrame:
+    """Convert /leagues-classic/{id}/standings/ pages into raw_league_entries rows.
+
+    Args:
+        league_id: Classic league ID
+        pages: Raw standings responses (any order)
+
+    Returns:
+        DataFrame with one row per league member, ordered by rank
+    """
+    timestamp = pd.Timestamp.now(tz="UTC")
+    rows = [
+        {
+            "league_id": league_id,
+            "manager_id": result.get("entry"),
+            "entry_name": result.get("entry_name"),
+            "player_name": result.get("player_name"),
+            "rank": result.get("rank"),
+            "total": result.get("total"),
+            "as_of_utc": timestamp,
+        }
+        for page in pages
+        for result in (page.get("standings") or {}).get("results", [])
+    ]
+    if not rows:
         return pd.DataFrame()
 
-    # Create a lookup for player prices and teams from bootstrap data
-    player_prices = {}
-    player_teams = {}
-    if bootstrap_data and "elements" in bootstrap_data:
-        for player in bootstrap_data["elements"]:
-            player_id = player.get("id")
-            if player_id:
-                player_prices[player_id] = player.get("now_cost")  # Price in 0.1M units
-                player_teams[player_id] = player.get("team")
+    df = pd.DataFrame(rows).drop_duplicates(subset=["manager_id"])
+    return df.sort_values("rank").reset_index(drop=True)
 
-    # Create a lookup for fixtures (fixture_id -> {team_h, team_a})
+
+def build_fixtures_lookup(fixtures_data: list[dict] | None) -> dict[int, dict[str, Any]]:
+    """Build fixture_id -> {team_h, team_a} lookup from the raw fixtures payload."""
     fixtures_lookup = {}
     if fixtures_data:
         for fixture in fixtures_data:
@@ -622,95 +683,334 @@ def process_raw_gameweek_performance(
                     "team_h": fixture.get("team_h"),
                     "team_a": fixture.get("team_a"),
                 }
+    return fixtures_lookup
+
+
+GAMEWEEK_PERFORMANCE_INT_STATS = [
+    "total_points",
+    "minutes",
+    "goals_scored",
+    "assists",
+    "clean_sheets",
+    "goals_conceded",
+    "own_goals",
+    "penalties_saved",
+    "penalties_missed",
+    "yellow_cards",
+    "red_cards",
+    "saves",
+    "bonus",
+    "bps",
+]
+GAMEWEEK_PERFORMANCE_STR_STATS = [
+    "influence",
+    "creativity",
+    "threat",
+    "ict_index",
+    "expected_goals",
+    "expected_assists",
+    "expected_goal_involvements",
+    "expected_goals_conceded",
+]
+
+
+def _lookup(keys: np.ndarray, index: pd.Index, values: np.ndarray) -> np.ndarray:
+    """Array lookup of values by key; missing keys give NaN (ints stay ints when all keys are found)."""
+    positions = index.get_indexer(keys)
+    found = positions >= 0
+    if found.all():
+        return values[positions]
+    result = np.full(len(keys), np.nan)
+    result[found] = values[positions[found]]
+    return result
+
+
+def _legacy_fixture_context(fixture: Any) -> tuple[Any, Any] | None:
+    """(opponent_team, is_home) from the rare dict / list-of-dict explain fixture formats."""
+    if isinstance(fixture, list) and fixture:
+        fixture = fixture[0]
+    if isinstance(fixture, dict):
+        return fixture.get("opponent_team"), fixture.get("is_home")
+    return None
+
+
+def _first_fixture(explain: list[dict] | None, fixtures_lookup: dict[int, dict[str, Any]]) -> Any:
+    """First usable explain fixture: a known fixture ID or legacy (opponent_team, is_home) context."""
+    for entry in explain or []:
+        fixture = entry.get("fixture")
+        if isinstance(fixture, int) and fixture in fixtures_lookup:
+            return fixture
+        legacy = _legacy_fixture_context(fixture)
+        if legacy is not None:
+            return legacy
+    return None
+
+
+def _fixture_context(
+    first_fixtures: list[Any], team_ids: np.ndarray, fixtures_lookup: dict[int, dict[str, Any]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Resolve opponent_team and was_home for every element with array lookups against fixtures.
+
+    Only elements whose team is known get a context; legacy dict/list fixtures are
+    copied through as given.
+    """
+    n = len(first_fixtures)
+    opponent = np.full(n, np.nan)
+    was_home = np.full(n, None, dtype=object)
+    fixture_ids = np.fromiter((f if type(f) is int else -1 for f in first_fixtures), dtype="int64", count=n)
+
+    fixtures_index = pd.Index(list(fixtures_lookup), dtype="int64")
+    team_h = np.array([info["team_h"] for info in fixtures_lookup.values()], dtype=float)
+    team_a = np.array([info["team_a"] for info in fixtures_lookup.values()], dtype=float)
+    positions = fixtures_index.get_indexer(fixture_ids)
+
+    has_team = ~np.isnan(team_ids) & (team_ids != 0)
+    rows = np.flatnonzero((positions >= 0) & has_team)
+    home, away = team_h[positions[rows]], team_a[positions[rows]]
+    is_home = team_ids[rows] == home
+    is_away = team_ids[rows] == away
+    opponent[rows] = np.where(is_home, away, np.where(is_away, home, np.nan))
+    was_home[rows] = np.where(is_home, True, np.where(is_away, False, None))
+
+    for row in np.flatnonzero(has_team & (fixture_ids == -1)):
+        if first_fixtures[row] is not None:
+            legacy_opponent, was_home[row] = first_fixtures[row]
+            opponent[row] = np.nan if legacy_opponent is None else legacy_opponent
+
+    return opponent, was_home
+
+
+def _stat_column(values: list[Any]) -> np.ndarray | pd.Series:
+    """Stat values as an array; mixed/missing values fall back to pandas inference (None -> NaN)."""
+    array = np.array(values)
+    return pd.Series(values) if array.dtype == object else array
+
+
+def _restore_int(values: np.ndarray) -> np.ndarray:
+    """Float array back to int64 when it has no missing values."""
+    if values.dtype.kind == "f" and not np.isnan(values).any():
+        return values.astype("int64")
+    return values
+
+
+def _bootstrap_player_lookup(bootstrap_data: dict[str, Any] | None) -> tuple[pd.Index, np.ndarray, np.ndarray]:
+    """Player ID index with aligned team and now_cost (0.1M units) arrays; the last duplicate ID wins."""
+    players = [p for p in (bootstrap_data or {}).get("elements") or [] if p.get("id")]
+    players_index = pd.Index([p["id"] for p in players])
+    if players_index.has_duplicates:
+        keep = ~players_index.duplicated(keep="last")
+        players, players_index = [p for p, k in zip(players, keep, strict=True) if k], players_index[keep]
+    return players_index, np.array([p.get("team") for p in players]), np.array([p.get("now_cost") for p in players])
+
+
+def _performance_frame(
+    elements: list[dict],
+    gameweeks: int | np.ndarray,
+    player_lookup: tuple[pd.Index, np.ndarray, np.ndarray],
+    fixtures_lookup: dict[int, dict[str, Any]],
+    as_of_utc: pd.Timestamp,
+) -> pd.DataFrame:
+    """Columnar performance frame for live elements of one or more gameweeks."""
+    player_ids = np.array([element.get("id") for element in elements])
+    stats = [element.get("stats") or {} for element in elements]
+
+    # Player prices (0.1M units) and teams from bootstrap data
+    players_index, teams, costs = player_lookup
+    team_ids = _lookup(player_ids, players_index, teams)
+    values = _lookup(player_ids, players_index, costs)
+
+    first_fixtures = [_first_fixture(element.get("explain"), fixtures_lookup) for element in elements]
+    opponent_team, was_home = _fixture_context(first_fixtures, team_ids.astype(float), fixtures_lookup)
+
+    columns = {"player_id": player_ids, "gameweek": gameweeks}
+    for column in GAMEWEEK_PERFORMANCE_INT_STATS:
+        columns[column] = _stat_column([s.get(column) for s in stats])
+    for column in GAMEWEEK_PERFORMANCE_STR_STATS:
+        columns[column] = np.array([str(s.get(column, "")) for s in stats], dtype=object)
+    columns["team_id"] = team_ids
+    columns["opponent_team"] = _restore_int(opponent_team)
+    columns["was_home"] = was_home if pd.isna(was_home).any() else was_home.astype(bool)
+    columns["value"] = values
+    columns["selected"] = _stat_column([s.get("selected") for s in stats])
+    columns["as_of_utc"] = as_of_utc
+    return pd.DataFrame(columns)
 
-    processed_performances = []
-    timestamp = pd.Timestamp.now(tz="UTC")
 
-    for element in elements:
-        element_id = element.get("id")
-        stats = element.get("stats", {})
-        explain = element.get("explain", [])
-
-        # Get fixture info from explain data (for opponent, home/away)
-        opponent_team = None
-        was_home = None
-        player_team_id = player_teams.get(element_id)
-
-        if explain and player_team_id:
-            for fixture_data in explain:
-                fixture = fixture_data.get("fixture")
-
-                # Handle fixture as integer ID (most common case)
-                if isinstance(fixture, int) and fixture in fixtures_lookup:
-                    fixture_info = fixtures_lookup[fixture]
-                    team_h = fixture_info["team_h"]
-                    team_a = fixture_info["team_a"]
-
-                    # Determine opponent and home/away based on player's team
-                    if player_team_id == team_h:
-                        opponent_team = team_a
-                        was_home = True
-                    elif player_team_id == team_a:
-                        opponent_team = team_h
-                        was_home = False
-                    break
-
-                # Legacy support: fixture as dict (rare)
-                elif isinstance(fixture, dict):
-                    opponent_team = fixture.get("opponent_team")
-                    was_home = fixture.get("is_home")
-                    break
-
-                # Legacy support: fixture as list (rare)
-                elif isinstance(fixture, list) and fixture:
-                    first_fixture = fixture[0]
-                    if isinstance(first_fixture, dict):
-                        opponent_team = first_fixture.get("opponent_team")
-                        was_home = first_fixture.get("is_home")
-                        break
-
-        processed_performance = {
-            "player_id": element_id,
-            "gameweek": gameweek,
-            "total_points": stats.get("total_points"),
-            "minutes": stats.get("minutes"),
-            "goals_scored": stats.get("goals_scored"),
-            "assists": stats.get("assists"),
-            "clean_sheets": stats.get("clean_sheets"),
-            "goals_conceded": stats.get("goals_conceded"),
-            "own_goals": stats.get("own_goals"),
-            "penalties_saved": stats.get("penalties_saved"),
-            "penalties_missed": stats.get("penalties_missed"),
-            "yellow_cards": stats.get("yellow_cards"),
-            "red_cards": stats.get("red_cards"),
-            "saves": stats.get("saves"),
-            "bonus": stats.get("bonus"),
-            "bps": stats.get("bps"),
-            "influence": str(stats.get("influence", "")),
-            "creativity": str(stats.get("creativity", "")),
-            "threat": str(stats.get("threat", "")),
-            "ict_index": str(stats.get("ict_index", "")),
-            "expected_goals": str(stats.get("expected_goals", "")),
-            "expected_assists": str(stats.get("expected_assists", "")),
-            "expected_goal_involvements": str(stats.get("expected_goal_involvements", "")),
-            "expected_goals_conceded": str(stats.get("expected_goals_conceded", "")),
-            "team_id": player_teams.get(element_id),  # Get from bootstrap data
-            "opponent_team": opponent_team,
-            "was_home": was_home,
-            "value": player_prices.get(element_id),  # Get actual player price from bootstrap
-            "selected": stats.get("selected"),
-            "as_of_utc": timestamp,
-        }
-        processed_performances.append(processed_performance)
+def process_raw_gameweek_performance(
+    live_data: dict[str, Any],
+    gameweek: int,
+    bootstrap_data: dict[str, Any] = None,
+    fixtures_data: list[dict] = None,
+    fixtures_lookup: dict[int, dict[str, Any]] | None = None,
+    as_of_utc: pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """Convert raw gameweek live data to DataFrame with proper value population.
 
-    df = pd.DataFrame(processed_performances)
+    Columnar: each stat is pulled into its own array in one pass over the elements,
+    opponent and home/away come from array lookups of each element's first explain
+    fixture, and price/team are attached from bootstrap the same way. The frame is
+    built once at the end.
 
-    try:
-        print(f"✅ Processed {len(processed_performances)} player performances for GW{gameweek}")
-        return df
-    except Exception as e:
-        print(f"❌ Gameweek performance validation failed: {str(e)[:200]}")
-        return df
+    Pass a prebuilt fixtures_lookup (see build_fixtures_lookup) to avoid rebuilding
+    it from fixtures_data on every gameweek, or use process_raw_gameweek_performance_batch
+    for several gameweeks at once.
+    """
+    print(f"Processing gameweek {gameweek} performance data...")
+
+    if not live_data or "elements" not in live_data:
+        print("Warning: No live data provided")
+        return pd.DataFrame()
+
+    elements = live_data.get("elements", [])
+    if not elements:
+        print("Warning: No player performance data found")
+        return pd.DataFrame()
+
+    # Create a lookup for fixtures (fixture_id -> {team_h, team_a})
+    if fixtures_lookup is None:
+        fixtures_lookup = build_fixtures_lookup(fixtures_data)
+
+    df = _performance_frame(
+        elements,
+        gameweek,
+        _bootstrap_player_lookup(bootstrap_data),
+        fixtures_lookup,
+        pd.Timestamp.now(tz="UTC") if as_of_utc is None else as_of_utc,
+    )
+
+    print(f"✅ Processed {len(df)} player performances for GW{gameweek}")
+    return df
+
+
+def process_raw_gameweek_performance_batch(
+    live_by_gameweek: dict[int, dict[str, Any]],
+    bootstrap_data: dict[str, Any] = None,
+    fixtures_data: list[dict] = None,
+    fixtures_lookup: dict[int, dict[str, Any]] | None = None,
+    as_of_utc: pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """Convert many gameweeks' live data into one performance DataFrame.
+
+    The bootstrap price/team lookup and the fixtures lookup are built once for the
+    whole batch, and the elements of every gameweek go through a single columnar
+    pass. Rows match process_raw_gameweek_performance for each gameweek, in
+    gameweek order, with one shared as_of_utc.
+
+    Args:
+        live_by_gameweek: Gameweek -> /event/{gw}/live/ payload
+        bootstrap_data: Bootstrap payload for player prices and teams
+        fixtures_data: Raw fixtures payload (ignored when fixtures_lookup is given)
+        fixtures_lookup: Prebuilt fixture_id -> {team_h, team_a} lookup
+        as_of_utc: Capture timestamp for every row (defaults to now)
+
+    Returns:
+        Performance DataFrame for all gameweeks with elements (empty if none have any)
+    """
+    print(f"Processing {len(live_by_gameweek)} gameweeks of performance data...")
+
+    elements: list[dict] = []
+    gameweeks: list[np.ndarray] = []
+    for gameweek, live_data in sorted(live_by_gameweek.items()):
+        gameweek_elements = (live_data or {}).get("elements") or []
+        if not gameweek_elements:
+            print(f"Warning: No player performance data found for GW{gameweek}")
+            continue
+        elements.extend(gameweek_elements)
+        gameweeks.append(np.full(len(gameweek_elements), gameweek, dtype="int64"))
+
+    if not elements:
+        return pd.DataFrame()
+
+    if fixtures_lookup is None:
+        fixtures_lookup = build_fixtures_lookup(fixtures_data)
+
+    df = _performance_frame(
+        elements,
+        np.concatenate(gameweeks),
+        _bootstrap_player_lookup(bootstrap_data),
+        fixtures_lookup,
+        pd.Timestamp.now(tz="UTC") if as_of_utc is None else as_of_utc,
+    )
+
+    print(f"✅ Processed {len(df)} player performances across {len(gameweeks)} gameweeks")
+    return df
+
+
+# Player field -> value used when a source lacks it or has no value (vaastav players_raw has no set-piece orders)
+SNAPSHOT_PLAYER_FIELDS: dict[str, Any] = {
+    "status": "a",
+    "chance_of_playing_next_round": None,
+    "chance_of_playing_this_round": None,
+    "news": "",
+    "news_added": None,
+    "now_cost": None,
+    "ep_this": "0.0",
+    "ep_next": "0.0",
+    "form": "0.0",
+    "penalties_order": None,
+    "corners_and_indirect_freekicks_order": None,
+    "direct_freekicks_order": None,
+}
+SNAPSHOT_TEXT_FIELDS = ("status", "news", "ep_this", "ep_next", "form")
+SNAPSHOT_INT_FIELDS = ("now_cost", "penalties_order", "corners_and_indirect_freekicks_order", "direct_freekicks_order")
+
+
+def _snapshot_column(players: pd.DataFrame, field: str) -> pd.Series:
+    """One snapshot field from a player frame, typed and with missing values defaulted."""
+    default = SNAPSHOT_PLAYER_FIELDS[field]
+    if field not in players.columns:
+        return pd.Series(default, index=players.index, dtype=object)
+
+    values = players[field]
+    if field in SNAPSHOT_TEXT_FIELDS:
+        # Numeric sources (vaastav floats, categoricals) are formatted as the API's strings
+        text = values if values.dtype == object else values.astype(str)
+        return text.where(values.notna(), default)
+    if field in SNAPSHOT_INT_FIELDS:
+        return pd.to_numeric(values, errors="coerce").astype("Int64")
+    if field == "news_added":
+        return pd.to_datetime(values, utc=True, errors="coerce", format="ISO8601")
+    return values
+
+
+def project_player_snapshots(
+    players: pd.DataFrame,
+    gameweeks: int | list[int],
+    is_backfilled: bool = False,
+    timestamp: pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """Project player data (bootstrap elements or vaastav players_raw) onto snapshot columns.
+
+    Fields are projected once and broadcast across the gameweeks with a cross join,
+    so a gameweek range costs one projection rather than one per gameweek.
+
+    Args:
+        players: One row per player with API field names ("id", "status", "news", ...)
+        gameweeks: Gameweek number, or gameweeks to repeat the snapshot for
+        is_backfilled: Whether this is inferred/backfilled data vs real capture
+        timestamp: Snapshot time (defaults to now)
+
+    Returns:
+        Snapshot DataFrame (unvalidated), ordered by gameweek then player
+    """
+    timestamp = timestamp if timestamp is not None else pd.Timestamp.now(tz="UTC")
+    gameweeks = [gameweeks] if isinstance(gameweeks, int) else list(gameweeks)
+
+    projected = pd.DataFrame(
+        {
+            "player_id": players["id"].astype("int64"),
+            **{field: _snapshot_column(players, field) for field in SNAPSHOT_PLAYER_FIELDS},
+        }
+    )
+
+    # Cross join gameweeks x players as positional takes (cheaper than merge(how="cross"))
+    n_players = len(projected)
+    df = projected.take(np.tile(np.arange(n_players), len(gameweeks))).reset_index(drop=True)
+    df.insert(1, "gameweek", np.repeat(np.asarray(gameweeks, dtype="int64"), n_players))
+    df["is_backfilled"] = is_backfilled
+    df["snapshot_date"] = timestamp
+    df["as_of_utc"] = timestamp
+    return df
 
 
 def process_player_gameweek_snapshot(
@@ -736,58 +1036,15 @@ def process_player_gameweek_snapshot(
         print("Warning: No player data found in bootstrap")
         return pd.DataFrame()
 
-    # Process each player, capturing only snapshot-relevant fields
-    processed_snapshots = []
-    timestamp = pd.Timestamp.now(tz="UTC")
-
-    for player in players:
-        snapshot = {
-            # Primary keys
-            "player_id": player["id"],
-            "gameweek": gameweek,
-            # Availability status
-            "status": player.get("status", "a"),
-            "chance_of_playing_next_round": player.get("chance_of_playing_next_round"),
-            "chance_of_playing_this_round": player.get("chance_of_playing_this_round"),
-            # Injury/suspension news
-            "news": player.get("news", ""),
-            "news_added": player.get("news_added"),
-            # Price at snapshot time
-            "now_cost": player.get("now_cost"),
-            # Expected points at snapshot time
-            "ep_this": player.get("ep_this", "0.0"),
-            "ep_next": player.get("ep_next", "0.0"),
-            # Form at snapshot time
-            "form": player.get("form", "0.0"),
-            # Set piece responsibilities at snapshot time
-            "penalties_order": player.get("penalties_order"),
-            "corners_and_indirect_freekicks_order": player.get("corners_and_indirect_freekicks_order"),
-            "direct_freekicks_order": player.get("direct_freekicks_order"),
-            # Backfill flag
-            "is_backfilled": is_backfilled,
-            # Metadata
-            "snapshot_date": timestamp,
-            "as_of_utc": timestamp,
-        }
-        processed_snapshots.append(snapshot)
-
-    df = pd.DataFrame(processed_snapshots)
-
-    # Clean data before validation
-    print("🧹 Cleaning snapshot data...")
-
-    # Handle None/null values in news field (convert to empty string)
-    if "news" in df.columns:
-        df["news"] = df["news"].fillna("")
-
-    # Handle ep_this and ep_next (convert None to "0.0")
-    for col in ["ep_this", "ep_next", "form"]:
-        if col in df.columns:
-            df[col] = df[col].fillna("0.0")
+    # Only the snapshot-relevant fields; missing values are defaulted by the projection
+    players_df = pd.DataFrame(
+        {field: [player.get(field) for player in players] for field in ["id", *SNAPSHOT_PLAYER_FIELDS]}
+    )
+    df = project_player_snapshots(players_df, gameweek, is_backfilled=is_backfilled)
 
     # Validate against schema
     try:
-        validated_df = RawPlayerGameweekSnapshotSchema.validate(df)
+        validated_df = validate_table(df, RawPlayerGameweekSnapshotSchema, "raw_player_gameweek_snapshot")
         print(f"✅ Snapshot validation successful - {len(validated_df)} player snapshots for GW{gameweek}")
         return validated_df
     except Exception as e:
@@ -796,13 +1053,59 @@ def process_player_gameweek_snapshot(
         return df
 
 
-def process_raw_betting_odds(odds_df: pd.DataFrame, fixtures_df: pd.DataFrame, teams_df: pd.DataFrame) -> pd.DataFrame:
+# football-data.co.uk column -> RawBettingOddsSchema column (source columns missing from a season become null)
+BETTING_ODDS_COLUMN_MAP = {
+    "Referee": "referee",
+    # Match statistics
+    **{col: col for col in ["HS", "AS", "HST", "AST", "HC", "AC", "HF", "AF", "HY", "AY", "HR", "AR"]},
+    # Pre-match odds - Bet365, Pinnacle and aggregates
+    **{col: col for col in ["B365H", "B365D", "B365A", "PSH", "PSD", "PSA"]},
+    **{col: col for col in ["MaxH", "MaxD", "MaxA", "AvgH", "AvgD", "AvgA"]},
+    # Closing odds - Bet365, Pinnacle and aggregates
+    **{col: col for col in ["B365CH", "B365CD", "B365CA", "PSCH", "PSCD", "PSCA"]},
+    **{col: col for col in ["MaxCH", "MaxCD", "MaxCA", "AvgCH", "AvgCD", "AvgCA"]},
+    # Over/Under 2.5 - Bet365, Betfair Exchange and aggregates
+    "B365>2.5": "B365_over_2_5",
+    "B365<2.5": "B365_under_2_5",
+    "BFE>2.5": "BFE_over_2_5",
+    "BFE<2.5": "BFE_under_2_5",
+    "Max>2.5": "Max_over_2_5",
+    "Max<2.5": "Max_under_2_5",
+    "Avg>2.5": "Avg_over_2_5",
+    "Avg<2.5": "Avg_under_2_5",
+    # Asian Handicap
+    **{col: col for col in ["AHh", "B365AHH", "B365AHA", "PAHH", "PAHA", "AvgAHH", "AvgAHA"]},
+}
+
+ODDS_MATCH_KEYS = ["match_date", "home_team_id", "away_team_id"]
+
+
+def _describe_odds_rows(odds: pd.DataFrame, limit: int = 3) -> str:
+    """Short "Home v Away (date)" listing of odds rows for warnings."""
+    sample = odds.head(limit)
+    labels = sample["HomeTeam"] + " v " + sample["AwayTeam"] + " (" + sample["match_date"].dt.strftime("%Y-%m-%d") + ")"
+    more = f", +{len(odds) - limit} more" if len(odds) > limit else ""
+    return ", ".join(labels) + more
+
+
+def process_raw_betting_odds(
+    odds_df: pd.DataFrame,
+    fixtures_df: pd.DataFrame,
+    teams_df: pd.DataFrame,
+    alias_index: pd.DataFrame | None = None,
+) -> pd.DataFrame:
     """Process betting odds data and map to FPL fixtures.
 
+    Team names are resolved through the team alias index, so any source's spelling
+    listed there works. Odds rows are joined to fixtures on (match_date, home_team_id,
+    away_team_id) and renamed through BETTING_ODDS_COLUMN_MAP. Rows whose key matches
+    no fixture, or more than one, are reported and dropped.
+
     Args:
-        odds_df: Raw betting odds DataFrame from football-data.co.uk
+        odds_df: Raw betting odds DataFrame (football-data.co.uk or The Odds API)
         fixtures_df: FPL fixtures DataFrame (from raw_fixtures)
         teams_df: FPL teams DataFrame (from raw_teams_bootstrap)
+        alias_index: Team alias index (from raw_team_aliases); built from teams_df if None or empty
 
     Returns:
         Processed DataFrame matching RawBettingOddsSchema, or empty DataFrame on error
@@ -816,158 +1119,82 @@ def process_raw_betting_odds(odds_df: pd.DataFrame, fixtures_df: pd.DataFrame, t
         print("⚠️  No betting odds data to process")
         return pd.DataFrame()
 
-    # Team name mapping: football-data.co.uk -> FPL
-    TEAM_NAME_MAPPING = {
-        "Man United": "Man Utd",
-        "Tottenham": "Spurs",
-    }
-
-    # Create team name to ID mapping
-    team_name_to_id = dict(zip(teams_df["name"], teams_df["team_id"], strict=False))
-
     # Convert date format from dd/mm/yyyy to datetime
+    odds = odds_df.copy()
     try:
-        odds_df["Date"] = pd.to_datetime(odds_df["Date"], format="%d/%m/%Y")
+        odds["match_date"] = pd.to_datetime(odds["Date"], format="%d/%m/%Y")
     except Exception as e:
         print(f"⚠️  Error parsing dates: {e}")
         return pd.DataFrame()
 
     # Map team names to IDs
-    def map_team_name(name: str) -> int | None:
-        """Map football-data.co.uk team name to FPL team_id."""
-        # Apply name mapping first
-        mapped_name = TEAM_NAME_MAPPING.get(name, name)
-        return team_name_to_id.get(mapped_name)
-
-    odds_df["home_team_id"] = odds_df["HomeTeam"].apply(map_team_name)
-    odds_df["away_team_id"] = odds_df["AwayTeam"].apply(map_team_name)
+    if alias_index is None or alias_index.empty:
+        alias_index = build_team_alias_index(teams_df)
+    odds["home_team_id"] = resolve_team_ids(odds["HomeTeam"], alias_index)
+    odds["away_team_id"] = resolve_team_ids(odds["AwayTeam"], alias_index)
 
     # Filter out rows with unmapped teams
-    before_count = len(odds_df)
-    odds_df = odds_df.dropna(subset=["home_team_id", "away_team_id"])
-    unmapped_count = before_count - len(odds_df)
-    if unmapped_count > 0:
-        print(f"⚠️  Dropped {unmapped_count} matches with unmapped teams")
-
-    # Convert team IDs to int
-    odds_df["home_team_id"] = odds_df["home_team_id"].astype(int)
-    odds_df["away_team_id"] = odds_df["away_team_id"].astype(int)
-
-    # Prepare fixtures for matching (extract date from kickoff_utc)
-    fixtures_df = fixtures_df.copy()
-    fixtures_df["match_date"] = pd.to_datetime(fixtures_df["kickoff_utc"]).dt.date
-
-    # Match odds to fixtures on date + teams
-    matched_odds = []
-    unmatched_count = 0
-
-    for _, odds_row in odds_df.iterrows():
-        match_date = odds_row["Date"].date()
-        home_id = odds_row["home_team_id"]
-        away_id = odds_row["away_team_id"]
-
-        # Find matching fixture
-        fixture_match = fixtures_df[
-            (fixtures_df["match_date"] == match_date)
-            & (fixtures_df["home_team_id"] == home_id)
-            & (fixtures_df["away_team_id"] == away_id)
-        ]
-
-        if len(fixture_match) == 1:
-            fixture_id = fixture_match.iloc[0]["fixture_id"]
-
-            # Build processed row with all required fields
-            processed_row = {
-                "fixture_id": fixture_id,
-                "match_date": pd.Timestamp(match_date),
-                "home_team_id": home_id,
-                "away_team_id": away_id,
-                "referee": odds_row.get("Referee"),
-                # Match statistics
-                "HS": odds_row.get("HS"),
-                "AS": odds_row.get("AS"),
-                "HST": odds_row.get("HST"),
-                "AST": odds_row.get("AST"),
-                "HC": odds_row.get("HC"),
-                "AC": odds_row.get("AC"),
-                "HF": odds_row.get("HF"),
-                "AF": odds_row.get("AF"),
-                "HY": odds_row.get("HY"),
-                "AY": odds_row.get("AY"),
-                "HR": odds_row.get("HR"),
-                "AR": odds_row.get("AR"),
-                # Pre-match odds - Bet365
-                "B365H": odds_row.get("B365H"),
-                "B365D": odds_row.get("B365D"),
-                "B365A": odds_row.get("B365A"),
-                # Pre-match odds - Pinnacle
-                "PSH": odds_row.get("PSH"),
-                "PSD": odds_row.get("PSD"),
-                "PSA": odds_row.get("PSA"),
-                # Pre-match odds - Aggregates
-                "MaxH": odds_row.get("MaxH"),
-                "MaxD": odds_row.get("MaxD"),
-                "MaxA": odds_row.get("MaxA"),
-                "AvgH": odds_row.get("AvgH"),
-                "AvgD": odds_row.get("AvgD"),
-                "AvgA": odds_row.get("AvgA"),
-                # Closing odds - Bet365
-                "B365CH": odds_row.get("B365CH"),
-                "B365CD": odds_row.get("B365CD"),
-                "B365CA": odds_row.get("B365CA"),
-                # Closing odds - Pinnacle
-                "PSCH": odds_row.get("PSCH"),
-                "PSCD": odds_row.get("PSCD"),
-                "PSCA": odds_row.get("PSCA"),
-                # Closing odds - Aggregates
-                "MaxCH": odds_row.get("MaxCH"),
-                "MaxCD": odds_row.get("MaxCD"),
-                "MaxCA": odds_row.get("MaxCA"),
-                "AvgCH": odds_row.get("AvgCH"),
-                "AvgCD": odds_row.get("AvgCD"),
-                "AvgCA": odds_row.get("AvgCA"),
-                # Over/Under 2.5 - Bet365
-                "B365_over_2_5": odds_row.get("B365>2.5"),
-                "B365_under_2_5": odds_row.get("B365<2.5"),
-                # Over/Under 2.5 - Betfair Exchange
-                "BFE_over_2_5": odds_row.get("BFE>2.5"),
-                "BFE_under_2_5": odds_row.get("BFE<2.5"),
-                # Over/Under 2.5 - Aggregates
-                "Max_over_2_5": odds_row.get("Max>2.5"),
-                "Max_under_2_5": odds_row.get("Max<2.5"),
-                "Avg_over_2_5": odds_row.get("Avg>2.5"),
-                "Avg_under_2_5": odds_row.get("Avg<2.5"),
-                # Asian Handicap
-                "AHh": odds_row.get("AHh"),
-                "B365AHH": odds_row.get("B365AHH"),
-                "B365AHA": odds_row.get("B365AHA"),
-                "PAHH": odds_row.get("PAHH"),
-                "PAHA": odds_row.get("PAHA"),
-                "AvgAHH": odds_row.get("AvgAHH"),
-                "AvgAHA": odds_row.get("AvgAHA"),
-                # Metadata
-                "as_of_utc": pd.Timestamp.now(tz="UTC"),
-            }
-
-            matched_odds.append(processed_row)
-        else:
-            unmatched_count += 1
-
-    if unmatched_count > 0:
-        print(f"⚠️  {unmatched_count} betting odds rows could not be matched to fixtures")
+    unmapped = odds["home_team_id"].isna() | odds["away_team_id"].isna()
+    if unmapped.any():
+        names = pd.concat(
+            [odds.loc[odds["home_team_id"].isna(), "HomeTeam"], odds.loc[odds["away_team_id"].isna(), "AwayTeam"]]
+        )
+        print(
+            f"⚠️  Dropped {unmapped.sum()} matches with unmapped teams: {', '.join(sorted(names.astype(str).unique()))}"
+        )
+        odds = odds[~unmapped]
+    odds = odds.astype({"home_team_id": int, "away_team_id": int})
+
+    # Fixture keys (kickoff date in UTC); a key shared by several fixtures cannot be matched
+    kickoff = pd.to_datetime(fixtures_df["kickoff_utc"])
+    if kickoff.dt.tz is not None:
+        kickoff = kickoff.dt.tz_localize(None)
+    fixture_keys = pd.DataFrame(
+        {
+            "fixture_id": fixtures_df["fixture_id"].to_numpy(),
+            "match_date": kickoff.dt.normalize().to_numpy(),
+            "home_team_id": fixtures_df["home_team_id"].to_numpy(),
+            "away_team_id": fixtures_df["away_team_id"].to_numpy(),
+        }
+    ).dropna(subset=ODDS_MATCH_KEYS)
+    duplicated = fixture_keys.duplicated(ODDS_MATCH_KEYS, keep=False)
+    ambiguous_keys = fixture_keys.loc[duplicated, ODDS_MATCH_KEYS].drop_duplicates()
+    fixture_keys = fixture_keys[~duplicated].astype({"home_team_id": int, "away_team_id": int})
+
+    matched = odds.merge(fixture_keys, on=ODDS_MATCH_KEYS, how="left", indicator=True)
+
+    # Anti-joins: odds whose key matches several fixtures, then odds with no fixture at all
+    is_ambiguous = (
+        matched[ODDS_MATCH_KEYS].merge(ambiguous_keys, how="left", indicator=True)["_merge"].eq("both").to_numpy()
+    )
+    is_unmatched = matched["_merge"].eq("left_only").to_numpy() & ~is_ambiguous
+    if is_ambiguous.any():
+        print(
+            f"⚠️  {is_ambiguous.sum()} betting odds rows matched more than one fixture: "
+            f"{_describe_odds_rows(matched[is_ambiguous])}"
+        )
+    if is_unmatched.any():
+        print(
+            f"⚠️  {is_unmatched.sum()} betting odds rows could not be matched to fixtures: "
+            f"{_describe_odds_rows(matched[is_unmatched])}"
+        )
+    matched = matched[matched["_merge"].eq("both").to_numpy()]
 
-    if not matched_odds:
+    if matched.empty:
         print("⚠️  No betting odds matched to fixtures")
         return pd.DataFrame()
 
-    # Convert to DataFrame
-    df = pd.DataFrame(matched_odds)
+    renamed = matched.reindex(columns=list(BETTING_ODDS_COLUMN_MAP)).rename(columns=BETTING_ODDS_COLUMN_MAP)
+    df = pd.concat(
+        [matched[["fixture_id", *ODDS_MATCH_KEYS]].astype({"fixture_id": int}), renamed], axis=1
+    ).reset_index(drop=True)
+    df["as_of_utc"] = pd.Timestamp.now(tz="UTC")
 
     print(f"✅ Matched {len(df)} betting odds to fixtures")
 
     # Validate against schema
     try:
-        validated_df = RawBettingOddsSchema.validate(df)
+        validated_df = validate_table(df, RawBettingOddsSchema, "raw_betting_odds")
         print(f"✅ Betting odds validation successful - {len(validated_df)} fixtures with odds")
         return validated_df
     except Exception as e:
@@ -0,0 +1,78 @@
+"""Run-scoped cache of shared FPL resources.
+
+A single ``main`` or backfill run needs the same bootstrap payload, fixtures
+payload and fixture lookup for every gameweek and odds step. ``RunContext``
+fetches each of them at most once per run and hands the same objects to every
+step, so a run makes O(1) bootstrap/fixtures requests regardless of how many
+gameweeks it touches.
+"""
+
+from typing import Any
+
+import pandas as pd
+
+from .fpl_api import fetch_fpl_bootstrap, fetch_fpl_fixtures
+from .raw_processor import build_fixtures_lookup
+
+
+class RunContext:
+    """Lazily fetched, run-scoped bootstrap/fixtures resources."""
+
+    def __init__(self, bootstrap: dict | None = None, fixtures: list[dict] | None = None):
+        self._bootstrap = bootstrap
+        self._fixtures = fixtures
+        self._fixtures_lookup: dict[int, dict[str, Any]] | None = None
+        self._fixtures_df: pd.DataFrame | None = None
+        self._teams_df: pd.DataFrame | None = None
+        self._team_aliases: pd.DataFrame | None = None
+        self.requests = {"bootstrap": 0, "fixtures": 0}
+
+    @property
+    def bootstrap(self) -> dict:
+        """Bootstrap payload, fetched on first access."""
+        if self._bootstrap is None:
+            self._bootstrap = fetch_fpl_bootstrap()
+            self.requests["bootstrap"] += 1
+        return self._bootstrap
+
+    @property
+    def fixtures(self) -> list[dict]:
+        """Fixtures payload, fetched on first access."""
+        if self._fixtures is None:
+            self._fixtures = fetch_fpl_fixtures()
+            self.requests["fixtures"] += 1
+        return self._fixtures
+
+    @property
+    def fixtures_lookup(self) -> dict[int, dict[str, Any]]:
+        """fixture_id -> {team_h, team_a}, built once from the fixtures payload."""
+        if self._fixtures_lookup is None:
+            self._fixtures_lookup = build_fixtures_lookup(self.fixtures)
+        return self._fixtures_lookup
+
+    @property
+    def fixtures_df(self) -> pd.DataFrame:
+        """raw_fixtures frame for odds matching, read from the database once."""
+        if self._fixtures_df is None:
+            from db.operations import db_ops
+
+            self._fixtures_df = db_ops.get_raw_fixtures()
+        return self._fixtures_df
+
+    @property
+    def teams_df(self) -> pd.DataFrame:
+        """raw_teams_bootstrap frame for odds team mapping, read from the database once."""
+        if self._teams_df is None:
+            from db.operations import db_ops
+
+            self._teams_df = db_ops.get_raw_teams_bootstrap()
+        return self._teams_df
+
+    @property
+    def team_aliases(self) -> pd.DataFrame:
+        """raw_team_aliases index for odds team-name resolution, read from the database once."""
+        if self._team_aliases is None:
+            from db.operations import db_ops
+
+            self._team_aliases = db_ops.get_team_aliases()
+        return self._team_aliases
@@ -1,24 +1,364 @@
-"""Vaastav GitHub data fetching functions."""
+"""Vaastav GitHub data fetching functions.
+
+Historical CSVs from vaastav/Fantasy-Premier-League are kept as versioned local
+copies under ``data/vaastav/<season>/`` with a manifest recording each copy's
+SHA-256, size, ETag and fetch time. Reads are served from the local copy after
+its hash is verified, so repeated backfills never touch the network:
+
+- Past seasons never change and are downloaded once.
+- The current season is revalidated (``If-None-Match``) once the copy is older
+  than ``FPL_VAASTAV_MAX_AGE_HOURS``; a changed file becomes a new version and
+  only the newest ``MAX_VERSIONS`` are kept.
+- A copy whose hash no longer matches the manifest is discarded and re-downloaded.
+- If GitHub is unreachable, a stale but intact copy is used with a warning.
+
+CSVs are parsed straight from the local file (no decode to ``str``) with an
+explicit dtype map per file and optional column selection; with ``chunksize``
+the file is parsed ``FPL_VAASTAV_CHUNK_SIZE`` rows at a time and ``row_filter``
+drops unwanted rows chunk by chunk, so the full file is never held in memory.
+
+While an archived run is replayed (``--replay``) files come from the payload
+archive and are read from a temporary copy; the cache and its manifest are left
+untouched.
+
+Configuration (environment variables):
+    FPL_VAASTAV_CACHE_DIR: Cache directory (default data/vaastav)
+    FPL_VAASTAV_MAX_AGE_HOURS: Age after which current-season copies are revalidated (default 24)
+    FPL_VAASTAV_CHUNK_SIZE: Rows parsed per chunk by the chunked readers (default 50000)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
 
 import pandas as pd
 
-from utils import http_get
+from utils import now_utc
+
+from . import payload_archive
+from .http_client import http_get, http_get_response
+
+VAASTAV_BASE_URL = "https://raw.githubusercontent.com/vaastav/Fantasy-Premier-League/master/data"
+VAASTAV_CACHE_DIR = Path(os.getenv("FPL_VAASTAV_CACHE_DIR", str(Path("data") / "vaastav")))
+VAASTAV_MAX_AGE_HOURS = float(os.getenv("FPL_VAASTAV_MAX_AGE_HOURS", "24"))
+VAASTAV_CHUNK_SIZE = int(os.getenv("FPL_VAASTAV_CHUNK_SIZE", "50000"))
+MAX_VERSIONS = 3
+
+_INT_STATS = [
+    "assists",
+    "bonus",
+    "bps",
+    "clean_sheets",
+    "goals_conceded",
+    "goals_scored",
+    "minutes",
+    "own_goals",
+    "penalties_missed",
+    "penalties_saved",
+    "red_cards",
+    "saves",
+    "starts",
+    "total_points",
+    "yellow_cards",
+]
+_FLOAT_STATS = [
+    "creativity",
+    "expected_assists",
+    "expected_goal_involvements",
+    "expected_goals",
+    "expected_goals_conceded",
+    "ict_index",
+    "influence",
+    "threat",
+    "xP",
+]
+
+# Explicit dtypes per vaastav file (columns missing from older seasons are ignored by read_csv)
+VAASTAV_DTYPES: dict[str, dict[str, str]] = {
+    "gws/merged_gw.csv": {
+        "name": "category",
+        "position": "category",
+        "team": "category",
+        "element": "int32",
+        "fixture": "int32",
+        "opponent_team": "int16",
+        "round": "int16",
+        "GW": "int16",
+        "selected": "int32",
+        "transfers_balance": "int32",
+        "transfers_in": "int32",
+        "transfers_out": "int32",
+        "value": "int16",
+        "was_home": "bool",
+        "team_a_score": "float32",
+        "team_h_score": "float32",
+        **dict.fromkeys(_INT_STATS, "int16"),
+        **dict.fromkeys(_FLOAT_STATS, "float32"),
+    },
+    "fixtures.csv": {
+        "id": "int32",
+        "event": "float32",
+        "team_h": "int16",
+        "team_a": "int16",
+        "team_h_score": "float32",
+        "team_a_score": "float32",
+        "finished": "bool",
+    },
+    "players_raw.csv": {
+        "id": "int32",
+        "status": "category",
+        "team": "int16",
+        "element_type": "int8",
+        "now_cost": "int16",
+        "chance_of_playing_next_round": "float64",
+        "chance_of_playing_this_round": "float64",
+        "ep_this": "float64",
+        "ep_next": "float64",
+        "form": "float64",
+    },
+}
+
+_stats = {"hits": 0, "downloads": 0, "revalidated": 0, "corrupt": 0}
+
+
+def _manifest_path() -> Path:
+    return VAASTAV_CACHE_DIR / "manifest.json"
+
+
+def _load_manifest() -> dict:
+    try:
+        return json.loads(_manifest_path().read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest: dict) -> None:
+    path = _manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp_path, path)
+
 
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
 
-def download_vaastav_merged_gw(season_folder: str) -> pd.DataFrame:
-    """Download historical GW data from vaastav repo and return as DataFrame."""
-    print(f"Downloading historical GW data for {season_folder}...")
 
-    base_url = "https://raw.githubusercontent.com/vaastav/Fantasy-Premier-League/master/data"
-    url = f"{base_url}/{season_folder}/gws/merged_gw.csv"
+def _version_path(season: str, path: str, sha256: str) -> Path:
+    stem, _, suffix = path.replace("/", "__").rpartition(".")
+    return VAASTAV_CACHE_DIR / season / f"{stem}@{sha256[:12]}.{suffix}"
 
+
+def _is_past_season(season: str) -> bool:
+    """Whether a season such as "2024-25" has finished (vaastav data no longer changes)."""
     try:
-        from io import StringIO
+        start_year = int(season.split("-")[0])
+    except ValueError:
+        return False
+    return now_utc().replace(tzinfo=None) >= pd.Timestamp(year=start_year + 1, month=8, day=1)
+
+
+def _is_fresh(season: str, entry: dict) -> bool:
+    if _is_past_season(season):
+        return True
+    age = now_utc() - pd.Timestamp(entry["fetched_at"])
+    return age.total_seconds() < VAASTAV_MAX_AGE_HOURS * 3600
+
+
+def _store_version(manifest: dict, key: str, season: str, path: str, body: bytes, etag: str | None) -> Path:
+    sha256 = hashlib.sha256(body).hexdigest()
+    local_path = _version_path(season, path, sha256)
+    local_path.parent.mkdir(parents=True, exist_ok=True)
+    if not local_path.exists():
+        tmp_path = local_path.with_suffix(local_path.suffix + ".tmp")
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, local_path)
+
+    entry = manifest.get(key, {})
+    versions = [sha256] + [v for v in entry.get("versions", []) if v != sha256]
+    for old in versions[MAX_VERSIONS:]:
+        _version_path(season, path, old).unlink(missing_ok=True)
+
+    manifest[key] = {
+        "url": f"{VAASTAV_BASE_URL}/{key}",
+        "sha256": sha256,
+        "size": len(body),
+        "etag": etag,
+        "fetched_at": now_utc().isoformat(),
+        "versions": versions[:MAX_VERSIONS],
+    }
+    _save_manifest(manifest)
+    return local_path
+
+
+def _replay_copy(path: str, body: bytes) -> Path:
+    """Local file holding a replayed body, outside the cache so replays never change it."""
+    sha256 = hashlib.sha256(body).hexdigest()
+    local_path = Path(tempfile.gettempdir()) / "fpl_vaastav_replay" / f"{sha256}{Path(path).suffix}"
+    if not local_path.exists():
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_path.with_suffix(local_path.suffix + f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, local_path)
+    return local_path
+
+
+def fetch_vaastav_file(season: str, path: str, refresh: bool = False) -> Path:
+    """Get a verified local copy of a vaastav data file, downloading only when needed.
 
-        data = http_get(url)
-        # Parse CSV data directly into DataFrame
-        df = pd.read_csv(StringIO(data.decode("utf-8")))
-        print(f"Downloaded vaastav historical data: {len(df)} rows")
+    Args:
+        season: Season folder, e.g. "2024-25"
+        path: File path within the season folder, e.g. "gws/merged_gw.csv"
+        refresh: Revalidate with GitHub even if the local copy is fresh
+
+    Returns:
+        Path to the local copy
+
+    Raises:
+        requests.RequestException: If the file must be downloaded and the download fails
+    """
+    key = f"{season}/{path}"
+    url = f"{VAASTAV_BASE_URL}/{key}"
+    manifest = _load_manifest()
+    entry = manifest.get(key)
+
+    if payload_archive.is_replaying():
+        # Replays must reproduce the recorded run, so go through the archive
+        return _replay_copy(path, http_get(url))
+
+    local_path = _version_path(season, path, entry["sha256"]) if entry else None
+    if entry and (not local_path.exists() or _sha256_file(local_path) != entry["sha256"]):
+        print(f"⚠️ Cached vaastav {key} failed its integrity check, re-downloading")
+        _stats["corrupt"] += 1
+        if local_path.exists():
+            local_path.unlink()
+        entry = None
+
+    if entry and not refresh and _is_fresh(season, entry):
+        _stats["hits"] += 1
+        return local_path
+
+    headers = {"If-None-Match": entry["etag"]} if entry and entry.get("etag") else None
+    try:
+        response = http_get_response(url, headers=headers)
+    except Exception as e:
+        if entry:
+            print(f"⚠️ Could not revalidate vaastav {key} ({e}); using cached copy from {entry['fetched_at']}")
+            _stats["hits"] += 1
+            return local_path
+        raise
+
+    if response.status_code == 304 and entry:
+        entry["fetched_at"] = now_utc().isoformat()
+        _save_manifest(manifest)
+        _stats["revalidated"] += 1
+        return local_path
+
+    _stats["downloads"] += 1
+    return _store_version(manifest, key, season, path, response.content, response.headers.get("ETag"))
+
+
+def read_vaastav_csv(
+    season: str,
+    path: str,
+    columns: list[str] | None = None,
+    dtype: dict[str, str] | None = None,
+    chunksize: int | None = None,
+    row_filter: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    """Read a vaastav CSV from the local cache with explicit dtypes.
+
+    Args:
+        season: Season folder, e.g. "2024-25"
+        path: File path within the season folder
+        columns: Only read these columns (None reads all)
+        dtype: Column dtypes (defaults to VAASTAV_DTYPES for the file)
+        chunksize: Parse this many rows at a time instead of the whole file at once
+        row_filter: Applied to each chunk (or the whole frame) to drop unwanted rows
+        refresh: Revalidate the cached copy with GitHub first
+
+    Returns:
+        Parsed DataFrame
+    """
+    local_path = fetch_vaastav_file(season, path, refresh=refresh)
+    dtypes = dtype if dtype is not None else VAASTAV_DTYPES.get(path, {})
+    if columns is not None:
+        dtypes = {col: t for col, t in dtypes.items() if col in columns}
+        # Tolerate columns missing from older seasons
+        header = pd.read_csv(local_path, nrows=0).columns
+        columns = [col for col in columns if col in header]
+
+    try:
+        return _parse_csv(local_path, columns, dtypes, chunksize, row_filter)
+    except (ValueError, TypeError) as e:
+        # e.g. missing values in a column declared as an integer in an older season
+        print(f"Warning: vaastav {season}/{path} does not match the declared dtypes ({e}); inferring types")
+        return _parse_csv(local_path, columns, {}, chunksize, row_filter)
+
+
+def _parse_csv(
+    local_path: Path,
+    columns: list[str] | None,
+    dtypes: dict[str, str],
+    chunksize: int | None,
+    row_filter: Callable[[pd.DataFrame], pd.DataFrame] | None,
+) -> pd.DataFrame:
+    if chunksize:
+        chunks = [
+            row_filter(chunk) if row_filter is not None else chunk
+            for chunk in pd.read_csv(local_path, usecols=columns, dtype=dtypes, chunksize=chunksize)
+        ]
+        df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
+        # Categories differ per chunk, so concat falls back to object; restore them
+        categorical = {col: "category" for col, t in dtypes.items() if t == "category" and col in df.columns}
+        return df.astype(categorical) if categorical else df
+
+    df = pd.read_csv(local_path, usecols=columns, dtype=dtypes)
+    return row_filter(df) if row_filter is not None else df
+
+
+def get_vaastav_cache_stats() -> dict[str, int]:
+    """Cache hits, downloads, 304 revalidations and integrity failures for this process."""
+    return dict(_stats)
+
+
+def download_vaastav_merged_gw(
+    season_folder: str, columns: list[str] | None = None, gameweeks: list[int] | None = None
+) -> pd.DataFrame:
+    """Load historical GW data from vaastav repo (cached locally) and return as DataFrame.
+
+    The file (~25k rows per season) is parsed in chunks of VAASTAV_CHUNK_SIZE rows.
+
+    Args:
+        season_folder: Season folder, e.g. "2024-25"
+        columns: Only load these columns (None loads all)
+        gameweeks: Only keep rows of these gameweeks, filtered chunk by chunk (None keeps all)
+    """
+    print(f"Loading historical GW data for {season_folder}...")
+
+    if gameweeks is not None and columns is not None and "GW" not in columns:
+        columns = [*columns, "GW"]
+
+    def in_gameweeks(chunk: pd.DataFrame) -> pd.DataFrame:
+        return chunk[chunk["GW"].isin(gameweeks)]
+
+    try:
+        df = read_vaastav_csv(
+            season_folder,
+            "gws/merged_gw.csv",
+            columns=columns,
+            chunksize=VAASTAV_CHUNK_SIZE,
+            row_filter=in_gameweeks if gameweeks is not None else None,
+        )
+        print(f"Loaded vaastav historical data: {len(df)} rows")
         return df
     except Exception as e:
         print(f"Error downloading vaastav data: {e}")
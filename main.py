@@ -4,20 +4,26 @@ FPL Dataset Builder V0.1
 A minimal, synchronous script to download and normalize FPL data.
 """
 
+from pathlib import Path
+
 import pandas as pd
 import typer
 
 from cli.helpers import (
     auto_capture_snapshot_if_needed,
+    configure_validation,
     fetch_and_save_bootstrap_data,
     fetch_and_save_gameweek_data,
     initialize_data_environment,
     print_completion_summary,
+    print_run_summaries,
     process_and_save_derived_data,
     run_preflight_checks,
+    start_replay_mode,
 )
 from db.operations import db_ops
 from fetchers import get_current_gameweek
+from fetchers.run_context import RunContext
 from safety.cli import create_safety_cli
 
 app = typer.Typer(help="FPL Dataset Builder V0.1 - Complete FPL API data capture with raw data architecture.")
@@ -37,6 +43,15 @@ def main(
     ),
     skip_gameweek: bool = typer.Option(False, help="Skip gameweek fetching (only update bootstrap/derived data)"),
     skip_derived: bool = typer.Option(False, help="Skip derived analytics processing"),
+    replay: str = typer.Option(None, "--replay", help="Replay an archived run ID instead of fetching from the network"),
+    validation_mode: str = typer.Option(
+        None,
+        "--validation-mode",
+        help="Schema validation: full, sampled (head/tail rows) or fingerprint (skip unchanged)",
+    ),
+    validation_table_mode: list[str] = typer.Option(
+        None, "--validation-table-mode", help="Per-table validation mode as table=mode (repeatable)"
+    ),
 ):
     """Download and process complete FPL data with smart refresh logic.
 
@@ -61,9 +76,14 @@ def main(
 
     3. Quick price/form update (fastest):
        uv run main.py main --skip-gameweek --skip-derived
+
+    4. Repeat run that skips validating unchanged tables:
+       uv run main.py main --validation-mode fingerprint
     """
     typer.echo("🏈 FPL Dataset Builder V0.1 - Smart Refresh")
     typer.echo()
+    start_replay_mode(replay)
+    configure_validation(validation_mode, validation_table_mode)
 
     # 1. Pre-flight checks
     run_preflight_checks(validate_before, create_backup, "pre_main_run")
@@ -72,7 +92,9 @@ def main(
     initialize_data_environment()
 
     # 3. Fetch and save bootstrap data (ALWAYS refreshed)
-    bootstrap = fetch_and_save_bootstrap_data(manager_id)
+    # Bootstrap, fixtures and the fixtures lookup are fetched once and shared by every later step
+    context = RunContext()
+    bootstrap = fetch_and_save_bootstrap_data(manager_id, context=context)
 
     # Get current gameweek information
     current_gameweek, is_finished = get_current_gameweek(bootstrap)
@@ -93,7 +115,7 @@ def main(
         gameweek_skipped = True
     elif current_gameweek:
         gameweek_updated = fetch_and_save_gameweek_data(
-            current_gameweek, manager_id, bootstrap, force_refresh=force_refresh_gameweek
+            current_gameweek, manager_id, bootstrap, force_refresh=force_refresh_gameweek, context=context
         )
         if not gameweek_updated:
             gameweek_skipped = True
@@ -116,8 +138,9 @@ def main(
         except Exception:
             pass
 
-        fixtures_df = db_ops.get_raw_fixtures()
-        teams_df = db_ops.get_raw_teams_bootstrap()
+        fixtures_df = context.fixtures_df
+        teams_df = context.teams_df
+        team_aliases = context.team_aliases
 
         # Step 1: Fetch historical odds from football-data.co.uk (played matches)
         typer.echo("   📥 Fetching historical odds from football-data.co.uk...")
@@ -125,7 +148,7 @@ def main(
         try:
             raw_odds_df = fetch_betting_odds_data(season="2025-26")
             if not raw_odds_df.empty:
-                processed_historical = process_raw_betting_odds(raw_odds_df, fixtures_df, teams_df)
+                processed_historical = process_raw_betting_odds(raw_odds_df, fixtures_df, teams_df, team_aliases)
                 if not processed_historical.empty:
                     historical_odds = processed_historical
                     typer.echo(f"   ✅ Historical odds: {len(historical_odds)} fixtures")
@@ -171,7 +194,9 @@ def main(
                         try:
                             raw_realtime_df = fetch_realtime_betting_odds(api_key=api_key, gameweek=next_gameweek)
                             if not raw_realtime_df.empty:
-                                processed_realtime = process_raw_betting_odds(raw_realtime_df, fixtures_df, teams_df)
+                                processed_realtime = process_raw_betting_odds(
+                                    raw_realtime_df, fixtures_df, teams_df, team_aliases
+                                )
 
                                 # Filter to only include fixtures for the next gameweek
                                 gw_fixture_ids = set(gw_fixtures["fixture_id"].tolist())
@@ -314,6 +339,7 @@ def snapshot(
     typer.echo()
     typer.echo("🎉 Snapshot capture completed successfully!")
     typer.echo(f"✅ Player availability state captured for GW{gameweek}")
+    print_run_summaries()
     typer.echo(
         f"📊 Access snapshot: uv run python -c \"from client.fpl_data_client import FPLDataClient; client=FPLDataClient(); snapshot=client.get_player_availability_snapshot({gameweek}); print(f'Snapshot: {{len(snapshot)}} players')\""
     )
@@ -356,6 +382,7 @@ def refresh_bootstrap(
     typer.echo("✅ Latest player prices, form, and availability updated")
     if snapshot_captured:
         typer.echo(f"✅ Availability snapshot captured for GW{snapshot_gameweek}")
+    print_run_summaries()
     typer.echo()
     typer.echo("💡 Tip: Use 'uv run main.py main' for a full refresh including gameweek data")
 
@@ -376,8 +403,6 @@ def refresh_gameweek(
         uv run main.py refresh-gameweek --force       # Force refresh current
         uv run main.py refresh-gameweek --gameweek 7  # Refresh specific gameweek
     """
-    from fetchers import fetch_fpl_bootstrap
-
     typer.echo("🔄 FPL Gameweek Data Refresh")
     typer.echo()
 
@@ -386,7 +411,8 @@ def refresh_gameweek(
 
     # Fetch bootstrap data (needed for player mapping)
     typer.echo("📥 Fetching bootstrap data...")
-    bootstrap = fetch_fpl_bootstrap()
+    context = RunContext()
+    bootstrap = context.bootstrap
 
     # Determine gameweek
     if gameweek is None:
@@ -401,7 +427,7 @@ def refresh_gameweek(
     typer.echo()
 
     # Fetch and save gameweek data
-    updated = fetch_and_save_gameweek_data(gameweek, manager_id, bootstrap, force_refresh=force)
+    updated = fetch_and_save_gameweek_data(gameweek, manager_id, bootstrap, force_refresh=force, context=context)
 
     typer.echo()
     if updated:
@@ -414,6 +440,7 @@ def refresh_gameweek(
     else:
         typer.echo("ℹ️  Gameweek data already exists")
         typer.echo("   Use --force to refresh anyway")
+    print_run_summaries()
 
 
 @app.command()
@@ -471,7 +498,7 @@ def fetch_betting_odds(
         raise typer.Exit(1)
 
     # Process and match to fixtures
-    processed_odds = process_raw_betting_odds(raw_odds_df, fixtures_df, teams_df)
+    processed_odds = process_raw_betting_odds(raw_odds_df, fixtures_df, teams_df, db_ops.rebuild_team_aliases())
 
     if processed_odds.empty:
         typer.echo("❌ No betting odds could be matched to fixtures")
@@ -575,7 +602,7 @@ def fetch_realtime_odds(
 
     # Process and match to fixtures
     typer.echo("🔄 Processing betting odds data...")
-    processed_odds = process_raw_betting_odds(raw_odds_df, fixtures_df, teams_df)
+    processed_odds = process_raw_betting_odds(raw_odds_df, fixtures_df, teams_df, db_ops.rebuild_team_aliases())
 
     # Filter by gameweek if specified
     if gameweek is not None:
@@ -633,6 +660,15 @@ def backfill_gameweeks_cmd(
     manager_id: int = typer.Option(4233026, "--manager-id", help="FPL manager ID for personal data tracking"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be backfilled without saving"),
     force: bool = typer.Option(False, "--force", help="Overwrite existing gameweek data"),
+    replay: str = typer.Option(None, "--replay", help="Replay an archived run ID instead of fetching from the network"),
+    validation_mode: str = typer.Option(
+        None,
+        "--validation-mode",
+        help="Schema validation: full, sampled (head/tail rows) or fingerprint (skip unchanged)",
+    ),
+    validation_table_mode: list[str] = typer.Option(
+        None, "--validation-table-mode", help="Per-table validation mode as table=mode (repeatable)"
+    ),
 ):
     """Backfill missing gameweek performance data.
 
@@ -641,10 +677,14 @@ def backfill_gameweeks_cmd(
         uv run main.py backfill gameweeks --gameweek 1       # Backfill specific gameweek
         uv run main.py backfill gameweeks --start-gw 1 --end-gw 5  # Backfill range
         uv run main.py backfill gameweeks --dry-run          # Preview what would be backfilled
+        uv run main.py backfill gameweeks --replay <run-id>  # Re-run offline from archived payloads
     """
     from scripts.backfill.gameweeks import main as gameweeks_main
 
+    start_replay_mode(replay)
+    configure_validation(validation_mode, validation_table_mode)
     gameweeks_main(gameweek, start_gw, end_gw, manager_id, dry_run, force)
+    print_run_summaries()
 
 
 @backfill_app.command(name="snapshots")
@@ -655,6 +695,15 @@ def backfill_snapshots_cmd(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be backfilled without saving"),
     force: bool = typer.Option(False, "--force", help="Overwrite existing snapshot data"),
     season: str = typer.Option("2025-26", "--season", help="Season to fetch data from"),
+    replay: str = typer.Option(None, "--replay", help="Replay an archived run ID instead of fetching from the network"),
+    validation_mode: str = typer.Option(
+        None,
+        "--validation-mode",
+        help="Schema validation: full, sampled (head/tail rows) or fingerprint (skip unchanged)",
+    ),
+    validation_table_mode: list[str] = typer.Option(
+        None, "--validation-table-mode", help="Per-table validation mode as table=mode (repeatable)"
+    ),
 ):
     """Backfill player availability snapshots for GW1-6 using vaastav's historical data.
 
@@ -662,10 +711,64 @@ def backfill_snapshots_cmd(
         uv run main.py backfill snapshots                    # Backfill all GW1-6
         uv run main.py backfill snapshots --gameweek 3       # Backfill specific gameweek
         uv run main.py backfill snapshots --start-gw 1 --end-gw 4  # Backfill range
+        uv run main.py backfill snapshots --replay <run-id>  # Re-run offline from archived payloads
     """
     from scripts.backfill.snapshots import main as snapshots_main
 
+    start_replay_mode(replay)
+    configure_validation(validation_mode, validation_table_mode)
     snapshots_main(gameweek, start_gw, end_gw, dry_run, force, season)
+    print_run_summaries()
+
+
+@backfill_app.command(name="managers")
+def backfill_managers_cmd(
+    manager_ids: str = typer.Option(None, "--manager-ids", help="Comma-separated FPL manager IDs"),
+    ids_file: Path = typer.Option(None, "--ids-file", help="File with one manager ID per line"),
+    league_id: int = typer.Option(None, "--league-id", help="Classic league ID to ingest all members of"),
+    max_managers: int = typer.Option(None, "--max-managers", help="Only the top N managers of the league"),
+    gameweek: int = typer.Option(None, "--gameweek", "-g", help="Specific gameweek to ingest"),
+    start_gw: int = typer.Option(None, "--start-gw", help="Starting gameweek for range ingestion"),
+    end_gw: int = typer.Option(None, "--end-gw", help="Ending gameweek for range ingestion"),
+    chunk_size: int = typer.Option(500, "--chunk-size", help="Managers fetched and saved per batch"),
+    concurrency: int = typer.Option(8, "--concurrency", help="Maximum requests in flight"),
+    requests_per_second: float = typer.Option(10.0, "--rps", help="Global request rate cap"),
+    with_history: bool = typer.Option(
+        False, "--with-history", help="Also fill gameweek summaries from each manager's entry history"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be ingested without fetching picks"),
+    force: bool = typer.Option(False, "--force", help="Re-fetch managers and league standings already stored"),
+    replay: str = typer.Option(None, "--replay", help="Replay an archived run ID instead of fetching from the network"),
+):
+    """Ingest picks and gameweek summaries for many managers (a league, cohort or ID list).
+
+    Resumable: managers already stored for a gameweek are skipped, so re-run after an interruption.
+
+    Examples:
+        uv run main.py backfill managers --league-id 123456               # Whole mini-league, current GW
+        uv run main.py backfill managers --league-id 314 --max-managers 10000 --start-gw 1 --end-gw 10
+        uv run main.py backfill managers --manager-ids 4233026,123456 -g 5
+        uv run main.py backfill managers --ids-file cohort.txt --with-history
+    """
+    from scripts.backfill.managers import main as managers_main
+
+    start_replay_mode(replay)
+    managers_main(
+        manager_ids,
+        ids_file,
+        league_id,
+        max_managers,
+        gameweek,
+        start_gw,
+        end_gw,
+        chunk_size,
+        concurrency,
+        requests_per_second,
+        with_history,
+        dry_run,
+        force,
+    )
+    print_run_summaries()
 
 
 @backfill_app.command(name="derived")
@@ -675,6 +778,14 @@ def backfill_derived_cmd(
     end_gw: int = typer.Option(None, "--end-gw", help="Ending gameweek for range backfill"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be backfilled without saving"),
     force: bool = typer.Option(False, "--force", help="Overwrite existing derived data"),
+    validation_mode: str = typer.Option(
+        None,
+        "--validation-mode",
+        help="Schema validation: full, sampled (head/tail rows) or fingerprint (skip unchanged)",
+    ),
+    validation_table_mode: list[str] = typer.Option(
+        None, "--validation-table-mode", help="Per-table validation mode as table=mode (repeatable)"
+    ),
 ):
     """Backfill all derived analytics tables for historical gameweeks.
 
@@ -701,7 +812,9 @@ def backfill_derived_cmd(
 
     from scripts.backfill.derived import main as derived_main
 
+    configure_validation(validation_mode, validation_table_mode)
     derived_main()
+    print_run_summaries()
 
 
 @backfill_app.command(name="ownership")
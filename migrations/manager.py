@@ -233,6 +233,9 @@ def down():
         import shutil
 
         db_path = str(self.engine.url).replace("sqlite:///", "")
+        # Under WAL, committed pages can still sit in the -wal file; fold them into the database first
+        with self.engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
         shutil.copy2(db_path, backup_path)
 
         print(f"Database backed up to: {backup_path}")
@@ -1,8 +1,11 @@
 """Data backup and safe write operations."""
 
+import gzip
 import hashlib
 import logging
 import shutil
+import sqlite3
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 
@@ -24,8 +27,16 @@ class DataSafetyManager:
             "fpl_data.db",  # Main database file
             "fpl_raw_bootstrap.json",  # Raw API data backup
             "fpl_raw_fixtures.json",  # Raw fixtures backup
+            "fpl_raw_bootstrap.json.gz",  # Raw API data backup (FPL_RAW_DUMP_GZIP=1)
+            "fpl_raw_fixtures.json.gz",  # Raw fixtures backup (FPL_RAW_DUMP_GZIP=1)
         }
 
+    @staticmethod
+    def _split_name(filename: str) -> tuple[str, str]:
+        """Split a file name into base name and full extension ("x.json.gz" -> ("x", ".json.gz"))."""
+        base, _, extension = Path(filename).name.partition(".")
+        return base, f".{extension}" if extension else ""
+
     def create_backup(self, filename: str, backup_suffix: str = None) -> Path:
         """Create a timestamped backup of a file."""
         source_path = self.data_dir / filename
@@ -36,9 +47,14 @@ class DataSafetyManager:
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         suffix = f"_{backup_suffix}" if backup_suffix else ""
-        backup_filename = f"{source_path.stem}{suffix}_{timestamp}{source_path.suffix}"
+        base, extension = self._split_name(filename)
+        backup_filename = f"{base}{suffix}_{timestamp}{extension}"
         backup_path = self.backup_dir / backup_filename
 
+        if extension == ".db":
+            # Under WAL, committed pages can still sit in fpl_data.db-wal; fold them into the file first
+            with closing(sqlite3.connect(source_path)) as connection:
+                connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
         shutil.copy2(source_path, backup_path)
         logger.info(f"Created backup: {backup_path}")
         return backup_path
@@ -47,6 +63,9 @@ class DataSafetyManager:
         """Create backups of all critical files."""
         backups = {}
         for filename in self.critical_files:
+            if not (self.data_dir / filename).exists():
+                # Raw dumps exist in either plain or gzip form, not both
+                continue
             backup_path = self.create_backup(filename, backup_suffix)
             if backup_path:
                 backups[filename] = backup_path
@@ -153,11 +172,12 @@ class DataSafetyManager:
                                 "last_modified": datetime.fromtimestamp(filepath.stat().st_mtime).isoformat(),
                                 "error": f"Database connection failed: {db_error}",
                             }
-                    elif filename.endswith(".json"):
-                        # JSON file summary
+                    elif filename.endswith((".json", ".json.gz")):
+                        # JSON file summary (raw dumps may be gzip-compressed)
                         import json
 
-                        with open(filepath) as f:
+                        opener = gzip.open if filename.endswith(".gz") else open
+                        with opener(filepath, "rb") as f:
                             data = json.load(f)
 
                         summary[filename] = {
@@ -197,12 +217,13 @@ class DataSafetyManager:
 
     def emergency_restore(self, filename: str, backup_timestamp: str = None) -> bool:
         """Restore a file from the most recent (or specified) backup."""
+        base, extension = self._split_name(filename)
         if backup_timestamp:
             # Restore from specific backup
-            backup_pattern = f"{Path(filename).stem}*{backup_timestamp}*"
+            backup_pattern = f"{base}*{backup_timestamp}*{extension}"
         else:
             # Find most recent backup
-            backup_pattern = f"{Path(filename).stem}*"
+            backup_pattern = f"{base}*{extension}"
 
         backup_files = list(self.backup_dir.glob(backup_pattern))
 
@@ -215,6 +236,10 @@ class DataSafetyManager:
 
         try:
             target_path = self.data_dir / filename
+            if extension == ".db":
+                # A leftover WAL would be replayed over the restored file on the next connection
+                for sidecar in ("-wal", "-shm"):
+                    target_path.with_name(target_path.name + sidecar).unlink(missing_ok=True)
             shutil.copy2(latest_backup, target_path)
             logger.info(f"Restored {filename} from {latest_backup}")
             return True
@@ -30,6 +30,7 @@ Usage:
 import argparse
 
 from client.fpl_data_client import FPLDataClient
+from db.database import sqlite_profile
 from db.operations import db_ops
 from fetchers.derived_processor import DerivedDataProcessor
 
@@ -86,11 +87,11 @@ def backfill_gameweek(gameweek: int, force: bool = False, dry_run: bool = False)
     # Create processor and process all derived data
     # Note: processor loads raw data from database (current snapshot)
     # We override gameweek after processing
-    processor = DerivedDataProcessor()
-
     try:
         # Process all derived data (uses current raw data from database)
-        derived_data = processor.process_all_derived_data()
+        with sqlite_profile("analytics"):
+            processor = DerivedDataProcessor()
+            derived_data = processor.process_all_derived_data()
 
         # Override gameweek for all tables
         for _table_name, df in derived_data.items():
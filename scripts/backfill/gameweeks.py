@@ -29,12 +29,16 @@ Usage:
     uv run python backfill_gameweeks.py --dry-run
 """
 
+import pandas as pd
 import typer
 
 from db.operations import DatabaseOperations
-from fetchers.fpl_api import fetch_fpl_bootstrap, fetch_fpl_fixtures, fetch_gameweek_live_data
+from fetchers.async_fetch import fetch_many_live, fetch_many_picks
+from fetchers.fpl_api import fetch_gameweek_live_data
+from fetchers.http_client import get_connection_stats
 from fetchers.live_data import get_current_gameweek
-from fetchers.raw_processor import process_raw_gameweek_performance
+from fetchers.raw_processor import process_raw_gameweek_performance, process_raw_gameweek_performance_batch
+from fetchers.run_context import RunContext
 
 
 def get_missing_gameweeks(db_ops: DatabaseOperations, max_gameweek: int) -> list[int]:
@@ -52,63 +56,86 @@ def get_missing_gameweeks(db_ops: DatabaseOperations, max_gameweek: int) -> list
 
 
 def backfill_gameweek(
-    db_ops: DatabaseOperations, gameweek: int, manager_id: int, dry_run: bool = False, bootstrap_data: dict = None
+    db_ops: DatabaseOperations,
+    gameweek: int,
+    manager_id: int,
+    dry_run: bool = False,
+    bootstrap_data: dict = None,
+    live_data: dict | None = None,
+    manager_picks: dict | None = None,
+    context: RunContext | None = None,
+    batched_performance: pd.DataFrame | None = None,
 ) -> bool:
-    """Backfill a specific gameweek's data including player performance and manager picks."""
+    """Backfill a specific gameweek's data including player performance and manager picks.
+
+    live_data and manager_picks may be passed in when they were prefetched concurrently;
+    anything not supplied is fetched here. Pass a shared context so fixtures are fetched
+    once per run rather than once per gameweek. batched_performance holds this gameweek's
+    rows when the caller already processed (and, unless dry_run, saved) performance for
+    the whole range in one batch; performance is then not fetched or saved again here.
+    """
     print(f"\n🔄 Processing gameweek {gameweek}...")
 
     success_count = 0
     total_operations = 2  # player performance + manager picks
 
+    if context is None:
+        context = RunContext(bootstrap=bootstrap_data)
+
     # Fetch bootstrap data if not provided (for historical prices)
     if bootstrap_data is None:
         print("  🔄 Fetching current bootstrap data for price lookup...")
-        bootstrap_data = fetch_fpl_bootstrap()
+        bootstrap_data = context.bootstrap
 
     try:
         # 1. Fetch and process player performance data
-        print(f"  📊 Fetching player performance data for GW{gameweek}...")
-        live_data = fetch_gameweek_live_data(gameweek)
-
-        if not live_data:
-            print(f"  ❌ Could not fetch live data for gameweek {gameweek}")
-        elif "elements" not in live_data or not live_data["elements"]:
-            print(f"  ⚠️  No player data found for gameweek {gameweek}")
+        if batched_performance is not None:
+            action = "Would save" if dry_run else "Saved"
+            print(f"  📊 {action} {len(batched_performance)} player performances with the batch")
+            success_count += 1
         else:
-            # Fetch fixtures data for opponent_team lookup
-            print("  🔄 Fetching fixtures data for opponent_team lookup...")
-            fixtures_data = fetch_fpl_fixtures()
-
-            # Process the player performance data with bootstrap and fixtures data
-            gameweek_performance_df = process_raw_gameweek_performance(
-                live_data, gameweek, bootstrap_data, fixtures_data
-            )
-
-            if gameweek_performance_df.empty:
-                print(f"  ⚠️  Processed player performance data is empty for gameweek {gameweek}")
+            if live_data is None:
+                print(f"  📊 Fetching player performance data for GW{gameweek}...")
+                live_data = fetch_gameweek_live_data(gameweek)
+
+            if not live_data:
+                print(f"  ❌ Could not fetch live data for gameweek {gameweek}")
+            elif "elements" not in live_data or not live_data["elements"]:
+                print(f"  ⚠️  No player data found for gameweek {gameweek}")
             else:
-                print(f"  📊 Processed {len(gameweek_performance_df)} player performances")
+                # Process the player performance data with bootstrap and the run's fixtures lookup
+                gameweek_performance_df = process_raw_gameweek_performance(
+                    live_data, gameweek, bootstrap_data, fixtures_lookup=context.fixtures_lookup
+                )
 
-                if dry_run:
-                    print(
-                        f"  🔍 DRY RUN: Would save {len(gameweek_performance_df)} player performance records for GW{gameweek}"
-                    )
-                    # Show sample data
-                    sample = gameweek_performance_df[["player_id", "total_points", "minutes", "goals_scored"]].head(3)
-                    print("  Sample player performance data:")
-                    print(sample.to_string(index=False))
+                if gameweek_performance_df.empty:
+                    print(f"  ⚠️  Processed player performance data is empty for gameweek {gameweek}")
                 else:
-                    # Save player performance to database
-                    db_ops.save_raw_player_gameweek_performance(gameweek_performance_df)
-                    print(f"  ✅ Successfully saved {len(gameweek_performance_df)} player performance records")
-                success_count += 1
+                    print(f"  📊 Processed {len(gameweek_performance_df)} player performances")
+
+                    if dry_run:
+                        print(
+                            f"  🔍 DRY RUN: Would save {len(gameweek_performance_df)} player performance records for GW{gameweek}"
+                        )
+                        # Show sample data
+                        sample = gameweek_performance_df[["player_id", "total_points", "minutes", "goals_scored"]].head(
+                            3
+                        )
+                        print("  Sample player performance data:")
+                        print(sample.to_string(index=False))
+                    else:
+                        # Save player performance to database
+                        db_ops.save_raw_player_gameweek_performance(gameweek_performance_df)
+                        print(f"  ✅ Successfully saved {len(gameweek_performance_df)} player performance records")
+                    success_count += 1
 
         # 2. Fetch and process manager picks data
-        print(f"  👤 Fetching manager picks for GW{gameweek}...")
         from fetchers.fpl_api import fetch_manager_gameweek_picks
         from fetchers.raw_processor import process_raw_my_picks
 
-        manager_picks = fetch_manager_gameweek_picks(manager_id, gameweek)
+        if manager_picks is None:
+            print(f"  👤 Fetching manager picks for GW{gameweek}...")
+            manager_picks = fetch_manager_gameweek_picks(manager_id, gameweek)
 
         if not manager_picks:
             print(f"  ❌ Could not fetch manager picks for gameweek {gameweek}")
@@ -169,8 +196,9 @@ def main(
 
     # Fetch bootstrap data once for price lookups
     print("🔄 Fetching bootstrap data for player price lookups...")
+    context = RunContext()
     try:
-        bootstrap = fetch_fpl_bootstrap()
+        bootstrap = context.bootstrap
     except Exception as e:
         print(f"❌ Error fetching bootstrap data: {e}")
         return
@@ -217,19 +245,54 @@ def main(
     if dry_run:
         print("🔍 DRY RUN MODE - No data will be saved")
 
-    # Process each gameweek
-    successful = 0
-    failed = 0
-
+    # Check if data already exists (unless force flag is used)
+    gameweeks_to_process = []
     for gw in target_gameweeks:
-        # Check if data already exists (unless force flag is used)
         if not force:
             existing_data = db_ops.get_raw_player_gameweek_performance(gameweek=gw)
             if not existing_data.empty:
                 print(f"⏭️  Gameweek {gw}: Data already exists ({len(existing_data)} records), skipping...")
                 continue
+        gameweeks_to_process.append(gw)
+
+    # Prefetch live data and picks for every gameweek concurrently
+    live_by_gw = {r.key: r.data for r in fetch_many_live(gameweeks_to_process) if r.ok}
+    picks_by_gw = {r.key: r.data for r in fetch_many_picks(manager_id, gameweeks_to_process) if r.ok}
+
+    # Process every prefetched gameweek in one batch and save it in one transaction;
+    # gameweeks whose live data could not be prefetched are retried one by one below
+    performance_by_gw = {}
+    performance_df = process_raw_gameweek_performance_batch(
+        live_by_gw, bootstrap, fixtures_lookup=context.fixtures_lookup
+    )
+    if not performance_df.empty:
+        if dry_run:
+            print(f"🔍 DRY RUN: Would save {len(performance_df)} player performance records in one transaction")
+            performance_by_gw = dict(tuple(performance_df.groupby("gameweek")))
+        else:
+            try:
+                db_ops.save_raw_player_gameweek_performance(performance_df)
+                print(f"✅ Saved {len(performance_df)} player performance records in one transaction")
+                performance_by_gw = dict(tuple(performance_df.groupby("gameweek")))
+            except Exception as e:
+                print(f"❌ Batch save failed, falling back to per-gameweek saves: {e}")
 
-        success = backfill_gameweek(db_ops, gw, manager_id, dry_run, bootstrap)
+    # Process each gameweek
+    successful = 0
+    failed = 0
+
+    for gw in gameweeks_to_process:
+        success = backfill_gameweek(
+            db_ops,
+            gw,
+            manager_id,
+            dry_run,
+            bootstrap,
+            live_data=live_by_gw.get(gw),
+            manager_picks=picks_by_gw.get(gw),
+            context=context,
+            batched_performance=performance_by_gw.get(gw),
+        )
         if success:
             successful += 1
         else:
@@ -239,6 +302,14 @@ def main(
     print("\n📈 Backfill Summary:")
     print(f"✅ Successful: {successful} gameweeks")
     print(f"❌ Failed: {failed} gameweeks")
+    http_stats = get_connection_stats()
+    print(
+        f"🔌 HTTP: {http_stats['requests']} requests over {http_stats['new_connections']} connections "
+        f"({http_stats['reused_connections']} reused)"
+    )
+    print(
+        f"📦 Shared resources fetched: {context.requests['bootstrap']} bootstrap, {context.requests['fixtures']} fixtures"
+    )
 
     if successful > 0 and not dry_run:
         print("\n🎉 Backfill completed! You now have historical data for more gameweeks.")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+League-Scale Manager Ingestion Script
+
+Fetches picks and gameweek summaries for many managers - a list of manager IDs,
+a file of IDs (e.g. a top-10k cohort) or every member of a classic league - and
+stores them in the multi-manager tables:
+- raw_manager_picks (one row per manager, gameweek and squad position)
+- raw_manager_gameweek_summary (one row per manager and gameweek)
+- raw_league_entries (league members, reused when a run is resumed)
+
+Managers are fetched concurrently in chunks and each chunk is committed before
+the next starts, so memory use is bounded by --chunk-size and re-running an
+interrupted ingestion skips everything already stored.
+
+Usage:
+    # Ingest a mini-league for the current gameweek
+    uv run main.py backfill managers --league-id 123456
+
+    # Top 10k of the overall league, GW1-10, with past summaries from entry history
+    uv run main.py backfill managers --league-id 314 --max-managers 10000 --start-gw 1 --end-gw 10 --with-history
+
+    # Explicit manager IDs or a file with one ID per line
+    uv run main.py backfill managers --manager-ids 4233026,123456 --gameweek 5
+    uv run main.py backfill managers --ids-file cohort.txt
+"""
+
+from pathlib import Path
+
+import typer
+
+from db.operations import DatabaseOperations
+from fetchers.http_client import get_connection_stats
+from fetchers.live_data import get_current_gameweek
+from fetchers.manager_ingest import (
+    DEFAULT_CHUNK_SIZE,
+    fetch_league_standings,
+    ingest_manager_history,
+    ingest_manager_picks,
+)
+from fetchers.run_context import RunContext
+
+
+def resolve_manager_ids(
+    db_ops: DatabaseOperations,
+    manager_ids: str | None,
+    ids_file: Path | None,
+    league_id: int | None,
+    max_managers: int | None,
+    force: bool,
+    concurrency: int,
+    requests_per_second: float,
+) -> list[int]:
+    """Collect the managers to ingest from explicit IDs, an ID file and/or a classic league."""
+    ids: list[int] = []
+    if manager_ids:
+        ids.extend(int(part) for part in manager_ids.split(",") if part.strip())
+    if ids_file:
+        ids.extend(int(line) for line in ids_file.read_text().split() if line.strip())
+
+    if league_id:
+        entries = db_ops.get_raw_league_entries(league_id)
+        enough_stored = not entries.empty and (max_managers is None or len(entries) >= max_managers)
+        if enough_stored and not force:
+            print(f"📋 League {league_id}: using {len(entries)} stored members (--force to refresh standings)")
+        else:
+            entries = fetch_league_standings(
+                league_id, max_managers, max_concurrency=concurrency, requests_per_second=requests_per_second
+            )
+            if not entries.empty:
+                db_ops.save_raw_league_entries(entries)
+        if not entries.empty:
+            entries = entries.sort_values("rank")
+            if max_managers:
+                entries = entries.head(max_managers)
+            ids.extend(int(manager_id) for manager_id in entries["manager_id"])
+
+    # De-duplicate while keeping order (league rank order for league members)
+    return list(dict.fromkeys(ids))
+
+
+def main(
+    manager_ids: str | None = typer.Option(None, "--manager-ids", help="Comma-separated FPL manager IDs"),
+    ids_file: Path | None = typer.Option(None, "--ids-file", help="File with one manager ID per line"),
+    league_id: int | None = typer.Option(None, "--league-id", help="Classic league ID to ingest all members of"),
+    max_managers: int | None = typer.Option(None, "--max-managers", help="Only the top N managers of the league"),
+    gameweek: int | None = typer.Option(None, "--gameweek", "-g", help="Specific gameweek to ingest"),
+    start_gw: int | None = typer.Option(None, "--start-gw", help="Starting gameweek for range ingestion"),
+    end_gw: int | None = typer.Option(None, "--end-gw", help="Ending gameweek for range ingestion"),
+    chunk_size: int = typer.Option(DEFAULT_CHUNK_SIZE, "--chunk-size", help="Managers fetched and saved per batch"),
+    concurrency: int = typer.Option(8, "--concurrency", help="Maximum requests in flight"),
+    requests_per_second: float = typer.Option(10.0, "--rps", help="Global request rate cap"),
+    with_history: bool = typer.Option(
+        False, "--with-history", help="Also fill gameweek summaries from each manager's entry history"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be ingested without fetching picks"),
+    force: bool = typer.Option(False, "--force", help="Re-fetch managers and league standings already stored"),
+):
+    """Ingest picks and gameweek summaries for many managers."""
+
+    print("👥 FPL League-Scale Manager Ingestion")
+    print("=" * 40)
+
+    db_ops = DatabaseOperations()
+
+    ids = resolve_manager_ids(
+        db_ops, manager_ids, ids_file, league_id, max_managers, force, concurrency, requests_per_second
+    )
+    if not ids:
+        print("⚠️  No managers to ingest (use --manager-ids, --ids-file or --league-id)")
+        return
+
+    # Determine which gameweeks to process
+    if gameweek:
+        gameweeks = [gameweek]
+    elif start_gw and end_gw:
+        gameweeks = list(range(start_gw, end_gw + 1))
+    else:
+        try:
+            current_gameweek, _ = get_current_gameweek(RunContext().bootstrap)
+        except Exception as e:
+            print(f"❌ Error detecting current gameweek: {e}")
+            return
+        gameweeks = [current_gameweek]
+
+    print(f"🎯 Target: {len(ids)} managers x gameweeks {gameweeks[0]}-{gameweeks[-1]}")
+
+    if dry_run:
+        print("🔍 DRY RUN MODE - No data will be fetched or saved")
+        for gw in gameweeks:
+            done = db_ops.get_ingested_manager_ids(gw)
+            pending = sum(1 for manager_id in ids if force or manager_id not in done)
+            print(f"   GW{gw}: {pending} managers to fetch, {len(ids) - pending} already ingested")
+        return
+
+    fetch_options = {
+        "db_ops": db_ops,
+        "chunk_size": chunk_size,
+        "force": force,
+        "max_concurrency": concurrency,
+        "requests_per_second": requests_per_second,
+    }
+    if with_history:
+        history_stats = ingest_manager_history(ids, gameweeks, **fetch_options)
+        print(
+            f"📜 History: {history_stats['stored']} managers stored, {history_stats['skipped']} skipped, "
+            f"{history_stats['failed']} failed"
+        )
+    stats = ingest_manager_picks(ids, gameweeks, **fetch_options)
+
+    # Summary
+    print("\n📈 Ingestion Summary:")
+    print(f"✅ Stored: {stats['stored']} manager-gameweeks ({stats['rows']} picks)")
+    print(f"⏭️  Skipped (already ingested): {stats['skipped']}")
+    print(f"❌ Failed: {stats['failed']} (re-run to retry)")
+    http_stats = get_connection_stats()
+    print(
+        f"🔌 HTTP: {http_stats['requests']} requests over {http_stats['new_connections']} connections "
+        f"({http_stats['reused_connections']} reused)"
+    )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -43,104 +43,79 @@ import pandas as pd
 import typer
 
 from db.operations import DatabaseOperations
-
-
-def fetch_vaastav_players_raw(season: str = "2025-26") -> pd.DataFrame:
-    """Fetch players_raw.csv from vaastav's repository.
+from fetchers.raw_processor import project_player_snapshots
+from fetchers.vaastav import VAASTAV_CHUNK_SIZE, read_vaastav_csv
+
+# players_raw.csv columns used to build snapshots (the file has ~100)
+SNAPSHOT_SOURCE_COLUMNS = [
+    "id",
+    "status",
+    "chance_of_playing_next_round",
+    "chance_of_playing_this_round",
+    "news",
+    "news_added",
+    "now_cost",
+    "ep_this",
+    "ep_next",
+    "form",
+]
+
+
+def fetch_vaastav_players_raw(season: str = "2025-26", refresh: bool = False) -> pd.DataFrame:
+    """Load players_raw.csv from vaastav's repository (cached locally, see fetchers.vaastav).
 
     Args:
         season: Season string (e.g., "2025-26")
+        refresh: Revalidate the cached copy with GitHub even if it is fresh
 
     Returns:
         DataFrame with player data including status, news, availability
     """
-    url = f"https://raw.githubusercontent.com/vaastav/Fantasy-Premier-League/master/data/{season}/players_raw.csv"
-
-    print(f"📥 Fetching vaastav data from: {url}")
+    print(f"📥 Loading vaastav players_raw.csv for {season}")
 
     try:
-        df = pd.read_csv(url)
-        print(f"✅ Fetched {len(df)} players from vaastav repository")
+        df = read_vaastav_csv(
+            season, "players_raw.csv", columns=SNAPSHOT_SOURCE_COLUMNS, chunksize=VAASTAV_CHUNK_SIZE, refresh=refresh
+        )
+        print(f"✅ Loaded {len(df)} players from vaastav repository")
         return df
     except Exception as e:
         print(f"❌ Error fetching vaastav data: {e}")
         raise
 
 
-def convert_vaastav_to_snapshot(vaastav_df: pd.DataFrame, gameweek: int, is_backfilled: bool = True) -> pd.DataFrame:
+def convert_vaastav_to_snapshot(
+    vaastav_df: pd.DataFrame, gameweeks: int | list[int], is_backfilled: bool = True
+) -> pd.DataFrame:
     """Convert vaastav players_raw data to our snapshot format.
 
     Args:
         vaastav_df: DataFrame from vaastav's players_raw.csv
-        gameweek: Gameweek number to assign
+        gameweeks: Gameweek number, or gameweeks that all receive the same snapshot
         is_backfilled: Mark as backfilled (True for historical data)
 
     Returns:
-        DataFrame in our snapshot schema format
+        DataFrame in our snapshot schema format (one block of players per gameweek)
     """
-    print(f"🔄 Converting vaastav data to snapshot format for GW{gameweek}...")
-
-    # Map vaastav columns to our snapshot schema
-    snapshot_records = []
-    timestamp = pd.Timestamp.now(tz="UTC")
-
-    for _, player in vaastav_df.iterrows():
-        # Vaastav uses 'id' field which should match FPL player_id
-        snapshot = {
-            # Primary keys
-            "player_id": int(player["id"]),
-            "gameweek": gameweek,
-            # Availability status (direct mapping)
-            "status": str(player.get("status", "a")),
-            "chance_of_playing_next_round": player.get("chance_of_playing_next_round"),
-            "chance_of_playing_this_round": player.get("chance_of_playing_this_round"),
-            # Injury/suspension news (direct mapping)
-            "news": str(player.get("news", "")),
-            "news_added": pd.to_datetime(player.get("news_added")) if pd.notna(player.get("news_added")) else None,
-            # Price at snapshot time (direct mapping)
-            "now_cost": int(player.get("now_cost")) if pd.notna(player.get("now_cost")) else None,
-            # Expected points (direct mapping)
-            "ep_this": str(player.get("ep_this", "0.0")),
-            "ep_next": str(player.get("ep_next", "0.0")),
-            # Form (direct mapping)
-            "form": str(player.get("form", "0.0")),
-            # Backfill flag
-            "is_backfilled": is_backfilled,
-            # Metadata
-            "snapshot_date": timestamp,
-            "as_of_utc": timestamp,
-        }
-        snapshot_records.append(snapshot)
-
-    df = pd.DataFrame(snapshot_records)
-
-    # Clean data
-    print("🧹 Cleaning snapshot data...")
-
-    # Handle None/null values in news field
-    if "news" in df.columns:
-        df["news"] = df["news"].fillna("")
-        df["news"] = df["news"].replace("nan", "")
-
-    # Handle ep_this, ep_next, form
-    for col in ["ep_this", "ep_next", "form"]:
-        if col in df.columns:
-            df[col] = df[col].fillna("0.0")
-            df[col] = df[col].replace("nan", "0.0")
-
-    print(f"✅ Converted {len(df)} player snapshots for GW{gameweek}")
+    gameweek_list = [gameweeks] if isinstance(gameweeks, int) else list(gameweeks)
+    print(f"🔄 Converting vaastav data to snapshot format for GW{', GW'.join(map(str, gameweek_list))}...")
+
+    # Vaastav uses 'id' field which should match FPL player_id
+    df = project_player_snapshots(vaastav_df, gameweek_list, is_backfilled=is_backfilled)
+
+    print(f"✅ Converted {len(df)} player snapshots ({len(vaastav_df)} players x {len(gameweek_list)} gameweeks)")
     return df
 
 
 def backfill_gameweek_from_vaastav(
-    db_ops: DatabaseOperations, gameweek: int, vaastav_df: pd.DataFrame, dry_run: bool = False
+    db_ops: DatabaseOperations, gameweek: int, snapshot_df: pd.DataFrame, dry_run: bool = False
 ) -> bool:
-    """Backfill a specific gameweek using vaastav data.
+    """Backfill a specific gameweek using snapshots converted from vaastav data.
 
     Args:
         db_ops: Database operations instance
         gameweek: Gameweek number (1-6)
-        vaastav_df: DataFrame from vaastav's players_raw.csv
+        snapshot_df: This gameweek's rows from convert_vaastav_to_snapshot
         dry_run: If True, don't save to database
 
     Returns:
@@ -149,9 +124,6 @@ def backfill_gameweek_from_vaastav(
     print(f"\n🔄 Processing snapshot for gameweek {gameweek} from vaastav data...")
 
     try:
-        # Convert vaastav data to our snapshot format
-        snapshot_df = convert_vaastav_to_snapshot(vaastav_df, gameweek, is_backfilled=True)
-
         if snapshot_df.empty:
             print(f"  ❌ Failed to process snapshot for gameweek {gameweek}")
             return False
@@ -260,25 +232,32 @@ def main(
     if dry_run:
         print("🔍 DRY RUN MODE - No data will be saved")
 
-    # Process each gameweek
     successful = 0
     failed = 0
     skipped = 0
 
+    # Check which snapshots already exist (unless force flag is used)
+    pending_gameweeks = []
     for gw in target_gameweeks:
-        # Check if snapshot already exists (unless force flag is used)
         if not force:
             existing_snapshots = db_ops.get_raw_player_gameweek_snapshot(gameweek=gw)
             if not existing_snapshots.empty:
                 print(f"⏭️  Gameweek {gw}: Snapshot exists ({len(existing_snapshots)} records), skipping...")
                 skipped += 1
                 continue
-
-        success = backfill_gameweek_from_vaastav(db_ops, gw, vaastav_df, dry_run)
-        if success:
-            successful += 1
-        else:
-            failed += 1
+        pending_gameweeks.append(gw)
+
+    # Convert once for every pending gameweek, then save each gameweek's block
+    if pending_gameweeks:
+        snapshots = convert_vaastav_to_snapshot(vaastav_df, pending_gameweeks, is_backfilled=True)
+        snapshots_by_gameweek = dict(tuple(snapshots.groupby("gameweek", sort=False)))
+        for gw in pending_gameweeks:
+            gameweek_snapshots = snapshots_by_gameweek.get(gw, snapshots.iloc[0:0])
+            success = backfill_gameweek_from_vaastav(db_ops, gw, gameweek_snapshots, dry_run)
+            if success:
+                successful += 1
+            else:
+                failed += 1
 
     # Summary
     print("\n📈 Backfill Summary:")
@@ -0,0 +1 @@
+"""Benchmarks for data processing hot paths (run against synthetic stub data)."""
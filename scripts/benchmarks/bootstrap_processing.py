@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Bootstrap Processing Benchmark
+
+Times the players/teams/events/fixtures processors on synthetic bootstrap data
+(see scripts/stub_fpl_api.py) and reports the DataFrame memory footprint. The
+players processor is compared against the previous implementation, which
+copied every player dict and cleaned one column at a time. The whole bootstrap
+stage is timed with sequential and threaded validation.
+
+Usage:
+    uv run python scripts/benchmarks/bootstrap_processing.py
+    uv run python scripts/benchmarks/bootstrap_processing.py --players 800 --repeat 10
+"""
+
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd  # noqa: E402
+import typer  # noqa: E402
+
+from fetchers.raw_processor import (  # noqa: E402
+    process_all_raw_bootstrap_data,
+    process_raw_events_bootstrap,
+    process_raw_fixtures,
+    process_raw_players_bootstrap,
+    process_raw_teams_bootstrap,
+)
+from scripts.stub_fpl_api import SyntheticFPLData  # noqa: E402
+from validation.raw_schemas import RawPlayersBootstrapSchema  # noqa: E402
+
+
+def process_raw_players_bootstrap_per_column(bootstrap_data: dict[str, Any]) -> pd.DataFrame:
+    """The previous players processor, kept as the benchmark baseline."""
+    timestamp = pd.Timestamp.now(tz="UTC")
+    processed_players = []
+    for player in bootstrap_data.get("elements", []):
+        processed_player = dict(player)
+        processed_player["player_id"] = processed_player["id"]
+        processed_player["team_id"] = processed_player["team"]
+        processed_player["position_id"] = processed_player["element_type"]
+        processed_player["as_of_utc"] = timestamp
+        processed_players.append(processed_player)
+
+    df = pd.DataFrame(processed_players)
+    if "squad_number" in df.columns:
+        df["squad_number"] = df["squad_number"].replace(["", "0"], None).astype("Int64")
+    for col in df.select_dtypes(include=["number"]).columns:
+        if col in ["chance_of_playing_next_round", "chance_of_playing_this_round"]:
+            df[col] = df[col].astype("Float64")
+        else:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
+    for col in df.select_dtypes(include=["object"]).columns:
+        if col != "squad_number":
+            df[col] = df[col].fillna("")
+    for col in ["news_added", "as_of_utc"]:
+        df[col] = pd.to_datetime(df[col], errors="coerce")
+    return RawPlayersBootstrapSchema.validate(df)
+
+
+def _time(func, repeat: int) -> tuple[float, pd.DataFrame]:
+    """Best wall time over repeat runs (processor output suppressed) and the last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _memory_kb(df: pd.DataFrame) -> float:
+    return df.memory_usage(deep=True).sum() / 1024
+
+
+def main(
+    players: int = typer.Option(800, "--players", help="Synthetic players in the bootstrap"),
+    repeat: int = typer.Option(5, "--repeat", help="Timing repetitions (best is reported)"),
+):
+    """Benchmark bootstrap processing time and DataFrame memory."""
+    data = SyntheticFPLData(n_players=players)
+    bootstrap = data.bootstrap()
+    fixtures = data.fixtures()
+    print(f"🏁 Bootstrap with {players} players")
+
+    baseline_s, baseline_df = _time(lambda: process_raw_players_bootstrap_per_column(bootstrap), repeat)
+    players_s, players_df = _time(lambda: process_raw_players_bootstrap(bootstrap), repeat)
+    print(
+        f"⏱️  players (previous): {baseline_s * 1000:7.1f} ms  {_memory_kb(baseline_df):8.1f} KiB  "
+        f"({len(baseline_df.select_dtypes('object').columns)} object columns)"
+    )
+    print(
+        f"⏱️  players:            {players_s * 1000:7.1f} ms  {_memory_kb(players_df):8.1f} KiB  "
+        f"({len(players_df.select_dtypes('object').columns)} object columns)"
+    )
+    print(
+        f"🚀 players: {baseline_s / players_s:.1f}x faster, "
+        f"{1 - _memory_kb(players_df) / _memory_kb(baseline_df):.0%} less memory"
+    )
+
+    for name, func in [
+        ("teams", lambda: process_raw_teams_bootstrap(bootstrap)),
+        ("events", lambda: process_raw_events_bootstrap(bootstrap)),
+        ("fixtures", lambda: process_raw_fixtures(fixtures)),
+    ]:
+        elapsed, df = _time(func, repeat)
+        print(f"⏱️  {name + ':':<21}{elapsed * 1000:7.1f} ms  {_memory_kb(df):8.1f} KiB")
+
+    # Whole bootstrap stage (all eight tables), sequential vs threaded validation
+    for workers in (1, 4):
+        elapsed, tables = _time(lambda w=workers: process_all_raw_bootstrap_data(bootstrap, max_workers=w), repeat)
+        memory = sum(_memory_kb(df) for df in tables.values())
+        print(f"⏱️  {f'all tables ({workers} thr):':<21}{elapsed * 1000:7.1f} ms  {memory:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    typer.run(main)
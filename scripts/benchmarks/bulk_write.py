@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Bulk Write Benchmark
+
+Times inserting synthetic frames (see scripts/stub_fpl_api.py) into a temporary
+SQLite database with bulk_insert_frame (column-wise tuples into a compiled Core
+INSERT via executemany) against the previous convert_datetime_columns +
+to_dict("records") + Session.bulk_insert_mappings writer. Covers the widest table
+(raw_players_bootstrap) and a season of raw_player_gameweek_performance, at a few
+chunk sizes, and checks that both writers store the same rows.
+
+Usage:
+    uv run python scripts/benchmarks/bulk_write.py
+    uv run python scripts/benchmarks/bulk_write.py --players 800 --gameweeks 38 --repeat 5
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd  # noqa: E402
+import typer  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from db import models_raw  # noqa: E402
+from db.bulk_write import bulk_insert_frame  # noqa: E402
+from db.database import Base  # noqa: E402
+from db.operations import convert_datetime_columns, read_model_frame  # noqa: E402
+from fetchers.raw_processor import (  # noqa: E402
+    process_raw_gameweek_performance_batch,
+    process_raw_players_bootstrap,
+)
+from scripts.stub_fpl_api import SyntheticFPLData  # noqa: E402
+
+CHUNK_SIZES = [500, 5000, 50000]
+
+
+def insert_mappings(engine, model, df: pd.DataFrame, datetime_columns: list[str]) -> None:
+    """The previous writer, kept as the benchmark baseline."""
+    with sessionmaker(bind=engine)() as session:
+        session.query(model).delete()
+        records = convert_datetime_columns(df, datetime_columns).to_dict("records")
+        session.bulk_insert_mappings(model, records)
+        session.commit()
+
+
+def insert_frame(engine, model, df: pd.DataFrame, datetime_columns: list[str], chunk_size: int) -> None:
+    """The current writer."""
+    with engine.begin() as connection:
+        connection.execute(model.__table__.delete())
+        bulk_insert_frame(connection, model, df, datetime_columns, chunk_size=chunk_size)
+
+
+def best_ms(fn, repeat: int) -> float:
+    """Best wall time in milliseconds over repeat calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def time_writers(engines, model, df: pd.DataFrame, datetime_columns: list[str], repeat: int):
+    """Best ms of the previous writer, and of bulk_insert_frame per chunk size."""
+    baseline = best_ms(lambda: insert_mappings(engines["mappings"], model, df, datetime_columns), repeat)
+    chunked = {
+        chunk_size: best_ms(
+            lambda chunk_size=chunk_size: insert_frame(engines["frame"], model, df, datetime_columns, chunk_size),
+            repeat,
+        )
+        for chunk_size in CHUNK_SIZES
+    }
+    return baseline, chunked
+
+
+def main(
+    players: int = typer.Option(800, "--players", help="Number of synthetic players"),
+    gameweeks: int = typer.Option(38, "--gameweeks", help="Gameweeks of performance rows"),
+    repeat: int = typer.Option(5, "--repeat", help="Timed writes per writer (best is reported)"),
+):
+    """Benchmark the executemany bulk writer against bulk_insert_mappings."""
+    data = SyntheticFPLData(n_players=players, current_gameweek=gameweeks)
+    bootstrap = data.bootstrap()
+    live_by_gw = {gw: data.live(gw) for gw in range(1, gameweeks + 1)}
+    with contextlib.redirect_stdout(io.StringIO()):
+        tables = [
+            (models_raw.RawPlayerBootstrap, process_raw_players_bootstrap(bootstrap), ["as_of_utc", "news_added"]),
+            (
+                models_raw.RawPlayerGameweekPerformance,
+                process_raw_gameweek_performance_batch(live_by_gw, bootstrap, data.fixtures()),
+                ["as_of_utc"],
+            ),
+        ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engines = {name: create_engine(f"sqlite:///{Path(tmp) / f'{name}.db'}") for name in ("mappings", "frame")}
+        for engine in engines.values():
+            Base.metadata.create_all(bind=engine)
+
+        rows = []
+        for model, df, datetime_columns in tables:
+            insert_mappings(engines["mappings"], model, df, datetime_columns)
+            insert_frame(engines["frame"], model, df, datetime_columns, CHUNK_SIZES[1])
+            pd.testing.assert_frame_equal(
+                read_model_frame(engines["frame"], model), read_model_frame(engines["mappings"], model)
+            )
+
+            baseline, chunked = time_writers(engines, model, df, datetime_columns, repeat)
+            rows.append((model.__tablename__, df.shape, baseline, chunked))
+        for engine in engines.values():
+            engine.dispose()
+
+    typer.echo("✅ Stored rows match bulk_insert_mappings for every table")
+    for table, (n_rows, n_cols), baseline, chunked in rows:
+        typer.echo(f"{table} ({n_rows} rows x {n_cols} columns)")
+        typer.echo(f"  bulk_insert_mappings: {baseline:.1f} ms ({n_rows / baseline * 1000:,.0f} rows/s)")
+        for chunk_size, ms in chunked.items():
+            typer.echo(
+                f"  executemany, chunks of {chunk_size}: {ms:.1f} ms ({n_rows / ms * 1000:,.0f} rows/s, "
+                f"{baseline / ms:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    typer.run(main)
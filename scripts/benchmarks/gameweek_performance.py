@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Gameweek Performance Processing Benchmark
+
+Times process_raw_gameweek_performance over a full 38-gameweek backfill of
+synthetic live data (see scripts/stub_fpl_api.py) against the previous
+row-by-row implementation, and checks that both produce the same table. Also
+times process_raw_gameweek_performance_batch, which builds the lookups once
+and returns the whole season as one frame.
+
+Usage:
+    uv run python scripts/benchmarks/gameweek_performance.py
+    uv run python scripts/benchmarks/gameweek_performance.py --players 800 --repeat 5
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd  # noqa: E402
+import typer  # noqa: E402
+
+from fetchers.raw_processor import (  # noqa: E402
+    GAMEWEEK_PERFORMANCE_INT_STATS,
+    GAMEWEEK_PERFORMANCE_STR_STATS,
+    build_fixtures_lookup,
+    process_raw_gameweek_performance,
+    process_raw_gameweek_performance_batch,
+)
+from scripts.stub_fpl_api import SyntheticFPLData  # noqa: E402
+
+
+def process_raw_gameweek_performance_rowwise(
+    live_data: dict[str, Any],
+    gameweek: int,
+    bootstrap_data: dict[str, Any],
+    fixtures_lookup: dict[int, dict[str, Any]],
+) -> pd.DataFrame:
+    """The previous per-element implementation, kept as the benchmark baseline and parity reference."""
+    player_prices = {}
+    player_teams = {}
+    for player in bootstrap_data.get("elements", []):
+        player_id = player.get("id")
+        if player_id:
+            player_prices[player_id] = player.get("now_cost")
+            player_teams[player_id] = player.get("team")
+
+    processed_performances = []
+    timestamp = pd.Timestamp.now(tz="UTC")
+
+    for element in live_data.get("elements", []):
+        element_id = element.get("id")
+        stats = element.get("stats", {})
+        explain = element.get("explain", [])
+
+        opponent_team = None
+        was_home = None
+        player_team_id = player_teams.get(element_id)
+
+        if explain and player_team_id:
+            for fixture_data in explain:
+                fixture = fixture_data.get("fixture")
+                if isinstance(fixture, int) and fixture in fixtures_lookup:
+                    fixture_info = fixtures_lookup[fixture]
+                    if player_team_id == fixture_info["team_h"]:
+                        opponent_team, was_home = fixture_info["team_a"], True
+                    elif player_team_id == fixture_info["team_a"]:
+                        opponent_team, was_home = fixture_info["team_h"], False
+                    break
+                elif isinstance(fixture, dict):
+                    opponent_team, was_home = fixture.get("opponent_team"), fixture.get("is_home")
+                    break
+                elif isinstance(fixture, list) and fixture and isinstance(fixture[0], dict):
+                    opponent_team, was_home = fixture[0].get("opponent_team"), fixture[0].get("is_home")
+                    break
+
+        performance = {"player_id": element_id, "gameweek": gameweek}
+        performance.update({column: stats.get(column) for column in GAMEWEEK_PERFORMANCE_INT_STATS})
+        performance.update({column: str(stats.get(column, "")) for column in GAMEWEEK_PERFORMANCE_STR_STATS})
+        performance.update(
+            {
+                "team_id": player_teams.get(element_id),
+                "opponent_team": opponent_team,
+                "was_home": was_home,
+                "value": player_prices.get(element_id),
+                "selected": stats.get("selected"),
+                "as_of_utc": timestamp,
+            }
+        )
+        processed_performances.append(performance)
+
+    return pd.DataFrame(processed_performances)
+
+
+def _time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(
+    players: int = typer.Option(800, "--players", help="Synthetic players per gameweek"),
+    gameweeks: int = typer.Option(38, "--gameweeks", help="Gameweeks in the backfill"),
+    repeat: int = typer.Option(3, "--repeat", help="Timing repetitions (best is reported)"),
+):
+    """Benchmark vectorized vs row-by-row gameweek performance processing."""
+    data = SyntheticFPLData(n_players=players, current_gameweek=gameweeks)
+    bootstrap = data.bootstrap()
+    fixtures_lookup = build_fixtures_lookup(data.fixtures())
+    live_by_gw = {gw: data.live(gw) for gw in range(1, gameweeks + 1)}
+    print(f"🏁 {gameweeks} gameweeks x {players} players")
+
+    # Parity first: identical output apart from the capture timestamp
+    for gw, live in live_by_gw.items():
+        vectorized = process_raw_gameweek_performance(live, gw, bootstrap, fixtures_lookup=fixtures_lookup)
+        rowwise = process_raw_gameweek_performance_rowwise(live, gw, bootstrap, fixtures_lookup)
+        pd.testing.assert_frame_equal(vectorized.drop(columns="as_of_utc"), rowwise.drop(columns="as_of_utc"))
+    print("✅ Outputs match the row-by-row implementation")
+    per_gw = pd.concat(
+        [
+            process_raw_gameweek_performance(live, gw, bootstrap, fixtures_lookup=fixtures_lookup)
+            for gw, live in live_by_gw.items()
+        ],
+        ignore_index=True,
+    )
+    batch = process_raw_gameweek_performance_batch(live_by_gw, bootstrap, fixtures_lookup=fixtures_lookup)
+    pd.testing.assert_frame_equal(batch.drop(columns="as_of_utc"), per_gw.drop(columns="as_of_utc"))
+    print("✅ Batch output matches the per-gameweek frames")
+
+    def run_vectorized():
+        for gw, live in live_by_gw.items():
+            process_raw_gameweek_performance(live, gw, bootstrap, fixtures_lookup=fixtures_lookup)
+
+    def run_batch():
+        process_raw_gameweek_performance_batch(live_by_gw, bootstrap, fixtures_lookup=fixtures_lookup)
+
+    def run_rowwise():
+        for gw, live in live_by_gw.items():
+            process_raw_gameweek_performance_rowwise(live, gw, bootstrap, fixtures_lookup)
+
+    # The processor prints progress per gameweek; keep it out of the timings
+    stdout, sys.stdout = sys.stdout, open("/dev/null", "w")  # noqa: SIM115
+    try:
+        vectorized_s = _time(run_vectorized, repeat)
+        batch_s = _time(run_batch, repeat)
+        rowwise_s = _time(run_rowwise, repeat)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    print(f"⏱️  Row-by-row: {rowwise_s * 1000:8.1f} ms ({rowwise_s / gameweeks * 1000:.2f} ms/GW)")
+    print(f"⏱️  Vectorized: {vectorized_s * 1000:8.1f} ms ({vectorized_s / gameweeks * 1000:.2f} ms/GW)")
+    print(f"⏱️  Batch:      {batch_s * 1000:8.1f} ms ({batch_s / gameweeks * 1000:.2f} ms/GW)")
+    print(f"🚀 Speedup: {rowwise_s / vectorized_s:.1f}x per gameweek, {rowwise_s / batch_s:.1f}x batched")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Model Frame Reads Benchmark
+
+Times the DatabaseOperations read path on a temporary SQLite database filled with
+synthetic data (see scripts/stub_fpl_api.py): the previous ORM hydration
+(session.query(Model).all() plus getattr per attribute) against read_model_frame,
+which runs a Core select straight into pd.read_sql_query. Covers the widest table
+(raw_players_bootstrap) and a season of raw_player_gameweek_performance, and checks
+that both paths return the same frame.
+
+Usage:
+    uv run python scripts/benchmarks/model_frame_reads.py
+    uv run python scripts/benchmarks/model_frame_reads.py --players 800 --gameweeks 38 --repeat 5
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd  # noqa: E402
+import typer  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.inspection import inspect  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from db import models_raw, operations  # noqa: E402
+from db.database import Base  # noqa: E402
+from db.operations import read_model_frame  # noqa: E402
+from fetchers.raw_processor import (  # noqa: E402
+    process_all_raw_bootstrap_data,
+    process_raw_gameweek_performance_batch,
+)
+from scripts.stub_fpl_api import SyntheticFPLData  # noqa: E402
+
+MODELS = [models_raw.RawPlayerBootstrap, models_raw.RawPlayerGameweekPerformance]
+
+
+def orm_frame(session_factory, model) -> pd.DataFrame:
+    """The previous model_to_dataframe read, kept as the benchmark baseline."""
+    with session_factory() as session:
+        query_result = session.query(model).all()
+        attributes = [attr.key for attr in inspect(model).attrs]
+        return pd.DataFrame([{attr: getattr(obj, attr) for attr in attributes} for obj in query_result])
+
+
+def core_frame(session_factory, model) -> pd.DataFrame:
+    """The current getter read path."""
+    with session_factory() as session:
+        return read_model_frame(session.connection(), model)
+
+
+def measure(fn, repeat: int) -> tuple[float, float]:
+    """Best wall time in milliseconds over repeat calls, and peak traced memory in MB of one call."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best * 1000, peak / 1e6
+
+
+def populate(engine, players: int, gameweeks: int) -> None:
+    """Save synthetic bootstrap data and a season of gameweek performance to engine's database."""
+    session_factory = sessionmaker(bind=engine)
+
+    def get_session():
+        with session_factory() as session:
+            yield session
+
+    data = SyntheticFPLData(n_players=players, current_gameweek=gameweeks)
+    bootstrap = data.bootstrap()
+    live_by_gw = {gw: data.live(gw) for gw in range(1, gameweeks + 1)}
+    ops = operations.DatabaseOperations()
+    ops.session_factory = session_factory
+    # save_raw_player_gameweek_performance opens its session through the module-level get_session
+    original = operations.get_session
+    operations.get_session = get_session
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ops.save_all_raw_data(process_all_raw_bootstrap_data(bootstrap))
+            ops.save_raw_player_gameweek_performance(
+                process_raw_gameweek_performance_batch(live_by_gw, bootstrap, data.fixtures())
+            )
+    finally:
+        operations.get_session = original
+
+
+def main(
+    players: int = typer.Option(800, "--players", help="Number of synthetic players"),
+    gameweeks: int = typer.Option(38, "--gameweeks", help="Gameweeks of performance rows"),
+    repeat: int = typer.Option(5, "--repeat", help="Timed reads per path (best is reported)"),
+):
+    """Benchmark ORM hydration against Core select reads for the widest and longest tables."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'fpl_bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        populate(engine, players, gameweeks)
+        session_factory = sessionmaker(bind=engine)
+
+        rows = []
+        for model in MODELS:
+            orm = orm_frame(session_factory, model)
+            core = core_frame(session_factory, model)
+            pd.testing.assert_frame_equal(core, orm)
+            orm_ms, orm_mb = measure(lambda model=model: orm_frame(session_factory, model), repeat)
+            core_ms, core_mb = measure(lambda model=model: core_frame(session_factory, model), repeat)
+            rows.append((model.__tablename__, core.shape, orm_ms, core_ms, orm_mb, core_mb))
+        engine.dispose()
+
+    typer.echo("✅ read_model_frame matches ORM hydration for every table")
+    for table, (n_rows, n_cols), orm_ms, core_ms, orm_mb, core_mb in rows:
+        typer.echo(
+            f"{table} ({n_rows} rows x {n_cols} columns): {orm_ms:.1f} ms -> {core_ms:.1f} ms "
+            f"({orm_ms / core_ms:.1f}x), peak {orm_mb:.1f} MB -> {core_mb:.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Players Bootstrap Save Benchmark
+
+Times saving synthetic bootstrap players (see scripts/stub_fpl_api.py) to a
+temporary SQLite database with the diff-based writer, against the previous
+delete-all + bulk insert, for an unchanged refresh and for a refresh where a
+few players' prices and transfers moved. Checks that both leave the same rows.
+
+Usage:
+    uv run python scripts/benchmarks/players_bootstrap_save.py
+    uv run python scripts/benchmarks/players_bootstrap_save.py --players 700 --changed 20 --repeat 10
+"""
+
+import contextlib
+import copy
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd  # noqa: E402
+import typer  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from db import models_raw  # noqa: E402
+from db.database import Base  # noqa: E402
+from db.operations import DatabaseOperations, _attribute_select, convert_datetime_columns  # noqa: E402
+from fetchers.raw_processor import process_raw_players_bootstrap  # noqa: E402
+from scripts.stub_fpl_api import SyntheticFPLData  # noqa: E402
+
+
+def save_players_full_rewrite(session_factory, df: pd.DataFrame) -> None:
+    """The previous writer (delete every row, insert every row), kept as the benchmark baseline."""
+    session = session_factory()
+    try:
+        session.query(models_raw.RawPlayerBootstrap).delete()
+        df_converted = convert_datetime_columns(df, ["as_of_utc", "news_added"])
+        session.bulk_insert_mappings(models_raw.RawPlayerBootstrap, df_converted.to_dict("records"))
+        session.commit()
+    finally:
+        session.close()
+
+
+def time_alternating(fn, frames: list[pd.DataFrame], repeat: int) -> float:
+    """Best wall time in milliseconds over repeat saves, cycling through frames."""
+    best = float("inf")
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(frames[i % len(frames)])
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def stored_players(engine) -> pd.DataFrame:
+    """Stored players without capture timestamps, ordered by player."""
+    df = pd.read_sql_query(_attribute_select(models_raw.RawPlayerBootstrap), engine)
+    return df.drop(columns="as_of_utc").sort_values("player_id", ignore_index=True)
+
+
+def main(
+    players: int = typer.Option(700, "--players", help="Number of synthetic players"),
+    changed: int = typer.Option(20, "--changed", help="Players whose price/transfers change between refreshes"),
+    repeat: int = typer.Option(7, "--repeat", help="Timed saves per scenario (best is reported)"),
+):
+    """Benchmark the diff-based players bootstrap writer against a full rewrite."""
+    bootstrap = SyntheticFPLData(n_players=players).bootstrap()
+    refreshed = copy.deepcopy(bootstrap)
+    for player in refreshed["elements"][:changed]:
+        player["now_cost"] += 1
+        player["transfers_in_event"] += 100
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        before = process_raw_players_bootstrap(bootstrap)
+        after = process_raw_players_bootstrap(refreshed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engines = {name: create_engine(f"sqlite:///{Path(tmp) / f'{name}.db'}") for name in ("full", "diff")}
+        for engine in engines.values():
+            Base.metadata.create_all(bind=engine)
+        full_sessions = sessionmaker(bind=engines["full"])
+        ops = DatabaseOperations()
+        ops.session_factory = sessionmaker(bind=engines["diff"])
+
+        save_players_full_rewrite(full_sessions, before)
+        ops.save_raw_players_bootstrap(before)
+        save_players_full_rewrite(full_sessions, after)
+        result = ops.save_raw_players_bootstrap(after)
+        pd.testing.assert_frame_equal(stored_players(engines["diff"]), stored_players(engines["full"]))
+        typer.echo(f"✅ Stored rows match the full rewrite ({result['updated']} updated, {result['changes']} changes)")
+
+        rows = [
+            (
+                f"unchanged refresh ({players} players)",
+                time_alternating(lambda df: save_players_full_rewrite(full_sessions, df), [after], repeat),
+                time_alternating(ops.save_raw_players_bootstrap, [after], repeat),
+            ),
+            (
+                f"refresh with {changed} changed players",
+                time_alternating(lambda df: save_players_full_rewrite(full_sessions, df), [before, after], repeat),
+                time_alternating(ops.save_raw_players_bootstrap, [before, after], repeat),
+            ),
+        ]
+        for engine in engines.values():
+            engine.dispose()
+
+    for name, full, diff in rows:
+        typer.echo(f"{name}: {full:.1f} ms -> {diff:.1f} ms ({full / diff:.1f}x)")
+    typer.echo(f"rows written per refresh: {2 * players} (delete + insert) -> {changed} updates")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Snapshot Projection Benchmark
+
+Times availability snapshot building from synthetic bootstrap data (see
+scripts/stub_fpl_api.py) and from a vaastav-style players_raw frame, and checks
+the results against the previous implementations: a per-player dict loop for
+bootstrap snapshots and an iterrows() conversion repeated for every backfilled
+gameweek.
+
+Usage:
+    uv run python scripts/benchmarks/snapshot_projection.py
+    uv run python scripts/benchmarks/snapshot_projection.py --players 800 --gameweeks 6 --repeat 10
+"""
+
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd  # noqa: E402
+import typer  # noqa: E402
+
+from fetchers.raw_processor import process_player_gameweek_snapshot  # noqa: E402
+from fetchers.vaastav import VAASTAV_DTYPES  # noqa: E402
+from scripts.backfill.snapshots import SNAPSHOT_SOURCE_COLUMNS, convert_vaastav_to_snapshot  # noqa: E402
+from scripts.stub_fpl_api import SyntheticFPLData  # noqa: E402
+from validation.raw_schemas import RawPlayerGameweekSnapshotSchema  # noqa: E402
+
+
+def process_player_gameweek_snapshot_rowwise(bootstrap_data: dict[str, Any], gameweek: int) -> pd.DataFrame:
+    """The previous bootstrap snapshot processor, kept as the benchmark baseline."""
+    timestamp = pd.Timestamp.now(tz="UTC")
+    processed_snapshots = []
+    for player in bootstrap_data.get("elements", []):
+        processed_snapshots.append(
+            {
+                "player_id": player["id"],
+                "gameweek": gameweek,
+                "status": player.get("status", "a"),
+                "chance_of_playing_next_round": player.get("chance_of_playing_next_round"),
+                "chance_of_playing_this_round": player.get("chance_of_playing_this_round"),
+                "news": player.get("news", ""),
+                "news_added": player.get("news_added"),
+                "now_cost": player.get("now_cost"),
+                "ep_this": player.get("ep_this", "0.0"),
+                "ep_next": player.get("ep_next", "0.0"),
+                "form": player.get("form", "0.0"),
+                "penalties_order": player.get("penalties_order"),
+                "corners_and_indirect_freekicks_order": player.get("corners_and_indirect_freekicks_order"),
+                "direct_freekicks_order": player.get("direct_freekicks_order"),
+                "is_backfilled": False,
+                "snapshot_date": timestamp,
+                "as_of_utc": timestamp,
+            }
+        )
+    df = pd.DataFrame(processed_snapshots)
+    df["news"] = df["news"].fillna("")
+    for col in ["ep_this", "ep_next", "form"]:
+        df[col] = df[col].fillna("0.0")
+    return RawPlayerGameweekSnapshotSchema.validate(df)
+
+
+def convert_vaastav_to_snapshot_iterrows(vaastav_df: pd.DataFrame, gameweek: int) -> pd.DataFrame:
+    """The previous per-gameweek vaastav conversion, kept as the benchmark baseline."""
+    timestamp = pd.Timestamp.now(tz="UTC")
+    snapshot_records = []
+    for _, player in vaastav_df.iterrows():
+        snapshot_records.append(
+            {
+                "player_id": int(player["id"]),
+                "gameweek": gameweek,
+                "status": str(player.get("status", "a")),
+                "chance_of_playing_next_round": player.get("chance_of_playing_next_round"),
+                "chance_of_playing_this_round": player.get("chance_of_playing_this_round"),
+                "news": str(player.get("news", "")),
+                "news_added": pd.to_datetime(player.get("news_added")) if pd.notna(player.get("news_added")) else None,
+                "now_cost": int(player.get("now_cost")) if pd.notna(player.get("now_cost")) else None,
+                "ep_this": str(player.get("ep_this", "0.0")),
+                "ep_next": str(player.get("ep_next", "0.0")),
+                "form": str(player.get("form", "0.0")),
+                "is_backfilled": True,
+                "snapshot_date": timestamp,
+                "as_of_utc": timestamp,
+            }
+        )
+    df = pd.DataFrame(snapshot_records)
+    df["news"] = df["news"].fillna("").replace("nan", "")
+    for col in ["ep_this", "ep_next", "form"]:
+        df[col] = df[col].fillna("0.0").replace("nan", "0.0")
+    return df
+
+
+def vaastav_players_raw(bootstrap: dict[str, Any]) -> pd.DataFrame:
+    """players_raw.csv-shaped frame with the dtypes the vaastav reader declares."""
+    df = pd.DataFrame(bootstrap["elements"])[SNAPSHOT_SOURCE_COLUMNS]
+    dtypes = {col: t for col, t in VAASTAV_DTYPES["players_raw.csv"].items() if col in df.columns}
+    return df.astype(dtypes)
+
+
+def time_call(fn, repeat: int) -> float:
+    """Best wall time in milliseconds over repeat calls (processor output silenced)."""
+    best = float("inf")
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def comparable(df: pd.DataFrame) -> pd.DataFrame:
+    """Validated snapshot columns of the previous implementation, without run timestamps."""
+    columns = [col for col in df.columns if col not in ("snapshot_date", "as_of_utc")]
+    schema = RawPlayerGameweekSnapshotSchema.to_schema().select_columns(columns)
+    return schema.validate(df[columns]).reset_index(drop=True)
+
+
+def main(
+    players: int = typer.Option(800, "--players", help="Number of synthetic players"),
+    gameweeks: int = typer.Option(6, "--gameweeks", help="Gameweeks to backfill from one vaastav snapshot"),
+    repeat: int = typer.Option(5, "--repeat", help="Timed runs per implementation (best is reported)"),
+):
+    """Benchmark snapshot projection against the previous row-wise builders."""
+    bootstrap = SyntheticFPLData(n_players=players).bootstrap()
+    vaastav_df = vaastav_players_raw(bootstrap)
+    gameweek_range = list(range(1, gameweeks + 1))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = process_player_gameweek_snapshot_rowwise(bootstrap, 1)
+        actual = process_player_gameweek_snapshot(bootstrap, 1)
+        expected_backfill = pd.concat(
+            [convert_vaastav_to_snapshot_iterrows(vaastav_df, gw) for gw in gameweek_range], ignore_index=True
+        )
+        actual_backfill = convert_vaastav_to_snapshot(vaastav_df, gameweek_range)
+    pd.testing.assert_frame_equal(comparable(actual), comparable(expected))
+    pd.testing.assert_frame_equal(
+        comparable(actual_backfill)[comparable(expected_backfill).columns], comparable(expected_backfill)
+    )
+    typer.echo("✅ Outputs match the previous implementations")
+
+    rows = [
+        (
+            f"bootstrap snapshot ({players} players)",
+            time_call(lambda: process_player_gameweek_snapshot_rowwise(bootstrap, 1), repeat),
+            time_call(lambda: process_player_gameweek_snapshot(bootstrap, 1), repeat),
+        ),
+        (
+            f"vaastav backfill ({players} players x {gameweeks} GWs)",
+            time_call(lambda: [convert_vaastav_to_snapshot_iterrows(vaastav_df, gw) for gw in gameweek_range], repeat),
+            time_call(lambda: convert_vaastav_to_snapshot(vaastav_df, gameweek_range), repeat),
+        ),
+    ]
+    for name, before, after in rows:
+        typer.echo(f"{name}: {before:.1f} ms -> {after:.1f} ms ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    typer.run(main)
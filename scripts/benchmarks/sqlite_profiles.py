@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+SQLite Profile Benchmark
+
+Runs the same workloads against a temporary SQLite database under each profile in
+db.database.SQLITE_PROFILES, using synthetic gameweek performance data (see
+scripts/stub_fpl_api.py):
+
+- write: save every gameweek with one transaction per gameweek, as main and the backfills do
+- commits: many single-row transactions, where journal_mode and synchronous dominate
+- read: full-table reads plus a per-player aggregate, as analytics and the client do
+- concurrent: the write workload on a thread while the main thread keeps reading, counting
+  reads completed and the slowest read (readers wait on the writer under a rollback journal)
+
+Profiles that refuse writes (query_only, i.e. readonly) are timed as the reader, with an
+ingest-profile connection doing the writes.
+
+Usage:
+    uv run python scripts/benchmarks/sqlite_profiles.py
+    uv run python scripts/benchmarks/sqlite_profiles.py --players 800 --gameweeks 38 --reads 20 --repeat 3
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd  # noqa: E402
+import typer  # noqa: E402
+from sqlalchemy import create_engine, event, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from db import operations  # noqa: E402
+from db.database import SQLITE_PROFILES, Base, apply_sqlite_profile  # noqa: E402
+from fetchers.raw_processor import process_raw_gameweek_performance_batch  # noqa: E402
+from scripts.stub_fpl_api import SyntheticFPLData  # noqa: E402
+
+READ_QUERIES = [
+    "SELECT * FROM raw_player_gameweek_performance",
+    "SELECT player_id, SUM(total_points) AS points, SUM(minutes) AS minutes "
+    "FROM raw_player_gameweek_performance GROUP BY player_id ORDER BY points DESC",
+]
+
+
+def profiled_engine(path: Path, profile: str):
+    """SQLite engine whose connections get the given profile's PRAGMAs."""
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", lambda dbapi_connection, _: apply_sqlite_profile(dbapi_connection, profile))
+    return engine
+
+
+@contextlib.contextmanager
+def bound_operations(engine):
+    """DatabaseOperations whose sessions, including module-level get_session ones, use engine."""
+    session_factory = sessionmaker(bind=engine)
+
+    def get_session():
+        with session_factory() as session:
+            yield session
+
+    original = operations.get_session
+    operations.get_session = get_session
+    ops = operations.DatabaseOperations()
+    ops.session_factory = session_factory
+    try:
+        yield ops
+    finally:
+        operations.get_session = original
+
+
+def write_gameweeks(ops: operations.DatabaseOperations, frames: list[pd.DataFrame]) -> None:
+    """Save each gameweek in its own transaction."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in frames:
+            ops.save_raw_player_gameweek_performance(frame)
+
+
+def commit_rows(engine, count: int) -> float:
+    """Insert count change-log rows, one transaction each; returns wall time in seconds."""
+    start = time.perf_counter()
+    for i in range(count):
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                "INSERT INTO raw_player_bootstrap_changes (player_id, field, old_value, new_value, as_of_utc) "
+                "VALUES (?, 'now_cost', '50', '51', '2025-08-16 10:00:00')",
+                (i,),
+            )
+    return time.perf_counter() - start
+
+
+def is_read_only(profile: str) -> bool:
+    """Whether a profile refuses writes (query_only)."""
+    return SQLITE_PROFILES[profile].get("query_only") == "ON"
+
+
+def read_once(engine) -> float:
+    """Run the read queries once; returns wall time in seconds."""
+    start = time.perf_counter()
+    with engine.connect() as connection:
+        for query in READ_QUERIES:
+            pd.read_sql_query(text(query), connection)
+    return time.perf_counter() - start
+
+
+def run_profile(profile: str, frames: list[pd.DataFrame], reads: int, repeat: int, tmp: Path) -> dict[str, float]:
+    """Time the write (best of repeat passes), read and concurrent workloads under one profile."""
+    engine = profiled_engine(tmp / f"{profile}.db", profile)
+    writer_engine = engine
+    if is_read_only(profile):
+        writer_engine = profiled_engine(tmp / f"{profile}.db", "ingest")
+    Base.metadata.create_all(bind=writer_engine)
+
+    with bound_operations(writer_engine) as ops:
+        write_s = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            write_gameweeks(ops, frames)
+            write_s = min(write_s, time.perf_counter() - start)
+
+        commits = max(len(frames) * 10, 100)
+        commit_s = commit_rows(writer_engine, commits)
+
+        read_once(engine)  # warm the page cache / memory map
+        read_s = sum(read_once(engine) for _ in range(reads))
+
+        # Concurrent: rewrite every gameweek on a thread while reading on this one
+        writer = threading.Thread(target=write_gameweeks, args=(ops, frames))
+        latencies = []
+        writer.start()
+        while writer.is_alive():
+            latencies.append(read_once(engine))
+        writer.join()
+    engine.dispose()
+    writer_engine.dispose()
+
+    rows = sum(len(frame) for frame in frames)
+    return {
+        "write_rows_per_s": rows / write_s,
+        "commits_per_s": commits / commit_s,
+        "reads_per_s": reads / read_s,
+        "concurrent_reads": len(latencies),
+        "max_read_ms": max(latencies, default=0.0) * 1000,
+    }
+
+
+def main(
+    players: int = typer.Option(800, "--players", help="Synthetic players per gameweek"),
+    gameweeks: int = typer.Option(38, "--gameweeks", help="Gameweeks written (one transaction each)"),
+    reads: int = typer.Option(20, "--reads", help="Read passes timed per profile"),
+    repeat: int = typer.Option(3, "--repeat", help="Write passes per profile (best is reported)"),
+):
+    """Benchmark write and read throughput under each SQLite profile."""
+    data = SyntheticFPLData(n_players=players, current_gameweek=gameweeks)
+    live_by_gw = {gw: data.live(gw) for gw in range(1, gameweeks + 1)}
+    with contextlib.redirect_stdout(io.StringIO()):
+        performance = process_raw_gameweek_performance_batch(live_by_gw, data.bootstrap(), data.fixtures())
+    frames = [frame for _, frame in performance.groupby("gameweek")]
+    typer.echo(f"🏁 {gameweeks} gameweeks x {players} players, {reads} read passes")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / "warmup").mkdir()
+        run_profile("default", frames[:2], 2, 1, Path(tmp) / "warmup")  # first-use costs of pandas/SQLAlchemy
+        profiles = ["default", *(profile for profile in SQLITE_PROFILES if profile != "default")]
+        results = {profile: run_profile(profile, frames, reads, repeat, Path(tmp)) for profile in profiles}
+
+    typer.echo(
+        f"{'profile':<10} {'write rows/s':>13} {'commits/s':>10} {'reads/s':>9} {'reads during write':>19} "
+        f"{'max read ms':>12}"
+    )
+    for profile, result in results.items():
+        typer.echo(
+            f"{profile:<10} {result['write_rows_per_s']:>13,.0f} {result['commits_per_s']:>10,.0f} "
+            f"{result['reads_per_s']:>9.1f} "
+            f"{result['concurrent_reads']:>19} {result['max_read_ms']:>12.1f}"
+        )
+    baseline = results["default"]
+    for profile in ("ingest", "analytics", "readonly"):
+        if is_read_only(profile):
+            typer.echo(
+                f"🚀 {profile}: reads {results[profile]['reads_per_s'] / baseline['reads_per_s']:.1f}x vs default"
+            )
+            continue
+        typer.echo(
+            f"🚀 {profile}: writes {results[profile]['write_rows_per_s'] / baseline['write_rows_per_s']:.1f}x, "
+            f"commits {results[profile]['commits_per_s'] / baseline['commits_per_s']:.1f}x, "
+            f"reads {results[profile]['reads_per_s'] / baseline['reads_per_s']:.1f}x vs default"
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
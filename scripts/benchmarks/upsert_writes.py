@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Upsert Writes Benchmark
+
+Re-saves a season of synthetic gameweek performance (see scripts/stub_fpl_api.py),
+with a few players' points changed per gameweek, through
+save_raw_player_gameweek_performance in each FPL_WRITE_MODE: "replace" (delete the
+gameweek, insert it again) and "upsert" (INSERT ... ON CONFLICT DO UPDATE of changed
+rows). Reports time and rows written per mode, and checks that both leave the same rows.
+
+Usage:
+    uv run python scripts/benchmarks/upsert_writes.py
+    uv run python scripts/benchmarks/upsert_writes.py --players 800 --gameweeks 38 --changed 20
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd  # noqa: E402
+import typer  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from db import models_raw, operations  # noqa: E402
+from db.database import Base  # noqa: E402
+from db.operations import read_model_frame  # noqa: E402
+from fetchers.raw_processor import process_raw_gameweek_performance_batch  # noqa: E402
+from scripts.stub_fpl_api import SyntheticFPLData  # noqa: E402
+
+MODEL = models_raw.RawPlayerGameweekPerformance
+
+
+@contextlib.contextmanager
+def bound_operations(engine, mode: str):
+    """DatabaseOperations in a write mode whose sessions, including module-level get_session ones, use engine."""
+    session_factory = sessionmaker(bind=engine)
+
+    def get_session():
+        with session_factory() as session:
+            yield session
+
+    original = operations.get_session
+    operations.get_session = get_session
+    ops = operations.DatabaseOperations()
+    ops.session_factory = session_factory
+    ops.write_mode = mode
+    try:
+        yield ops
+    finally:
+        operations.get_session = original
+
+
+def save_gameweeks(ops: operations.DatabaseOperations, frames: list[pd.DataFrame]) -> tuple[float, int, int]:
+    """Save each gameweek in its own transaction; returns wall ms, rows inserted or updated and rows deleted."""
+    written = deleted = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in frames:
+            ops.save_raw_player_gameweek_performance(frame)
+            stats = ops.write_stats[MODEL.__tablename__]
+            written += stats["written"]
+            # replace deletes the stored gameweek, which holds the same players as the frame here
+            deleted += stats.get("deleted", len(frame) if ops.write_mode == "replace" else 0)
+    return (time.perf_counter() - start) * 1000, written, deleted
+
+
+def main(
+    players: int = typer.Option(800, "--players", help="Synthetic players per gameweek"),
+    gameweeks: int = typer.Option(38, "--gameweeks", help="Gameweeks re-saved"),
+    changed: int = typer.Option(20, "--changed", help="Players whose points change per gameweek on the re-save"),
+):
+    """Benchmark re-saving gameweeks with replace vs upsert write modes."""
+    data = SyntheticFPLData(n_players=players, current_gameweek=gameweeks)
+    live_by_gw = {gw: data.live(gw) for gw in range(1, gameweeks + 1)}
+    with contextlib.redirect_stdout(io.StringIO()):
+        performance = process_raw_gameweek_performance_batch(live_by_gw, data.bootstrap(), data.fixtures())
+    frames = [frame for _, frame in performance.groupby("gameweek")]
+    refreshed = []
+    for frame in frames:
+        frame = frame.assign(as_of_utc=pd.Timestamp.now(tz="UTC").isoformat())
+        frame.loc[frame.index[:changed], "total_points"] += 1
+        refreshed.append(frame)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in operations.WRITE_MODES:
+            engine = create_engine(f"sqlite:///{Path(tmp) / f'{mode}.db'}")
+            Base.metadata.create_all(bind=engine)
+            with bound_operations(engine, mode) as ops:
+                save_gameweeks(ops, frames)
+                results[mode] = save_gameweeks(ops, refreshed)
+            stored = read_model_frame(engine, MODEL).drop(columns=["id", "as_of_utc"])
+            results[mode] += (stored.sort_values(["player_id", "gameweek"], ignore_index=True),)
+            engine.dispose()
+
+    pd.testing.assert_frame_equal(results["upsert"][3], results["replace"][3])
+    typer.echo(f"✅ Both modes store the same rows ({gameweeks} gameweeks x {players} players)")
+    for mode, (ms, written, deleted, _) in results.items():
+        typer.echo(f"{mode:<8} re-save: {ms:.1f} ms, {written} rows inserted/updated, {deleted} deleted")
+    typer.echo(f"🚀 upsert {results['replace'][0] / results['upsert'][0]:.1f}x faster than replace")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -23,6 +23,7 @@ import typer  # noqa: E402
 from rich.console import Console  # noqa: E402
 from rich.table import Table  # noqa: E402
 
+from fetchers.async_fetch import fetch_many_picks  # noqa: E402
 from fetchers.fpl_api import fetch_fpl_bootstrap, fetch_manager_gameweek_picks  # noqa: E402
 from fetchers.live_data import get_current_gameweek  # noqa: E402
 
@@ -30,9 +31,10 @@ console = Console()
 app = typer.Typer()
 
 
-def fetch_chip_usage(manager_id: int, gameweek: int) -> dict | None:
-    """Fetch chip usage for a specific gameweek."""
-    picks_data = fetch_manager_gameweek_picks(manager_id, gameweek)
+def fetch_chip_usage(manager_id: int, gameweek: int, picks_data: dict | None = None) -> dict | None:
+    """Fetch chip usage for a specific gameweek (or extract it from already-fetched picks)."""
+    if picks_data is None:
+        picks_data = fetch_manager_gameweek_picks(manager_id, gameweek)
     if not picks_data:
         return None
 
@@ -71,12 +73,15 @@ def capture(
     # Fetch chip usage for each gameweek
     chip_data = []
 
-    with console.status("[bold green]Fetching chip usage...") as status:
-        for gw in range(start_gw, end_gw + 1):
-            status.update(f"Fetching GW{gw}...")
-            chip_info = fetch_chip_usage(manager_id, gw)
-            if chip_info:
-                chip_data.append(chip_info)
+    with console.status("[bold green]Fetching chip usage..."):
+        results = fetch_many_picks(manager_id, list(range(start_gw, end_gw + 1)))
+
+    for result in results:
+        if not result.ok:
+            continue
+        chip_info = fetch_chip_usage(manager_id, result.key, picks_data=result.data)
+        if chip_info:
+            chip_data.append(chip_info)
 
     if not chip_data:
         console.print("[yellow]⚠️  No chip data found[/yellow]")
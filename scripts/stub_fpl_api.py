@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+Local stub of the FPL API for offline load and regression benchmarks.
+
+Serves the endpoints the pipeline uses - bootstrap-static, fixtures,
+event/{gw}/live, entry/{id}, entry/{id}/event/{gw}/picks, entry/{id}/history
+and leagues-classic/{id}/standings - from either
+synthetic data (shaped after the raw validation schemas, so every processor and
+schema check runs as it would against the real API) or an archived run recorded
+by fetchers.payload_archive. Latency, random 5xx errors and 429 responses with
+Retry-After can be injected to exercise retry and rate-limit behaviour.
+
+Point the fetchers at it with the FPL_API_BASE_URL environment variable:
+
+Usage:
+    uv run python scripts/stub_fpl_api.py --port 8765 --latency 0.05 --error-rate 0.01
+    FPL_API_BASE_URL=http://127.0.0.1:8765/api uv run main.py main --no-create-backup
+
+    # Serve a recorded run instead of synthetic data
+    uv run python scripts/stub_fpl_api.py --from-run 20251015T071500Z-3f9a1c
+"""
+
+import json
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import typer  # noqa: E402
+
+from fetchers import payload_archive  # noqa: E402
+from validation.raw_schemas import (  # noqa: E402
+    RawChipsSchema,
+    RawElementStatsSchema,
+    RawElementTypesSchema,
+    RawEventsBootstrapSchema,
+    RawFixturesSchema,
+    RawGameSettingsSchema,
+    RawPhasesSchema,
+    RawPlayersBootstrapSchema,
+    RawTeamsBootstrapSchema,
+)
+
+API_PREFIX = "/api"
+
+# Schema column name -> FPL API field name, where the processors rename fields
+_API_FIELD_NAMES = {
+    "players": {"player_id": "id", "team_id": "team", "position_id": "element_type"},
+    "teams": {"team_id": "id"},
+    "events": {"event_id": "id"},
+    "element_types": {"position_id": "id"},
+    "fixtures": {
+        "fixture_id": "id",
+        "kickoff_utc": "kickoff_time",
+        "home_team_id": "team_h",
+        "away_team_id": "team_a",
+    },
+}
+
+SEASON_START = datetime(2025, 8, 16, 15, 0)
+
+_LIVE_STAT_FIELDS = [
+    "minutes",
+    "goals_scored",
+    "assists",
+    "clean_sheets",
+    "goals_conceded",
+    "own_goals",
+    "penalties_saved",
+    "penalties_missed",
+    "yellow_cards",
+    "red_cards",
+    "saves",
+    "bonus",
+    "bps",
+    "total_points",
+]
+
+
+def _placeholder(column) -> object:
+    """A value that satisfies a pandera column's dtype and checks."""
+    stats = {}
+    for check in column.checks:
+        stats.update(check.statistics)
+    dtype = str(column.dtype)
+
+    if "allowed_values" in stats:
+        return sorted(stats["allowed_values"])[0]
+    if dtype == "bool":
+        return False
+    if dtype.startswith("datetime"):
+        return "2025-08-15T19:00:00Z"
+    if dtype == "str":
+        return "0.0" if stats.get("min_value") else ""
+    if dtype.lower().startswith("float"):
+        return float(stats.get("min_value") or 0.0)
+    return int(stats.get("min_value") or 0)
+
+
+def _kickoff(gameweek: int, hours_before: float = 0.0) -> str:
+    """ISO kickoff (or deadline) time for a gameweek, one week apart from SEASON_START."""
+    moment = SEASON_START + timedelta(weeks=gameweek - 1) - timedelta(hours=hours_before)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _template(schema_cls, kind: str | None = None) -> dict:
+    """API-shaped record template built from a raw schema (metadata columns dropped)."""
+    renames = _API_FIELD_NAMES.get(kind, {})
+    record = {}
+    for name, column in schema_cls.to_schema().columns.items():
+        if name == "as_of_utc":
+            continue
+        record[renames.get(name, name)] = _placeholder(column)
+    return record
+
+
+class SyntheticFPLData:
+    """Deterministic synthetic FPL season (20 teams, 38 gameweeks, round-robin fixtures)."""
+
+    def __init__(self, n_players: int = 700, current_gameweek: int = 10, seed: int = 0, league_size: int = 1000):
+        self.n_players = n_players
+        self.current_gameweek = current_gameweek
+        self.seed = seed
+        self.league_size = league_size
+        self._cache: dict[str, bytes] = {}
+        self._fixtures = self._build_fixtures()
+
+    def _rng(self, *key) -> random.Random:
+        # String seeds hash deterministically across processes, unlike hash()
+        return random.Random(":".join(map(str, (self.seed, *key))))
+
+    def _build_fixtures(self) -> list[dict]:
+        template = _template(RawFixturesSchema, "fixtures")
+        teams = list(range(1, 21))
+        fixtures = []
+        for gw in range(1, 39):
+            # Circle-method round robin: first half of the season mirrored in the second
+            rnd = (gw - 1) % 19
+            rotation = teams[:1] + teams[1:][rnd:] + teams[1:][:rnd]
+            for i in range(10):
+                home, away = rotation[i], rotation[19 - i]
+                if gw > 19:
+                    home, away = away, home
+                finished = gw < self.current_gameweek
+                rng = self._rng("fixture", gw, i)
+                fixtures.append(
+                    {
+                        **template,
+                        "id": len(fixtures) + 1,
+                        "code": 2500000 + len(fixtures) + 1,
+                        "event": gw,
+                        "kickoff_time": _kickoff(gw),
+                        "team_h": home,
+                        "team_a": away,
+                        "finished": finished,
+                        "finished_provisional": finished,
+                        "started": finished,
+                        "team_h_score": rng.randint(0, 4) if finished else None,
+                        "team_a_score": rng.randint(0, 3) if finished else None,
+                        "team_h_difficulty": rng.randint(2, 5),
+                        "team_a_difficulty": rng.randint(2, 5),
+                        "stats": [],
+                    }
+                )
+        return fixtures
+
+    def _players(self) -> list[dict]:
+        template = _template(RawPlayersBootstrapSchema, "players")
+        players = []
+        for player_id in range(1, self.n_players + 1):
+            rng = self._rng("player", player_id)
+            team = (player_id - 1) % 20 + 1
+            status = rng.choice(["a"] * 9 + ["i"])
+            chance = 100.0 if status == "a" else 25.0
+            players.append(
+                {
+                    **template,
+                    "id": player_id,
+                    "code": 100000 + player_id,
+                    "web_name": f"Player{player_id}",
+                    "first_name": "Synthetic",
+                    "second_name": f"Player{player_id}",
+                    "team": team,
+                    "team_code": team,
+                    "element_type": rng.choice([1, 2, 2, 3, 3, 3, 4]),
+                    "squad_number": None,
+                    "status": status,
+                    "chance_of_playing_next_round": chance,
+                    "chance_of_playing_this_round": chance,
+                    "news_added": None,
+                    "now_cost": rng.randint(40, 140),
+                    "total_points": rng.randint(0, 120),
+                    "selected_by_percent": f"{rng.uniform(0, 60):.1f}",
+                    "photo": f"{100000 + player_id}.jpg",
+                }
+            )
+        return players
+
+    def _events(self) -> list[dict]:
+        template = _template(RawEventsBootstrapSchema, "events")
+        return [
+            {
+                **template,
+                "id": gw,
+                "name": f"Gameweek {gw}",
+                "deadline_time": _kickoff(gw, hours_before=1.5),
+                "release_time": None,
+                "finished": gw < self.current_gameweek,
+                "data_checked": gw < self.current_gameweek,
+                "is_previous": gw == self.current_gameweek - 1,
+                "is_current": gw == self.current_gameweek,
+                "is_next": gw == self.current_gameweek + 1,
+                "top_element_info": {},
+                "chip_plays": [],
+                "overrides": {},
+            }
+            for gw in range(1, 39)
+        ]
+
+    def bootstrap(self) -> dict:
+        game_settings = _template(RawGameSettingsSchema)
+        for field in [
+            "featured_entries",
+            "percentile_ranks",
+            "underdog_differential",
+            "league_h2h_tiebreak_stats",
+            "ui_special_shirt_exclusions",
+        ]:
+            game_settings[field] = []
+
+        return {
+            "elements": self._players(),
+            "teams": [
+                {
+                    **_template(RawTeamsBootstrapSchema, "teams"),
+                    "id": team,
+                    "code": team,
+                    "name": f"Team {team}",
+                    "short_name": f"T{team:02d}",
+                    "position": team,
+                    "form": None,
+                }
+                for team in range(1, 21)
+            ],
+            "events": self._events(),
+            "game_settings": game_settings,
+            "element_stats": [
+                {**_template(RawElementStatsSchema), "name": field, "label": field} for field in _LIVE_STAT_FIELDS
+            ],
+            "element_types": [
+                {
+                    **_template(RawElementTypesSchema, "element_types"),
+                    "id": position,
+                    "plural_name": f"{name}s",
+                    "plural_name_short": name,
+                    "singular_name": name,
+                    "singular_name_short": name,
+                }
+                for position, name in enumerate(["GKP", "DEF", "MID", "FWD"], start=1)
+            ],
+            "chips": [
+                {**_template(RawChipsSchema), "id": i, "name": name, "overrides": {}}
+                for i, name in enumerate(["wildcard", "freehit", "bboost", "3xc"], start=1)
+            ],
+            "phases": [{**_template(RawPhasesSchema), "id": 1, "name": "Overall", "start_event": 1, "stop_event": 38}],
+        }
+
+    def fixtures(self) -> list[dict]:
+        return self._fixtures
+
+    def live(self, gameweek: int) -> dict:
+        fixture_by_team = {}
+        for fixture in self._fixtures:
+            if fixture["event"] == gameweek:
+                fixture_by_team[fixture["team_h"]] = fixture["id"]
+                fixture_by_team[fixture["team_a"]] = fixture["id"]
+
+        elements = []
+        for player_id in range(1, self.n_players + 1):
+            rng = self._rng("live", gameweek, player_id)
+            stats = dict.fromkeys(_LIVE_STAT_FIELDS, 0)
+            stats["minutes"] = rng.choice([0, 0, 45, 90, 90, 90])
+            if stats["minutes"]:
+                stats["goals_scored"] = rng.choice([0] * 8 + [1])
+                stats["assists"] = rng.choice([0] * 8 + [1])
+                stats["bps"] = rng.randint(0, 40)
+                stats["total_points"] = 2 + 4 * stats["goals_scored"] + 3 * stats["assists"]
+            for field in ["influence", "creativity", "threat", "ict_index", "expected_goals", "expected_assists"]:
+                stats[field] = f"{rng.uniform(0, 10):.1f}"
+            team = (player_id - 1) % 20 + 1
+            explain = [{"fixture": fixture_by_team[team], "stats": []}] if team in fixture_by_team else []
+            elements.append({"id": player_id, "stats": stats, "explain": explain})
+        return {"elements": elements}
+
+    def entry(self, manager_id: int) -> dict:
+        return {
+            "id": manager_id,
+            "name": f"Synthetic XI {manager_id}",
+            "player_first_name": "Stub",
+            "player_last_name": "Manager",
+            "current_event": self.current_gameweek,
+            "summary_overall_points": 500,
+            "summary_overall_rank": manager_id % 1_000_000 + 1,
+        }
+
+    def _chip(self, manager_id: int, gameweek: int) -> str | None:
+        return "wildcard" if gameweek == 3 and manager_id % 5 == 0 else None
+
+    def _entry_history(self, manager_id: int, gameweek: int) -> dict:
+        rng = self._rng("entry_history", manager_id, gameweek)
+        return {
+            "event": gameweek,
+            "points": rng.randint(20, 90),
+            "total_points": 50 * gameweek,
+            "rank": rng.randint(1, 10_000_000),
+            "overall_rank": rng.randint(1, 10_000_000),
+            "bank": rng.randint(0, 30),
+            "value": rng.randint(990, 1050),
+            "event_transfers": rng.randint(0, 2),
+            "event_transfers_cost": 0,
+            "points_on_bench": rng.randint(0, 15),
+        }
+
+    def picks(self, manager_id: int, gameweek: int) -> dict:
+        rng = self._rng("picks", manager_id, gameweek)
+        elements = rng.sample(range(1, self.n_players + 1), 15)
+        return {
+            "active_chip": self._chip(manager_id, gameweek),
+            "entry_history": self._entry_history(manager_id, gameweek),
+            "picks": [
+                {
+                    "element": element,
+                    "position": position,
+                    "multiplier": 0 if position > 11 else (2 if position == 1 else 1),
+                    "is_captain": position == 1,
+                    "is_vice_captain": position == 2,
+                }
+                for position, element in enumerate(elements, start=1)
+            ],
+        }
+
+    def history(self, manager_id: int) -> dict:
+        gameweeks = range(1, self.current_gameweek + 1)
+        return {
+            "current": [self._entry_history(manager_id, gw) for gw in gameweeks],
+            "past": [],
+            "chips": [
+                {"name": chip, "time": _kickoff(gw), "event": gw}
+                for gw in gameweeks
+                if (chip := self._chip(manager_id, gw))
+            ],
+        }
+
+    def league_standings(self, league_id: int, page: int) -> dict:
+        """Standings page (50 managers) of a synthetic classic league of league_size members."""
+        first = (page - 1) * 50 + 1
+        last = min(page * 50, self.league_size)
+        return {
+            "league": {"id": league_id, "name": f"Synthetic League {league_id}"},
+            "standings": {
+                "has_next": last < self.league_size,
+                "page": page,
+                "results": [
+                    {
+                        "entry": league_id * 100_000 + rank,
+                        "entry_name": f"Synthetic XI {league_id * 100_000 + rank}",
+                        "player_name": "Stub Manager",
+                        "rank": rank,
+                        "total": 1000 - rank,
+                    }
+                    for rank in range(first, last + 1)
+                ],
+            },
+        }
+
+    def payload_for(self, path: str) -> bytes | None:
+        """Response body for an API path (relative to /api, with any query string), or None if not served."""
+        if path in self._cache:
+            return self._cache[path]
+
+        path, _, query = path.partition("?")
+        if path == "/bootstrap-static/":
+            payload = self.bootstrap()
+        elif path == "/fixtures/":
+            payload = self.fixtures()
+        elif match := re.fullmatch(r"/event/(\d+)/live/", path):
+            payload = self.live(int(match.group(1)))
+        elif match := re.fullmatch(r"/entry/(\d+)/", path):
+            payload = self.entry(int(match.group(1)))
+        elif match := re.fullmatch(r"/entry/(\d+)/event/(\d+)/picks/", path):
+            payload = self.picks(int(match.group(1)), int(match.group(2)))
+        elif match := re.fullmatch(r"/entry/(\d+)/history/", path):
+            payload = self.history(int(match.group(1)))
+        elif match := re.fullmatch(r"/leagues-classic/(\d+)/standings/", path):
+            page = int(parse_qs(query).get("page_standings", ["1"])[0])
+            payload = self.league_standings(int(match.group(1)), page)
+        else:
+            return None
+
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        # Only shared, season-wide payloads are worth caching
+        if path in {"/bootstrap-static/", "/fixtures/"} or path.startswith("/event/"):
+            self._cache[path] = body
+        return body
+
+
+class ArchivedFPLData:
+    """Serve FPL API paths from a run recorded by fetchers.payload_archive."""
+
+    def __init__(self, run_id: str):
+        manifest = payload_archive.start_replay(run_id)
+        payload_archive.stop_replay()
+        self._by_path = {}
+        for key, entry in manifest["entries"].items():
+            parts = urlsplit(key)
+            if API_PREFIX in parts.path:
+                path = parts.path.split(API_PREFIX, 1)[1]
+                self._by_path[f"{path}?{parts.query}" if parts.query else path] = entry["sha256"]
+
+    def payload_for(self, path: str) -> bytes | None:
+        sha = self._by_path.get(path)
+        return payload_archive.load_object(sha) if sha else None
+
+
+class StubFPLAPIServer:
+    """Threaded local HTTP server impersonating the FPL API.
+
+    Args:
+        source: Data source with a payload_for(path) method (SyntheticFPLData or ArchivedFPLData)
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        latency: Seconds to wait before every response
+        error_rate: Probability of answering with a 503
+        rate_limit_rate: Probability of answering with a 429
+        retry_after: Retry-After seconds sent with 429 responses
+        seed: Seed for the fault-injection RNG
+    """
+
+    def __init__(
+        self,
+        source=None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int | None = None,
+    ):
+        self.source = source or SyntheticFPLData()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.stats = {"requests": 0, "ok": 0, "not_found": 0, "errors": 0, "rate_limited": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def _decide(self) -> str:
+        with self._lock:
+            self.stats["requests"] += 1
+            roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            return "rate_limited"
+        if roll < self.rate_limit_rate + self.error_rate:
+            return "errors"
+        return "ok"
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                outcome = stub._decide()
+                path = self.path
+                body = b""
+                if outcome == "ok":
+                    body = stub.source.payload_for(path[len(API_PREFIX) :]) if path.startswith(API_PREFIX) else None
+                    if body is None:
+                        outcome, body = "not_found", b""
+                stub._count(outcome)
+
+                status = {"ok": 200, "not_found": 404, "errors": 503, "rate_limited": 429}[outcome]
+                self.send_response(status)
+                if outcome == "rate_limited":
+                    self.send_header("Retry-After", str(stub.retry_after))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+        return Handler
+
+    def start(self) -> "StubFPLAPIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubFPLAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(8765, "--port", help="Port to listen on"),
+    latency: float = typer.Option(0.0, "--latency", help="Seconds of latency added to every response"),
+    error_rate: float = typer.Option(0.0, "--error-rate", help="Fraction of requests answered with 503"),
+    rate_limit_rate: float = typer.Option(0.0, "--rate-limit-rate", help="Fraction of requests answered with 429"),
+    retry_after: int = typer.Option(1, "--retry-after", help="Retry-After seconds sent with 429 responses"),
+    players: int = typer.Option(700, "--players", help="Number of synthetic players"),
+    current_gameweek: int = typer.Option(10, "--current-gw", help="Current gameweek of the synthetic season"),
+    from_run: str = typer.Option(None, "--from-run", help="Serve an archived run instead of synthetic data"),
+    seed: int = typer.Option(0, "--seed", help="Seed for synthetic data and fault injection"),
+):
+    """Run the stub FPL API until interrupted."""
+    source = ArchivedFPLData(from_run) if from_run else SyntheticFPLData(players, current_gameweek, seed)
+    server = StubFPLAPIServer(source, host, port, latency, error_rate, rate_limit_rate, retry_after, seed)
+    print(f"🧪 Stub FPL API listening on {server.base_url}")
+    print(f"   export FPL_API_BASE_URL={server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+        print(f"📊 Served: {server.stats}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -1,5 +1,7 @@
 """Pytest configuration and fixtures for FPL dataset builder tests."""
 
+import pytest
+
 
 def pytest_addoption(parser):
     """Add custom command line options for tests."""
@@ -10,3 +12,86 @@ def pytest_addoption(parser):
         default=None,
         help="Override last completed gameweek for completeness tests (default: auto-detect)",
     )
+
+
+@pytest.fixture(autouse=True)
+def isolated_payload_archive(tmp_path, monkeypatch):
+    """Keep payloads fetched during tests out of the real data/archive directory."""
+    from fetchers import payload_archive
+
+    monkeypatch.setattr(payload_archive, "ARCHIVE_DIR", tmp_path / "archive")
+    monkeypatch.setattr(payload_archive, "_run", None)
+    monkeypatch.setattr(payload_archive, "_replay", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiters():
+    """Start every test with fresh per-host rate limiters and closed circuits."""
+    from fetchers.rate_limit import reset_rate_limiters
+
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+@pytest.fixture(autouse=True)
+def isolated_vaastav_cache(tmp_path, monkeypatch):
+    """Keep vaastav CSVs downloaded during tests out of the real data/vaastav cache."""
+    from fetchers import vaastav
+
+    monkeypatch.setattr(vaastav, "VAASTAV_CACHE_DIR", tmp_path / "vaastav")
+
+
+@pytest.fixture(autouse=True)
+def isolated_validation_policy(tmp_path, monkeypatch):
+    """Run every test with the default validation policy and no stored fingerprints."""
+    from validation import validators
+
+    monkeypatch.setattr(validators, "VALIDATION_STATE_PATH", tmp_path / "validation_fingerprints.json")
+    validators.reset_validation_policy()
+    yield
+    validators.reset_validation_policy()
+
+
+@pytest.fixture(autouse=True)
+def restore_sqlite_profile():
+    """Undo SQLite profile switches made by a test or workload after every test."""
+    from db import database
+
+    profile = database.get_sqlite_profile()
+    yield
+    if database.get_sqlite_profile() != profile:
+        database.set_sqlite_profile(profile)
+
+
+@pytest.fixture
+def temp_db_ops(tmp_path, monkeypatch):
+    """DatabaseOperations on a fresh SQLite file instead of data/fpl_data.db.
+
+    Methods that open sessions through the module-level get_session are pointed at the same file.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from db import operations
+    from db.database import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'fpl_test.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+
+    def get_session():
+        with session_factory() as session:
+            yield session
+
+    monkeypatch.setattr(operations, "get_session", get_session)
+    ops = operations.DatabaseOperations()
+    ops.session_factory = session_factory
+    yield ops
+    engine.dispose()
+
+
+@pytest.fixture
+def temp_db_engine(temp_db_ops):
+    """Engine of the temp_db_ops database, for direct SQL against it."""
+    return temp_db_ops.session_factory.kw["bind"]
@@ -0,0 +1,88 @@
+"""Tests for the concurrent batch fetch engine."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fetchers.async_fetch import fetch_many
+
+
+class _SlowJSONHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self):  # noqa: N802
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.in_flight -= 1
+
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Serve slow JSON responses on localhost and track request concurrency."""
+    _SlowJSONHandler.in_flight = 0
+    _SlowJSONHandler.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowJSONHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestFetchMany:
+    """Tests for ordering, error isolation and concurrency limits."""
+
+    def test_results_returned_in_request_order(self, local_server):
+        """Test that results line up with the requested keys."""
+        requests = [(gw, f"{local_server}/event/{gw}/live/") for gw in range(1, 11)]
+        results = fetch_many(requests, requests_per_second=0)
+
+        assert [r.key for r in results] == list(range(1, 11))
+        assert all(r.ok for r in results)
+        assert results[4].data == {"path": "/event/5/live/"}
+
+    def test_errors_are_reported_per_request(self, local_server):
+        """Test that one failing request does not abort the batch."""
+        requests = [("good", f"{local_server}/ok"), ("bad", f"{local_server}/missing")]
+        good, bad = fetch_many(requests, requests_per_second=0, retries=1)
+
+        assert good.ok
+        assert not bad.ok
+        assert "404" in bad.error
+
+    def test_concurrency_is_bounded(self, local_server):
+        """Test that no more than max_concurrency requests are in flight."""
+        requests = [(i, f"{local_server}/item/{i}") for i in range(12)]
+        fetch_many(requests, max_concurrency=3, requests_per_second=0)
+
+        assert 1 < _SlowJSONHandler.max_in_flight <= 3
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns an empty list."""
+        assert fetch_many([]) == []
@@ -136,6 +136,64 @@ class TestBettingOddsProcessing:
             assert pd.api.types.is_datetime64_any_dtype(result["match_date"]), "match_date should be datetime type"
 
 
+class TestBettingOddsFixtureMatching:
+    """Tests for the keyed odds-to-fixture merge on synthetic fixtures (no database needed)."""
+
+    teams = pd.DataFrame({"team_id": [1, 2, 3, 4], "name": ["Arsenal", "Man Utd", "Spurs", "Chelsea"]})
+    fixtures = pd.DataFrame(
+        {
+            "fixture_id": [10, 11, 12, 13],
+            "kickoff_utc": pd.to_datetime(
+                ["2025-08-16 14:00", "2025-08-16 23:30", "2025-08-23 14:00", "2025-08-23 16:30"], utc=True
+            ),
+            "home_team_id": [1, 3, 4, 4],
+            "away_team_id": [2, 4, 1, 1],
+        }
+    )
+
+    def test_rows_matched_on_date_and_teams_with_renamed_columns(self):
+        """Test that odds join fixtures on (date, home, away) and columns follow the mapping table."""
+        odds = pd.DataFrame(
+            {
+                "Date": ["16/08/2025", "16/08/2025"],
+                "HomeTeam": ["Arsenal", "Tottenham"],
+                "AwayTeam": ["Man United", "Chelsea"],
+                "Referee": ["A Taylor", "M Oliver"],
+                "HS": [12, 7],
+                "B365H": [1.8, 2.4],
+                "B365>2.5": [1.7, 2.0],
+            }
+        )
+
+        result = process_raw_betting_odds(odds, self.fixtures, self.teams)
+
+        assert result["fixture_id"].tolist() == [10, 11]
+        assert result["home_team_id"].tolist() == [1, 3]
+        assert result["B365_over_2_5"].tolist() == [1.7, 2.0]
+        assert result["referee"].tolist() == ["A Taylor", "M Oliver"]
+        assert result["PSCH"].isna().all()
+        assert odds["Date"].tolist() == ["16/08/2025", "16/08/2025"], "Input frame should not be modified"
+
+    def test_ambiguous_and_unmatched_rows_are_reported_and_dropped(self, capsys):
+        """Test that keys matching several fixtures or none are reported and excluded."""
+        odds = pd.DataFrame(
+            {
+                "Date": ["23/08/2025", "17/08/2025", "16/08/2025", "16/08/2025"],
+                "HomeTeam": ["Chelsea", "Arsenal", "Arsenal", "Wrexham"],
+                "AwayTeam": ["Arsenal", "Man United", "Man United", "Arsenal"],
+                "B365H": [2.1, 1.8, 1.9, 3.0],
+            }
+        )
+
+        result = process_raw_betting_odds(odds, self.fixtures, self.teams)
+
+        output = capsys.readouterr().out
+        assert result["fixture_id"].tolist() == [10]
+        assert "Dropped 1 matches with unmapped teams" in output
+        assert "1 betting odds rows matched more than one fixture: Chelsea v Arsenal (2025-08-23)" in output
+        assert "1 betting odds rows could not be matched to fixtures: Arsenal v Man United (2025-08-17)" in output
+
+
 class TestBettingOddsValidation:
     """Tests for betting odds validation schema."""
 
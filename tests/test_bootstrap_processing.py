@@ -0,0 +1,118 @@
+"""Tests for schema-typed bootstrap and fixtures processing."""
+
+import pandas as pd
+
+from fetchers.raw_processor import (
+    BOOTSTRAP_TABLES,
+    decompose_bootstrap,
+    process_all_raw_bootstrap_data,
+    process_raw_events_bootstrap,
+    process_raw_fixtures,
+    process_raw_players_bootstrap,
+)
+from scripts.stub_fpl_api import SyntheticFPLData
+from validation.raw_schemas import RawPlayersBootstrapSchema
+from validation.validators import schema_dtypes
+
+
+class TestBootstrapProcessingDtypes:
+    """Tests that processed bootstrap tables carry the dtypes declared by the raw schemas."""
+
+    def test_schema_dtypes_keyed_by_api_field_name(self):
+        """Test that schema dtypes use API field names and leave timestamps to date parsing."""
+        dtypes = schema_dtypes(RawPlayersBootstrapSchema)
+
+        assert dtypes["id"] == "int64"
+        assert dtypes["squad_number"] == "Int64"
+        assert dtypes["status"] == "object"
+        assert dtypes["expected_goals_per_90"] == "float64"
+        assert "player_id" not in dtypes
+        assert "news_added" not in dtypes
+
+    def test_players_typed_with_nulls_filled_and_categoricals(self):
+        """Test that player nulls are filled per column type, floats are kept and status is categorical."""
+        bootstrap = SyntheticFPLData(n_players=30).bootstrap()
+        first = bootstrap["elements"][0]
+        first.update(
+            {
+                "expected_goals_per_90": 0.37,
+                "penalties_order": None,
+                "penalties_text": None,
+                "chance_of_playing_next_round": None,
+                "squad_number": 7,
+                "news_added": "2025-08-10T12:00:00Z",
+            }
+        )
+
+        df = process_raw_players_bootstrap(bootstrap)
+
+        row = df.iloc[0]
+        assert row["expected_goals_per_90"] == 0.37
+        assert row["penalties_order"] == 0
+        assert row["penalties_text"] == ""
+        assert pd.isna(row["chance_of_playing_next_round"])
+        assert row["squad_number"] == 7 and (df["squad_number"].iloc[1:] == 0).all()
+        assert isinstance(df["status"].dtype, pd.CategoricalDtype)
+        assert df["player_id"].tolist() == df["id"].tolist()
+        assert pd.api.types.is_datetime64_any_dtype(df["news_added"])
+
+    def test_events_and_fixtures_encode_nested_fields(self):
+        """Test that nested event/fixture fields become JSON strings and nullable counts stay typed."""
+        data = SyntheticFPLData(n_players=30, current_gameweek=3)
+        bootstrap = data.bootstrap()
+        bootstrap["events"][5]["highest_score"] = None
+        fixtures = data.fixtures()
+        fixtures[0]["event"] = None
+
+        events = process_raw_events_bootstrap(bootstrap)
+        fixtures_df = process_raw_fixtures(fixtures)
+
+        assert events.loc[5, "highest_score"] == 0
+        assert all(isinstance(value, str) for value in events["chip_plays"])
+        assert str(fixtures_df["event"].dtype) == "Int64" and pd.isna(fixtures_df.loc[0, "event"])
+        assert fixtures_df["stats"].str.startswith("[").all()
+        assert {"fixture_id", "home_team_id", "away_team_id", "kickoff_utc"} <= set(fixtures_df.columns)
+
+
+class TestBootstrapDecomposition:
+    """Tests for decomposing the bootstrap response into all raw tables in one pass."""
+
+    def test_all_tables_share_one_timestamp(self):
+        """Test that every table built from one bootstrap carries the same as_of_utc."""
+        bootstrap = SyntheticFPLData(n_players=30).bootstrap()
+        as_of_utc = pd.Timestamp("2025-08-15T10:00:00Z")
+
+        build_seconds = {}
+        frames = decompose_bootstrap(bootstrap, as_of_utc, build_seconds)
+        tables = process_all_raw_bootstrap_data(bootstrap, as_of_utc=as_of_utc)
+
+        assert set(frames) == set(tables) == set(BOOTSTRAP_TABLES) == set(build_seconds)
+        assert all((df["as_of_utc"] == as_of_utc).all() for df in frames.values())
+        # Schema coercion stores the timestamp as naive UTC
+        assert {ts for df in tables.values() for ts in df["as_of_utc"]} == {as_of_utc.tz_localize(None)}
+        assert tables["raw_element_types"]["position_id"].tolist() == [1, 2, 3, 4]
+        assert (tables["raw_chips"]["chip_id"] == tables["raw_chips"]["id"]).all()
+
+    def test_threaded_validation_matches_sequential(self):
+        """Test that validating the tables on a thread pool gives the same frames as one at a time."""
+        bootstrap = SyntheticFPLData(n_players=30).bootstrap()
+        as_of_utc = pd.Timestamp("2025-08-15T10:00:00Z")
+
+        sequential = process_all_raw_bootstrap_data(bootstrap, as_of_utc=as_of_utc, max_workers=1)
+        threaded = process_all_raw_bootstrap_data(bootstrap, as_of_utc=as_of_utc, max_workers=4)
+
+        assert list(threaded) == list(sequential)
+        for table in sequential:
+            pd.testing.assert_frame_equal(threaded[table], sequential[table])
+
+    def test_failed_table_does_not_block_others(self):
+        """Test that an empty section is skipped and an invalid table is kept unvalidated."""
+        bootstrap = SyntheticFPLData(n_players=30).bootstrap()
+        bootstrap["phases"] = []
+        bootstrap["teams"][0]["strength"] = 99
+
+        tables = process_all_raw_bootstrap_data(bootstrap, max_workers=4)
+
+        assert "raw_phases" not in tables
+        assert len(tables["raw_teams_bootstrap"]) == 20
+        assert isinstance(tables["raw_players_bootstrap"]["status"].dtype, pd.CategoricalDtype)
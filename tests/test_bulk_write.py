@@ -0,0 +1,218 @@
+"""Tests for the chunked executemany writer (bulk_insert_frame) behind every save_* method."""
+
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from db import models_derived, models_raw, operations
+from db.bulk_write import bulk_insert_frame
+from db.database import Base
+from db.operations import convert_datetime_columns, read_model_frame
+from fetchers.raw_processor import (
+    process_all_raw_bootstrap_data,
+    process_player_gameweek_snapshot,
+    process_raw_fixtures,
+    process_raw_gameweek_performance_batch,
+)
+from scripts.stub_fpl_api import SyntheticFPLData
+
+DATETIME_COLUMNS = ["as_of_utc", "news_added", "deadline_time", "release_time", "snapshot_date"]
+
+
+@pytest.fixture(scope="module")
+def raw_frames():
+    """Processed synthetic frames keyed by raw model."""
+    data = SyntheticFPLData(n_players=50, current_gameweek=3)
+    bootstrap = data.bootstrap()
+    with contextlib.redirect_stdout(io.StringIO()):
+        frames = process_all_raw_bootstrap_data(bootstrap)
+        frames["raw_fixtures"] = process_raw_fixtures(data.fixtures())
+        frames["raw_player_gameweek_performance"] = process_raw_gameweek_performance_batch(
+            {gw: data.live(gw) for gw in range(1, 4)}, bootstrap
+        )
+        frames["raw_player_gameweek_snapshot"] = process_player_gameweek_snapshot(bootstrap, 3)
+    models = {mapper.class_.__tablename__: mapper.class_ for mapper in Base.registry.mappers}
+    return {models[name]: df for name, df in frames.items() if not df.empty}
+
+
+class TestBulkInsertFrame:
+    """Tests for bulk_insert_frame and its use by DatabaseOperations."""
+
+    def test_matches_bulk_insert_mappings(self, temp_db_engine, raw_frames):
+        """Test that every raw table stores the same rows as the previous bulk_insert_mappings writer."""
+        for model, df in raw_frames.items():
+            with sessionmaker(bind=temp_db_engine)() as session:
+                records = convert_datetime_columns(df, DATETIME_COLUMNS).to_dict("records")
+                session.bulk_insert_mappings(model, records)
+                session.commit()
+            expected = read_model_frame(temp_db_engine, model)
+            reset_tables(temp_db_engine, model)
+            with temp_db_engine.begin() as connection:
+                stats = bulk_insert_frame(connection, model, df, DATETIME_COLUMNS, chunk_size=17)
+
+            assert stats["rows"] == len(df) and stats["rows_per_s"] > 0
+            pd.testing.assert_frame_equal(read_model_frame(temp_db_engine, model), expected, obj=model.__tablename__)
+
+    def test_failed_chunk_rolls_back_whole_write(self, temp_db_engine, raw_frames):
+        """Test that a constraint error in a later chunk leaves none of the frame's rows."""
+        engine = temp_db_engine
+        model = models_raw.RawPlayerGameweekPerformance
+        df = raw_frames[model]
+        duplicated = pd.concat([df, df.iloc[[0]]], ignore_index=True)
+
+        with pytest.raises(IntegrityError), engine.begin() as connection:
+            bulk_insert_frame(connection, model, duplicated, ["as_of_utc"], chunk_size=len(df))
+
+        assert read_model_frame(engine, model).empty
+
+    def test_missing_columns_get_python_defaults(self, temp_db_engine):
+        """Test that model columns absent from the frame get their Python-side defaults."""
+        engine = temp_db_engine
+        df = pd.DataFrame({"player_id": [1, 2], "gameweek": [5, 5], "unknown_column": ["x", "y"]})
+        runs = df.assign(
+            fixture_run_3gw_difficulty=2.5,
+            fixture_run_5gw_difficulty=3.0,
+            green_fixtures_next_3=2,
+            green_fixtures_next_5=3,
+            fixture_swing_upcoming=0.5,
+            optimal_transfer_in_window=True,
+            optimal_transfer_out_window=False,
+        )
+
+        with engine.begin() as connection:
+            bulk_insert_frame(connection, models_derived.DerivedFixtureRuns, runs)
+        stored = read_model_frame(engine, models_derived.DerivedFixtureRuns)
+
+        assert len(stored) == 2 and stored["calculation_date"].notna().all()
+        assert stored["optimal_transfer_in_window"].tolist() == [True, True]
+
+    def test_save_all_reports_write_rate(self, temp_db_ops, raw_frames):
+        """Test that save methods record rows/s per table and save_all_raw_data prints it."""
+        ops = temp_db_ops
+        frames = {model.__tablename__: df for model, df in raw_frames.items()}
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            ops.save_all_raw_data({"raw_teams_bootstrap": frames["raw_teams_bootstrap"]})
+
+        assert ops.write_stats["raw_teams_bootstrap"]["rows"] == 20
+        assert "raw_team_aliases" in ops.write_stats
+        assert "✅ Saved raw_teams_bootstrap: 20 rows (" in output.getvalue()
+        assert "rows/s)" in output.getvalue()
+
+
+def reset_tables(engine, *models) -> None:
+    """Drop and recreate tables (all of them by default), restarting their ids."""
+    tables = [model.__table__ for model in models] or None
+    Base.metadata.drop_all(bind=engine, tables=tables)
+    Base.metadata.create_all(bind=engine, tables=tables)
+
+
+def save(ops: operations.DatabaseOperations, method: str, df: pd.DataFrame) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        getattr(ops, method)(df)
+
+
+def stored(ops: operations.DatabaseOperations, model, key: list[str]) -> pd.DataFrame:
+    """Stored rows without surrogate ids and capture timestamps, ordered by key."""
+    with ops.session_factory() as session:
+        df = read_model_frame(session.connection(), model)
+    return df.drop(columns=["id", "as_of_utc"], errors="ignore").sort_values(key, ignore_index=True)
+
+
+class TestUpsertWriteMode:
+    """Tests for FPL_WRITE_MODE=upsert against the delete-and-reinsert saves."""
+
+    def test_performance_upsert_matches_replace(self, temp_db_ops, temp_db_engine, raw_frames):
+        """Test that upserting a changed gameweek leaves the same rows as replacing it, writing only changes."""
+        model = models_raw.RawPlayerGameweekPerformance
+        first = raw_frames[model]
+        second = first[first["gameweek"] == 2].copy()
+        second["as_of_utc"] = "2025-09-01T12:00:00Z"
+        second.loc[second.index[:3], "total_points"] += 5
+        second = second.iloc[:-2]  # two players dropped from the gameweek
+
+        key = ["player_id", "gameweek"]
+        results = {}
+        for mode in ("replace", "upsert"):
+            reset_tables(temp_db_engine)
+            temp_db_ops.write_mode = mode
+            save(temp_db_ops, "save_raw_player_gameweek_performance", first)
+            save(temp_db_ops, "save_raw_player_gameweek_performance", second)
+            results[mode] = stored(temp_db_ops, model, key)
+
+        pd.testing.assert_frame_equal(results["upsert"], results["replace"])
+        assert temp_db_ops.write_stats[model.__tablename__]["written"] == 3
+        assert temp_db_ops.write_stats[model.__tablename__]["deleted"] == 2
+
+        # Unchanged rows keep the capture time of their last change
+        times = read_model_frame(temp_db_engine, model, model.gameweek == 2)["as_of_utc"]
+        assert (times == pd.Timestamp("2025-09-01 12:00:00")).sum() == 3
+
+    def test_unchanged_save_writes_nothing(self, temp_db_ops, raw_frames):
+        """Test that re-saving identical data with a new capture time writes no rows."""
+        model = models_raw.RawPlayerGameweekPerformance
+        temp_db_ops.write_mode = "upsert"
+        save(temp_db_ops, "save_raw_player_gameweek_performance", raw_frames[model])
+
+        refreshed = raw_frames[model].assign(as_of_utc="2025-09-01T12:00:00Z")
+        save(temp_db_ops, "save_raw_player_gameweek_performance", refreshed)
+
+        assert temp_db_ops.write_stats[model.__tablename__]["written"] == 0
+        assert temp_db_ops.write_stats[model.__tablename__]["deleted"] == 0
+
+    def test_picks_position_swap_and_odds_replace_whole_table(self, temp_db_ops, temp_db_engine):
+        """Test that keys leaving a gameweek (picks) or the table (odds) are removed as with replace."""
+        picks = pd.DataFrame(
+            {
+                "event": [5, 5, 5],
+                "player_id": [10, 11, 12],
+                "position": [1, 2, 3],
+                "is_captain": [True, False, False],
+                "is_vice_captain": [False, True, False],
+                "multiplier": [2, 1, 1],
+                "as_of_utc": "2025-09-01T12:00:00Z",
+            }
+        )
+        swapped = picks.assign(position=[1, 3, 2])
+        odds = pd.DataFrame(
+            {
+                "fixture_id": [1, 2, 3],
+                "match_date": "2025-08-16",
+                "home_team_id": [1, 2, 3],
+                "away_team_id": [4, 5, 6],
+                "B365H": [2.1, 1.5, 3.0],
+                "as_of_utc": "2025-09-01T12:00:00Z",
+            }
+        )
+        repriced = odds.iloc[1:].assign(B365H=[1.6, 3.0])
+
+        picks_key = ["event", "player_id", "position"]
+        results = {}
+        for mode in ("replace", "upsert"):
+            reset_tables(temp_db_engine)
+            temp_db_ops.write_mode = mode
+            save(temp_db_ops, "save_raw_my_picks", picks)
+            save(temp_db_ops, "save_raw_my_picks", swapped)
+            save(temp_db_ops, "save_raw_betting_odds", odds)
+            save(temp_db_ops, "save_raw_betting_odds", repriced)
+            results[mode] = (
+                stored(temp_db_ops, models_raw.RawMyPicks, picks_key),
+                stored(temp_db_ops, models_raw.RawBettingOdds, ["fixture_id"]),
+            )
+
+        for upserted, replaced in zip(results["upsert"], results["replace"], strict=True):
+            pd.testing.assert_frame_equal(upserted, replaced)
+        assert temp_db_ops.write_stats["raw_betting_odds"]["written"] == 1
+        assert temp_db_ops.write_stats["raw_betting_odds"]["deleted"] == 1
+
+    def test_write_mode_from_env(self, monkeypatch):
+        """Test that FPL_WRITE_MODE selects the mode and unknown values fall back to replace."""
+        monkeypatch.setenv("FPL_WRITE_MODE", "upsert")
+        assert operations.DatabaseOperations().write_mode == "upsert"
+        monkeypatch.setenv("FPL_WRITE_MODE", "merge")
+        assert operations.DatabaseOperations().write_mode == "replace"
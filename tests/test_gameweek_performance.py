@@ -0,0 +1,80 @@
+"""Parity tests for the vectorized gameweek performance processor."""
+
+import pandas as pd
+
+from fetchers.raw_processor import build_fixtures_lookup, process_raw_gameweek_performance
+from scripts.benchmarks.gameweek_performance import process_raw_gameweek_performance_rowwise
+from scripts.stub_fpl_api import SyntheticFPLData
+
+BOOTSTRAP = {
+    "elements": [
+        {"id": 1, "team": 1, "now_cost": 55},
+        {"id": 2, "team": 2, "now_cost": 60},
+        {"id": 3, "team": 3, "now_cost": 45},
+        {"id": 4, "team": 4, "now_cost": 70},
+    ]
+}
+FIXTURES = [
+    {"id": 10, "team_h": 1, "team_a": 2},
+    {"id": 11, "team_h": 4, "team_a": 3},
+    {"id": 12, "team_h": 2, "team_a": 4},
+]
+
+
+def assert_matches_rowwise(live, gameweek, bootstrap, fixtures):
+    fixtures_lookup = build_fixtures_lookup(fixtures)
+    vectorized = process_raw_gameweek_performance(live, gameweek, bootstrap, fixtures_lookup=fixtures_lookup)
+    rowwise = process_raw_gameweek_performance_rowwise(live, gameweek, bootstrap, fixtures_lookup)
+    pd.testing.assert_frame_equal(vectorized.drop(columns="as_of_utc"), rowwise.drop(columns="as_of_utc"))
+    return vectorized
+
+
+class TestGameweekPerformanceParity:
+    """Tests that the columnar processor reproduces the row-by-row output."""
+
+    def test_synthetic_season_matches(self):
+        """Test that every gameweek of a synthetic season gives the same table."""
+        data = SyntheticFPLData(n_players=60, current_gameweek=6)
+        bootstrap = data.bootstrap()
+        fixtures = data.fixtures()
+
+        for gameweek in range(1, 7):
+            df = assert_matches_rowwise(data.live(gameweek), gameweek, bootstrap, fixtures)
+            assert len(df) == 60
+
+    def test_double_gameweek_uses_first_fixture(self):
+        """Test that a player with two fixtures gets the opponent of the first one."""
+        live = {
+            "elements": [
+                {"id": 2, "stats": {"total_points": 8}, "explain": [{"fixture": 12}, {"fixture": 10}]},
+                {"id": 4, "stats": {"total_points": 3}, "explain": [{"fixture": 99}, {"fixture": 11}]},
+            ]
+        }
+
+        df = assert_matches_rowwise(live, 5, BOOTSTRAP, FIXTURES)
+
+        assert df["opponent_team"].tolist() == [4, 3]
+        assert df["was_home"].tolist() == [True, True]
+
+    def test_legacy_unknown_and_partial_rows_match(self):
+        """Test that legacy fixture formats, unknown players and sparse stats are handled the same."""
+        live = {
+            "elements": [
+                {"id": 1, "stats": {"minutes": 90, "influence": "12.4"}, "explain": [{"fixture": 10}]},
+                {"id": 3, "stats": {}, "explain": [{"fixture": {"opponent_team": 9, "is_home": False}}]},
+                {
+                    "id": 4,
+                    "stats": {"selected": 1200},
+                    "explain": [{"fixture": [{"opponent_team": 3, "is_home": True}]}],
+                },
+                {"id": 77, "stats": {"total_points": 1}, "explain": [{"fixture": 10}]},
+                {"id": 2, "stats": {"total_points": 2}, "explain": []},
+            ]
+        }
+
+        df = assert_matches_rowwise(live, 3, BOOTSTRAP, FIXTURES)
+
+        assert df["opponent_team"].tolist()[:3] == [2, 9, 3]
+        assert pd.isna(df.loc[3, "team_id"]) and pd.isna(df.loc[3, "opponent_team"])
+        assert df.loc[0, "influence"] == "12.4"
+        assert df.loc[1, "influence"] == ""
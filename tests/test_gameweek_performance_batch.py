@@ -0,0 +1,86 @@
+"""Tests for batched multi-gameweek performance processing and saving."""
+
+import contextlib
+import io
+
+import pandas as pd
+
+from fetchers.raw_processor import (
+    build_fixtures_lookup,
+    process_raw_gameweek_performance,
+    process_raw_gameweek_performance_batch,
+)
+from scripts.stub_fpl_api import SyntheticFPLData
+
+AS_OF = pd.Timestamp("2025-09-01T12:00:00Z")
+
+
+def quietly(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+class TestGameweekPerformanceBatch:
+    """Tests for process_raw_gameweek_performance_batch and multi-gameweek saves."""
+
+    def test_batch_matches_per_gameweek_frames(self):
+        """Test that the batch frame equals the per-gameweek frames concatenated in gameweek order."""
+        data = SyntheticFPLData(n_players=25, current_gameweek=4)
+        bootstrap = data.bootstrap()
+        fixtures_lookup = build_fixtures_lookup(data.fixtures())
+        live_by_gw = {gw: data.live(gw) for gw in (3, 1, 2)}
+
+        batch = quietly(
+            process_raw_gameweek_performance_batch,
+            live_by_gw,
+            bootstrap,
+            fixtures_lookup=fixtures_lookup,
+            as_of_utc=AS_OF,
+        )
+        expected = pd.concat(
+            [
+                quietly(
+                    process_raw_gameweek_performance, live_by_gw[gw], gw, bootstrap, fixtures_lookup=fixtures_lookup
+                )
+                for gw in (1, 2, 3)
+            ],
+            ignore_index=True,
+        )
+
+        pd.testing.assert_frame_equal(batch.drop(columns="as_of_utc"), expected.drop(columns="as_of_utc"))
+        assert (batch["as_of_utc"] == AS_OF).all()
+
+    def test_gameweeks_without_elements_are_skipped(self):
+        """Test that empty live payloads are skipped and an all-empty batch returns an empty DataFrame."""
+        data = SyntheticFPLData(n_players=10, current_gameweek=3)
+        bootstrap = data.bootstrap()
+
+        batch = quietly(
+            process_raw_gameweek_performance_batch,
+            {1: data.live(1), 2: {"elements": []}, 3: None},
+            bootstrap,
+            data.fixtures(),
+        )
+
+        assert set(batch["gameweek"]) == {1}
+        assert len(batch) == 10
+        assert quietly(process_raw_gameweek_performance_batch, {1: {}}, bootstrap).empty
+
+    def test_save_replaces_every_gameweek_in_batch(self, temp_db_ops):
+        """Test that saving a multi-gameweek frame replaces those gameweeks and leaves others alone."""
+        temp_db_ops.write_mode = "replace"
+        data = SyntheticFPLData(n_players=15, current_gameweek=4)
+        bootstrap = data.bootstrap()
+        first = quietly(process_raw_gameweek_performance_batch, {gw: data.live(gw) for gw in (1, 2, 3)}, bootstrap)
+        quietly(temp_db_ops.save_raw_player_gameweek_performance, first)
+
+        rerun = quietly(
+            process_raw_gameweek_performance_batch, {gw: data.live(gw) for gw in (2, 3)}, bootstrap, as_of_utc=AS_OF
+        )
+        quietly(temp_db_ops.save_raw_player_gameweek_performance, rerun)
+
+        stored = temp_db_ops.get_raw_player_gameweek_performance()
+        assert stored.groupby("gameweek").size().to_dict() == {1: 15, 2: 15, 3: 15}
+        rerun_rows = stored[stored["gameweek"].isin([2, 3])]
+        assert (rerun_rows["as_of_utc"] == AS_OF.tz_localize(None)).all()
+        assert (stored.loc[stored["gameweek"] == 1, "as_of_utc"] != AS_OF.tz_localize(None)).all()
@@ -0,0 +1,92 @@
+"""Tests for the on-disk conditional-GET cache."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fetchers import http_cache
+
+
+class _ValidatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b'{"elements": []}'
+    etag = '"v1"'
+    full_responses = 0
+
+    def do_GET(self):  # noqa: N802
+        cls = type(self)
+        if self.path.startswith("/etag") and self.headers.get("If-None-Match") == cls.etag:
+            self.send_response(304)
+            self.send_header("ETag", cls.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        cls.full_responses += 1
+        self.send_response(200)
+        if self.path.startswith("/etag"):
+            self.send_header("ETag", cls.etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(cls.body)))
+        self.end_headers()
+        self.wfile.write(cls.body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def local_server(tmp_path, monkeypatch):
+    """Serve JSON with and without validators; point the cache at a temp dir."""
+    monkeypatch.setattr(http_cache, "CACHE_DIR", tmp_path / "http_cache")
+    _ValidatorHandler.body = b'{"elements": []}'
+    _ValidatorHandler.full_responses = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ValidatorHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestConditionalGetCache:
+    """Tests for revalidation, 304 handling and change detection."""
+
+    def test_second_fetch_served_from_304(self, local_server):
+        """Test that a repeat fetch revalidates and serves the cached body."""
+        url = f"{local_server}/etag/bootstrap-static/"
+        before = http_cache.get_cache_stats()
+
+        body1, unchanged1 = http_cache.cached_get(url)
+        body2, unchanged2 = http_cache.cached_get(url)
+
+        after = http_cache.get_cache_stats()
+        assert body1 == body2 == _ValidatorHandler.body
+        assert not unchanged1
+        assert unchanged2
+        assert http_cache.was_unchanged(url)
+        assert _ValidatorHandler.full_responses == 1
+        assert after["hits"] - before["hits"] == 1
+        assert after["misses"] - before["misses"] == 1
+
+    def test_identical_body_without_validators_is_unchanged(self, local_server):
+        """Test that content hashing detects unchanged payloads when the server sends no validators."""
+        url = f"{local_server}/plain/fixtures/"
+
+        _, unchanged1 = http_cache.cached_get(url)
+        _, unchanged2 = http_cache.cached_get(url)
+
+        assert not unchanged1
+        assert unchanged2
+
+    def test_changed_body_is_reported(self, local_server):
+        """Test that a changed payload is served fresh and flagged as changed."""
+        url = f"{local_server}/plain/fixtures/"
+        http_cache.cached_get(url)
+
+        _ValidatorHandler.body = b'{"elements": [1]}'
+        body, unchanged = http_cache.cached_get(url)
+
+        assert body == b'{"elements": [1]}'
+        assert not unchanged
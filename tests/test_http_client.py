@@ -0,0 +1,67 @@
+"""Tests for the shared pooled HTTP client used by all fetchers."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fetchers.http_client import HTTPClient, http_get
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Serve a tiny keep-alive JSON endpoint on localhost."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHTTPClient:
+    """Tests for connection pooling and reuse counters."""
+
+    def test_sequential_requests_reuse_connection(self, local_server):
+        """Test that repeated requests to one host share a keep-alive connection."""
+        client = HTTPClient()
+        for _ in range(5):
+            response = client.get(f"{local_server}/api/bootstrap-static/")
+            assert response.status_code == 200
+
+        stats = client.connection_stats()
+        assert stats["requests"] == 5
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 4
+        client.close()
+
+    def test_stats_empty_before_first_request(self):
+        """Test that a fresh client reports zero counters."""
+        client = HTTPClient()
+        stats = client.connection_stats()
+        assert stats["requests"] == 0
+        assert stats["hosts"] == {}
+
+    def test_accept_encoding_negotiates_compression(self):
+        """Test that the session advertises gzip support."""
+        client = HTTPClient()
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+
+    def test_http_get_returns_bytes(self, local_server):
+        """Test that the module-level http_get returns the response body."""
+        assert http_get(f"{local_server}/api/fixtures/") == b'{"ok": true}'
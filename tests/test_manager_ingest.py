@@ -0,0 +1,80 @@
+"""Tests for league-scale manager ingestion against the stub FPL API."""
+
+import pytest
+from sqlalchemy import text
+
+from fetchers import fpl_api
+from fetchers.manager_ingest import fetch_league_standings, ingest_manager_history, ingest_manager_picks
+from scripts.stub_fpl_api import StubFPLAPIServer, SyntheticFPLData
+
+FAST = {"requests_per_second": 0, "max_concurrency": 16}
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Run a synthetic stub API with a 120-member league and point the fetchers at it."""
+    monkeypatch.setenv("FPL_RATE_LIMIT_RPS", "1000")
+    monkeypatch.setenv("FPL_RATE_LIMIT_BURST", "1000")
+    with StubFPLAPIServer(SyntheticFPLData(n_players=40, current_gameweek=4, league_size=120)) as server:
+        fpl_api.set_fpl_api_base_url(server.base_url)
+        yield server
+    fpl_api.set_fpl_api_base_url(None)
+
+
+class TestManagerIngest:
+    """Tests for bulk picks/summary ingestion, checkpoints and league paging."""
+
+    def test_league_ingestion_stores_compact_rows(self, stub_api, temp_db_ops, temp_db_engine):
+        """Test that every league member's picks and summary are stored for the gameweek."""
+        league = fetch_league_standings(7, **FAST)
+        manager_ids = league["manager_id"].tolist()
+
+        stats = ingest_manager_picks(manager_ids, [3], chunk_size=50, **FAST)
+
+        picks = temp_db_ops.get_raw_manager_picks(gameweek=3)
+        summary = temp_db_ops.get_raw_manager_gameweek_summary(gameweek=3)
+        assert len(league) == 120
+        assert stats == {"stored": 120, "skipped": 0, "failed": 0, "rows": 1800}
+        assert len(picks) == 1800
+        assert len(summary) == 120
+        wildcard_managers = set(summary.loc[summary["active_chip"] == "wildcard", "manager_id"])
+        assert wildcard_managers == {m for m in manager_ids if m % 5 == 0}
+
+        with temp_db_engine.connect() as conn:
+            ddl = conn.execute(text("SELECT sql FROM sqlite_master WHERE name = 'raw_manager_picks'")).scalar()
+        assert "WITHOUT ROWID" in ddl
+
+    def test_rerun_resumes_from_checkpoint(self, stub_api, temp_db_ops):
+        """Test that managers already stored for a gameweek are not fetched again."""
+        manager_ids = list(range(1, 81))
+        ingest_manager_picks(manager_ids[:30], [2], chunk_size=25, **FAST)
+        served = stub_api.stats["requests"]
+
+        stats = ingest_manager_picks(manager_ids, [2], chunk_size=25, **FAST)
+
+        assert stats["skipped"] == 30
+        assert stats["stored"] == 50
+        assert stub_api.stats["requests"] - served == 50
+        assert len(temp_db_ops.get_ingested_manager_ids(2)) == 80
+
+    def test_history_fills_past_gameweek_summaries(self, stub_api, temp_db_ops):
+        """Test that one history request per manager fills summaries for every gameweek."""
+        manager_ids = [10, 11, 12]
+
+        stats = ingest_manager_history(manager_ids, [1, 2, 3, 4], **FAST)
+        again = ingest_manager_history(manager_ids, [1, 2, 3, 4], **FAST)
+
+        summary = temp_db_ops.get_raw_manager_gameweek_summary()
+        assert stats["rows"] == 12
+        assert len(summary) == 12
+        assert summary.loc[summary["manager_id"] == 10, "active_chip"].dropna().tolist() == ["wildcard"]
+        assert again["skipped"] == 3
+        assert stub_api.stats["requests"] == 3
+
+    def test_max_managers_stops_paging(self, stub_api):
+        """Test that only the standings pages needed for max_managers are requested."""
+        league = fetch_league_standings(7, max_managers=60, **FAST)
+
+        assert len(league) == 60
+        assert league["rank"].tolist() == list(range(1, 61))
+        assert stub_api.stats["requests"] == 2
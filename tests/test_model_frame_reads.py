@@ -0,0 +1,88 @@
+"""Tests for Core select reads (read_model_frame) used by the DatabaseOperations getters."""
+
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+from sqlalchemy.inspection import inspect
+
+from db import models_raw
+from db.operations import read_model_frame
+from fetchers.raw_processor import (
+    process_all_raw_bootstrap_data,
+    process_player_gameweek_snapshot,
+    process_raw_fixtures,
+    process_raw_gameweek_performance_batch,
+)
+from scripts.stub_fpl_api import SyntheticFPLData
+
+MODELS = [
+    models_raw.RawPlayerBootstrap,
+    models_raw.RawTeamBootstrap,
+    models_raw.RawEventBootstrap,
+    models_raw.RawFixtures,
+    models_raw.RawGameSettings,
+    models_raw.RawElementTypes,
+    models_raw.RawPlayerGameweekPerformance,
+    models_raw.RawPlayerGameweekSnapshot,
+]
+
+
+@pytest.fixture
+def populated(temp_db_ops):
+    """Session factory of the temp_db_ops database filled with a synthetic season."""
+    data = SyntheticFPLData(n_players=60, current_gameweek=4)
+    bootstrap = data.bootstrap()
+    with contextlib.redirect_stdout(io.StringIO()):
+        temp_db_ops.save_all_raw_data(process_all_raw_bootstrap_data(bootstrap))
+        temp_db_ops.save_raw_fixtures(process_raw_fixtures(data.fixtures()))
+        live_by_gw = {gw: data.live(gw) for gw in range(1, 5)}
+        temp_db_ops.save_raw_player_gameweek_performance(process_raw_gameweek_performance_batch(live_by_gw, bootstrap))
+        for gameweek in (3, 4):
+            temp_db_ops.save_raw_player_gameweek_snapshot(process_player_gameweek_snapshot(bootstrap, gameweek))
+    return temp_db_ops.session_factory
+
+
+def orm_frame(session, model) -> pd.DataFrame:
+    """Frame built by hydrating ORM instances, the reference for read_model_frame."""
+    attributes = [attr.key for attr in inspect(model).column_attrs]
+    return pd.DataFrame([{key: getattr(obj, key) for key in attributes} for obj in session.query(model).all()])
+
+
+class TestModelFrameReads:
+    """Tests for read_model_frame and the getters built on it."""
+
+    @pytest.mark.parametrize("model", MODELS, ids=lambda model: model.__tablename__)
+    def test_matches_orm_hydration(self, populated, model):
+        """Test that the Core read returns the same values and dtypes as ORM hydration."""
+        with populated() as session:
+            expected = orm_frame(session, model)
+            result = read_model_frame(session.connection(), model)
+
+        assert not result.empty
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_criteria_and_empty_result(self, populated):
+        """Test that WHERE criteria apply and no match gives an empty frame without columns."""
+        model = models_raw.RawPlayerGameweekPerformance
+        with populated() as session:
+            gameweek_two = read_model_frame(session.connection(), model, model.gameweek == 2)
+            nothing = read_model_frame(session.connection(), model, model.gameweek == 99)
+
+        assert set(gameweek_two["gameweek"]) == {2}
+        assert len(gameweek_two) == 60
+        assert nothing.empty and len(nothing.columns) == 0
+
+    def test_getters_create_no_orm_instances(self, populated, temp_db_ops, monkeypatch):
+        """Test that getters read through Core selects rather than loading model instances."""
+        loaded = []
+        for model in MODELS:
+            monkeypatch.setattr(model, "__init__", lambda self, *args, **kwargs: loaded.append(type(self)))
+
+        players = temp_db_ops.get_raw_players_bootstrap()
+        snapshots = temp_db_ops.get_player_snapshots_range(3, 4)
+        live = temp_db_ops.get_gameweek_live_data(gameweek=1)
+
+        assert len(players) == 60 and len(snapshots) == 120 and set(live["event"]) == {1}
+        assert loaded == []
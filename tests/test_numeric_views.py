@@ -0,0 +1,118 @@
+"""Tests for typed numeric reads of string-encoded FPL stats."""
+
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from db.models_raw import RawPlayerBootstrap
+from db.numeric_views import NUMERIC_TEXT_COLUMNS, create_numeric_views, read_numeric_frame
+from fetchers.derived_processor import DerivedDataProcessor
+from fetchers.raw_processor import (
+    process_all_raw_bootstrap_data,
+    process_raw_gameweek_performance,
+    process_raw_players_bootstrap,
+)
+from scripts.stub_fpl_api import SyntheticFPLData
+
+
+@pytest.fixture
+def temp_ops(temp_db_ops, temp_db_engine):
+    """temp_db_ops and its engine, with the numeric views created."""
+    create_numeric_views(temp_db_engine)
+    return temp_db_ops, temp_db_engine
+
+
+def save_synthetic_players(ops, blank_player: bool = True) -> dict:
+    """Store synthetic bootstrap players, optionally with one player's form blanked out."""
+    bootstrap = SyntheticFPLData(n_players=30, current_gameweek=3).bootstrap()
+    if blank_player:
+        bootstrap["elements"][0]["form"] = ""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ops.save_raw_players_bootstrap(process_raw_players_bootstrap(bootstrap))
+    return bootstrap
+
+
+class TestNumericViews:
+    """Tests for the numeric views and numeric getters."""
+
+    def test_view_casts_string_stats(self, temp_ops):
+        """Test that the players view returns REAL values and NULL for empty strings."""
+        ops, engine = temp_ops
+        bootstrap = save_synthetic_players(ops)
+
+        with engine.connect() as connection:
+            rows = connection.execute(
+                text("SELECT id, form, selected_by_percent FROM raw_players_bootstrap_numeric ORDER BY id")
+            ).all()
+
+        assert rows[0].form is None
+        assert isinstance(rows[1].form, float)
+        assert rows[1].selected_by_percent == float(bootstrap["elements"][1]["selected_by_percent"])
+
+    def test_numeric_getter_matches_parsed_strings(self, temp_ops):
+        """Test that numeric=True returns the same values as parsing the string read with to_numeric."""
+        ops, _ = temp_ops
+        save_synthetic_players(ops)
+
+        strings = ops.get_raw_players_bootstrap().sort_values("player_id", ignore_index=True)
+        numeric = ops.get_raw_players_bootstrap(numeric=True).sort_values("player_id", ignore_index=True)
+
+        assert list(numeric.columns) == list(strings.columns)
+        for column in NUMERIC_TEXT_COLUMNS[RawPlayerBootstrap]:
+            assert numeric[column].dtype == "float64", column
+            expected = pd.to_numeric(strings[column], errors="coerce")
+            pd.testing.assert_series_equal(numeric[column], expected, check_names=False)
+        pd.testing.assert_series_equal(numeric["web_name"], strings["web_name"])
+
+    def test_performance_getter_filters_and_casts(self, temp_ops):
+        """Test that numeric performance reads keep the gameweek filter and return float stats."""
+        ops, _ = temp_ops
+        data = SyntheticFPLData(n_players=20, current_gameweek=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for gameweek in (1, 2):
+                ops.save_raw_player_gameweek_performance(
+                    process_raw_gameweek_performance(data.live(gameweek), gameweek, data.bootstrap())
+                )
+
+        performance = ops.get_raw_player_gameweek_performance(gameweek=2, numeric=True)
+
+        assert set(performance["gameweek"]) == {2}
+        assert len(performance) == 20
+        assert performance["expected_goals"].dtype == "float64"
+        assert performance["ict_index"].dtype == "float64"
+
+    def test_xg_rates_use_numeric_read(self, temp_ops):
+        """Test that xG90/xA90 are computed from the numeric read for players with minutes."""
+        ops, engine = temp_ops
+        save_synthetic_players(ops, blank_player=False)
+        players = read_numeric_frame(engine, RawPlayerBootstrap, RawPlayerBootstrap.minutes > 0)
+
+        rates = ops.get_player_xg_xa_rates().sort_values("id", ignore_index=True)
+        players = players.sort_values("player_id", ignore_index=True)
+
+        assert len(rates) == len(players)
+        expected = players["expected_goals"] * 90.0 / players["minutes"]
+        pd.testing.assert_series_equal(rates["xG90"], expected, check_names=False)
+
+    def test_derived_processor_reads_numeric_players(self, temp_ops):
+        """Test that derived player metrics get float stats and survive a blank form value."""
+        ops, engine = temp_ops
+        bootstrap = SyntheticFPLData(n_players=30, current_gameweek=3).bootstrap()
+        bootstrap["elements"][0]["form"] = ""
+        with contextlib.redirect_stdout(io.StringIO()):
+            ops.save_all_raw_data(process_all_raw_bootstrap_data(bootstrap))
+
+        processor = DerivedDataProcessor()
+        processor.session.close()
+        processor.session = sessionmaker(bind=engine)()
+        raw_data = processor._load_raw_data()
+        metrics = processor._process_player_metrics(raw_data)
+
+        assert raw_data["players"]["form"].dtype == "float64"
+        assert raw_data["players"]["selected_by_percent"].dtype == "float64"
+        assert len(metrics) == 30
+        assert metrics.loc[metrics["player_id"] == bootstrap["elements"][0]["id"], "form_per_million"].item() == 0.0
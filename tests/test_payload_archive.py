@@ -0,0 +1,105 @@
+"""Tests for the content-addressed payload archive and offline replay."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fetchers import payload_archive
+from fetchers.http_client import http_get
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests_served = 0
+
+    def do_GET(self):  # noqa: N802
+        type(self).requests_served += 1
+        body = f'{{"path": "{self.path}"}}'.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Serve small JSON payloads on localhost and count requests."""
+    _CountingHandler.requests_served = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestPayloadArchive:
+    """Tests for recording, deduplication and replay of fetched payloads."""
+
+    def test_fetches_are_recorded_in_run_manifest(self, local_server):
+        """Test that every fetched payload is archived under the current run."""
+        http_get(f"{local_server}/event/1/live/")
+        http_get(f"{local_server}/fixtures/")
+
+        run_id = payload_archive.get_run_id()
+        assert payload_archive.list_runs() == [run_id]
+        objects = list((payload_archive.ARCHIVE_DIR / "objects").rglob("*.gz"))
+        assert len(objects) == 2
+
+    def test_identical_payloads_stored_once(self):
+        """Test that archiving the same body twice stores a single object."""
+        sha1 = payload_archive.archive_payload("http://example/a", b'{"same": true}')
+        sha2 = payload_archive.archive_payload("http://example/b", b'{"same": true}')
+
+        assert sha1 == sha2
+        assert len(list((payload_archive.ARCHIVE_DIR / "objects").rglob("*.gz"))) == 1
+
+    def test_replay_serves_archive_without_network(self, local_server):
+        """Test that a replayed run returns the recorded bodies and makes no requests."""
+        url = f"{local_server}/bootstrap-static/"
+        recorded = http_get(url)
+        run_id = payload_archive.get_run_id()
+        served_before = _CountingHandler.requests_served
+
+        payload_archive.start_replay(run_id)
+        try:
+            replayed = http_get(url)
+            with pytest.raises(payload_archive.ReplayError):
+                http_get(f"{local_server}/not-recorded/")
+        finally:
+            payload_archive.stop_replay()
+
+        assert replayed == recorded
+        assert _CountingHandler.requests_served == served_before
+
+    def test_manifest_appends_one_line_per_payload(self):
+        """Test that the run manifest grows by a line per payload and the latest line for a key wins."""
+        payload_archive.archive_payload("http://example/a", b'{"v": 1}')
+        payload_archive.archive_payload("http://example/b", b'{"v": 2}')
+        payload_archive.archive_payload("http://example/a", b'{"v": 3}')
+        run_id = payload_archive.get_run_id()
+
+        lines = (payload_archive.ARCHIVE_DIR / "runs" / f"{run_id}.jsonl").read_text().splitlines()
+        assert len(lines) == 4
+        manifest = payload_archive.start_replay(run_id)
+        try:
+            assert payload_archive.replay_payload("http://example/a") == b'{"v": 3}'
+        finally:
+            payload_archive.stop_replay()
+        assert manifest["run_id"] == run_id and len(manifest["entries"]) == 2
+
+    def test_secret_params_excluded_from_key(self):
+        """Test that API keys never appear in manifest keys."""
+        key = payload_archive.request_key("https://api.example/odds", {"apiKey": "secret", "regions": "uk"})
+
+        assert key == "https://api.example/odds?regions=uk"
+
+    def test_unknown_run_raises(self):
+        """Test that replaying a missing run fails clearly."""
+        with pytest.raises(payload_archive.ReplayError):
+            payload_archive.start_replay("does-not-exist")
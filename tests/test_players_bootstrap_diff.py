@@ -0,0 +1,111 @@
+"""Tests for the diff-based raw_players_bootstrap writer and its change log."""
+
+import contextlib
+import copy
+import io
+
+import pandas as pd
+
+from db import models_raw
+from db.operations import diff_model_rows
+from fetchers.raw_processor import process_raw_players_bootstrap
+from scripts.stub_fpl_api import SyntheticFPLData
+
+FIRST_RUN = pd.Timestamp("2025-08-15T10:00:00Z")
+SECOND_RUN = pd.Timestamp("2025-08-16T10:00:00Z")
+
+
+def players_frame(bootstrap: dict, as_of_utc: pd.Timestamp) -> pd.DataFrame:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return process_raw_players_bootstrap(bootstrap, as_of_utc=as_of_utc)
+
+
+class TestPlayersBootstrapDiff:
+    """Tests for incremental players bootstrap saves."""
+
+    def test_unchanged_refresh_writes_nothing(self, temp_db_ops):
+        """Test that re-saving the same players (new as_of_utc only) updates no rows and logs no changes."""
+        bootstrap = SyntheticFPLData(n_players=40).bootstrap()
+
+        first = temp_db_ops.save_raw_players_bootstrap(players_frame(bootstrap, FIRST_RUN))
+        second = temp_db_ops.save_raw_players_bootstrap(players_frame(bootstrap, SECOND_RUN))
+
+        assert first == {"inserted": 40, "updated": 0, "deleted": 0, "unchanged": 0, "changes": 0}
+        assert second == {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 40, "changes": 0}
+        stored = temp_db_ops.get_raw_players_bootstrap()
+        assert (stored["as_of_utc"] == FIRST_RUN.tz_localize(None)).all()
+        assert temp_db_ops.get_raw_player_bootstrap_changes().empty
+
+    def test_changed_fields_are_updated_and_logged(self, temp_db_ops):
+        """Test that price and news changes update only those players and are logged field by field."""
+        bootstrap = SyntheticFPLData(n_players=40).bootstrap()
+        temp_db_ops.save_raw_players_bootstrap(players_frame(bootstrap, FIRST_RUN))
+        refreshed = copy.deepcopy(bootstrap)
+        price_player, news_player = refreshed["elements"][0], refreshed["elements"][1]
+        old_cost = price_player["now_cost"]
+        old_chance = news_player["chance_of_playing_next_round"]
+        price_player["now_cost"] = old_cost + 1
+        news_player.update({"news": "Hamstring injury", "status": "d", "chance_of_playing_next_round": 75})
+
+        result = temp_db_ops.save_raw_players_bootstrap(players_frame(refreshed, SECOND_RUN))
+
+        assert result["updated"] == 2
+        assert result["unchanged"] == 38
+        stored = temp_db_ops.get_raw_players_bootstrap().set_index("player_id")
+        assert stored.loc[price_player["id"], "now_cost"] == old_cost + 1
+        assert stored.loc[news_player["id"], "news"] == "Hamstring injury"
+        assert stored.loc[news_player["id"], "as_of_utc"] == SECOND_RUN.tz_localize(None)
+
+        changes = temp_db_ops.get_raw_player_bootstrap_changes()
+        logged = set(
+            zip(changes["player_id"], changes["field"], changes["old_value"], changes["new_value"], strict=True)
+        )
+        assert (price_player["id"], "now_cost", str(old_cost), str(old_cost + 1)) in logged
+        assert (news_player["id"], "status", "a", "d") in logged
+        old_chance_text = None if old_chance is None else str(float(old_chance))
+        assert (news_player["id"], "chance_of_playing_next_round", old_chance_text, "75.0") in logged
+        assert (changes["as_of_utc"] == SECOND_RUN.tz_localize(None)).all()
+
+        news_only = temp_db_ops.get_raw_player_bootstrap_changes(fields=["news"])
+        assert news_only["player_id"].tolist() == [news_player["id"]]
+
+    def test_new_and_removed_players(self, temp_db_ops):
+        """Test that players missing from the bootstrap are deleted and new ones inserted."""
+        bootstrap = SyntheticFPLData(n_players=40).bootstrap()
+        temp_db_ops.save_raw_players_bootstrap(players_frame(bootstrap, FIRST_RUN))
+        refreshed = copy.deepcopy(bootstrap)
+        removed = refreshed["elements"].pop(0)
+        added = copy.deepcopy(refreshed["elements"][0])
+        added.update({"id": 9999, "code": 9999, "web_name": "Newcomer"})
+        refreshed["elements"].append(added)
+
+        result = temp_db_ops.save_raw_players_bootstrap(players_frame(refreshed, SECOND_RUN))
+
+        assert result == {"inserted": 1, "updated": 0, "deleted": 1, "unchanged": 39, "changes": 0}
+        stored_ids = set(temp_db_ops.get_raw_players_bootstrap()["player_id"])
+        assert 9999 in stored_ids
+        assert removed["id"] not in stored_ids
+
+    def test_diff_treats_stored_and_incoming_dtypes_alike(self):
+        """Test that nullable, categorical and tz-aware incoming values match their stored equivalents."""
+        model = models_raw.RawPlayerBootstrapChange
+        existing = pd.DataFrame(
+            {"id": [1, 2], "player_id": [10, 11], "field": ["now_cost", None], "old_value": ["5", None]}
+        ).assign(new_value=None, as_of_utc=pd.Timestamp("2025-08-15 10:00:00"))
+        incoming = pd.DataFrame(
+            {
+                "id": pd.array([1, 2], dtype="Int64"),
+                "player_id": pd.array([10, 12], dtype="Int64"),
+                "field": pd.Categorical(["now_cost", None]),
+                "old_value": ["5", None],
+                "as_of_utc": pd.Timestamp("2025-08-16T10:00:00Z"),
+            }
+        )
+
+        diff = diff_model_rows(model, existing, incoming, key="id")
+
+        assert diff["updated"] == [2]
+        assert diff["inserted"] == [] and diff["deleted"] == []
+        assert diff["changes"][["id", "field", "old_value", "new_value"]].values.tolist() == [
+            [2, "player_id", "11", "12"]
+        ]
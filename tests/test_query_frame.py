@@ -0,0 +1,98 @@
+"""Tests for DatabaseOperations.query_frame and the client history queries built on it."""
+
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from client.fpl_data_client import FPLDataClient
+from db import models_raw, operations
+from fetchers.raw_processor import process_player_gameweek_snapshot, process_raw_gameweek_performance_batch
+from scripts.stub_fpl_api import SyntheticFPLData
+
+
+@pytest.fixture
+def season(temp_db_ops, temp_db_engine):
+    """Client and captured SQL statements over the temp_db_ops database filled with synthetic history."""
+    ops = temp_db_ops
+    data = SyntheticFPLData(n_players=20, current_gameweek=5)
+    bootstrap = data.bootstrap()
+    picks = pd.DataFrame(
+        {
+            "event": [gw for gw in range(1, 6) for _ in range(3)],
+            "player_id": [player for _ in range(1, 6) for player in (1, 2, 3)],
+            "position": [position for _ in range(1, 6) for position in (3, 1, 2)],
+            "is_captain": False,
+            "is_vice_captain": False,
+            "multiplier": 1,
+            "chip_used": [chip for chip in (None, "wildcard", None, "bboost", None) for _ in range(3)],
+            "as_of_utc": "2025-09-01T12:00:00Z",
+        }
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        live_by_gw = {gw: data.live(gw) for gw in range(1, 6)}
+        ops.save_raw_player_gameweek_performance(process_raw_gameweek_performance_batch(live_by_gw, bootstrap))
+        for gameweek in range(1, 6):
+            snapshot = process_player_gameweek_snapshot(bootstrap, gameweek, is_backfilled=gameweek < 3)
+            ops.save_raw_player_gameweek_snapshot(snapshot)
+            ops.save_raw_my_picks(picks[picks["event"] == gameweek])
+
+    statements = []
+    event.listen(temp_db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return FPLDataClient(auto_init=False), statements
+
+
+class TestQueryFrame:
+    """Tests for SQL pushdown of client history filters."""
+
+    def test_filters_ordering_and_projection_compiled_into_sql(self, season):
+        """Test that player, gameweek range, ordering and columns are part of the SELECT."""
+        client, statements = season
+
+        history = client.get_player_gameweek_history(
+            player_id=7, start_gw=2, end_gw=4, columns=["player_id", "gameweek", "total_points"]
+        )
+
+        assert list(history.columns) == ["player_id", "gameweek", "total_points"]
+        assert history["gameweek"].tolist() == [2, 3, 4] and set(history["player_id"]) == {7}
+        sql = statements[-1]
+        assert "WHERE" in sql and "ORDER BY" in sql
+        assert "gameweek >=" in sql and "gameweek <=" in sql and "player_id =" in sql
+        assert "minutes" not in sql
+
+    def test_matches_previous_pandas_filtering(self, season):
+        """Test that history queries return the rows the load-then-filter implementation returned."""
+        client, _ = season
+        ops = operations.DatabaseOperations()
+
+        performance = ops.get_raw_player_gameweek_performance()
+        expected = performance[performance["gameweek"].between(2, 4)].sort_values(["player_id", "gameweek"])
+        pd.testing.assert_frame_equal(
+            client.get_player_gameweek_history(start_gw=2, end_gw=4), expected.reset_index(drop=True)
+        )
+
+        snapshots = ops.get_player_snapshots_range(1, 5, include_backfilled=False)
+        expected = snapshots[snapshots["player_id"] == 3].sort_values(["player_id", "gameweek"])
+        result = client.get_player_snapshots_history(1, 5, player_id=3, include_backfilled=False)
+        pd.testing.assert_frame_equal(result, expected.reset_index(drop=True))
+        assert result["gameweek"].tolist() == [3, 4, 5]
+
+        picks = client.get_my_picks_history(start_gw=2)
+        assert picks[["event", "position"]].values.tolist() == [[gw, pos] for gw in range(2, 6) for pos in (1, 2, 3)]
+
+    def test_chip_usage_reads_one_row_per_gameweek(self, season):
+        """Test that chip usage selects distinct gameweek/chip pairs in SQL."""
+        client, statements = season
+
+        chips = client.get_my_chip_usage(start_gw=2, end_gw=4)
+
+        assert chips["gameweek"].tolist() == [2, 3, 4]
+        assert chips["chip_used"].tolist() == ["wildcard", None, "bboost"]
+        assert "SELECT DISTINCT" in statements[-1]
+
+    def test_unknown_column_rejected(self, season):
+        """Test that names outside the model raise instead of being silently ignored."""
+        with pytest.raises(ValueError, match="Unknown columns"):
+            operations.DatabaseOperations().query_frame(models_raw.RawMyPicks, ranges={"gameweek": (1, 2)})
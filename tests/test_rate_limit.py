@@ -0,0 +1,122 @@
+"""Tests for the adaptive per-host rate limiter and circuit breaker."""
+
+import time
+
+import pytest
+import requests
+
+from fetchers.http_client import http_get, http_get_response
+from fetchers.rate_limit import CircuitOpenError, HostRateLimiter, get_rate_limiter_stats, parse_retry_after
+from scripts.stub_fpl_api import StubFPLAPIServer, SyntheticFPLData
+
+
+@pytest.fixture
+def stub_api():
+    """Run a small synthetic stub API."""
+    with StubFPLAPIServer(SyntheticFPLData(n_players=20), seed=1) as server:
+        yield server
+
+
+class TestHostRateLimiter:
+    """Tests for the token bucket and adaptive rate."""
+
+    def test_bucket_spaces_requests_after_burst(self):
+        """Test that requests beyond the burst are spaced at the configured rate."""
+        limiter = HostRateLimiter("example", rate=20, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+
+        assert time.monotonic() - start >= 0.15
+        assert limiter.stats()["requests"] == 5
+
+    def test_rate_halves_on_throttle_and_recovers(self):
+        """Test multiplicative decrease on 429 and additive increase on success."""
+        limiter = HostRateLimiter("example", rate=8, burst=8)
+        limiter.record_failure(429)
+        limiter.record_failure(503)
+        assert limiter.rate == 2
+
+        limiter.record_success()
+        assert limiter.rate == 3
+        stats = limiter.stats()
+        assert stats["throttled"] == 1
+        assert stats["server_errors"] == 1
+        assert stats["consecutive_failures"] == 0
+
+    def test_parse_retry_after(self):
+        """Test that both delta-seconds and HTTP-date Retry-After values are understood."""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestHttpGetWithLimiter:
+    """Tests for Retry-After handling and the circuit breaker over HTTP."""
+
+    def test_retry_after_is_honoured(self, stub_api):
+        """Test that a 429 with Retry-After delays the retry and is recorded in metrics."""
+        stub_api.rate_limit_rate = 1.0
+        stub_api.retry_after = 1
+        url = f"{stub_api.base_url}/fixtures/"
+
+        with pytest.raises(requests.HTTPError):
+            http_get_response(url, retries=1)
+
+        stub_api.rate_limit_rate = 0.0
+        start = time.monotonic()
+        body = http_get(url, retries=1)
+
+        assert body
+        assert time.monotonic() - start >= 0.9
+        host_stats = next(iter(get_rate_limiter_stats().values()))
+        assert host_stats["throttled"] == 1
+        assert host_stats["state"] == "closed"
+
+    def test_long_retry_after_fails_without_sleeping(self, stub_api, monkeypatch):
+        """Test that a Retry-After beyond FPL_MAX_RETRY_AFTER raises before any sleep or retry."""
+        monkeypatch.setenv("FPL_MAX_RETRY_AFTER", "60")
+        stub_api.rate_limit_rate = 1.0
+        stub_api.retry_after = 3600
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+
+        with pytest.raises(CircuitOpenError, match="3600s"):
+            http_get_response(f"{stub_api.base_url}/fixtures/", retries=3)
+
+        assert sleeps == []
+        assert stub_api.stats["requests"] == 1
+        assert HostRateLimiter("example", max_retry_after=60).backoff_delay(0, 3600) == 60
+
+    def test_circuit_opens_and_fails_fast(self, stub_api, monkeypatch):
+        """Test that repeated 5xx open the circuit and later calls fail without a request."""
+        monkeypatch.setenv("FPL_CIRCUIT_FAILURES", "2")
+        monkeypatch.setenv("FPL_CIRCUIT_COOLDOWN", "60")
+        stub_api.error_rate = 1.0
+        url = f"{stub_api.base_url}/fixtures/"
+
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                http_get_response(url, retries=1)
+        served = stub_api.stats["requests"]
+
+        start = time.monotonic()
+        with pytest.raises(CircuitOpenError):
+            http_get_response(url, retries=3)
+
+        assert time.monotonic() - start < 0.5
+        assert stub_api.stats["requests"] == served
+        host_stats = next(iter(get_rate_limiter_stats().values()))
+        assert host_stats["state"] == "open"
+        assert host_stats["circuit_opens"] == 1
+        assert host_stats["rejected"] == 1
+
+    def test_client_errors_are_not_retried(self, stub_api):
+        """Test that a 404 raises immediately without retries or limiter penalties."""
+        with pytest.raises(requests.HTTPError):
+            http_get_response(f"{stub_api.base_url}/unknown/", retries=3)
+
+        assert stub_api.stats["requests"] == 1
+        host_stats = next(iter(get_rate_limiter_stats().values()))
+        assert host_stats["consecutive_failures"] == 0
@@ -0,0 +1,57 @@
+"""Tests for raw API dump persistence and its backup handling."""
+
+import gzip
+
+from fetchers.fpl_api import save_raw_dump
+from safety.backup import DataSafetyManager
+from utils import loads_json
+
+PAYLOAD = b'{"elements":[{"id":1,"web_name":"Salah"}],"teams":[]}'
+
+
+class TestRawDump:
+    """Tests for byte-for-byte and gzip raw dumps."""
+
+    def test_plain_dump_is_byte_for_byte(self, tmp_path, monkeypatch):
+        """Test that the payload is written exactly as received."""
+        monkeypatch.delenv("FPL_RAW_DUMP_GZIP", raising=False)
+        path = save_raw_dump("fpl_raw_bootstrap", PAYLOAD, data_dir=str(tmp_path))
+
+        assert path.name == "fpl_raw_bootstrap.json"
+        assert path.read_bytes() == PAYLOAD
+
+    def test_gzip_dump_replaces_plain_copy(self, tmp_path, monkeypatch):
+        """Test that gzip mode writes .json.gz and removes the stale plain dump."""
+        save_raw_dump("fpl_raw_bootstrap", PAYLOAD, data_dir=str(tmp_path))
+        monkeypatch.setenv("FPL_RAW_DUMP_GZIP", "1")
+        path = save_raw_dump("fpl_raw_bootstrap", PAYLOAD, data_dir=str(tmp_path))
+
+        assert path.name == "fpl_raw_bootstrap.json.gz"
+        assert gzip.decompress(path.read_bytes()) == PAYLOAD
+        assert not (tmp_path / "fpl_raw_bootstrap.json").exists()
+
+    def test_loads_json_parses_bytes(self):
+        """Test that the JSON decoder accepts raw response bytes."""
+        assert loads_json(PAYLOAD)["elements"][0]["web_name"] == "Salah"
+
+
+class TestCompressedDumpBackups:
+    """Tests that safety backups handle gzip-compressed dumps."""
+
+    def test_backup_summary_and_restore(self, tmp_path, monkeypatch):
+        """Test that .json.gz dumps are backed up, summarised and restored."""
+        monkeypatch.setenv("FPL_RAW_DUMP_GZIP", "1")
+        save_raw_dump("fpl_raw_bootstrap", PAYLOAD, data_dir=str(tmp_path))
+        manager = DataSafetyManager(data_dir=str(tmp_path), backup_dir=str(tmp_path / "backups"))
+
+        backups = manager.create_full_backup("test")
+        backup_path = backups["fpl_raw_bootstrap.json.gz"]
+        summary = manager.get_data_summary()["fpl_raw_bootstrap.json.gz"]
+
+        assert backup_path.name.startswith("fpl_raw_bootstrap_test_")
+        assert backup_path.name.endswith(".json.gz")
+        assert summary["structure"] == ["elements", "teams"]
+
+        (tmp_path / "fpl_raw_bootstrap.json.gz").unlink()
+        assert manager.emergency_restore("fpl_raw_bootstrap.json.gz")
+        assert gzip.decompress((tmp_path / "fpl_raw_bootstrap.json.gz").read_bytes()) == PAYLOAD
@@ -16,6 +16,7 @@ import pandas as pd
 import pytest
 
 from client.fpl_data_client import FPLDataClient
+from db.team_aliases import build_team_alias_index, resolve_team_ids
 from fetchers.external import fetch_realtime_betting_odds
 from fetchers.raw_processor import process_raw_betting_odds
 from validation.raw_schemas import RawBettingOddsSchema
@@ -62,8 +63,9 @@ class TestRealtimeOddsFetching:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = bytes(str(mock_response_data).replace("'", '"'), "utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -97,10 +99,11 @@ class TestRealtimeOddsFetching:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps(mock_response_data).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -112,8 +115,8 @@ class TestRealtimeOddsFetching:
             for col in expected_columns:
                 assert col in result.columns, f"Missing expected column: {col}"
 
-    def test_fetch_realtime_odds_normalizes_team_names(self):
-        """Test that team names are normalized correctly."""
+    def test_fetch_realtime_odds_team_names_resolve_via_alias_index(self):
+        """Test that The Odds API team names are kept as-is and resolve through the team alias index."""
         mock_response_data = [
             {
                 "home_team": "Brighton and Hove Albion",
@@ -137,10 +140,11 @@ class TestRealtimeOddsFetching:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps(mock_response_data).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -148,13 +152,17 @@ class TestRealtimeOddsFetching:
             result = fetch_realtime_betting_odds(api_key="test_key")
 
             if not result.empty:
-                # Should normalize to football-data.co.uk format
-                assert result.iloc[0]["HomeTeam"] == "Brighton", "Should normalize 'Brighton and Hove Albion'"
-                assert result.iloc[0]["AwayTeam"] == "Leeds", "Should normalize 'Leeds United'"
+                assert result.iloc[0]["HomeTeam"] == "Brighton and Hove Albion"
+                assert result.iloc[0]["AwayTeam"] == "Leeds United"
+
+                teams = pd.DataFrame({"team_id": [6, 11], "name": ["Brighton", "Leeds"], "short_name": ["BHA", "LEE"]})
+                alias_index = build_team_alias_index(teams)
+                assert resolve_team_ids(result["HomeTeam"], alias_index).tolist() == [6]
+                assert resolve_team_ids(result["AwayTeam"], alias_index).tolist() == [11]
 
     def test_fetch_realtime_odds_handles_http_errors_gracefully(self):
         """Test that HTTP errors are handled gracefully."""
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import requests
 
             mock_get.side_effect = requests.RequestException("Network error")
@@ -201,10 +209,11 @@ class TestRealtimeOddsFetching:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps(mock_response_data).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -255,10 +264,11 @@ class TestRealtimeOddsProcessing:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps(mock_response_data).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -374,10 +384,11 @@ class TestRealtimeOddsProcessing:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps(mock_response_data).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -421,10 +432,11 @@ class TestRealtimeOddsProcessing:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps(mock_response_data).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -471,10 +483,11 @@ class TestRealtimeOddsProcessing:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps(mock_response_data).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -542,7 +555,7 @@ class TestRealtimeOddsIntegration:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             from db.operations import db_ops
@@ -550,6 +563,7 @@ class TestRealtimeOddsIntegration:
             from fetchers.raw_processor import process_raw_betting_odds
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps(mock_response_data).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -616,7 +630,7 @@ class TestRealtimeOddsIntegration:
             }
         ]
 
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             from db.operations import db_ops
@@ -624,6 +638,7 @@ class TestRealtimeOddsIntegration:
             from fetchers.raw_processor import process_raw_betting_odds
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps(mock_response_data).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -650,7 +665,7 @@ class TestRealtimeOddsErrorHandling:
     def test_fetch_with_invalid_api_key_returns_empty(self):
         """Test that invalid API key returns empty DataFrame."""
         # Mock API error response (401 or similar)
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import requests
 
             mock_get.side_effect = requests.RequestException("Invalid API key")
@@ -661,8 +676,9 @@ class TestRealtimeOddsErrorHandling:
 
     def test_fetch_handles_json_decode_errors(self):
         """Test that JSON decode errors are handled gracefully."""
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = b"Invalid JSON {"
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -672,10 +688,11 @@ class TestRealtimeOddsErrorHandling:
 
     def test_fetch_handles_empty_response(self):
         """Test that empty API response is handled gracefully."""
-        with patch("fetchers.external.requests.get") as mock_get:
+        with patch("fetchers.http_client.HTTPClient.get") as mock_get:
             import json
 
             mock_response = Mock()
+            mock_response.status_code = 200
             mock_response.content = json.dumps([]).encode("utf-8")
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -0,0 +1,50 @@
+"""Tests for the run-scoped bootstrap/fixtures context."""
+
+from fetchers import run_context
+from fetchers.raw_processor import build_fixtures_lookup, process_raw_gameweek_performance
+from fetchers.run_context import RunContext
+
+FIXTURES = [
+    {"id": 1, "event": 1, "team_h": 1, "team_a": 2},
+    {"id": 2, "event": 2, "team_h": 2, "team_a": 1},
+]
+
+BOOTSTRAP = {"elements": [{"id": 10, "team": 1, "now_cost": 55}, {"id": 20, "team": 2, "now_cost": 60}]}
+
+
+class TestRunContext:
+    """Tests that shared resources are fetched and built once per run."""
+
+    def test_fixtures_fetched_once_across_gameweeks(self, monkeypatch):
+        """Test that many gameweek steps share a single fixtures request and lookup."""
+        calls = []
+
+        def fake_fetch_fixtures():
+            calls.append("fixtures")
+            return FIXTURES
+
+        monkeypatch.setattr(run_context, "fetch_fpl_fixtures", fake_fetch_fixtures)
+        context = RunContext(bootstrap=BOOTSTRAP)
+
+        lookups = [context.fixtures_lookup for _ in range(38)]
+
+        assert calls == ["fixtures"]
+        assert context.requests == {"bootstrap": 0, "fixtures": 1}
+        assert all(lookup is lookups[0] for lookup in lookups)
+        assert lookups[0] == {1: {"team_h": 1, "team_a": 2}, 2: {"team_h": 2, "team_a": 1}}
+
+    def test_prebuilt_lookup_matches_fixtures_data(self):
+        """Test that passing a prebuilt lookup gives the same opponents as passing raw fixtures."""
+        live_data = {
+            "elements": [
+                {"id": 10, "stats": {"total_points": 6, "minutes": 90}, "explain": [{"fixture": 1}]},
+                {"id": 20, "stats": {"total_points": 2, "minutes": 90}, "explain": [{"fixture": 1}]},
+            ]
+        }
+
+        from_fixtures = process_raw_gameweek_performance(live_data, 1, BOOTSTRAP, FIXTURES)
+        from_lookup = process_raw_gameweek_performance(
+            live_data, 1, BOOTSTRAP, fixtures_lookup=build_fixtures_lookup(FIXTURES)
+        )
+
+        assert from_lookup["opponent_team"].tolist() == from_fixtures["opponent_team"].tolist() == [2, 1]
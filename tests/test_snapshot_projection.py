@@ -0,0 +1,80 @@
+"""Tests for projecting bootstrap and vaastav player data onto availability snapshots."""
+
+import pandas as pd
+
+from fetchers.raw_processor import process_player_gameweek_snapshot, project_player_snapshots
+from scripts.backfill import snapshots
+from scripts.backfill.snapshots import SNAPSHOT_SOURCE_COLUMNS, convert_vaastav_to_snapshot
+from scripts.stub_fpl_api import SyntheticFPLData
+from validation.raw_schemas import RawPlayerGameweekSnapshotSchema
+
+
+def vaastav_frame(bootstrap: dict) -> pd.DataFrame:
+    """players_raw.csv-shaped frame with vaastav reader dtypes (numeric ep/form, categorical status)."""
+    df = pd.DataFrame(bootstrap["elements"])[SNAPSHOT_SOURCE_COLUMNS]
+    return df.astype({"status": "category", "ep_this": "float64", "ep_next": "float64", "form": "float64"})
+
+
+class TestSnapshotProjection:
+    """Tests for the shared snapshot projection."""
+
+    def test_gameweek_range_is_cross_joined(self):
+        """Test that every player appears once per gameweek, ordered by gameweek then player."""
+        bootstrap = SyntheticFPLData(n_players=20).bootstrap()
+
+        snapshots = convert_vaastav_to_snapshot(vaastav_frame(bootstrap), [2, 3, 4])
+
+        assert len(snapshots) == 60
+        assert snapshots["gameweek"].tolist() == [2] * 20 + [3] * 20 + [4] * 20
+        assert snapshots["player_id"].tolist() == [p["id"] for p in bootstrap["elements"]] * 3
+        assert snapshots["is_backfilled"].all()
+        assert snapshots["as_of_utc"].nunique() == 1
+
+    def test_vaastav_and_bootstrap_sources_agree(self):
+        """Test that vaastav dtypes (floats, categoricals) project to the same snapshot as the API strings."""
+        bootstrap = SyntheticFPLData(n_players=20).bootstrap()
+        bootstrap["elements"][0].update({"form": "2.5", "news": None, "news_added": "2025-08-10T12:00:00Z"})
+        columns = [col for col in SNAPSHOT_SOURCE_COLUMNS if col != "id"]
+        timestamp = pd.Timestamp("2025-08-15T10:00:00Z")
+
+        from_api = project_player_snapshots(pd.DataFrame(bootstrap["elements"]), 1, timestamp=timestamp)
+        from_vaastav = project_player_snapshots(vaastav_frame(bootstrap), 1, timestamp=timestamp)
+
+        pd.testing.assert_frame_equal(from_vaastav[columns], from_api[columns])
+        assert from_vaastav.loc[0, "form"] == "2.5"
+        assert from_vaastav.loc[0, "news"] == ""
+        assert from_vaastav.loc[0, "news_added"] == pd.Timestamp("2025-08-10T12:00:00Z")
+
+    def test_missing_fields_use_defaults(self):
+        """Test that fields absent from the source get snapshot defaults and still validate."""
+        players = pd.DataFrame({"id": [1, 2], "status": ["a", None], "now_cost": [55, 60]})
+
+        snapshots = project_player_snapshots(players, [5], is_backfilled=True)
+
+        assert snapshots["status"].tolist() == ["a", "a"]
+        assert snapshots["news"].tolist() == ["", ""]
+        assert snapshots["ep_this"].tolist() == ["0.0", "0.0"]
+        assert snapshots["penalties_order"].isna().all()
+        RawPlayerGameweekSnapshotSchema.validate(snapshots)
+
+    def test_bootstrap_snapshot_keeps_set_piece_orders(self):
+        """Test that the bootstrap processor keeps set-piece orders and nullable chances."""
+        bootstrap = SyntheticFPLData(n_players=10).bootstrap()
+        bootstrap["elements"][0].update({"penalties_order": 1, "chance_of_playing_next_round": None})
+
+        snapshot = process_player_gameweek_snapshot(bootstrap, gameweek=7)
+
+        assert snapshot.loc[0, "penalties_order"] == 1
+        assert pd.isna(snapshot.loc[0, "chance_of_playing_next_round"])
+        assert (snapshot["gameweek"] == 7).all()
+
+    def test_empty_players_raw_reports_failed_gameweeks(self, monkeypatch, capsys):
+        """Test that a players_raw.csv without rows fails each gameweek instead of raising KeyError."""
+        empty = vaastav_frame(SyntheticFPLData(n_players=20).bootstrap()).iloc[0:0]
+        monkeypatch.setattr(snapshots, "fetch_vaastav_players_raw", lambda season: empty)
+
+        snapshots.main(gameweek=None, start_gw=1, end_gw=2, dry_run=True, force=True, season="2025-26")
+
+        output = capsys.readouterr().out
+        assert "❌ Failed to process snapshot for gameweek 1" in output
+        assert "❌ Failed: 2 gameweeks" in output
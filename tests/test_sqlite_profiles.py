@@ -0,0 +1,148 @@
+"""Tests for the SQLite performance profiles applied to database connections."""
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+
+from client.fpl_data_client import FPLDataClient
+from db import database
+from db.database import SQLITE_PROFILES, apply_sqlite_profile
+from safety.backup import DataSafetyManager
+
+
+def profiled_engine(path, profile: str):
+    """SQLite engine on path whose connections get the given profile."""
+    engine = create_engine(f"sqlite:///{path}")
+    event.listen(engine, "connect", lambda dbapi_connection, _: apply_sqlite_profile(dbapi_connection, profile))
+    return engine
+
+
+class TestSqliteProfiles:
+    """Tests for SQLITE_PROFILES, apply_sqlite_profile and profile selection."""
+
+    @pytest.mark.parametrize("profile", ["ingest", "analytics", "readonly"])
+    def test_profile_pragmas_applied_on_connect(self, tmp_path, profile):
+        """Test that every PRAGMA of a profile is in effect on new connections."""
+        engine = profiled_engine(tmp_path / "fpl_test.db", profile)
+        settings = SQLITE_PROFILES[profile]
+
+        with engine.connect() as connection:
+            pragma = {name: connection.exec_driver_sql(f"PRAGMA {name}").scalar() for name in settings}
+        engine.dispose()
+
+        assert pragma.get("journal_mode", "wal") == "wal"
+        assert pragma.get("query_only", 1) == 1
+        assert pragma["synchronous"] == 1  # NORMAL
+        assert pragma["temp_store"] == 2  # MEMORY
+        for name in ("busy_timeout", "cache_size", "mmap_size"):
+            assert pragma[name] == settings[name], name
+
+    def test_default_profile_leaves_sqlite_settings(self, tmp_path):
+        """Test that the default profile keeps the rollback journal."""
+        engine = profiled_engine(tmp_path / "fpl_test.db", "default")
+
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+        engine.dispose()
+
+    def test_set_sqlite_profile_validates_and_switches(self, monkeypatch):
+        """Test that profiles are selected by name and unknown names are rejected."""
+        monkeypatch.setitem(database._sqlite_profile, "name", database.get_sqlite_profile())
+
+        database.set_sqlite_profile("analytics")
+        assert database.get_sqlite_profile() == "analytics"
+        with pytest.raises(ValueError, match="Unknown SQLite profile"):
+            database.set_sqlite_profile("turbo")
+
+        monkeypatch.setenv("FPL_SQLITE_PROFILE", "turbo")
+        assert database._sqlite_profile_from_env() == database.DEFAULT_SQLITE_PROFILE
+        monkeypatch.setenv("FPL_SQLITE_PROFILE", "readonly")
+        assert database._sqlite_profile_from_env() == "readonly"
+
+    def test_readonly_profile_refuses_writes_on_rollback_journal_file(self, tmp_path):
+        """Test that readonly connects to a non-WAL file without switching it and rejects writes."""
+        with closing(sqlite3.connect(tmp_path / "fpl_test.db")) as setup:
+            setup.execute("CREATE TABLE picks (id INTEGER PRIMARY KEY)")
+        engine = profiled_engine(tmp_path / "fpl_test.db", "readonly")
+
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+            assert connection.exec_driver_sql("SELECT COUNT(*) FROM picks").scalar() == 0
+            with pytest.raises(OperationalError, match="readonly"):
+                connection.exec_driver_sql("INSERT INTO picks VALUES (1)")
+        engine.dispose()
+
+    def test_sqlite_profile_scopes_a_workload_unless_env_pins_one(self, monkeypatch):
+        """Test that sqlite_profile switches for its block and FPL_SQLITE_PROFILE wins."""
+        monkeypatch.delenv("FPL_SQLITE_PROFILE", raising=False)
+        database.set_sqlite_profile("ingest")
+
+        with database.sqlite_profile("analytics"):
+            assert database.get_sqlite_profile() == "analytics"
+        assert database.get_sqlite_profile() == "ingest"
+
+        monkeypatch.setenv("FPL_SQLITE_PROFILE", "ingest")
+        with database.sqlite_profile("analytics"):
+            assert database.get_sqlite_profile() == "ingest"
+
+    def test_read_only_client_uses_own_engine(self, tmp_path, monkeypatch):
+        """Test that a read_only client refuses writes through its own engine and leaves the shared one alone."""
+        with closing(sqlite3.connect(tmp_path / "fpl_test.db")) as setup:
+            setup.execute("CREATE TABLE picks (id INTEGER PRIMARY KEY)")
+        monkeypatch.setattr(database, "DATABASE_URL", f"sqlite:///{tmp_path / 'fpl_test.db'}")
+        database.set_sqlite_profile("ingest")
+
+        client = FPLDataClient(auto_init=False, read_only=True)
+        engine = client._db.session_factory.kw["bind"]
+
+        assert database.get_sqlite_profile() == "ingest"
+        assert engine is not database.engine
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA query_only").scalar() == 1
+            with pytest.raises(OperationalError, match="readonly"):
+                connection.exec_driver_sql("INSERT INTO picks VALUES (1)")
+        engine.dispose()
+        assert FPLDataClient(auto_init=False)._db is not client._db
+
+    def test_backup_includes_uncheckpointed_wal_pages(self, tmp_path):
+        """Test that a database backup taken while the WAL holds commits contains them."""
+        writer = sqlite3.connect(tmp_path / "fpl_data.db")
+        writer.execute("PRAGMA journal_mode = WAL")
+        writer.execute("PRAGMA wal_autocheckpoint = 0")
+        writer.execute("CREATE TABLE picks (id INTEGER PRIMARY KEY)")
+        writer.executemany("INSERT INTO picks VALUES (?)", [(i,) for i in range(100)])
+        writer.commit()
+
+        manager = DataSafetyManager(data_dir=str(tmp_path), backup_dir=str(tmp_path / "backups"))
+        backup_path = manager.create_backup("fpl_data.db", "test")
+        writer.close()
+
+        with closing(sqlite3.connect(backup_path)) as backup:
+            assert backup.execute("SELECT COUNT(*) FROM picks").fetchone()[0] == 100
+
+    def test_restore_discards_stale_wal(self, tmp_path):
+        """Test that restoring a backup is not undone by commits left in an uncheckpointed WAL."""
+        db_path = tmp_path / "fpl_data.db"
+        with closing(sqlite3.connect(db_path)) as setup:
+            setup.execute("PRAGMA journal_mode = WAL")
+            setup.execute("CREATE TABLE picks (id INTEGER PRIMARY KEY)")
+            setup.executemany("INSERT INTO picks VALUES (?)", [(i,) for i in range(10)])
+            setup.commit()
+        manager = DataSafetyManager(data_dir=str(tmp_path), backup_dir=str(tmp_path / "backups"))
+        manager.create_backup("fpl_data.db", "test")
+
+        # A writer commits more rows and goes away without checkpointing them into the file
+        writer = sqlite3.connect(db_path)
+        writer.execute("PRAGMA wal_autocheckpoint = 0")
+        writer.executemany("INSERT INTO picks VALUES (?)", [(i,) for i in range(10, 1010)])
+        writer.commit()
+        crashed_wal = (tmp_path / "fpl_data.db-wal").read_bytes()
+        writer.close()
+        (tmp_path / "fpl_data.db-wal").write_bytes(crashed_wal)
+
+        assert manager.emergency_restore("fpl_data.db")
+        with closing(sqlite3.connect(db_path)) as restored:
+            assert restored.execute("SELECT COUNT(*) FROM picks").fetchone()[0] == 10
@@ -0,0 +1,65 @@
+"""Tests for the local stub FPL API and the overridable API base URL."""
+
+import pytest
+import requests
+
+from fetchers import fpl_api
+from fetchers.http_client import http_get_response
+from fetchers.raw_processor import process_all_raw_bootstrap_data
+from scripts.stub_fpl_api import StubFPLAPIServer, SyntheticFPLData
+from utils import loads_json
+
+
+@pytest.fixture
+def stub_api(tmp_path, monkeypatch):
+    """Run a synthetic stub API and point the fetchers at it."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    with StubFPLAPIServer(SyntheticFPLData(n_players=60, current_gameweek=5)) as server:
+        fpl_api.set_fpl_api_base_url(server.base_url)
+        yield server
+    fpl_api.set_fpl_api_base_url(None)
+
+
+class TestStubFPLAPI:
+    """Tests that the fetchers run end to end against the stub server."""
+
+    def test_fetchers_use_overridden_base_url(self, stub_api):
+        """Test that bootstrap, live and manager fetches are served by the stub."""
+        bootstrap = fpl_api.fetch_fpl_bootstrap(use_cache=False)
+        live = fpl_api.fetch_gameweek_live_data(3)
+        manager = fpl_api.fetch_manager_team_with_budget(123)
+
+        assert len(bootstrap["elements"]) == 60
+        assert len(live["elements"]) == 60
+        assert manager["entry_name"] == "Synthetic XI 123"
+        assert len(manager["picks"]) == 15
+        assert stub_api.stats["ok"] == 4
+
+    def test_synthetic_bootstrap_passes_schema_validation(self):
+        """Test that synthetic bootstrap data validates against every raw schema."""
+        bootstrap = loads_json(SyntheticFPLData(n_players=30).payload_for("/bootstrap-static/"))
+        tables = process_all_raw_bootstrap_data(bootstrap)
+
+        assert len(tables["raw_players_bootstrap"]) == 30
+        assert len(tables["raw_teams_bootstrap"]) == 20
+        assert len(tables["raw_events_bootstrap"]) == 38
+
+    def test_rate_limit_injection_sends_retry_after(self, stub_api):
+        """Test that injected 429 responses carry a Retry-After header."""
+        stub_api.rate_limit_rate = 1.0
+        stub_api.retry_after = 7
+
+        with pytest.raises(requests.HTTPError) as exc_info:
+            http_get_response(fpl_api.fpl_api_url("fixtures/"), retries=1)
+
+        assert exc_info.value.response.status_code == 429
+        assert exc_info.value.response.headers["Retry-After"] == "7"
+        assert stub_api.stats["rate_limited"] == 1
+
+    def test_unknown_path_is_404(self, stub_api):
+        """Test that endpoints the stub does not implement return 404."""
+        with pytest.raises(requests.HTTPError) as exc_info:
+            http_get_response(fpl_api.fpl_api_url("dream-team/1/"), retries=1)
+
+        assert exc_info.value.response.status_code == 404
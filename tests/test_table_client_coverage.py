@@ -46,6 +46,15 @@ class TestTableClientCoverage:
             "gameweek_historical": {
                 "raw_player_gameweek_performance",
                 "raw_player_gameweek_snapshot",
+                "raw_player_bootstrap_changes",
+            },
+            "reference": {
+                "raw_team_aliases",
+            },
+            "league_managers": {
+                "raw_manager_picks",
+                "raw_manager_gameweek_summary",
+                "raw_league_entries",
             },
             "derived_analytics": {
                 "derived_player_metrics",
@@ -81,6 +90,13 @@ class TestTableClientCoverage:
                 "get_player_availability_snapshot",
                 "get_player_snapshots_history",
             ],
+            "raw_player_bootstrap_changes": ["get_player_bootstrap_changes"],
+            # Reference Data
+            "raw_team_aliases": ["get_team_aliases", "resolve_team_ids"],
+            # League-scale Manager Data
+            "raw_manager_picks": ["get_manager_picks"],
+            "raw_manager_gameweek_summary": ["get_manager_gameweek_summary"],
+            "raw_league_entries": ["get_league_entries"],
             # Derived Analytics
             "derived_player_metrics": ["get_derived_player_metrics"],
             "derived_team_form": ["get_derived_team_form"],
@@ -102,12 +118,14 @@ class TestTableClientCoverage:
         """Test that table counts match documentation claims."""
         total_expected = sum(len(tables) for tables in expected_tables.values())
 
-        # Documentation claims: 18 total tables
-        assert total_expected == 18, f"Expected 18 total tables, but counted {total_expected}"
+        # Documentation claims: 23 total tables
+        assert total_expected == 23, f"Expected 23 total tables, but counted {total_expected}"
 
         # Verify category counts
         assert len(expected_tables["raw_data"]) == 11, "Expected 11 raw data tables"
-        assert len(expected_tables["gameweek_historical"]) == 2, "Expected 2 gameweek historical tables"
+        assert len(expected_tables["gameweek_historical"]) == 3, "Expected 3 gameweek historical tables"
+        assert len(expected_tables["reference"]) == 1, "Expected 1 reference table"
+        assert len(expected_tables["league_managers"]) == 3, "Expected 3 league manager tables"
         assert len(expected_tables["derived_analytics"]) == 5, "Expected 5 derived analytics tables"
 
     def test_all_tables_have_client_methods(self, expected_tables, table_to_method_mapping, client):
@@ -215,6 +233,7 @@ class TestTableClientCoverage:
         raw_model_classes = [
             models_raw.RawPlayerBootstrap,
             models_raw.RawTeamBootstrap,
+            models_raw.RawTeamAlias,
             models_raw.RawEventBootstrap,
             models_raw.RawFixtures,
             models_raw.RawGameSettings,
@@ -226,6 +245,10 @@ class TestTableClientCoverage:
             models_raw.RawMyPicks,
             models_raw.RawPlayerGameweekPerformance,
             models_raw.RawPlayerGameweekSnapshot,
+            models_raw.RawPlayerBootstrapChange,
+            models_raw.RawManagerPicks,
+            models_raw.RawManagerGameweekSummary,
+            models_raw.RawLeagueEntries,
         ]
 
         # Get table names from derived models
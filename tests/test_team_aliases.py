@@ -0,0 +1,104 @@
+"""Tests for the team-name alias index used to resolve odds sources to FPL teams."""
+
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+
+from db import team_aliases
+from db.team_aliases import build_team_alias_index, normalize_team_names, resolve_team_ids
+from fetchers.raw_processor import process_raw_betting_odds, process_raw_fixtures, process_raw_teams_bootstrap
+from scripts.stub_fpl_api import SyntheticFPLData
+
+FPL_NAMES = {1: ("Man Utd", "MUN"), 2: ("Spurs", "TOT"), 3: ("Nott'm Forest", "NFO"), 20: ("Brighton", "BHA")}
+
+
+@pytest.fixture
+def synthetic_season():
+    """Synthetic bootstrap and fixtures with a few teams renamed to their FPL names."""
+    data = SyntheticFPLData(n_players=40)
+    bootstrap = data.bootstrap()
+    for team in bootstrap["teams"]:
+        if team["id"] in FPL_NAMES:
+            team["name"], team["short_name"] = FPL_NAMES[team["id"]]
+    with contextlib.redirect_stdout(io.StringIO()):
+        teams_df = process_raw_teams_bootstrap(bootstrap)
+        fixtures_df = process_raw_fixtures(data.fixtures())
+    return teams_df, fixtures_df
+
+
+class TestTeamAliases:
+    """Tests for building the alias index and resolving names against it."""
+
+    def test_normalize_team_names(self):
+        """Test that case, punctuation and "&" vs "and" do not change the lookup key."""
+        names = pd.Series(["Brighton & Hove Albion", "brighton and hove albion", "Nott'm Forest", " Man. Utd "])
+
+        keys = normalize_team_names(names).tolist()
+
+        assert keys == ["brighton and hove albion", "brighton and hove albion", "nottm forest", "man utd"]
+
+    def test_index_covers_bootstrap_and_curated_names(self, synthetic_season):
+        """Test that names, short names and curated aliases of this season's teams all resolve."""
+        teams_df, _ = synthetic_season
+        alias_index = build_team_alias_index(teams_df)
+
+        names = pd.Series(["Man Utd", "MUN", "Man United", "Manchester United", "Tottenham Hotspur", "Unknown FC"])
+        resolved = resolve_team_ids(names, alias_index)
+
+        assert resolved.iloc[:5].tolist() == [1, 1, 1, 1, 2]
+        assert pd.isna(resolved.iloc[5])
+        assert alias_index["alias_key"].is_unique
+        # Curated aliases for teams outside this season (e.g. Leeds) are not indexed
+        assert "leeds united" not in set(alias_index["alias_key"])
+
+    def test_odds_sources_resolve_to_same_fixture(self, synthetic_season):
+        """Test that football-data.co.uk and The Odds API spellings match the same fixture."""
+        teams_df, fixtures_df = synthetic_season
+        odds = pd.DataFrame(
+            {
+                "Date": ["16/08/2025", "16/08/2025"],
+                "HomeTeam": ["Man United", "Manchester United"],
+                "AwayTeam": ["Brighton", "Brighton and Hove Albion"],
+                "B365H": [2.1, 2.2],
+                "B365D": [3.4, 3.4],
+                "B365A": [3.3, 3.2],
+            }
+        )
+
+        results = []
+        for row in range(len(odds)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                results.append(process_raw_betting_odds(odds.iloc[[row]], fixtures_df, teams_df))
+
+        assert [result["fixture_id"].tolist() for result in results] == [[1], [1]]
+        assert [result["home_team_id"].tolist() for result in results] == [[1], [1]]
+
+    def test_saving_teams_rebuilds_alias_index(self, temp_db_ops, synthetic_season):
+        """Test that save_raw_teams_bootstrap stores the alias index for the saved teams."""
+        teams_df, _ = synthetic_season
+
+        temp_db_ops.save_raw_teams_bootstrap(teams_df)
+        stored = temp_db_ops.get_team_aliases()
+
+        expected = build_team_alias_index(teams_df)
+        pd.testing.assert_frame_equal(
+            stored.sort_values("alias_key", ignore_index=True),
+            expected.sort_values("alias_key", ignore_index=True),
+        )
+        assert set(stored["source"]) == {"name", "short_name", "curated"}
+
+    def test_rebuild_picks_up_new_curated_aliases(self, temp_db_ops, synthetic_season, monkeypatch):
+        """Test that rebuild_team_aliases adds curated spellings without the teams being saved again."""
+        teams_df, _ = synthetic_season
+        temp_db_ops.save_raw_teams_bootstrap(teams_df)
+        spellings = (*team_aliases.TEAM_NAME_ALIASES["Man Utd"], "Manchester Utd FC")
+        monkeypatch.setitem(team_aliases.TEAM_NAME_ALIASES, "Man Utd", spellings)
+        assert resolve_team_ids(pd.Series(["Manchester Utd FC"]), temp_db_ops.get_team_aliases()).isna().all()
+
+        rebuilt = temp_db_ops.rebuild_team_aliases()
+
+        stored = temp_db_ops.get_team_aliases()
+        assert len(stored) == len(rebuilt)
+        assert resolve_team_ids(pd.Series(["Manchester Utd FC"]), stored).tolist() == [1]
@@ -0,0 +1,156 @@
+"""Tests for the cached vaastav CSV source."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from fetchers import payload_archive, vaastav
+
+FIXTURES_CSV = (
+    b"id,event,kickoff_time,team_h,team_a,team_h_score,team_a_score,finished,pulse_id\n"
+    b"1,1,2024-08-16T19:00:00Z,14,9,1,0,True,115827\n"
+    b"2,1,2024-08-17T11:30:00Z,12,10,2,2,True,115828\n"
+    b"3,38,2025-05-25T15:00:00Z,1,2,,,False,115829\n"
+)
+
+
+class _CSVHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = FIXTURES_CSV
+    requests_served = 0
+    not_modified = 0
+
+    def do_GET(self):  # noqa: N802
+        cls = type(self)
+        cls.requests_served += 1
+        etag = f'"{hash(cls.body)}"'
+        if self.headers.get("If-None-Match") == etag:
+            cls.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(cls.body)))
+        self.end_headers()
+        self.wfile.write(cls.body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def vaastav_server(monkeypatch):
+    """Serve vaastav-style CSVs locally (the cache directory is isolated by conftest)."""
+    _CSVHandler.body = FIXTURES_CSV
+    _CSVHandler.requests_served = 0
+    _CSVHandler.not_modified = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CSVHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(vaastav, "VAASTAV_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/data")
+    monkeypatch.setattr(vaastav, "_stats", dict.fromkeys(vaastav._stats, 0))
+    yield _CSVHandler
+    server.shutdown()
+    server.server_close()
+
+
+class TestVaastavCache:
+    """Tests for local copies, integrity checks, revalidation and typed parsing."""
+
+    def test_past_season_read_once(self, vaastav_server):
+        """Test that a finished season is downloaded once and then served locally."""
+        first = vaastav.read_vaastav_csv("2024-25", "fixtures.csv")
+        second = vaastav.read_vaastav_csv("2024-25", "fixtures.csv")
+
+        assert vaastav_server.requests_served == 1
+        assert len(first) == len(second) == 3
+        assert vaastav.get_vaastav_cache_stats()["hits"] == 1
+
+    def test_explicit_dtypes_columns_and_row_filter(self, vaastav_server):
+        """Test column selection, declared dtypes and row filtering."""
+        df = vaastav.read_vaastav_csv(
+            "2024-25",
+            "fixtures.csv",
+            columns=["team_h", "team_a", "team_h_score", "team_a_score", "not_in_this_season"],
+            row_filter=lambda df: df.dropna(subset=["team_h_score"]),
+        )
+
+        assert list(df.columns) == ["team_h", "team_a", "team_h_score", "team_a_score"]
+        assert len(df) == 2
+        assert str(df["team_h"].dtype) == "int16"
+        assert str(df["team_h_score"].dtype) == "float32"
+
+    def test_chunked_read_filters_each_chunk(self, vaastav_server):
+        """Test that a chunked read matches the whole-file read and keeps category dtypes."""
+        chunks_seen = []
+
+        def finished(chunk):
+            chunks_seen.append(len(chunk))
+            return chunk[chunk["finished"]]
+
+        whole = vaastav.read_vaastav_csv("2024-25", "fixtures.csv", row_filter=finished)
+        chunks_seen.clear()
+        chunked = vaastav.read_vaastav_csv(
+            "2024-25", "fixtures.csv", dtype={"id": "int32", "finished": "bool"}, chunksize=2, row_filter=finished
+        )
+
+        assert chunks_seen == [2, 1]
+        pd.testing.assert_frame_equal(chunked[["id", "finished"]], whole[["id", "finished"]])
+
+        categorical = vaastav.read_vaastav_csv(
+            "2024-25", "fixtures.csv", dtype={"kickoff_time": "category"}, chunksize=1
+        )
+        assert str(categorical["kickoff_time"].dtype) == "category"
+        assert len(categorical) == 3
+
+    def test_corrupted_copy_is_redownloaded(self, vaastav_server):
+        """Test that a local copy failing its hash check is replaced."""
+        local_path = vaastav.fetch_vaastav_file("2024-25", "fixtures.csv")
+        local_path.write_bytes(b"id\n999\n")
+
+        df = vaastav.read_vaastav_csv("2024-25", "fixtures.csv")
+
+        assert len(df) == 3
+        assert vaastav_server.requests_served == 2
+        assert vaastav.get_vaastav_cache_stats()["corrupt"] == 1
+
+    def test_current_season_revalidates_and_versions(self, vaastav_server, monkeypatch):
+        """Test that stale current-season copies revalidate, and changed content becomes a new version."""
+        monkeypatch.setattr(vaastav, "VAASTAV_MAX_AGE_HOURS", 0)
+        original = vaastav.fetch_vaastav_file("2099-00", "fixtures.csv")
+        unchanged = vaastav.fetch_vaastav_file("2099-00", "fixtures.csv")
+
+        vaastav_server.body = FIXTURES_CSV + b"4,38,2025-05-25T15:00:00Z,3,4,1,1,True,115830\n"
+        updated = vaastav.fetch_vaastav_file("2099-00", "fixtures.csv")
+
+        assert unchanged == original
+        assert vaastav_server.not_modified == 1
+        assert updated != original
+        assert original.exists() and updated.exists()
+        manifest = vaastav._load_manifest()["2099-00/fixtures.csv"]
+        assert len(manifest["versions"]) == 2
+        assert manifest["sha256"] == vaastav._sha256_file(updated)
+
+    def test_replay_reads_archive_without_touching_cache(self, vaastav_server):
+        """Test that a replayed run serves the archived CSV and leaves the cache manifest unchanged."""
+        recorded = vaastav.read_vaastav_csv("2099-00", "fixtures.csv")
+        run_id = payload_archive.get_run_id()
+        manifest = vaastav._manifest_path().read_bytes()
+        cached_files = sorted(vaastav.VAASTAV_CACHE_DIR.rglob("*"))
+
+        payload_archive.start_replay(run_id)
+        try:
+            replayed = vaastav.read_vaastav_csv("2099-00", "fixtures.csv", refresh=True)
+        finally:
+            payload_archive.stop_replay()
+
+        pd.testing.assert_frame_equal(replayed, recorded)
+        assert vaastav_server.requests_served == 1
+        assert vaastav._manifest_path().read_bytes() == manifest
+        assert sorted(vaastav.VAASTAV_CACHE_DIR.rglob("*")) == cached_files
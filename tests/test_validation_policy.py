@@ -0,0 +1,140 @@
+"""Tests for the schema validation policy (full, sampled and fingerprint-skip modes)."""
+
+import pandas as pd
+import pandera.pandas as pa
+import pytest
+
+from fetchers.raw_processor import process_raw_teams_bootstrap
+from scripts.stub_fpl_api import SyntheticFPLData
+from validation import validators
+from validation.raw_schemas import RawTeamsBootstrapSchema
+from validation.validators import (
+    get_validation_mode,
+    get_validation_stats,
+    parse_table_modes,
+    set_validation_policy,
+    validate_table,
+)
+
+
+class PointsSchema(pa.DataFrameModel):
+    """Small schema for exercising the validation modes."""
+
+    player_id: int = pa.Field(ge=1)
+    points: int = pa.Field(ge=0)
+    as_of_utc: str
+
+    class Config:
+        coerce = True
+
+
+def points_frame(n_rows: int = 200, as_of: str = "2025-08-15T10:00:00Z") -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "player_id": [str(i) for i in range(1, n_rows + 1)],
+            "points": range(n_rows),
+            "as_of_utc": as_of,
+        }
+    )
+
+
+class TestValidationModes:
+    """Tests for full, sampled and fingerprint validation."""
+
+    def test_full_mode_rejects_bad_row_anywhere(self):
+        """Test that full mode catches an invalid value in the middle of the frame."""
+        df = points_frame()
+        df.loc[100, "points"] = -1
+
+        with pytest.raises(pa.errors.SchemaError):
+            validate_table(df, PointsSchema, "points")
+
+    def test_sampled_mode_checks_head_and_tail_but_coerces_everything(self):
+        """Test that sampled mode only checks the edge rows while still coercing every row."""
+        set_validation_policy(default="sampled")
+        df = points_frame()
+        df.loc[100, "points"] = -1
+
+        validated = validate_table(df, PointsSchema, "points")
+        assert validated["player_id"].dtype == "int64"
+
+        df.loc[0, "points"] = -1
+        with pytest.raises(pa.errors.SchemaError):
+            validate_table(df, PointsSchema, "points")
+
+    def test_fingerprint_mode_skips_unchanged_frames(self):
+        """Test that an identical frame (apart from as_of_utc) is only coerced on the second run."""
+        set_validation_policy(default="fingerprint")
+
+        validate_table(points_frame(), PointsSchema, "points")
+        validated = validate_table(points_frame(as_of="2025-08-16T10:00:00Z"), PointsSchema, "points")
+
+        assert validated["player_id"].dtype == "int64"
+        stats = get_validation_stats()["points"]
+        assert stats["calls"] == 2
+        assert stats["skipped"] == 1
+        assert stats["rows"] == 400
+        assert stats["schema"] == "PointsSchema"
+
+    def test_fingerprint_mode_revalidates_changed_frames(self):
+        """Test that a changed frame is validated again and fingerprints persist across processes."""
+        set_validation_policy(default="fingerprint")
+        validate_table(points_frame(), PointsSchema, "points")
+        assert validators.VALIDATION_STATE_PATH.exists()
+
+        # A new process reloads stored fingerprints from disk
+        validators.reset_validation_policy()
+        set_validation_policy(default="fingerprint")
+        changed = points_frame()
+        changed.loc[5, "points"] = -1
+
+        with pytest.raises(pa.errors.SchemaError):
+            validate_table(changed, PointsSchema, "points")
+        validate_table(points_frame(), PointsSchema, "points")
+        assert get_validation_stats()["points"]["skipped"] == 1
+
+    def test_processor_uses_table_mode(self):
+        """Test that processors validate through the policy under their table name."""
+        set_validation_policy(tables={"raw_teams_bootstrap": "fingerprint"})
+        bootstrap = SyntheticFPLData(n_players=30).bootstrap()
+
+        first = process_raw_teams_bootstrap(bootstrap)
+        second = process_raw_teams_bootstrap(bootstrap)
+
+        pd.testing.assert_frame_equal(first.drop(columns="as_of_utc"), second.drop(columns="as_of_utc"))
+        stats = get_validation_stats()["raw_teams_bootstrap"]
+        assert stats["mode"] == "fingerprint"
+        assert stats["schema"] == RawTeamsBootstrapSchema.__name__
+        assert stats["skipped"] == 1
+
+
+class TestValidationPolicy:
+    """Tests for choosing validation modes."""
+
+    def test_table_modes_override_default(self):
+        """Test that per-table modes take precedence over the default mode."""
+        set_validation_policy(
+            default="sampled", tables=parse_table_modes("raw_fixtures=full, raw_teams_bootstrap=fingerprint")
+        )
+
+        assert get_validation_mode("raw_fixtures") == "full"
+        assert get_validation_mode("raw_teams_bootstrap") == "fingerprint"
+        assert get_validation_mode("raw_players_bootstrap") == "sampled"
+
+    def test_invalid_modes_rejected(self):
+        """Test that unknown or malformed modes raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_table_modes(["raw_fixtures=quick"])
+        with pytest.raises(ValueError):
+            parse_table_modes("raw_fixtures")
+        with pytest.raises(ValueError):
+            set_validation_policy(default="none")
+
+    def test_environment_sets_default_policy(self, monkeypatch):
+        """Test that FPL_VALIDATION_MODE and FPL_VALIDATION_TABLE_MODES configure the policy."""
+        monkeypatch.setenv("FPL_VALIDATION_MODE", "sampled")
+        monkeypatch.setenv("FPL_VALIDATION_TABLE_MODES", "raw_fixtures=fingerprint")
+        validators.reset_validation_policy()
+
+        assert get_validation_mode("raw_players_bootstrap") == "sampled"
+        assert get_validation_mode("raw_fixtures") == "fingerprint"
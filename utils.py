@@ -1,26 +1,29 @@
 """Utility functions for FPL dataset builder."""
 
+import json
 import os
-import time
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
-import requests
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib decoder
+    orjson = None
 
 
 def http_get(url: str, retries: int = 3, timeout: int = 30) -> bytes:
-    """HTTP GET with retries."""
-    for attempt in range(retries):
-        try:
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
-            return response.content
-        except requests.RequestException as e:
-            if attempt == retries - 1:
-                raise
-            print(f"Retry {attempt + 1}/{retries} for {url}: {e}")
-            time.sleep(2**attempt)
-    return b""
+    """HTTP GET with retries over the shared pooled session (see fetchers.http_client)."""
+    from fetchers.http_client import http_get as pooled_http_get
+
+    return pooled_http_get(url, retries=retries, timeout=timeout)
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON, using orjson when it is installed (several times faster on bootstrap-sized payloads)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def now_utc() -> datetime:
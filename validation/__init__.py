@@ -1,8 +1,20 @@
 """Validation package for FPL dataset builder."""
 
 # Legacy schemas removed - now use raw_schemas.py and derived_schemas.py
-from .validators import validate_dataframe
+from .validators import (
+    VALIDATION_MODES,
+    get_validation_stats,
+    schema_dtypes,
+    set_validation_policy,
+    validate_dataframe,
+    validate_table,
+)
 
 __all__ = [
+    "VALIDATION_MODES",
+    "get_validation_stats",
+    "schema_dtypes",
+    "set_validation_policy",
     "validate_dataframe",
+    "validate_table",
 ]
@@ -1,5 +1,14 @@
 """Validation utilities and functions."""
 
+import hashlib
+import json
+import os
+import threading
+import time
+from functools import cache
+from pathlib import Path
+from typing import Any
+
 import pandas as pd
 import pandera as pa
 
@@ -16,3 +25,201 @@ def validate_dataframe(df: pd.DataFrame, schema: pa.DataFrameModel, name: str) -
     except Exception as e:
         print(f"❌ Validation error for {name}: {e}")
         raise
+
+
+@cache
+def schema_dtypes(schema: type[pa.DataFrameModel]) -> dict[str, str]:
+    """Pandas dtypes declared by a schema, keyed by field name (the API name, not the alias).
+
+    Timestamp columns are left out since they need pd.to_datetime parsing; string
+    columns map to object.
+
+    Args:
+        schema: Pandera DataFrameModel class
+
+    Returns:
+        Dictionary of field name -> dtype, suitable for DataFrame.astype
+    """
+    columns = schema.to_schema().columns
+    dtypes = {}
+    for alias, (_, field) in schema.__fields__.items():
+        dtype = str(columns[alias].dtype)
+        if dtype.startswith("datetime"):
+            continue
+        dtypes[field.original_name] = "object" if dtype == "str" else dtype
+    return dtypes
+
+
+# Validation policy
+#
+# Every processor validates through validate_table(), which applies the mode chosen for
+# that table:
+#   full         - validate every row (default)
+#   sampled      - coerce the whole frame but run checks on the first/last rows only
+#   fingerprint  - skip checks when the frame is identical to the last one that passed
+#                  for this table (only dtype coercion runs); fingerprints persist across runs
+VALIDATION_MODES = ("full", "sampled", "fingerprint")
+VALIDATION_SAMPLE_ROWS = int(os.getenv("FPL_VALIDATION_SAMPLE_ROWS", "50"))
+VALIDATION_STATE_PATH = Path(os.getenv("FPL_VALIDATION_STATE", str(Path("data") / "validation_fingerprints.json")))
+
+# Columns stamped per run that must not make an unchanged frame look new
+FINGERPRINT_IGNORE_COLUMNS = ("as_of_utc",)
+
+
+def parse_table_modes(spec: str | list[str] | None) -> dict[str, str]:
+    """Parse per-table modes given as "table=mode" items (comma-separated or as a list).
+
+    Raises:
+        ValueError: If an item is malformed or names an unknown mode
+    """
+    items = spec if isinstance(spec, list) else (spec or "").split(",")
+    table_modes = {}
+    for item in items:
+        if not item.strip():
+            continue
+        table, sep, mode = item.partition("=")
+        mode = mode.strip()
+        if not sep or not table.strip() or mode not in VALIDATION_MODES:
+            raise ValueError(f"Invalid validation mode '{item}' (expected table=mode, mode one of {VALIDATION_MODES})")
+        table_modes[table.strip()] = mode
+    return table_modes
+
+
+def _mode_from_env() -> str:
+    mode = os.getenv("FPL_VALIDATION_MODE", "full")
+    return mode if mode in VALIDATION_MODES else "full"
+
+
+_policy: dict[str, Any] = {"default": _mode_from_env(), "tables": {}}
+_stats: dict[str, dict[str, Any]] = {}
+_fingerprints: dict[str, str] | None = None
+# Bootstrap tables are validated on a thread pool; guards the fingerprint store and its file
+_fingerprint_lock = threading.Lock()
+
+
+def set_validation_policy(default: str | None = None, tables: dict[str, str] | None = None) -> None:
+    """Choose the validation mode for all tables and/or individual tables.
+
+    Args:
+        default: Mode for tables without their own setting (None keeps the current default)
+        tables: Per-table modes, merged over FPL_VALIDATION_TABLE_MODES and earlier calls
+
+    Raises:
+        ValueError: If a mode is not one of VALIDATION_MODES
+    """
+    for mode in [default, *(tables or {}).values()]:
+        if mode is not None and mode not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode '{mode}' (expected one of {VALIDATION_MODES})")
+    if default is not None:
+        _policy["default"] = default
+    _policy["tables"].update(tables or {})
+
+
+def reset_validation_policy() -> None:
+    """Restore the environment-configured policy and clear stats and loaded fingerprints."""
+    global _fingerprints
+    _policy["default"] = _mode_from_env()
+    try:
+        _policy["tables"] = parse_table_modes(os.getenv("FPL_VALIDATION_TABLE_MODES"))
+    except ValueError as e:
+        print(f"⚠️  Ignoring FPL_VALIDATION_TABLE_MODES: {e}")
+        _policy["tables"] = {}
+    _stats.clear()
+    _fingerprints = None
+
+
+def get_validation_mode(table: str) -> str:
+    """Validation mode that applies to a table."""
+    return _policy["tables"].get(table, _policy["default"])
+
+
+def get_validation_stats() -> dict[str, dict[str, Any]]:
+    """Per-table validation counters and time for this process.
+
+    Returns:
+        Dictionary of table -> {schema, mode, calls, skipped, rows, seconds}
+    """
+    return {table: dict(stats) for table, stats in _stats.items()}
+
+
+def _load_fingerprints() -> dict[str, str]:
+    global _fingerprints
+    with _fingerprint_lock:
+        if _fingerprints is None:
+            try:
+                _fingerprints = json.loads(VALIDATION_STATE_PATH.read_text())
+            except (OSError, ValueError):
+                _fingerprints = {}
+        return _fingerprints
+
+
+def _save_fingerprint(table: str, fingerprint: str) -> None:
+    fingerprints = _load_fingerprints()
+    with _fingerprint_lock:
+        fingerprints[table] = fingerprint
+        try:
+            VALIDATION_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = VALIDATION_STATE_PATH.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(fingerprints, indent=2, sort_keys=True))
+            os.replace(tmp_path, VALIDATION_STATE_PATH)
+        except OSError as e:
+            print(f"⚠️  Could not save validation fingerprint for {table}: {e}")
+
+
+def frame_fingerprint(df: pd.DataFrame, schema: type[pa.DataFrameModel]) -> str | None:
+    """Content hash of a frame (ignoring per-run timestamps) and of the schema it is checked against.
+
+    Returns:
+        Hex digest, or None if the frame holds values that cannot be hashed (e.g. lists)
+    """
+    data = df.drop(columns=[col for col in FINGERPRINT_IGNORE_COLUMNS if col in df.columns])
+    digest = hashlib.sha256(repr(schema.to_schema()).encode())
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in data.dtypes.items()]).encode())
+    try:
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    except TypeError:
+        return None
+    return digest.hexdigest()
+
+
+def validate_table(df: pd.DataFrame, schema: type[pa.DataFrameModel], table: str) -> pd.DataFrame:
+    """Validate a processed table according to its validation mode and record the time taken.
+
+    Args:
+        df: DataFrame to validate
+        schema: Pandera DataFrameModel for the table
+        table: Table name used for per-table modes, fingerprints and stats
+
+    Returns:
+        Validated (coerced) DataFrame
+
+    Raises:
+        pandera.errors.SchemaError: If validation fails (as Schema.validate does)
+    """
+    mode = get_validation_mode(table)
+    stats = _stats.setdefault(
+        table, {"schema": schema.__name__, "mode": mode, "calls": 0, "skipped": 0, "rows": 0, "seconds": 0.0}
+    )
+    stats["mode"] = mode
+    start = time.perf_counter()
+    try:
+        if mode == "sampled" and len(df) > 2 * VALIDATION_SAMPLE_ROWS:
+            return schema.validate(df, head=VALIDATION_SAMPLE_ROWS, tail=VALIDATION_SAMPLE_ROWS)
+        if mode != "fingerprint":
+            return schema.validate(df)
+
+        fingerprint = frame_fingerprint(df, schema)
+        if fingerprint is not None and _load_fingerprints().get(table) == fingerprint:
+            stats["skipped"] += 1
+            return schema.to_schema().coerce_dtype(df)
+        validated = schema.validate(df)
+        if fingerprint is not None:
+            _save_fingerprint(table, fingerprint)
+        return validated
+    finally:
+        stats["calls"] += 1
+        stats["rows"] += len(df)
+        stats["seconds"] += time.perf_counter() - start
+
+
+reset_validation_policy()